@@ -1,3 +1,3 @@
-from . import auth, tickers, analyses, datasets
+from . import auth, tickers, analyses, datasets, jobs
 
-__all__ = ["auth", "tickers", "analyses", "datasets"]
\ No newline at end of file
+__all__ = ["auth", "tickers", "analyses", "datasets", "jobs"]
\ No newline at end of file
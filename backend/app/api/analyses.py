@@ -1,8 +1,11 @@
 """Analysis management API endpoints"""
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from sqlalchemy.orm import Session
-from typing import List
-from fastapi.responses import FileResponse, HTMLResponse
+from typing import List, Optional
+from email.utils import formatdate, parsedate_to_datetime
+from datetime import timezone
+from fastapi.responses import FileResponse
+import re
 import shutil
 from pathlib import Path
 import asyncio
@@ -10,13 +13,15 @@ import asyncio
 
 from ..database import get_db
 from ..schemas.analysis import AnalysisCreate, AnalysisResponse, AnalysisNameUpdate, AnalysisFullUpdate
-from ..services.analysis_service import create_analysis, get_user_analyses, get_analysis_by_id, update_analysis_configuration, reset_analysis_state, delete_sections_and_files
+from ..services.analysis_service import create_analysis, get_user_analyses, get_analysis_by_id, update_analysis_configuration, reset_analysis_state, delete_sections_and_files, mark_sections_pending, delete_collected_files
 from ..core.deps import get_current_user
 from ..models.user import User
-from ..services.data_collection_service import data_collection_service
-from ..report_generation.section_runner import run_section_generation
+from ..report_generation.section_runner import SECTIONS_METADATA
 from ..models.section import Section
 from ..services.file_service import file_service
+from ..services.collector_loader_service import collector_loader_service
+from ..report_generation.compression import select_variant
+from ..jobs import enqueue_job, cancel_resource_jobs
 
 router = APIRouter(prefix="/api/analyses", tags=["analyses"])
 
@@ -97,13 +102,16 @@ async def update_analysis_name(
 async def update_analysis_full(
     analysis_id: str,
     update_data: AnalysisFullUpdate,
+    full: bool = True,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Update full analysis configuration (companies, years_back, name):
     - Updates: Companies, years_back, name
-    - Deletes: All Section records and all generated files
+    - Deletes: Collected data files (Excel, pickle, artifacts) and sections
+    - full=false: Keeps Section records and HTML instead; after re-collection
+      only sections whose inputs changed are regenerated
     - Resets: Status to 'created', progress to 0, clears timestamps
     
     Use this when you need to change the analysis scope or companies.
@@ -117,8 +125,14 @@ async def update_analysis_full(
         )
     
     try:
-        # Delete sections and files using service
-        sections_deleted, files_deleted = await delete_sections_and_files(db, analysis_id)
+        # Delete collected data (and, for a full reset, the sections) using service
+        if full:
+            sections_deleted, files_deleted = await delete_sections_and_files(db, analysis_id)
+            sections_kept = 0
+        else:
+            sections_kept = mark_sections_pending(db, analysis_id)
+            files_deleted = await delete_collected_files(analysis_id)
+            sections_deleted = 0
         
         # Update analysis configuration using service
         update_analysis_configuration(
@@ -144,9 +158,10 @@ async def update_analysis_full(
             "companies": analysis.companies,
             "years_back": analysis.years_back,
             "sections_deleted": sections_deleted,
+            "sections_kept": sections_kept,
             "files_deleted": files_deleted,
             "status": analysis.status,
-            "note": "Configuration updated. All data cleared. Ready for fresh data collection."
+            "note": "Configuration updated. Collected data cleared. Ready for fresh data collection."
         }
         
     except Exception as e:
@@ -158,9 +173,8 @@ async def update_analysis_full(
         )
 # Add new endpoint
 @router.post("/{analysis_id}/start-collection")
-def start_data_collection(
+async def start_data_collection(
     analysis_id: str,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -178,15 +192,13 @@ def start_data_collection(
             detail=f"Analysis is in '{analysis.status}' status, cannot start collection"
         )
     
-    # Start background collection
-    background_tasks.add_task(
-        data_collection_service.collect_data_for_analysis,
-        analysis_id
-    )
+    # Queue collection for a job worker
+    job = await enqueue_job(db, "analysis.collect", current_user.user_id, analysis_id, analysis_id)
     
     return {
         "message": "Data collection started",
         "analysis_id": analysis_id,
+        "job_id": job.job_id,
         "status": "collection"
     }
 
@@ -226,9 +238,8 @@ def download_raw_data(
 
 # Add this endpoint
 @router.post("/{analysis_id}/start-analysis")
-def start_analysis_generation(
+async def start_analysis_generation(
     analysis_id: str,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -254,18 +265,20 @@ def start_analysis_generation(
             detail="Financial collector data not found. Please run data collection again."
         )
     
-    # Start section generation in background
-    background_tasks.add_task(run_section_generation, analysis, db)
+    # Queue section generation for a job worker
+    job = await enqueue_job(db, "analysis.generate", current_user.user_id, analysis_id, analysis_id)
     
     return {
         "message": "Section generation started",
         "analysis_id": analysis_id,
+        "job_id": job.job_id,
         "status": "generating"
     }
 
 @router.post("/{analysis_id}/restart-analysis")
 async def restart_analysis(
     analysis_id: str,
+    full: bool = True,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -273,6 +286,8 @@ async def restart_analysis(
     Restart analysis generation (Phase B) while keeping collected data (Phase A):
     - Keeps: Analysis record, raw_data.xlsx, financial_collector.pkl
     - Deletes: All Section records and section HTML files
+    - full=false: Keeps Section records and HTML instead; the next run
+      regenerates only sections whose inputs or code changed
     - Resets: Status to 'collection_complete', Phase to 'A', progress to 100
     
     Use this to regenerate analysis sections without re-collecting data.
@@ -299,10 +314,16 @@ async def restart_analysis(
         )
     
     try:
-        # Step 1: Delete all related sections from database
-        sections_deleted = db.query(Section).filter(
-            Section.analysis_id == analysis_id
-        ).delete()
+        # Step 1: Delete all related sections from database (full restart),
+        # or queue them, keeping their fingerprints
+        if full:
+            sections_deleted = db.query(Section).filter(
+                Section.analysis_id == analysis_id
+            ).delete()
+            sections_kept = 0
+        else:
+            sections_kept = mark_sections_pending(db, analysis_id)
+            sections_deleted = 0
         
         # Step 2: Reset analysis to collection_complete state
         analysis.status = "collection_complete"
@@ -319,7 +340,7 @@ async def restart_analysis(
         sections_dir = file_service.get_sections_dir(analysis_id)
         files_deleted = 0
         
-        if sections_dir.exists():
+        if full and sections_dir.exists():
             # Count files before deletion
             files_deleted = sum(1 for _ in sections_dir.glob("*.html"))
             # Run the blocking file operation in a thread pool
@@ -332,13 +353,15 @@ async def restart_analysis(
             "analysis_id": analysis_id,
             "analysis_name": analysis.name,
             "sections_deleted": sections_deleted,
+            "sections_kept": sections_kept,
             "html_files_deleted": files_deleted,
             "status": analysis.status,
             "phase": analysis.phase,
             "progress": analysis.progress,
             "raw_data_preserved": True,
             "collector_preserved": True,
-            "note": "Phase A data preserved. Ready to regenerate Phase B analysis sections."
+            "note": "Phase A data preserved. Ready to regenerate Phase B analysis sections." if full
+                    else "Phase A data preserved. Only sections whose inputs changed will be regenerated."
         }
         
     except Exception as e:
@@ -369,6 +392,9 @@ async def delete_analysis(
         )
     
     try:
+        # Stop queued/running collection and generation jobs
+        cancel_resource_jobs(db, analysis_id)
+        
         # Step 1: Delete all related sections from database
         sections_deleted = db.query(Section).filter(
             Section.analysis_id == analysis_id
@@ -379,6 +405,7 @@ async def delete_analysis(
         db.commit()
         
         # Step 3: Delete the entire analysis directory and all its contents (async)
+        collector_loader_service.invalidate_financial_collector(analysis_id)
         analysis_dir = file_service.get_analysis_dir(analysis_id)
         files_deleted = False
         
@@ -409,13 +436,17 @@ async def delete_analysis(
 @router.post("/{analysis_id}/reset")
 async def reset_analysis(
     analysis_id: str,
+    full: bool = True,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     Reset an analysis to start fresh:
     - Keeps: Analysis record (companies, years_back, name, etc.)
-    - Deletes: All Section records and all generated files
+    - Deletes: All data files and sections
+    - full=false: Deletes only the collected data files (Excel, pickle,
+      artifacts) and keeps Section records and HTML; after re-collection
+      only sections whose inputs changed are regenerated
     - Resets: Status to 'created', progress to 0, clears timestamps and errors
     
     Use this to re-run data collection with updated data.
@@ -429,10 +460,16 @@ async def reset_analysis(
         )
     
     try:
-        # Step 1: Delete all related sections from database
-        sections_deleted = db.query(Section).filter(
-            Section.analysis_id == analysis_id
-        ).delete()
+        # Step 1: Delete all related sections from database (full reset),
+        # or queue them, keeping their fingerprints
+        if full:
+            sections_deleted = db.query(Section).filter(
+                Section.analysis_id == analysis_id
+            ).delete()
+            sections_kept = 0
+        else:
+            sections_kept = mark_sections_pending(db, analysis_id)
+            sections_deleted = 0
         
         # Step 2: Reset analysis state (keep the analysis record itself)
         analysis.status = "created"
@@ -445,10 +482,13 @@ async def reset_analysis(
         db.commit()
         
         # Step 3: Delete all files but keep the directory structure (async)
+        collector_loader_service.invalidate_financial_collector(analysis_id)
         analysis_dir = file_service.get_analysis_dir(analysis_id)
         files_deleted = False
         
-        if analysis_dir.exists():
+        if not full:
+            files_deleted = await delete_collected_files(analysis_id)
+        elif analysis_dir.exists():
             # Run the blocking file operation in a thread pool
             import asyncio
             await asyncio.to_thread(shutil.rmtree, analysis_dir)
@@ -462,6 +502,7 @@ async def reset_analysis(
             "analysis_id": analysis_id,
             "analysis_name": analysis.name,
             "sections_deleted": sections_deleted,
+            "sections_kept": sections_kept,
             "files_deleted": files_deleted,
             "status": analysis.status,
             "note": "Analysis is ready for fresh data collection"
@@ -512,14 +553,98 @@ def get_analysis_sections(
         ]
     }
 
+@router.post("/{analysis_id}/sections/{section_number}/regenerate")
+async def regenerate_section(
+    analysis_id: str,
+    section_number: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Rebuild a single section from the current collected data and code"""
+    analysis = get_analysis_by_id(db, analysis_id, current_user)
+    if not analysis:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Analysis not found"
+        )
+    
+    if section_number not in {m["number"] for m in SECTIONS_METADATA}:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Section not found"
+        )
+    
+    if analysis.status not in ("complete", "partial_complete"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Cannot regenerate a section until generation has finished. Current status: {analysis.status}"
+        )
+    
+    if not file_service.collector_pickle_exists(analysis_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Financial collector data not found. Please run data collection again."
+        )
+    
+    job = await enqueue_job(
+        db, "analysis.regenerate_section", current_user.user_id,
+        analysis_id, analysis_id, section_number
+    )
+    
+    return {
+        "message": "Section regeneration started",
+        "analysis_id": analysis_id,
+        "section_number": section_number,
+        "job_id": job.job_id,
+        "status": "processing"
+    }
+
+
+def _section_validators(section: Section, html_path: Path, encoding: Optional[str]):
+    """ETag and Last-Modified of a generated section page (per encoding)"""
+    stat = html_path.stat()
+    if section.completed_at:
+        modified = section.completed_at.replace(tzinfo=timezone.utc).timestamp()
+    else:
+        modified = stat.st_mtime
+    etag = f'"{section.section_id}-{int(modified * 1000):x}-{stat.st_size:x}'
+    if encoding:
+        etag += f"-{encoding}"
+    return etag + '"', formatdate(modified, usegmt=True), modified
+
+
+def _not_modified(request: Request, etag: str, modified: float) -> bool:
+    """Whether the client's cached copy is still current"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in candidates or any(
+            tag.removeprefix("W/") == etag for tag in candidates
+        )
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(modified) <= since
+    return False
+
+
 @router.get("/{analysis_id}/sections/{section_number}")
 def get_section_html(
     analysis_id: str,
     section_number: int,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """Get HTML content for a specific section"""
+    """
+    Get HTML content for a specific section.
+    
+    Serves the precompressed variant the client accepts (brotli, gzip)
+    straight from disk, and answers conditional requests with 304.
+    """
     analysis = get_analysis_by_id(db, analysis_id, current_user)
     if not analysis:
         raise HTTPException(
@@ -544,7 +669,6 @@ def get_section_html(
             detail=f"Section not ready. Current status: {section.status}"
         )
     
-    from pathlib import Path
     html_path = Path(section.html_path)
     
     if not html_path.exists():
@@ -553,7 +677,59 @@ def get_section_html(
             detail="Section HTML file not found"
         )
     
-    with open(html_path, 'r', encoding='utf-8') as f:
-        html_content = f.read()
+    file_path, encoding = select_variant(str(html_path), request.headers.get("accept-encoding"))
+    etag, last_modified, modified = _section_validators(section, html_path, encoding)
+    headers = {
+        "ETag": etag,
+        "Last-Modified": last_modified,
+        # Cache, but revalidate: a regenerated section gets a new ETag
+        "Cache-Control": "private, no-cache",
+        "Vary": "Accept-Encoding",
+    }
+    
+    if _not_modified(request, etag, modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
     
-    return HTMLResponse(content=html_content)
\ No newline at end of file
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return FileResponse(path=file_path, media_type="text/html", headers=headers)
+
+
+# Chart sidecar files are named by the hash of their content
+CHART_FILE_PATTERN = re.compile(r"^[0-9a-f]{16}\.json$")
+
+
+@router.get("/{analysis_id}/charts/{chart_file}")
+def get_chart_data(
+    analysis_id: str,
+    chart_file: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get the figure JSON of a lazily loaded section chart"""
+    analysis = get_analysis_by_id(db, analysis_id, current_user)
+    if not analysis:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Analysis not found"
+        )
+    
+    if not CHART_FILE_PATTERN.match(chart_file):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Chart not found"
+        )
+    
+    chart_path = file_service.get_charts_dir(analysis_id) / chart_file
+    if not chart_path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Chart not found"
+        )
+    
+    # Content-addressed, so the browser can keep it as long as it likes
+    return FileResponse(
+        path=str(chart_path),
+        media_type="application/json",
+        headers={"Cache-Control": "private, max-age=31536000, immutable"}
+    )
\ No newline at end of file
@@ -5,7 +5,7 @@ File: backend/app/api/datasets.py
 Complete CRUD operations + data access endpoints for datasets
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import FileResponse, HTMLResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any
@@ -22,9 +22,9 @@ from backend.app.schemas.dataset import (
     SavedQueryCreate, SavedQueryResponse
 )
 from backend.app.services.collector_loader_service import collector_loader_service
+from backend.app.services.dataset_store_service import dataset_store_service
 from backend.app.services.file_service import file_service
-from backend.app.data_collection.dataset_collector import DatasetCollection
-from ..services.data_collection_service import data_collection_service
+from backend.app.jobs import enqueue_job, cancel_resource_jobs
 from backend.app.config import settings
 from backend.app.schemas.dataset import DatasetCreate, DatasetUpdate, DatasetResponse, DataQuery, DataFilter
 
@@ -216,6 +216,7 @@ async def update_dataset_config(
     db.commit()
     db.refresh(dataset)
     
+    collector_loader_service.invalidate_dataset_collector(dataset_id)
     # TODO: Delete existing pickle file
     
     return dataset
@@ -236,10 +237,14 @@ async def delete_dataset(
     if dataset.user_id != current_user.user_id:
         raise HTTPException(status_code=403, detail="Only owner can delete dataset")
     
+    cancel_resource_jobs(db, dataset_id)
+    
     # Delete from database (cascades to dashboards, queries, etc.)
     db.delete(dataset)
     db.commit()
     
+    collector_loader_service.invalidate_dataset_collector(dataset_id)
+    dataset_store_service.delete_dataset_store(dataset_id)
     # TODO: Delete files from disk
     
     return {"message": "Dataset deleted successfully", "dataset_id": dataset_id}
@@ -269,6 +274,9 @@ async def reset_dataset(
     
     db.commit()
     
+    collector_loader_service.invalidate_dataset_collector(dataset_id)
+    dataset_store_service.delete_dataset_store(dataset_id)
+    
     return {"message": "Dataset reset successfully", "dataset_id": dataset_id}
 
 
@@ -279,7 +287,6 @@ async def reset_dataset(
 @router.post("/{dataset_id}/start-collection")
 async def start_collection(
     dataset_id: str,
-    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -296,15 +303,13 @@ async def start_collection(
         raise HTTPException(status_code=400, detail=f"Cannot collect data when status is {dataset.status}")
     
     
-    # Start background collection
-    background_tasks.add_task(
-        data_collection_service.collect_data_for_dataset,
-        dataset_id
-    )
+    # Queue collection on the batch lane
+    job = await enqueue_job(db, "dataset.collect", current_user.user_id, dataset_id, dataset_id)
     
     return {
         "message": "Data collection started",
         "analysis_id": dataset_id,
+        "job_id": job.job_id,
         "status": "collection"
     }
     
@@ -365,8 +370,11 @@ async def get_profile(
     """Get consolidated financial data"""
     _validate_dataset_access(dataset_id, current_user.user_id, db)
     
-    collector = collector_loader_service.load_dataset_collector(dataset_id)
-    df = collector.get_profiles()
+    df = dataset_store_service.load_table(
+        dataset_id, "profiles",
+        columns=['Company', 'Symbol', 'Year'] + columns if columns else None,
+        filters=[('Symbol', 'in', companies), ('Year', 'in', years)]
+    )
   
     # Apply filters (same logic as before)
     if companies:
@@ -405,8 +413,11 @@ async def get_financial_data(
     """Get consolidated financial data"""
     _validate_dataset_access(dataset_id, current_user.user_id, db)
     
-    collector = collector_loader_service.load_dataset_collector(dataset_id)
-    df = collector.get_all_financial_data()
+    df = dataset_store_service.load_table(
+        dataset_id, "financial",
+        columns=['Company', 'Symbol', 'Year'] + columns if columns else None,
+        filters=[('Symbol', 'in', companies), ('Year', 'in', years)]
+    )
 
 
     # Apply filters (same logic as before)
@@ -446,8 +457,11 @@ async def get_income_statement_data(
     """Get consolidated financial data"""
     _validate_dataset_access(dataset_id, current_user.user_id, db)
     
-    collector = collector_loader_service.load_dataset_collector(dataset_id)
-    df = collector.get_income_statements()
+    df = dataset_store_service.load_table(
+        dataset_id, "is",
+        columns=['Company', 'Symbol', 'Year'] + columns if columns else None,
+        filters=[('Symbol', 'in', companies), ('Year', 'in', years)]
+    )
     
     print(f"Retrieved income statement data from dataset with {len(df)} rows and {len(df.columns)} columns")
     print(f"Columns: {df.columns.tolist()}")
@@ -489,8 +503,11 @@ async def get_balance_sheet_data(
     """Get consolidated financial data"""
     _validate_dataset_access(dataset_id, current_user.user_id, db)
     
-    collector = collector_loader_service.load_dataset_collector(dataset_id)
-    df = collector.get_balance_sheets()
+    df = dataset_store_service.load_table(
+        dataset_id, "bs",
+        columns=['Company', 'Symbol', 'Year'] + columns if columns else None,
+        filters=[('Symbol', 'in', companies), ('Year', 'in', years)]
+    )
     
     print(f"Retrieved balance sheet data from dataset with {len(df)} rows and {len(df.columns)} columns")
     print(f"Columns: {df.columns.tolist()}")
@@ -532,8 +549,11 @@ async def get_cash_flow_statement_data(
     """Get consolidated financial data"""
     _validate_dataset_access(dataset_id, current_user.user_id, db)
     
-    collector = collector_loader_service.load_dataset_collector(dataset_id)
-    df = collector.get_cash_flows()
+    df = dataset_store_service.load_table(
+        dataset_id, "cf",
+        columns=['Company', 'Symbol', 'Year'] + columns if columns else None,
+        filters=[('Symbol', 'in', companies), ('Year', 'in', years)]
+    )
     
     print(f"Retrieved cash flow data from dataset with {len(df)} rows and {len(df.columns)} columns")
     print(f"Columns: {df.columns.tolist()}")
@@ -575,8 +595,11 @@ async def get_ratio_data(
     """Get consolidated financial data"""
     _validate_dataset_access(dataset_id, current_user.user_id, db)
     
-    collector = collector_loader_service.load_dataset_collector(dataset_id)
-    df = collector.get_ratios()
+    df = dataset_store_service.load_table(
+        dataset_id, "ratios",
+        columns=['Company', 'Symbol', 'Year'] + columns if columns else None,
+        filters=[('Symbol', 'in', companies), ('Year', 'in', years)]
+    )
     
     print(f"Retrieved ratios from dataset with {len(df)} rows and {len(df.columns)} columns")
     print(f"Columns: {df.columns.tolist()}")
@@ -618,8 +641,11 @@ async def get_key_metrics_data(
     """Get consolidated financial data"""
     _validate_dataset_access(dataset_id, current_user.user_id, db)
     
-    collector = collector_loader_service.load_dataset_collector(dataset_id)
-    df = collector.get_key_metrics()
+    df = dataset_store_service.load_table(
+        dataset_id, "metrics",
+        columns=['Company', 'Symbol', 'Year'] + columns if columns else None,
+        filters=[('Symbol', 'in', companies), ('Year', 'in', years)]
+    )
     
     print(f"Retrieved key metrics from dataset with {len(df)} rows and {len(df.columns)} columns")
     print(f"Columns: {df.columns.tolist()}")
@@ -661,8 +687,11 @@ async def get_enterprise_value_data(
     """Get consolidated financial data"""
     _validate_dataset_access(dataset_id, current_user.user_id, db)
     
-    collector = collector_loader_service.load_dataset_collector(dataset_id)
-    df = collector.get_enterprise_values()
+    df = dataset_store_service.load_table(
+        dataset_id, "ev",
+        columns=['Company', 'Symbol', 'Year'] + columns if columns else None,
+        filters=[('Symbol', 'in', companies), ('Year', 'in', years)]
+    )
     
     print(f"Retrieved enterprise value data from dataset with {len(df)} rows and {len(df.columns)} columns")
     print(f"Columns: {df.columns.tolist()}")
@@ -704,8 +733,11 @@ async def get_employee_historical_data(
     """Get consolidated financial data"""
     _validate_dataset_access(dataset_id, current_user.user_id, db)
     
-    collector = collector_loader_service.load_dataset_collector(dataset_id)
-    df = collector.get_employee_history()
+    df = dataset_store_service.load_table(
+        dataset_id, "employees",
+        columns=['Company', 'Symbol', 'Year'] + columns if columns else None,
+        filters=[('Symbol', 'in', companies), ('Year', 'in', years)]
+    )
     
     print(f"Retrieved employee historical data from dataset with {len(df)} rows and {len(df.columns)} columns")
     print(f"Columns: {df.columns.tolist()}")
@@ -747,8 +779,11 @@ async def get_insider_stat_data(
     """Get consolidated financial data"""
     _validate_dataset_access(dataset_id, current_user.user_id, db)
     
-    collector = collector_loader_service.load_dataset_collector(dataset_id)
-    df = collector.get_insider_statistics()
+    df = dataset_store_service.load_table(
+        dataset_id, "insiderstats",
+        columns=['Company', 'Symbol', 'Year'] + columns if columns else None,
+        filters=[('Symbol', 'in', companies), ('Year', 'in', years)]
+    )
     
     print(f"Retrieved insider statistics data from dataset with {len(df)} rows and {len(df.columns)} columns")
     print(f"Columns: {df.columns.tolist()}")
@@ -790,8 +825,12 @@ async def get_analyst_estimate_data(
     """Get consolidated financial data"""
     _validate_dataset_access(dataset_id, current_user.user_id, db)
     
-    collector = collector_loader_service.load_dataset_collector(dataset_id)
-    df = collector.get_analyst_estimates_only() # not using get_analyst_estimates which returns both estimates and targets
+    # not using get_analyst_estimates which returns both estimates and targets
+    df = dataset_store_service.load_table(
+        dataset_id, "analyst",
+        columns=['Company', 'Symbol', 'Year'] + columns if columns else None,
+        filters=[('Symbol', 'in', companies), ('Year', 'in', years)]
+    )
     
     print(f"Retrieved analyst estimate data from dataset with {len(df)} rows and {len(df.columns)} columns")
     print(f"Columns: {df.columns.tolist()}")
@@ -833,8 +872,11 @@ async def get_analyst_target_data(
     """Get consolidated financial data"""
     _validate_dataset_access(dataset_id, current_user.user_id, db)
     
-    collector = collector_loader_service.load_dataset_collector(dataset_id)
-    df = collector.get_price_targets()
+    df = dataset_store_service.load_table(
+        dataset_id, "targets",
+        columns=['Company', 'Symbol', 'Year'] + columns if columns else None,
+        filters=[('Symbol', 'in', companies), ('Year', 'in', years)]
+    )
     
     print(f"Retrieved analyst price target from dataset with {len(df)} rows and {len(df.columns)} columns")
     print(f"Columns: {df.columns.tolist()}")
@@ -876,8 +918,11 @@ async def get_analyst_coverage_data(
     """Get consolidated financial data"""
     _validate_dataset_access(dataset_id, current_user.user_id, db)
     
-    collector = collector_loader_service.load_dataset_collector(dataset_id)
-    df = collector.get_analyst_coverage_summary()
+    df = dataset_store_service.load_table(
+        dataset_id, "coverage",
+        columns=['Company', 'Symbol', 'Year'] + columns if columns else None,
+        filters=[('Symbol', 'in', companies), ('Year', 'in', years)]
+    )
     
     print(f"Retrieved analyst coverage data from dataset with {len(df)} rows and {len(df.columns)} columns")
     print(f"Columns: {df.columns.tolist()}")
@@ -920,8 +965,10 @@ async def get_daily_prices(
     """Get daily price data"""
     _validate_dataset_access(dataset_id, current_user.user_id, db)
     
-    collector = collector_loader_service.load_dataset_collector(dataset_id)
-    df = collector.get_prices_daily()
+    df = dataset_store_service.load_table(
+        dataset_id, "daily",
+        filters=[('symbol', 'in', symbols), ('date', '>=', start_date), ('date', '<=', end_date)]
+    )
     
     if symbols:
         df = df[df['symbol'].isin(symbols)]
@@ -961,8 +1008,10 @@ async def get_monthly_prices(
     """Get monthly price data"""
     _validate_dataset_access(dataset_id, current_user.user_id, db)
     
-    collector = collector_loader_service.load_dataset_collector(dataset_id)
-    df = collector.get_prices_monthly()
+    df = dataset_store_service.load_table(
+        dataset_id, "monthly",
+        filters=[('symbol', 'in', symbols), ('date', '>=', start_date), ('date', '<=', end_date)]
+    )
     
     if symbols:
         df = df[df['symbol'].isin(symbols)]
@@ -999,8 +1048,10 @@ async def get_sp500daily_prices(
     """Get daily price data"""
     _validate_dataset_access(dataset_id, current_user.user_id, db)
     
-    collector = collector_loader_service.load_dataset_collector(dataset_id)
-    df = collector.get_sp500_daily()
+    df = dataset_store_service.load_table(
+        dataset_id, "sp500d",
+        filters=[('symbol', 'in', symbols), ('date', '>=', start_date), ('date', '<=', end_date)]
+    )
     
     if symbols:
         df = df[df['symbol'].isin(symbols)]
@@ -1039,8 +1090,10 @@ async def get_sp500monthly_prices(
     """Get monthly price data"""
     _validate_dataset_access(dataset_id, current_user.user_id, db)
     
-    collector = collector_loader_service.load_dataset_collector(dataset_id)
-    df = collector.get_sp500_monthly()
+    df = dataset_store_service.load_table(
+        dataset_id, "sp500m",
+        filters=[('symbol', 'in', symbols), ('date', '>=', start_date), ('date', '<=', end_date)]
+    )
     
     if symbols:
         df = df[df['symbol'].isin(symbols)]
@@ -1076,8 +1129,10 @@ async def get_institutional_ownership(
     """Get institutional ownership data"""
     _validate_dataset_access(dataset_id, current_user.user_id, db)
     
-    collector = collector_loader_service.load_dataset_collector(dataset_id)
-    df = collector.get_institutional_ownership()
+    df = dataset_store_service.load_table(
+        dataset_id, "institutional",
+        filters=[('Symbol', 'in', companies)]
+    )
     
     if companies:
         df = df[df['Symbol'].isin(companies)]
@@ -1112,8 +1167,10 @@ async def get_insider_trading(
     """Get insider trading transactions"""
     _validate_dataset_access(dataset_id, current_user.user_id, db)
     
-    collector = collector_loader_service.load_dataset_collector(dataset_id)
-    df = collector.get_insider_trading_latest()
+    df = dataset_store_service.load_table(
+        dataset_id, "insider",
+        filters=[('Symbol', 'in', companies), ('transactionType', '==', transaction_type), ('transactionDate', '>=', start_date)]
+    )
     
     if companies:
         df = df[df['Symbol'].isin(companies)]
@@ -1153,8 +1210,11 @@ async def get_economic_data(
     """Get macroeconomic indicators"""
     _validate_dataset_access(dataset_id, current_user.user_id, db)
     
-    collector = collector_loader_service.load_dataset_collector(dataset_id)
-    df = collector.get_economic()
+    df = dataset_store_service.load_table(
+        dataset_id, "economic",
+        columns=['Year'] + indicators if indicators else None,
+        filters=[('Year', '>=', start_year), ('Year', '<=', end_year)]
+    )
     
     if start_year:
         df = df[df['Year'] >= start_year]
@@ -1188,14 +1248,16 @@ async def get_metadata(
     """Not dependent on dataset - get metadata about available data, needs fixing later to remove dataset_id"""
     _validate_dataset_access(dataset_id, current_user.user_id, db)
     
-    collector = collector_loader_service.load_dataset_collector(dataset_id)
-    financial_df = collector.get_all_financial_data()
+    financial_df = dataset_store_service.load_table(
+        dataset_id, "financial", columns=['Company', 'Symbol', 'Year']
+    )
+    metric_columns = dataset_store_service.table_columns(dataset_id, "financial") or financial_df.columns
     
     return {
         "companies": financial_df['Symbol'].unique().tolist(),
         "company_names": dict(zip(financial_df['Symbol'], financial_df['Company'])),
         "years": sorted(financial_df['Year'].unique().tolist()),
-        "available_metrics": [c for c in financial_df.columns if c not in ['Company', 'Symbol', 'Year', 'date', 'symbol']],
+        "available_metrics": [c for c in metric_columns if c not in ['Company', 'Symbol', 'Year', 'date', 'symbol']],
         "data_sources": [
             "financial",
             "income statement",
@@ -1229,14 +1291,16 @@ async def get_dataset_metadata(
     """Get metadata about available data"""
     _validate_dataset_access(dataset_id, current_user.user_id, db)
     
-    collector = collector_loader_service.load_dataset_collector(dataset_id)
-    financial_df = collector.get_all_financial_data()
+    financial_df = dataset_store_service.load_table(
+        dataset_id, "financial", columns=['Company', 'Symbol', 'Year']
+    )
+    metric_columns = dataset_store_service.table_columns(dataset_id, "financial") or financial_df.columns
     
     return {
         "companies": financial_df['Symbol'].unique().tolist(),
         "company_names": dict(zip(financial_df['Symbol'], financial_df['Company'])),
         "years": sorted(financial_df['Year'].unique().tolist()),
-        "available_metrics": [c for c in financial_df.columns if c not in ['Company', 'Symbol', 'Year', 'date', 'symbol']],
+        "available_metrics": [c for c in metric_columns if c not in ['Company', 'Symbol', 'Year', 'date', 'symbol']],
         "data_sources": [
             "financial",
             "income statement",
@@ -1381,19 +1445,21 @@ async def execute_saved_query(
     _validate_dataset_access(dataset_id, current_user.user_id, db)
     
     # Execute the query
-    collector = collector_loader_service.load_dataset_collector(dataset_id)
+    config = saved_query.query_config
     
     # Get data source
     data_source = saved_query.data_source
     data_source = data_source.lower()
     df = pd.DataFrame()
     try:
-        df = _get_df_for_data_source(collector, data_source)
+        df = _get_df_for_data_source(
+            dataset_id, data_source,
+            companies=config.get('companies'), years=config.get('years')
+        )
     except ValueError as e:
         raise HTTPException(400, str(e))
         
     # Apply saved query config
-    config = saved_query.query_config
     
     if config.get('filters'):
         df = _apply_filters(df, [DataFilter(**f) for f in config['filters']])
@@ -1495,11 +1561,13 @@ async def query_data(
     """Flexible data query with filtering, sorting, pagination"""
     _validate_dataset_access(dataset_id, current_user.user_id, db)
     
-    collector = collector_loader_service.load_dataset_collector(dataset_id)
     data_source = data_source.lower()
     df = pd.DataFrame()
     try:
-        df = _get_df_for_data_source(collector, data_source)
+        df = _get_df_for_data_source(
+            dataset_id, data_source,
+            companies=query.companies, years=query.years
+        )
     except ValueError as e:
         raise HTTPException(400, str(e))
             
@@ -2100,47 +2168,20 @@ def _apply_filters(df: pd.DataFrame, filters: List[DataFilter]) -> pd.DataFrame:
     
     return df
 
-def _get_df_for_data_source(collector: DatasetCollection, data_source: str) -> pd.DataFrame:
-    """Helper to get DataFrame for specific data source"""
-    if data_source == "financial":
-        return collector.get_all_financial_data()
-    elif data_source == "is":
-        return collector.get_income_statements()
-    elif data_source == "bs":
-        return collector.get_balance_sheets()
-    elif data_source == "cf":
-        return collector.get_cash_flows()
-    elif data_source == "ratios":
-        return collector.get_ratios()
-    elif data_source == "metrics":
-        return collector.get_key_metrics()
-    elif data_source == "ev":
-        return collector.get_enterprise_values()
-    elif data_source == "daily" or data_source == "prices daily" or data_source == "daily prices":
-        return collector.get_prices_daily()
-    elif data_source == "monthly" or data_source == "prices monthly" or data_source == "monthly prices":
-        return collector.get_prices_monthly()
-    elif data_source == "sp500d" or data_source == "s&p 500 daily" or data_source == "sp 500 daily":
-        return collector.get_sp500_daily()
-    elif data_source == "sp500m" or data_source == "s&p 500 monthly" or data_source == "sp 500 monthly":
-        return collector.get_sp500_monthly()
-    elif data_source == "institutional":
-        return collector.get_institutional_ownership()
-    elif data_source == "insider" or data_source == "insider trading":
-        return collector.get_insider_trading_latest()
-    elif data_source == "insider statistics" or data_source == "insiderstats":
-        return collector.get_insider_statistics()
-    elif data_source == "profiles":
-        return collector.get_profiles()
-    elif data_source == "employees":
-        return collector.get_employee_history()
-    elif data_source == "analyst":
-        return collector.get_analyst_estimates_only()
-    elif data_source == "targets":
-        return collector.get_price_targets()
-    elif data_source == "coverage":
-        return collector.get_analyst_coverage_summary()
-    elif data_source == "economic" or data_source == "economic indicators":
-        return collector.get_economic()
-    else:
-        raise ValueError(f"Invalid data_source: {data_source}")
\ No newline at end of file
+def _get_df_for_data_source(
+    dataset_id: str,
+    data_source: str,
+    companies: Optional[List[str]] = None,
+    years: Optional[List[int]] = None
+) -> pd.DataFrame:
+    """Helper to get DataFrame for specific data source, with company/year filters pushed down to the store"""
+    table = dataset_store_service.resolve_table(data_source)
+    
+    # Same symbol column choice as the DataFrame filter applied by the callers
+    stored_columns = dataset_store_service.table_columns(dataset_id, table) or []
+    symbol_col = 'Symbol' if 'Symbol' in stored_columns else 'symbol'
+    
+    return dataset_store_service.load_table(
+        dataset_id, table,
+        filters=[(symbol_col, 'in', companies), ('Year', 'in', years)]
+    )
\ No newline at end of file
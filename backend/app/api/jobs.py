@@ -0,0 +1,64 @@
+"""Background job status API endpoints"""
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from ..database import get_db
+from ..core.deps import get_current_user
+from ..models.user import User
+from ..models.job import Job
+from ..schemas.job import JobResponse
+from ..jobs import cancel_job, get_user_jobs
+
+router = APIRouter(prefix="/api/jobs", tags=["jobs"])
+
+
+def _get_user_job(db: Session, job_id: str, current_user: User) -> Job:
+    job = db.query(Job).filter(
+        Job.job_id == job_id,
+        Job.user_id == current_user.user_id
+    ).first()
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    return job
+
+@router.get("/", response_model=List[JobResponse])
+def list_jobs(
+    status_filter: Optional[str] = None,
+    resource_id: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """List the current user's recent jobs, optionally for one analysis/dataset"""
+    return get_user_jobs(db, current_user.user_id, status=status_filter, resource_id=resource_id)
+
+@router.get("/{job_id}", response_model=JobResponse)
+def get_job(
+    job_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get job status"""
+    return _get_user_job(db, job_id, current_user)
+
+@router.post("/{job_id}/cancel", response_model=JobResponse)
+def cancel(
+    job_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Cancel a job. Queued jobs are dropped at once; running ones stop
+    within a few seconds and their analysis/dataset can be started again.
+    """
+    job = _get_user_job(db, job_id, current_user)
+    try:
+        return cancel_job(db, job)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=str(e)
+        )
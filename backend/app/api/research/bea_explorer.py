@@ -178,7 +178,7 @@ class FixedAssetsTimeSeriesResponse(BaseModel):
 # ============================================================================
 
 @router.get("/nipa/tables", response_model=List[NIPATableResponse])
-async def get_nipa_tables(
+def get_nipa_tables(
     active_only: bool = True,
     db: Session = Depends(get_data_db)):
     """Get list of NIPA tables"""
@@ -209,7 +209,7 @@ async def get_nipa_tables(
 
 
 @router.get("/nipa/tables/{table_name}", response_model=NIPATableResponse)
-async def get_nipa_table(
+def get_nipa_table(
     table_name: str,
     db: Session = Depends(get_data_db)):
     """Get details of a specific NIPA table"""
@@ -238,7 +238,7 @@ async def get_nipa_table(
 
 
 @router.get("/nipa/tables/{table_name}/series", response_model=List[NIPASeriesResponse])
-async def get_nipa_table_series(
+def get_nipa_table_series(
     table_name: str,
     db: Session = Depends(get_data_db)):
     """Get all series for a NIPA table"""
@@ -271,7 +271,7 @@ async def get_nipa_table_series(
 
 
 @router.get("/nipa/series/{series_code}/data", response_model=NIPATimeSeriesResponse)
-async def get_nipa_series_data(
+def get_nipa_series_data(
     series_code: str,
     start_year: Optional[int] = None,
     end_year: Optional[int] = None,
@@ -322,7 +322,7 @@ async def get_nipa_series_data(
 
 
 @router.get("/nipa/headline")
-async def get_nipa_headline(db: Session = Depends(get_data_db)):
+def get_nipa_headline(db: Session = Depends(get_data_db)):
     """
     Get headline GDP data for Research portal dashboard.
     Returns current GDP growth, prior quarter, components contribution, and trend.
@@ -427,7 +427,7 @@ async def get_nipa_headline(db: Session = Depends(get_data_db)):
 # ============================================================================
 
 @router.get("/regional/tables", response_model=List[RegionalTableResponse])
-async def get_regional_tables(
+def get_regional_tables(
     active_only: bool = True,
     db: Session = Depends(get_data_db)):
     """Get list of Regional tables"""
@@ -456,7 +456,7 @@ async def get_regional_tables(
 
 
 @router.get("/regional/tables/{table_name}/linecodes", response_model=List[RegionalLineCodeResponse])
-async def get_regional_table_linecodes(
+def get_regional_table_linecodes(
     table_name: str,
     db: Session = Depends(get_data_db)):
     """Get all line codes for a Regional table"""
@@ -480,7 +480,7 @@ async def get_regional_table_linecodes(
 
 
 @router.get("/regional/geographies", response_model=List[RegionalGeoResponse])
-async def get_regional_geographies(
+def get_regional_geographies(
     geo_type: Optional[str] = None,
     search: Optional[str] = None,
     limit: int = Query(100, ge=1, le=1000),
@@ -505,7 +505,7 @@ async def get_regional_geographies(
 
 
 @router.get("/regional/data", response_model=RegionalTimeSeriesResponse)
-async def get_regional_data(
+def get_regional_data(
     table_name: str,
     line_code: int,
     geo_fips: str,
@@ -568,7 +568,7 @@ async def get_regional_data(
 
 
 @router.get("/regional/data/batch", response_model=RegionalBatchTimeSeriesResponse)
-async def get_regional_data_batch(
+def get_regional_data_batch(
     table_name: str,
     line_code: int,
     geo_fips_list: str = Query(..., description="Comma-separated list of geo_fips codes"),
@@ -653,7 +653,7 @@ async def get_regional_data_batch(
 
 
 @router.get("/regional/snapshot")
-async def get_regional_snapshot(
+def get_regional_snapshot(
     table_name: str = "SAGDP1",
     line_code: int = 1,
     geo_type: str = "State",
@@ -724,7 +724,7 @@ async def get_regional_snapshot(
 # ============================================================================
 
 @router.get("/gdpbyindustry/tables", response_model=List[GDPByIndustryTableResponse])
-async def get_gdpbyindustry_tables(
+def get_gdpbyindustry_tables(
     active_only: bool = True,
     db: Session = Depends(get_data_db)):
     """Get list of GDP by Industry tables"""
@@ -750,7 +750,7 @@ async def get_gdpbyindustry_tables(
 
 
 @router.get("/gdpbyindustry/industries", response_model=List[GDPByIndustryIndustryResponse])
-async def get_gdpbyindustry_industries(
+def get_gdpbyindustry_industries(
     active_only: bool = True,
     level: Optional[int] = None,
     db: Session = Depends(get_data_db)):
@@ -798,7 +798,7 @@ async def get_gdpbyindustry_industries(
 
 
 @router.get("/gdpbyindustry/data", response_model=GDPByIndustryTimeSeriesResponse)
-async def get_gdpbyindustry_data(
+def get_gdpbyindustry_data(
     table_id: int,
     industry_code: str,
     frequency: str = "A",
@@ -860,7 +860,7 @@ async def get_gdpbyindustry_data(
 
 
 @router.get("/gdpbyindustry/snapshot")
-async def get_gdpbyindustry_snapshot(
+def get_gdpbyindustry_snapshot(
     table_id: int = 1,
     frequency: str = "A",
     year: Optional[str] = None,
@@ -928,7 +928,7 @@ async def get_gdpbyindustry_snapshot(
 # ============================================================================
 
 @router.get("/ita/indicators", response_model=List[ITAIndicatorResponse])
-async def get_ita_indicators(
+def get_ita_indicators(
     active_only: bool = True,
     search: Optional[str] = None,
     db: Session = Depends(get_data_db)):
@@ -954,7 +954,7 @@ async def get_ita_indicators(
 
 
 @router.get("/ita/areas", response_model=List[ITAAreaResponse])
-async def get_ita_areas(
+def get_ita_areas(
     active_only: bool = True,
     area_type: Optional[str] = None,
     db: Session = Depends(get_data_db)):
@@ -978,7 +978,7 @@ async def get_ita_areas(
 
 
 @router.get("/ita/data", response_model=ITATimeSeriesResponse)
-async def get_ita_data(
+def get_ita_data(
     indicator_code: str,
     area_code: str = "AllCountries",
     frequency: str = "A",
@@ -1032,7 +1032,7 @@ async def get_ita_data(
 
 
 @router.get("/ita/headline")
-async def get_ita_headline(
+def get_ita_headline(
     frequency: str = "A",
     db: Session = Depends(get_data_db)):
     """Get headline ITA metrics (key balance indicators)"""
@@ -1064,7 +1064,7 @@ async def get_ita_headline(
 
 
 @router.get("/ita/snapshot")
-async def get_ita_snapshot(
+def get_ita_snapshot(
     indicator_code: str = "BalGds",
     frequency: str = "A",
     year: Optional[str] = None,
@@ -1131,7 +1131,7 @@ async def get_ita_snapshot(
 # ============================================================================
 
 @router.get("/fixedassets/tables", response_model=List[FixedAssetsTableResponse])
-async def get_fixedassets_tables(
+def get_fixedassets_tables(
     active_only: bool = True,
     db: Session = Depends(get_data_db)):
     """Get list of Fixed Assets tables"""
@@ -1159,7 +1159,7 @@ async def get_fixedassets_tables(
 
 
 @router.get("/fixedassets/tables/{table_name}/series", response_model=List[FixedAssetsSeriesResponse])
-async def get_fixedassets_table_series(
+def get_fixedassets_table_series(
     table_name: str,
     db: Session = Depends(get_data_db)):
     """Get all series for a Fixed Assets table"""
@@ -1192,7 +1192,7 @@ async def get_fixedassets_table_series(
 
 
 @router.get("/fixedassets/series/{series_code}/data", response_model=FixedAssetsTimeSeriesResponse)
-async def get_fixedassets_series_data(
+def get_fixedassets_series_data(
     series_code: str,
     start_year: Optional[int] = None,
     end_year: Optional[int] = None,
@@ -1228,7 +1228,7 @@ async def get_fixedassets_series_data(
 
 
 @router.get("/fixedassets/headline")
-async def get_fixedassets_headline(
+def get_fixedassets_headline(
     db: Session = Depends(get_data_db)):
     """Get headline Fixed Assets metrics"""
     headline_series = [
@@ -1269,7 +1269,7 @@ async def get_fixedassets_headline(
 
 
 @router.get("/fixedassets/snapshot")
-async def get_fixedassets_snapshot(
+def get_fixedassets_snapshot(
     table_name: str = "FAAt101",
     year: Optional[str] = None,
     db: Session = Depends(get_data_db)):
@@ -1330,7 +1330,7 @@ async def get_fixedassets_snapshot(
 # ============================================================================
 
 @router.get("/fixedassets/data/batch")
-async def get_fixedassets_data_batch(
+def get_fixedassets_data_batch(
     series_codes: str = Query(..., description="Comma-separated list of series codes"),
     start_year: Optional[int] = None,
     end_year: Optional[int] = None,
@@ -1391,7 +1391,7 @@ async def get_fixedassets_data_batch(
 
 
 @router.get("/nipa/data/batch")
-async def get_nipa_data_batch(
+def get_nipa_data_batch(
     series_codes: str = Query(..., description="Comma-separated list of series codes"),
     start_year: Optional[int] = None,
     end_year: Optional[int] = None,
@@ -1450,7 +1450,7 @@ async def get_nipa_data_batch(
 
 
 @router.get("/gdpbyindustry/data/batch")
-async def get_gdpbyindustry_data_batch(
+def get_gdpbyindustry_data_batch(
     table_id: int,
     industry_codes: str = Query(..., description="Comma-separated list of industry codes"),
     year_type: str = "A",
@@ -1525,7 +1525,7 @@ async def get_gdpbyindustry_data_batch(
 
 
 @router.get("/ita/data/batch")
-async def get_ita_data_batch(
+def get_ita_data_batch(
     indicator: str,
     area_codes: str = Query(..., description="Comma-separated list of area codes"),
     start_year: Optional[int] = None,
@@ -147,7 +147,7 @@ def _calculate_price_metrics(series_id: str, item_code: str, item_name: str,
 # =============================================================================
 
 @router.get("/dimensions", response_model=APDimensions)
-async def get_dimensions(
+def get_dimensions(
     db: Session = Depends(get_data_db),
     current_user = Depends(get_current_user)
 ):
@@ -208,7 +208,7 @@ async def get_dimensions(
 # =============================================================================
 
 @router.get("/series", response_model=APSeriesListResponse)
-async def get_series(
+def get_series(
     area_code: Optional[str] = Query(None, description="Filter by area code"),
     item_code: Optional[str] = Query(None, description="Filter by item code"),
     category: Optional[str] = Query(None, description="Filter by category"),
@@ -275,7 +275,7 @@ async def get_series(
 
 
 @router.get("/series/{series_id}/data", response_model=APSeriesData)
-async def get_series_data(
+def get_series_data(
     series_id: str,
     months: int = Query(60, ge=1, le=600, description="Number of months of data"),
     db: Session = Depends(get_data_db),
@@ -347,7 +347,7 @@ FEATURED_ITEMS = {
 
 
 @router.get("/overview", response_model=APOverviewResponse)
-async def get_overview(
+def get_overview(
     db: Session = Depends(get_data_db),
     current_user = Depends(get_current_user)
 ):
@@ -454,7 +454,7 @@ async def get_overview(
 # =============================================================================
 
 @router.get("/areas/compare", response_model=APAreaComparisonResponse)
-async def compare_areas(
+def compare_areas(
     item_code: str = Query(..., description="Item code to compare"),
     db: Session = Depends(get_data_db),
     current_user = Depends(get_current_user)
@@ -542,7 +542,7 @@ async def compare_areas(
 # =============================================================================
 
 @router.get("/items/analysis", response_model=APItemsAnalysisResponse)
-async def get_items_analysis(
+def get_items_analysis(
     category: str = Query(..., description="Category: Food, Gasoline, Household Fuels"),
     limit: int = Query(50, ge=1, le=200),
     db: Session = Depends(get_data_db),
@@ -643,7 +643,7 @@ async def get_items_analysis(
 # =============================================================================
 
 @router.get("/top-movers", response_model=APTopMoversResponse)
-async def get_top_movers(
+def get_top_movers(
     period: str = Query("mom", description="Period: 'mom' or 'yoy'"),
     category: Optional[str] = Query(None, description="Filter by category"),
     limit: int = Query(10, ge=1, le=50),
@@ -741,7 +741,7 @@ async def get_top_movers(
 # =============================================================================
 
 @router.get("/items/{item_code}/timeline", response_model=APItemTimelineResponse)
-async def get_item_timeline(
+def get_item_timeline(
     item_code: str,
     area_code: str = Query("0000", description="Area code (default: national)"),
     months: int = Query(60, ge=1, le=600),
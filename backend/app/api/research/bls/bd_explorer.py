@@ -84,7 +84,7 @@ ALL_DATACLASSES = ['01', '02', '03', '04', '05', '06', '07', '08']
 # ============================================================================
 
 @router.get("/dimensions", response_model=BDDimensions)
-async def get_dimensions(db: Session = Depends(get_data_db)):
+def get_dimensions(db: Session = Depends(get_data_db)):
     """Get available dimensions for filtering BD data"""
     # States
     states = db.execute(
@@ -167,7 +167,7 @@ async def get_dimensions(db: Session = Depends(get_data_db)):
 # ============================================================================
 
 @router.get("/series", response_model=BDSeriesListResponse)
-async def get_series(
+def get_series(
     state_code: Optional[str] = Query(None, description="Filter by state code"),
     industry_code: Optional[str] = Query(None, description="Filter by industry code"),
     dataclass_code: Optional[str] = Query(None, description="Filter by data class"),
@@ -279,7 +279,7 @@ async def get_series(
 
 
 @router.get("/series/{series_id}", response_model=BDSeriesInfo)
-async def get_series_detail(
+def get_series_detail(
     series_id: str,
     db: Session = Depends(get_data_db)
 ):
@@ -342,7 +342,7 @@ async def get_series_detail(
 
 
 @router.get("/data", response_model=BDDataResponse)
-async def get_data(
+def get_data(
     series_ids: str = Query(..., description="Comma-separated series IDs"),
     start_year: Optional[int] = Query(None),
     end_year: Optional[int] = Query(None),
@@ -451,7 +451,7 @@ async def get_data(
 # ============================================================================
 
 @router.get("/overview", response_model=BDOverviewResponse)
-async def get_overview(
+def get_overview(
     state_code: str = Query('00', description="State code (00 for US)"),
     industry_code: str = Query('000000', description="Industry code"),
     seasonal_code: str = Query('S', description="S=Seasonally adjusted, U=Unadjusted"),
@@ -636,7 +636,7 @@ async def get_overview(
 
 
 @router.get("/overview/timeline", response_model=BDOverviewTimelineResponse)
-async def get_overview_timeline(
+def get_overview_timeline(
     state_code: str = Query('00', description="State code"),
     industry_code: str = Query('000000', description="Industry code"),
     seasonal_code: str = Query('S'),
@@ -742,7 +742,7 @@ async def get_overview_timeline(
 # ============================================================================
 
 @router.get("/states/comparison", response_model=BDStateComparisonResponse)
-async def get_state_comparison(
+def get_state_comparison(
     industry_code: str = Query('000000'),
     seasonal_code: str = Query('S'),
     dataelement_code: str = Query('1', description="1=Employment, 2=Establishments"),
@@ -860,7 +860,7 @@ async def get_state_comparison(
 
 
 @router.get("/states/timeline", response_model=BDStateTimelineResponse)
-async def get_state_timeline(
+def get_state_timeline(
     state_codes: str = Query(..., description="Comma-separated state codes"),
     industry_code: str = Query('000000'),
     dataclass_code: str = Query('01', description="Data class (01=Gross Gains, 04=Gross Losses, etc.)"),
@@ -942,7 +942,7 @@ async def get_state_timeline(
 # ============================================================================
 
 @router.get("/industries/comparison", response_model=BDIndustryComparisonResponse)
-async def get_industry_comparison(
+def get_industry_comparison(
     state_code: str = Query('00'),
     seasonal_code: str = Query('S'),
     dataelement_code: str = Query('1'),
@@ -1060,7 +1060,7 @@ async def get_industry_comparison(
 
 
 @router.get("/industries/timeline", response_model=BDIndustryTimelineResponse)
-async def get_industry_timeline(
+def get_industry_timeline(
     industry_codes: str = Query(..., description="Comma-separated industry codes"),
     state_code: str = Query('00'),
     dataclass_code: str = Query('01'),
@@ -1145,7 +1145,7 @@ async def get_industry_timeline(
 # ============================================================================
 
 @router.get("/job-flow", response_model=BDJobFlowResponse)
-async def get_job_flow(
+def get_job_flow(
     state_code: str = Query('00'),
     industry_code: str = Query('000000'),
     seasonal_code: str = Query('S'),
@@ -1252,7 +1252,7 @@ async def get_job_flow(
 
 
 @router.get("/job-flow/timeline", response_model=BDJobFlowTimelineResponse)
-async def get_job_flow_timeline(
+def get_job_flow_timeline(
     state_code: str = Query('00'),
     industry_code: str = Query('000000'),
     seasonal_code: str = Query('S'),
@@ -1337,7 +1337,7 @@ async def get_job_flow_timeline(
 # ============================================================================
 
 @router.get("/size-class", response_model=BDSizeClassResponse)
-async def get_size_class_analysis(
+def get_size_class_analysis(
     sizeclass_type: str = Query('firm', description="'firm' (01-09) or 'empchange' (10+)"),
     seasonal_code: str = Query('S'),
     ratelevel_code: str = Query('L'),
@@ -1457,7 +1457,7 @@ async def get_size_class_analysis(
 
 
 @router.get("/size-class/timeline", response_model=BDSizeClassTimelineResponse)
-async def get_size_class_timeline(
+def get_size_class_timeline(
     sizeclass_codes: str = Query(..., description="Comma-separated size class codes"),
     dataclass_code: str = Query('01'),
     ratelevel_code: str = Query('L'),
@@ -1542,7 +1542,7 @@ async def get_size_class_timeline(
 # ============================================================================
 
 @router.get("/births-deaths", response_model=BDBirthsDeathsResponse)
-async def get_births_deaths(
+def get_births_deaths(
     state_code: str = Query('00'),
     industry_code: str = Query('000000'),
     seasonal_code: str = Query('S'),
@@ -1653,7 +1653,7 @@ async def get_births_deaths(
 
 
 @router.get("/births-deaths/timeline", response_model=BDBirthsDeathsTimelineResponse)
-async def get_births_deaths_timeline(
+def get_births_deaths_timeline(
     state_code: str = Query('00'),
     industry_code: str = Query('000000'),
     seasonal_code: str = Query('S'),
@@ -1744,7 +1744,7 @@ async def get_births_deaths_timeline(
 # ============================================================================
 
 @router.get("/top-movers", response_model=BDTopMoversResponse)
-async def get_top_movers(
+def get_top_movers(
     comparison_type: str = Query('state', description="'state' or 'industry'"),
     metric: str = Query('net_change', description="'gross_gains', 'gross_losses', 'net_change'"),
     ratelevel_code: str = Query('L'),
@@ -1933,7 +1933,7 @@ async def get_top_movers(
 # ============================================================================
 
 @router.get("/trend", response_model=BDTrendResponse)
-async def get_trend(
+def get_trend(
     state_code: str = Query('00'),
     industry_code: str = Query('000000'),
     dataclass_code: str = Query('01'),
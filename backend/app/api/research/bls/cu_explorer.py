@@ -282,7 +282,7 @@ def _calculate_inflation_metrics(series_id: str, item_name: str, db: Session) ->
 
 
 @router.get("/overview", response_model=CUOverviewResponse)
-@cached("bls:cu:overview", category=DataCategory.BLS_MONTHLY, param_keys=["area_code"])
+@cached("bls:cu:overview", category=DataCategory.BLS_MONTHLY, param_keys=["area_code"], local=True)
 def get_cu_overview(
     area_code: str = Query("0000", description="Area code (default: US City Average)"),
     current_user=Depends(get_current_user),
@@ -145,7 +145,7 @@ def _calculate_inflation_metric(series_id: str, item_code: str, item_name: str,
 # =============================================================================
 
 @router.get("/dimensions", response_model=CWDimensions)
-async def get_dimensions(
+def get_dimensions(
     db: Session = Depends(get_data_db),
     current_user = Depends(get_current_user)
 ):
@@ -196,7 +196,7 @@ async def get_dimensions(
 # =============================================================================
 
 @router.get("/series", response_model=CWSeriesListResponse)
-async def get_series(
+def get_series(
     area_code: Optional[str] = Query(None, description="Filter by area code"),
     item_code: Optional[str] = Query(None, description="Filter by item code"),
     seasonal_code: Optional[str] = Query(None, description="Filter by seasonal (S/U)"),
@@ -262,7 +262,7 @@ async def get_series(
 
 
 @router.get("/series/{series_id}/data", response_model=CWDataResponse)
-async def get_series_data(
+def get_series_data(
     series_id: str,
     months: int = Query(60, ge=1, le=600, description="Number of months of data"),
     db: Session = Depends(get_data_db),
@@ -318,7 +318,7 @@ async def get_series_data(
 # =============================================================================
 
 @router.get("/overview", response_model=CWOverviewResponse)
-async def get_overview(
+def get_overview(
     area_code: str = Query("0000", description="Area code (default: U.S. city average)"),
     db: Session = Depends(get_data_db),
     current_user = Depends(get_current_user)
@@ -374,7 +374,7 @@ async def get_overview(
 # =============================================================================
 
 @router.get("/overview/timeline", response_model=CWOverviewTimelineResponse)
-async def get_overview_timeline(
+def get_overview_timeline(
     area_code: str = Query("0000", description="Area code"),
     months_back: int = Query(24, ge=0, le=600, description="Months of history (0 = all)"),
     db: Session = Depends(get_data_db),
@@ -478,7 +478,7 @@ async def get_overview_timeline(
 # =============================================================================
 
 @router.get("/categories", response_model=CWCategoryAnalysisResponse)
-async def get_category_analysis(
+def get_category_analysis(
     area_code: str = Query("0000", description="Area code"),
     db: Session = Depends(get_data_db),
     current_user = Depends(get_current_user)
@@ -525,7 +525,7 @@ async def get_category_analysis(
 # =============================================================================
 
 @router.get("/categories/timeline", response_model=CWCategoryTimelineResponse)
-async def get_category_timeline(
+def get_category_timeline(
     area_code: str = Query("0000", description="Area code"),
     months_back: int = Query(24, ge=0, le=600, description="Months of history (0 = all)"),
     db: Session = Depends(get_data_db),
@@ -593,7 +593,7 @@ async def get_category_timeline(
 # =============================================================================
 
 @router.get("/areas/compare", response_model=CWAreaComparisonResponse)
-async def compare_areas(
+def compare_areas(
     item_code: str = Query("SA0", description="Item code to compare"),
     db: Session = Depends(get_data_db),
     current_user = Depends(get_current_user)
@@ -644,7 +644,7 @@ async def compare_areas(
 # =============================================================================
 
 @router.get("/top-movers", response_model=CWTopMoversResponse)
-async def get_top_movers(
+def get_top_movers(
     period: str = Query("yoy", description="Period: 'mom' or 'yoy'"),
     area_code: str = Query("0000", description="Area code"),
     limit: int = Query(10, ge=1, le=50),
@@ -68,7 +68,7 @@ MAJOR_GROUPS = ['000', '110', '120', '130', '200', '210', '240']
 # ============================================================================
 
 @router.get("/dimensions", response_model=ECDimensions)
-async def get_dimensions(db: Session = Depends(get_data_db)):
+def get_dimensions(db: Session = Depends(get_data_db)):
     """Get available dimensions for filtering EC data"""
     # Compensation types
     compensations = db.execute(
@@ -115,7 +115,7 @@ async def get_dimensions(db: Session = Depends(get_data_db)):
 # ============================================================================
 
 @router.get("/series", response_model=ECSeriesListResponse)
-async def get_series(
+def get_series(
     comp_code: Optional[str] = Query(None, description="Filter by compensation type"),
     group_code: Optional[str] = Query(None, description="Filter by worker group"),
     ownership_code: Optional[str] = Query(None, description="Filter by ownership type"),
@@ -214,7 +214,7 @@ async def get_series(
 
 
 @router.get("/series/{series_id}/data", response_model=ECDataResponse)
-async def get_series_data(
+def get_series_data(
     series_id: str,
     start_year: Optional[int] = Query(None),
     end_year: Optional[int] = Query(None),
@@ -277,7 +277,7 @@ async def get_series_data(
 # ============================================================================
 
 @router.get("/overview", response_model=ECOverviewResponse)
-async def get_overview(
+def get_overview(
     ownership_code: str = Query("2", description="Ownership type (1=Civilian, 2=Private, 3=State/local)"),
     db: Session = Depends(get_data_db)
 ):
@@ -422,7 +422,7 @@ async def get_overview(
 # ============================================================================
 
 @router.get("/timeline", response_model=ECTimelineResponse)
-async def get_timeline(
+def get_timeline(
     ownership_code: str = Query("2", description="Ownership type"),
     periodicity_code: str = Query("I", description="I=Index, Q=3-month %, A=12-month %"),
     years: int = Query(10, description="Number of years"),
@@ -500,7 +500,7 @@ async def get_timeline(
 # ============================================================================
 
 @router.get("/groups", response_model=ECGroupAnalysisResponse)
-async def get_groups(
+def get_groups(
     ownership_code: str = Query("2", description="Ownership type"),
     comp_code: str = Query("1", description="Compensation type (1/2/3)"),
     db: Session = Depends(get_data_db)
@@ -581,7 +581,7 @@ async def get_groups(
 
 
 @router.get("/groups/timeline", response_model=ECGroupTimelineResponse)
-async def get_groups_timeline(
+def get_groups_timeline(
     ownership_code: str = Query("2"),
     comp_code: str = Query("1"),
     periodicity_code: str = Query("I"),
@@ -681,7 +681,7 @@ async def get_groups_timeline(
 # ============================================================================
 
 @router.get("/ownership-comparison", response_model=ECOwnershipComparisonResponse)
-async def get_ownership_comparison(
+def get_ownership_comparison(
     comp_code: str = Query("1", description="Compensation type"),
     group_code: str = Query("000", description="Worker group"),
     db: Session = Depends(get_data_db)
@@ -760,7 +760,7 @@ async def get_ownership_comparison(
 
 
 @router.get("/ownership-comparison/timeline", response_model=ECOwnershipTimelineResponse)
-async def get_ownership_timeline(
+def get_ownership_timeline(
     comp_code: str = Query("1"),
     periodicity_code: str = Query("I"),
     years: int = Query(10),
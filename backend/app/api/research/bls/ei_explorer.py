@@ -90,7 +90,7 @@ KEY_EXPORT_EX_FUEL = 'EIUIQEXFUELS'  # Exports ex fuel
 # ============================================================================
 
 @router.get("/dimensions", response_model=EIDimensions)
-async def get_dimensions(db: Session = Depends(get_data_db)):
+def get_dimensions(db: Session = Depends(get_data_db)):
     """Get available dimensions for filtering EI data"""
     # Get all indexes
     indexes = db.execute(
@@ -190,7 +190,7 @@ async def get_dimensions(db: Session = Depends(get_data_db)):
 # ============================================================================
 
 @router.get("/series", response_model=EISeriesListResponse)
-async def get_series(
+def get_series(
     index_code: Optional[str] = Query(None, description="Filter by index code (IR, IQ, CO, CD, etc.)"),
     search: Optional[str] = Query(None, description="Search in series name/title"),
     country: Optional[str] = Query(None, description="Filter by country/region name"),
@@ -260,7 +260,7 @@ async def get_series(
 
 
 @router.get("/series/{series_id}", response_model=EISeriesInfo)
-async def get_series_by_id(series_id: str, db: Session = Depends(get_data_db)):
+def get_series_by_id(series_id: str, db: Session = Depends(get_data_db)):
     """Get a specific series by ID"""
     result = db.execute(
         select(EISeries, EIIndex.index_name).join(
@@ -297,7 +297,7 @@ async def get_series_by_id(series_id: str, db: Session = Depends(get_data_db)):
 # ============================================================================
 
 @router.get("/data", response_model=EIDataResponse)
-async def get_data(
+def get_data(
     series_ids: str = Query(..., description="Comma-separated series IDs"),
     start_year: Optional[int] = Query(None),
     end_year: Optional[int] = Query(None),
@@ -374,7 +374,7 @@ async def get_data(
 # ============================================================================
 
 @router.get("/overview", response_model=EIOverviewResponse)
-async def get_overview(
+def get_overview(
     year: Optional[int] = Query(None),
     period: Optional[str] = Query(None),
     db: Session = Depends(get_data_db)
@@ -490,7 +490,7 @@ async def get_overview(
 
 
 @router.get("/overview/timeline", response_model=EIOverviewTimelineResponse)
-async def get_overview_timeline(
+def get_overview_timeline(
     start_year: Optional[int] = Query(None),
     db: Session = Depends(get_data_db)
 ):
@@ -568,7 +568,7 @@ async def get_overview_timeline(
 # ============================================================================
 
 @router.get("/countries/comparison", response_model=EICountryComparisonResponse)
-async def get_country_comparison(
+def get_country_comparison(
     direction: str = Query("import", description="'import' (CO) or 'export' (CD)"),
     industry: Optional[str] = Query("All Industries", description="Industry filter"),
     year: Optional[int] = Query(None),
@@ -688,7 +688,7 @@ async def get_country_comparison(
 
 
 @router.get("/countries/timeline", response_model=EICountryTimelineResponse)
-async def get_country_timeline(
+def get_country_timeline(
     country_codes: str = Query(..., description="Comma-separated country names"),
     direction: str = Query("import", description="'import' (CO) or 'export' (CD)"),
     industry: Optional[str] = Query("All Industries"),
@@ -766,7 +766,7 @@ async def get_country_timeline(
 # ============================================================================
 
 @router.get("/trade-flow", response_model=EITradeFlowResponse)
-async def get_trade_flow(
+def get_trade_flow(
     year: Optional[int] = Query(None),
     period: Optional[str] = Query(None),
     db: Session = Depends(get_data_db)
@@ -907,7 +907,7 @@ async def get_trade_flow(
 
 
 @router.get("/trade-balance", response_model=EITradeBalanceResponse)
-async def get_trade_balance(
+def get_trade_balance(
     year: Optional[int] = Query(None),
     period: Optional[str] = Query(None),
     db: Session = Depends(get_data_db)
@@ -969,7 +969,7 @@ async def get_trade_balance(
 
 
 @router.get("/trade-balance/timeline", response_model=EITradeBalanceTimelineResponse)
-async def get_trade_balance_timeline(
+def get_trade_balance_timeline(
     country: str = Query(..., description="Country name"),
     start_year: Optional[int] = Query(None),
     db: Session = Depends(get_data_db)
@@ -1042,7 +1042,7 @@ async def get_trade_balance_timeline(
 # ============================================================================
 
 @router.get("/categories", response_model=EIIndexCategoryResponse)
-async def get_index_categories(
+def get_index_categories(
     direction: str = Query("import", description="'import' or 'export'"),
     classification: str = Query("BEA", description="'BEA', 'NAICS', or 'Harmonized'"),
     year: Optional[int] = Query(None),
@@ -1139,7 +1139,7 @@ async def get_index_categories(
 
 
 @router.get("/categories/timeline", response_model=EIIndexCategoryTimelineResponse)
-async def get_index_category_timeline(
+def get_index_category_timeline(
     series_ids: str = Query(..., description="Comma-separated series IDs"),
     direction: str = Query("import"),
     classification: str = Query("BEA"),
@@ -1206,7 +1206,7 @@ async def get_index_category_timeline(
 # ============================================================================
 
 @router.get("/services", response_model=EIServicesResponse)
-async def get_services(
+def get_services(
     year: Optional[int] = Query(None),
     period: Optional[str] = Query(None),
     db: Session = Depends(get_data_db)
@@ -1289,7 +1289,7 @@ async def get_services(
 # ============================================================================
 
 @router.get("/terms-of-trade", response_model=EITermsOfTradeResponse)
-async def get_terms_of_trade(
+def get_terms_of_trade(
     year: Optional[int] = Query(None),
     period: Optional[str] = Query(None),
     db: Session = Depends(get_data_db)
@@ -1361,7 +1361,7 @@ async def get_terms_of_trade(
 
 
 @router.get("/terms-of-trade/timeline", response_model=EITermsOfTradeTimelineResponse)
-async def get_terms_of_trade_timeline(
+def get_terms_of_trade_timeline(
     series_ids: Optional[str] = Query(None, description="Comma-separated series IDs"),
     start_year: Optional[int] = Query(None),
     db: Session = Depends(get_data_db)
@@ -1436,7 +1436,7 @@ async def get_terms_of_trade_timeline(
 # ============================================================================
 
 @router.get("/trend", response_model=EITrendResponse)
-async def get_trend(
+def get_trend(
     series_id: str = Query(...),
     start_year: Optional[int] = Query(None),
     db: Session = Depends(get_data_db)
@@ -1523,7 +1523,7 @@ async def get_trend(
 # ============================================================================
 
 @router.get("/top-movers", response_model=EITopMoversResponse)
-async def get_top_movers(
+def get_top_movers(
     direction: str = Query("all", description="'import', 'export', or 'all'"),
     metric: str = Query("yoy_change", description="'mom_change' or 'yoy_change'"),
     limit: int = Query(10),
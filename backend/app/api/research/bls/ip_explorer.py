@@ -84,7 +84,7 @@ DURATION_PERCENT_CHANGE = '1'  # Annual percent change
 # ============================================================================
 
 @router.get("/dimensions", response_model=IPDimensions)
-async def get_dimensions(db: Session = Depends(get_data_db)):
+def get_dimensions(db: Session = Depends(get_data_db)):
     """Get available dimensions for filtering IP data"""
     # Sectors
     sectors = db.execute(
@@ -148,7 +148,7 @@ async def get_dimensions(db: Session = Depends(get_data_db)):
 # ============================================================================
 
 @router.get("/series", response_model=IPSeriesListResponse)
-async def get_series(
+def get_series(
     sector_code: Optional[str] = Query(None, description="Sector code filter"),
     industry_code: Optional[str] = Query(None, description="Industry code filter"),
     measure_code: Optional[str] = Query(None, description="Measure code filter"),
@@ -240,7 +240,7 @@ async def get_series(
 
 
 @router.get("/series/{series_id}/data", response_model=IPDataResponse)
-async def get_series_data(
+def get_series_data(
     series_id: str,
     start_year: Optional[int] = Query(None, description="Start year filter"),
     end_year: Optional[int] = Query(None, description="End year filter"),
@@ -333,7 +333,7 @@ async def get_series_data(
 # ============================================================================
 
 @router.get("/overview", response_model=IPOverviewResponse)
-async def get_overview(
+def get_overview(
     year: Optional[int] = Query(None, description="Year for overview (defaults to latest)"),
     db: Session = Depends(get_data_db)
 ):
@@ -475,7 +475,7 @@ async def get_overview(
 
 
 @router.get("/overview/timeline", response_model=IPOverviewTimelineResponse)
-async def get_overview_timeline(
+def get_overview_timeline(
     measure_code: str = Query(MEASURE_LABOR_PRODUCTIVITY, description="Measure to track"),
     duration_code: str = Query(DURATION_INDEX, description="Duration code (0=Index, 1=% change)"),
     start_year: Optional[int] = Query(None, description="Start year"),
@@ -575,7 +575,7 @@ async def get_overview_timeline(
 # ============================================================================
 
 @router.get("/sectors/{sector_code}", response_model=IPSectorAnalysisResponse)
-async def get_sector_analysis(
+def get_sector_analysis(
     sector_code: str,
     year: Optional[int] = Query(None, description="Year for analysis"),
     display_level: int = Query(2, description="Industry hierarchy level (1-5)"),
@@ -711,7 +711,7 @@ async def get_sector_analysis(
 
 
 @router.get("/sectors/{sector_code}/timeline", response_model=IPSectorTimelineResponse)
-async def get_sector_timeline(
+def get_sector_timeline(
     sector_code: str,
     measure_code: str = Query(MEASURE_LABOR_PRODUCTIVITY, description="Measure to track"),
     industry_codes: str = Query(..., description="Comma-separated industry codes"),
@@ -813,7 +813,7 @@ async def get_sector_timeline(
 # ============================================================================
 
 @router.get("/industries/{industry_code}", response_model=IPIndustryAnalysisResponse)
-async def get_industry_analysis(
+def get_industry_analysis(
     industry_code: str,
     year: Optional[int] = Query(None, description="Year for analysis"),
     db: Session = Depends(get_data_db)
@@ -924,7 +924,7 @@ async def get_industry_analysis(
 
 
 @router.get("/industries/{industry_code}/timeline", response_model=IPIndustryTimelineResponse)
-async def get_industry_timeline(
+def get_industry_timeline(
     industry_code: str,
     measure_codes: str = Query(..., description="Comma-separated measure codes"),
     start_year: Optional[int] = Query(None, description="Start year"),
@@ -1016,7 +1016,7 @@ async def get_industry_timeline(
 # ============================================================================
 
 @router.get("/measures/{measure_code}", response_model=IPMeasureComparisonResponse)
-async def get_measure_comparison(
+def get_measure_comparison(
     measure_code: str,
     sector_code: Optional[str] = Query(None, description="Filter by sector"),
     display_level: int = Query(2, description="Industry hierarchy level"),
@@ -1135,7 +1135,7 @@ async def get_measure_comparison(
 
 
 @router.get("/measures/{measure_code}/timeline", response_model=IPMeasureTimelineResponse)
-async def get_measure_timeline(
+def get_measure_timeline(
     measure_code: str,
     industry_codes: str = Query(..., description="Comma-separated industry codes"),
     start_year: Optional[int] = Query(None, description="Start year"),
@@ -1227,7 +1227,7 @@ async def get_measure_timeline(
 # ============================================================================
 
 @router.get("/top-rankings", response_model=IPTopRankingsResponse)
-async def get_top_rankings(
+def get_top_rankings(
     ranking_type: str = Query("highest", description="'highest', 'lowest', 'fastest_growing', 'fastest_declining'"),
     measure_code: str = Query(MEASURE_LABOR_PRODUCTIVITY, description="Measure to rank by"),
     sector_code: Optional[str] = Query(None, description="Filter by sector"),
@@ -1398,7 +1398,7 @@ async def get_top_rankings(
 # ============================================================================
 
 @router.get("/productivity-vs-costs", response_model=IPProductivityVsCostsResponse)
-async def get_productivity_vs_costs(
+def get_productivity_vs_costs(
     sector_code: Optional[str] = Query(None, description="Filter by sector"),
     display_level: int = Query(2, description="Industry hierarchy level"),
     year: Optional[int] = Query(None, description="Year for comparison"),
@@ -1539,7 +1539,7 @@ async def get_productivity_vs_costs(
 
 
 @router.get("/productivity-vs-costs/timeline", response_model=IPProductivityVsCostsTimelineResponse)
-async def get_productivity_vs_costs_timeline(
+def get_productivity_vs_costs_timeline(
     industry_code: str = Query(..., description="Industry code"),
     start_year: Optional[int] = Query(None, description="Start year"),
     end_year: Optional[int] = Query(None, description="End year"),
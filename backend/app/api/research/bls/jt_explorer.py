@@ -155,7 +155,7 @@ def _calculate_jolts_metric(
 # =============================================================================
 
 @router.get("/dimensions", response_model=JTDimensions)
-async def get_dimensions(
+def get_dimensions(
     db: Session = Depends(get_data_db),
     current_user = Depends(get_current_user)
 ):
@@ -230,7 +230,7 @@ async def get_dimensions(
 # =============================================================================
 
 @router.get("/series", response_model=JTSeriesListResponse)
-async def get_series(
+def get_series(
     industry_code: Optional[str] = Query(None, description="Filter by industry"),
     state_code: Optional[str] = Query(None, description="Filter by state/region"),
     dataelement_code: Optional[str] = Query(None, description="Filter by data element (JO/HI/TS/QU/LD)"),
@@ -323,7 +323,7 @@ async def get_series(
 
 
 @router.get("/series/{series_id}/data", response_model=JTDataResponse)
-async def get_series_data(
+def get_series_data(
     series_id: str,
     months: int = Query(60, ge=1, le=600, description="Number of months of data"),
     db: Session = Depends(get_data_db),
@@ -387,7 +387,7 @@ async def get_series_data(
 
 @router.get("/overview", response_model=JTOverviewResponse)
 @cached("bls:jt:overview", category=DataCategory.BLS_MONTHLY, param_keys=["industry_code", "state_code"])
-async def get_overview(
+def get_overview(
     industry_code: str = Query("000000", description="Industry code (default: Total nonfarm)"),
     state_code: str = Query("00", description="State/region code (default: Total US)"),
     db: Session = Depends(get_data_db),
@@ -427,7 +427,7 @@ async def get_overview(
 
 
 @router.get("/overview/timeline", response_model=JTOverviewTimelineResponse)
-async def get_overview_timeline(
+def get_overview_timeline(
     industry_code: str = Query("000000", description="Industry code"),
     state_code: str = Query("00", description="State/region code"),
     months: int = Query(60, ge=12, le=300, description="Number of months"),
@@ -512,7 +512,7 @@ async def get_overview_timeline(
 # =============================================================================
 
 @router.get("/industries", response_model=JTIndustryAnalysisResponse)
-async def get_industry_analysis(
+def get_industry_analysis(
     state_code: str = Query("00", description="State/region code"),
     db: Session = Depends(get_data_db),
     current_user = Depends(get_current_user)
@@ -563,7 +563,7 @@ async def get_industry_analysis(
 
 
 @router.get("/industries/timeline", response_model=JTIndustryTimelineResponse)
-async def get_industry_timeline(
+def get_industry_timeline(
     dataelement_code: str = Query("JO", description="Data element (JO/HI/TS/QU/LD)"),
     ratelevel_code: str = Query("R", description="Rate (R) or Level (L)"),
     state_code: str = Query("00", description="State/region code"),
@@ -645,7 +645,7 @@ async def get_industry_timeline(
 # =============================================================================
 
 @router.get("/regions", response_model=JTRegionAnalysisResponse)
-async def get_region_analysis(
+def get_region_analysis(
     industry_code: str = Query("000000", description="Industry code"),
     db: Session = Depends(get_data_db),
     current_user = Depends(get_current_user)
@@ -693,7 +693,7 @@ async def get_region_analysis(
 
 
 @router.get("/regions/timeline", response_model=JTRegionTimelineResponse)
-async def get_region_timeline(
+def get_region_timeline(
     dataelement_code: str = Query("JO", description="Data element"),
     ratelevel_code: str = Query("R", description="Rate or Level"),
     industry_code: str = Query("000000", description="Industry code"),
@@ -773,7 +773,7 @@ async def get_region_timeline(
 # =============================================================================
 
 @router.get("/sizeclasses", response_model=JTSizeClassAnalysisResponse)
-async def get_sizeclass_analysis(
+def get_sizeclass_analysis(
     industry_code: str = Query("000000", description="Industry code (only Total nonfarm has size class data)"),
     db: Session = Depends(get_data_db),
     current_user = Depends(get_current_user)
@@ -855,7 +855,7 @@ async def get_sizeclass_analysis(
 
 
 @router.get("/sizeclasses/timeline", response_model=JTSizeClassTimelineResponse)
-async def get_sizeclass_timeline(
+def get_sizeclass_timeline(
     dataelement_code: str = Query("JO", description="Data element"),
     ratelevel_code: str = Query("R", description="Rate or Level"),
     months: int = Query(60, ge=12, le=300),
@@ -933,7 +933,7 @@ async def get_sizeclass_timeline(
 # =============================================================================
 
 @router.get("/top-movers", response_model=JTTopMoversResponse)
-async def get_top_movers(
+def get_top_movers(
     dataelement_code: str = Query("JO", description="Data element"),
     period: str = Query("yoy", description="Period: 'mom' or 'yoy'"),
     limit: int = Query(10, ge=1, le=20),
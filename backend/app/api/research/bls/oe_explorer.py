@@ -73,7 +73,7 @@ MAJOR_OCCUPATION_GROUPS = [
 # ============================================================================
 
 @router.get("/dimensions", response_model=OEDimensions)
-async def get_dimensions(db: Session = Depends(get_data_db)):
+def get_dimensions(db: Session = Depends(get_data_db)):
     """Get available dimensions for filtering OE data"""
     # Area types
     area_types = db.execute(
@@ -145,7 +145,7 @@ async def get_dimensions(db: Session = Depends(get_data_db)):
 # ============================================================================
 
 @router.get("/series", response_model=OESeriesListResponse)
-async def get_series(
+def get_series(
     occupation_code: Optional[str] = Query(None, description="Filter by occupation code"),
     area_code: Optional[str] = Query(None, description="Filter by area code"),
     state_code: Optional[str] = Query(None, description="Filter by state code"),
@@ -276,7 +276,7 @@ async def get_series(
 
 
 @router.get("/series/{series_id}/data", response_model=OEDataResponse)
-async def get_series_data(
+def get_series_data(
     series_id: str,
     years: int = Query(10, description="Number of years to retrieve"),
     db: Session = Depends(get_data_db)
@@ -360,7 +360,7 @@ async def get_series_data(
 # ============================================================================
 
 @router.get("/overview", response_model=OEOverviewResponse)
-async def get_overview(
+def get_overview(
     area_code: str = Query("0000000", description="Area code (0000000=National)"),
     db: Session = Depends(get_data_db)
 ):
@@ -483,7 +483,7 @@ async def get_overview(
 
 
 @router.get("/overview/timeline", response_model=OEOverviewTimelineResponse)
-async def get_overview_timeline(
+def get_overview_timeline(
     area_code: str = Query("0000000", description="Area code"),
     datatype: str = Query("employment", description="employment or annual_mean"),
     years: int = Query(10, description="Number of years"),
@@ -554,7 +554,7 @@ async def get_overview_timeline(
 # ============================================================================
 
 @router.get("/occupations", response_model=OEOccupationAnalysisResponse)
-async def get_occupations(
+def get_occupations(
     area_code: str = Query("0000000", description="Area code"),
     industry_code: str = Query("000000", description="Industry code"),
     major_group: Optional[str] = Query(None, description="Filter by major group (e.g., 11 for Management)"),
@@ -674,7 +674,7 @@ async def get_occupations(
 
 
 @router.get("/occupations/timeline", response_model=OEOccupationTimelineResponse)
-async def get_occupations_timeline(
+def get_occupations_timeline(
     area_code: str = Query("0000000"),
     industry_code: str = Query("000000"),
     datatype: str = Query("employment", description="employment, annual_mean, hourly_mean"),
@@ -755,7 +755,7 @@ async def get_occupations_timeline(
 # ============================================================================
 
 @router.get("/states", response_model=OEStateComparisonResponse)
-async def get_states(
+def get_states(
     occupation_code: str = Query("000000", description="Occupation code"),
     db: Session = Depends(get_data_db)
 ):
@@ -855,7 +855,7 @@ async def get_states(
 
 
 @router.get("/states/timeline", response_model=OEStateTimelineResponse)
-async def get_states_timeline(
+def get_states_timeline(
     occupation_code: str = Query("000000"),
     datatype: str = Query("annual_mean", description="employment, annual_mean, hourly_mean"),
     state_codes: Optional[str] = Query(None, description="Comma-separated state codes"),
@@ -961,7 +961,7 @@ async def get_states_timeline(
 # ============================================================================
 
 @router.get("/industries", response_model=OEIndustryAnalysisResponse)
-async def get_industries(
+def get_industries(
     occupation_code: str = Query("000000", description="Occupation code"),
     sector_code: Optional[str] = Query(None, description="Filter by sector"),
     limit: int = Query(50, le=200),
@@ -1064,7 +1064,7 @@ async def get_industries(
 
 
 @router.get("/industries/timeline", response_model=OEIndustryTimelineResponse)
-async def get_industries_timeline(
+def get_industries_timeline(
     occupation_code: str = Query("000000"),
     datatype: str = Query("annual_mean"),
     industry_codes: Optional[str] = Query(None, description="Comma-separated industry codes"),
@@ -1153,7 +1153,7 @@ async def get_industries_timeline(
 # ============================================================================
 
 @router.get("/top-rankings", response_model=OETopRankingsResponse)
-async def get_top_rankings(
+def get_top_rankings(
     area_code: str = Query("0000000", description="Area code"),
     ranking_type: str = Query("highest_paying", description="highest_paying, most_employed, highest_lq"),
     limit: int = Query(20, le=50),
@@ -1225,7 +1225,7 @@ async def get_top_rankings(
 # ============================================================================
 
 @router.get("/top-movers", response_model=OETopMoversResponse)
-async def get_top_movers(
+def get_top_movers(
     area_code: str = Query("0000000", description="Area code"),
     metric: str = Query("annual_mean", description="employment or annual_mean"),
     limit: int = Query(10, le=25),
@@ -1360,7 +1360,7 @@ async def get_top_movers(
 # ============================================================================
 
 @router.get("/wage-distribution", response_model=OEWageDistributionResponse)
-async def get_wage_distribution(
+def get_wage_distribution(
     occupation_code: str = Query(..., description="Occupation code"),
     area_code: str = Query("0000000", description="Area code"),
     db: Session = Depends(get_data_db)
@@ -1428,7 +1428,7 @@ async def get_wage_distribution(
 # ============================================================================
 
 @router.get("/occupation-profile", response_model=OEOccupationProfileResponse)
-async def get_occupation_profile(
+def get_occupation_profile(
     occupation_code: str = Query(..., description="Occupation code"),
     area_code: str = Query("0000000", description="Area code"),
     industry_code: str = Query("000000", description="Industry code"),
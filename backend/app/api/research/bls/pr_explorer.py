@@ -87,7 +87,7 @@ MANUFACTURING_SECTORS = ['3000', '3100', '3200']
 # ============================================================================
 
 @router.get("/dimensions", response_model=PRDimensions)
-async def get_dimensions(db: Session = Depends(get_data_db)):
+def get_dimensions(db: Session = Depends(get_data_db)):
     """Get available dimensions for filtering PR data"""
     # Get sectors
     sectors = db.execute(
@@ -134,7 +134,7 @@ async def get_dimensions(db: Session = Depends(get_data_db)):
 # ============================================================================
 
 @router.get("/series", response_model=PRSeriesListResponse)
-async def get_series(
+def get_series(
     sector_code: Optional[str] = Query(None, description="Filter by sector code"),
     class_code: Optional[str] = Query(None, description="Filter by class code"),
     measure_code: Optional[str] = Query(None, description="Filter by measure code"),
@@ -237,7 +237,7 @@ async def get_series(
 
 
 @router.get("/series/{series_id}/data", response_model=PRDataResponse)
-async def get_series_data(
+def get_series_data(
     series_id: str,
     years: int = Query(0, description="Number of years to retrieve (0=all)"),
     period_type: str = Query("quarterly", description="quarterly, annual, or all"),
@@ -329,7 +329,7 @@ async def get_series_data(
 # ============================================================================
 
 @router.get("/overview", response_model=PROverviewResponse)
-async def get_overview(
+def get_overview(
     class_code: str = Query("6", description="Class code (5=All persons, 6=Employees)"),
     period_type: str = Query("quarterly", description="quarterly or annual"),
     db: Session = Depends(get_data_db)
@@ -444,7 +444,7 @@ async def get_overview(
 
 
 @router.get("/overview/timeline", response_model=PROverviewTimelineResponse)
-async def get_overview_timeline(
+def get_overview_timeline(
     measure: str = Query("labor_productivity", description="labor_productivity, unit_labor_costs, output, compensation"),
     duration: str = Query("index", description="index or pct_change"),
     class_code: str = Query("6", description="Class code"),
@@ -546,7 +546,7 @@ async def get_overview_timeline(
 # ============================================================================
 
 @router.get("/sectors/{sector_code}", response_model=PRSectorAnalysisResponse)
-async def get_sector_analysis(
+def get_sector_analysis(
     sector_code: str,
     class_code: str = Query("6", description="Class code"),
     period_type: str = Query("quarterly", description="quarterly or annual"),
@@ -662,7 +662,7 @@ async def get_sector_analysis(
 
 
 @router.get("/sectors/{sector_code}/timeline", response_model=PRMeasureTimelineResponse)
-async def get_sector_timeline(
+def get_sector_timeline(
     sector_code: str,
     duration: str = Query("index", description="index, yoy, or qoq"),
     class_code: str = Query("6"),
@@ -759,7 +759,7 @@ async def get_sector_timeline(
 # ============================================================================
 
 @router.get("/measures/{measure_code}", response_model=PRMeasureComparisonResponse)
-async def get_measure_comparison(
+def get_measure_comparison(
     measure_code: str,
     duration_code: str = Query("3", description="Duration code (1=YoY, 2=QoQ, 3=Index)"),
     class_code: str = Query("6"),
@@ -862,7 +862,7 @@ async def get_measure_comparison(
 
 
 @router.get("/measures/{measure_code}/timeline", response_model=PRMeasureComparisonTimelineResponse)
-async def get_measure_comparison_timeline(
+def get_measure_comparison_timeline(
     measure_code: str,
     duration_code: str = Query("3"),
     class_code: str = Query("6"),
@@ -957,7 +957,7 @@ async def get_measure_comparison_timeline(
 # ============================================================================
 
 @router.get("/classes/compare", response_model=PRClassComparisonResponse)
-async def get_class_comparison(
+def get_class_comparison(
     sector_code: str = Query("8500", description="Sector code"),
     measure_code: str = Query("01", description="Measure code"),
     period_type: str = Query("quarterly"),
@@ -1056,7 +1056,7 @@ async def get_class_comparison(
 
 
 @router.get("/classes/timeline", response_model=PRClassTimelineResponse)
-async def get_class_timeline(
+def get_class_timeline(
     sector_code: str = Query("8500"),
     measure_code: str = Query("01"),
     duration_code: str = Query("3"),
@@ -1147,7 +1147,7 @@ async def get_class_timeline(
 # ============================================================================
 
 @router.get("/productivity-vs-costs", response_model=PRProductivityVsCostsResponse)
-async def get_productivity_vs_costs(
+def get_productivity_vs_costs(
     class_code: str = Query("6"),
     period_type: str = Query("quarterly"),
     db: Session = Depends(get_data_db)
@@ -1234,7 +1234,7 @@ async def get_productivity_vs_costs(
 
 
 @router.get("/productivity-vs-costs/timeline", response_model=PRProductivityVsCostsTimelineResponse)
-async def get_productivity_vs_costs_timeline(
+def get_productivity_vs_costs_timeline(
     sector_code: str = Query("8500"),
     duration: str = Query("index", description="index or pct_change"),
     class_code: str = Query("6"),
@@ -1316,7 +1316,7 @@ async def get_productivity_vs_costs_timeline(
 # ============================================================================
 
 @router.get("/manufacturing", response_model=PRManufacturingComparisonResponse)
-async def get_manufacturing_comparison(
+def get_manufacturing_comparison(
     class_code: str = Query("6"),
     period_type: str = Query("quarterly"),
     db: Session = Depends(get_data_db)
@@ -1405,7 +1405,7 @@ async def get_manufacturing_comparison(
 
 
 @router.get("/manufacturing/timeline", response_model=PRManufacturingTimelineResponse)
-async def get_manufacturing_timeline(
+def get_manufacturing_timeline(
     measure: str = Query("productivity", description="productivity, unit_labor_costs, output"),
     duration: str = Query("index", description="index or pct_change"),
     class_code: str = Query("6"),
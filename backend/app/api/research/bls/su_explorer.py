@@ -80,7 +80,7 @@ def build_series_id(item_code: str, area_code: str = '0000') -> str:
 # ==================== Dimensions ====================
 
 @router.get("/dimensions", response_model=SUDimensions)
-async def get_dimensions(
+def get_dimensions(
     db: Session = Depends(get_data_db),
     current_user=Depends(get_current_user)
 ):
@@ -123,7 +123,7 @@ async def get_dimensions(
 # ==================== Series ====================
 
 @router.get("/series", response_model=SUSeriesListResponse)
-async def get_series(
+def get_series(
     item_code: Optional[str] = Query(None, description="Filter by item code"),
     search: Optional[str] = Query(None, description="Search series title/item name"),
     limit: int = Query(100, ge=1, le=500),
@@ -199,7 +199,7 @@ async def get_series(
 
 
 @router.get("/series/{series_id}", response_model=SUSeriesInfo)
-async def get_series_by_id(
+def get_series_by_id(
     series_id: str,
     db: Session = Depends(get_data_db),
     current_user=Depends(get_current_user)
@@ -245,7 +245,7 @@ async def get_series_by_id(
 # ==================== Data ====================
 
 @router.get("/data", response_model=SUDataResponse)
-async def get_data(
+def get_data(
     series_ids: str = Query(..., description="Comma-separated series IDs"),
     start_year: Optional[int] = Query(None, description="Start year"),
     end_year: Optional[int] = Query(None, description="End year"),
@@ -348,7 +348,7 @@ async def get_data(
 # ==================== Overview ====================
 
 @router.get("/overview", response_model=SUOverviewResponse)
-async def get_overview(
+def get_overview(
     year: Optional[int] = Query(None, description="Year (default: latest)"),
     period: Optional[str] = Query(None, description="Period (default: latest)"),
     db: Session = Depends(get_data_db),
@@ -491,7 +491,7 @@ async def get_overview(
 
 
 @router.get("/overview/timeline", response_model=SUOverviewTimelineResponse)
-async def get_overview_timeline(
+def get_overview_timeline(
     item_codes: Optional[str] = Query(None, description="Comma-separated item codes (default: key items)"),
     start_year: Optional[int] = Query(None, description="Start year"),
     db: Session = Depends(get_data_db),
@@ -570,7 +570,7 @@ async def get_overview_timeline(
 # ==================== Category Analysis ====================
 
 @router.get("/category/{item_code}", response_model=SUCategoryAnalysisResponse)
-async def get_category_analysis(
+def get_category_analysis(
     item_code: str,
     year: Optional[int] = Query(None, description="Year (default: latest)"),
     period: Optional[str] = Query(None, description="Period (default: latest)"),
@@ -745,7 +745,7 @@ async def get_category_analysis(
 
 
 @router.get("/category/{item_code}/timeline", response_model=SUCategoryTimelineResponse)
-async def get_category_timeline(
+def get_category_timeline(
     item_code: str,
     start_year: Optional[int] = Query(None, description="Start year"),
     include_subcategories: bool = Query(True, description="Include subcategories"),
@@ -842,7 +842,7 @@ async def get_category_timeline(
 # ==================== Comparison ====================
 
 @router.get("/comparison", response_model=SUComparisonResponse)
-async def get_comparison(
+def get_comparison(
     item_codes: str = Query(..., description="Comma-separated item codes"),
     year: Optional[int] = Query(None, description="Year (default: latest)"),
     period: Optional[str] = Query(None, description="Period (default: latest)"),
@@ -946,7 +946,7 @@ async def get_comparison(
 
 
 @router.get("/comparison/timeline", response_model=SUComparisonTimelineResponse)
-async def get_comparison_timeline(
+def get_comparison_timeline(
     item_codes: str = Query(..., description="Comma-separated item codes"),
     start_year: Optional[int] = Query(None, description="Start year"),
     db: Session = Depends(get_data_db),
@@ -1024,7 +1024,7 @@ async def get_comparison_timeline(
 # ==================== Top Movers ====================
 
 @router.get("/top-movers", response_model=SUTopMoversResponse)
-async def get_top_movers(
+def get_top_movers(
     change_type: str = Query('year_over_year', description="'month_over_month' or 'year_over_year'"),
     direction: str = Query('highest', description="'highest' or 'lowest'"),
     limit: int = Query(10, ge=1, le=29),
@@ -1153,7 +1153,7 @@ async def get_top_movers(
 # ==================== Inflation Analysis ====================
 
 @router.get("/inflation/{item_code}", response_model=SUInflationResponse)
-async def get_inflation_analysis(
+def get_inflation_analysis(
     item_code: str,
     start_year: Optional[int] = Query(None, description="Start year"),
     db: Session = Depends(get_data_db),
@@ -1245,7 +1245,7 @@ async def get_inflation_analysis(
 # ==================== YoY Comparison ====================
 
 @router.get("/yoy-comparison", response_model=SUYoYComparisonResponse)
-async def get_yoy_comparison(
+def get_yoy_comparison(
     item_codes: Optional[str] = Query(None, description="Comma-separated item codes (default: key items)"),
     start_year: Optional[int] = Query(None, description="Start year"),
     db: Session = Depends(get_data_db),
@@ -163,7 +163,7 @@ RACE_BREAKDOWN_ACTIVITIES = EDUCATION_BREAKDOWN_ACTIVITIES
 # ============================================================================
 
 @router.get("/dimensions", response_model=TUDimensions)
-async def get_dimensions(db: Session = Depends(get_data_db)):
+def get_dimensions(db: Session = Depends(get_data_db)):
     """Get available dimensions for filtering TU data"""
 
     # Get all dimension data in parallel queries
@@ -277,7 +277,7 @@ async def get_dimensions(db: Session = Depends(get_data_db)):
 # ============================================================================
 
 @router.get("/series/search", response_model=TUSeriesListResponse)
-async def search_series(
+def search_series(
     search: str = Query(..., description="Search term for series title or activity"),
     stattype_code: Optional[str] = Query(None, description="Filter by stat type"),
     limit: int = Query(50, le=500),
@@ -304,7 +304,7 @@ async def search_series(
     series_list = db.execute(query).scalars().all()
 
     # Batch lookup dimension names
-    series_info_list = await _enrich_series_list(db, series_list)
+    series_info_list = _enrich_series_list(db, series_list)
 
     return TUSeriesListResponse(
         total=total,
@@ -315,7 +315,7 @@ async def search_series(
 
 
 @router.get("/series/browse", response_model=TUSeriesListResponse)
-async def browse_series(
+def browse_series(
     actcode_code: Optional[str] = Query(None, description="Filter by activity code"),
     stattype_code: Optional[str] = Query(None, description="Filter by stat type"),
     sex_code: Optional[str] = Query(None, description="Filter by sex"),
@@ -361,7 +361,7 @@ async def browse_series(
     query = query.order_by(TUSeries.series_id).limit(limit).offset(offset)
     series_list = db.execute(query).scalars().all()
 
-    series_info_list = await _enrich_series_list(db, series_list)
+    series_info_list = _enrich_series_list(db, series_list)
 
     return TUSeriesListResponse(
         total=total,
@@ -372,7 +372,7 @@ async def browse_series(
 
 
 @router.get("/series/drilldown", response_model=TUDrilldownResponse)
-async def drilldown_series(
+def drilldown_series(
     actcode_code: Optional[str] = Query(None, description="Current activity code"),
     stattype_code: Optional[str] = Query(None, description="Current stat type"),
     sex_code: Optional[str] = Query(None, description="Current sex"),
@@ -525,7 +525,7 @@ async def drilldown_series(
     )
 
 
-async def _enrich_series_list(db: Session, series_list: List[TUSeries]) -> List[TUSeriesInfo]:
+def _enrich_series_list(db: Session, series_list: List[TUSeries]) -> List[TUSeriesInfo]:
     """Batch lookup dimension names for series list"""
     if not series_list:
         return []
@@ -694,7 +694,7 @@ async def _enrich_series_list(db: Session, series_list: List[TUSeries]) -> List[
 # ============================================================================
 
 @router.get("/series/{series_id}/data", response_model=TUDataResponse)
-async def get_series_data(
+def get_series_data(
     series_id: str,
     start_year: Optional[int] = Query(None, description="Start year filter"),
     end_year: Optional[int] = Query(None, description="End year filter"),
@@ -758,7 +758,7 @@ async def get_series_data(
 # ============================================================================
 
 @router.get("/overview", response_model=TUOverviewResponse)
-async def get_overview(
+def get_overview(
     year: Optional[int] = Query(None, description="Year filter (default: latest)"),
     db: Session = Depends(get_data_db)
 ):
@@ -853,7 +853,7 @@ async def get_overview(
 
 
 @router.get("/overview/timeline", response_model=TUOverviewTimelineResponse)
-async def get_overview_timeline(
+def get_overview_timeline(
     start_year: Optional[int] = Query(None, description="Start year"),
     end_year: Optional[int] = Query(None, description="End year"),
     activities: Optional[str] = Query(None, description="Comma-separated activity codes"),
@@ -944,7 +944,7 @@ async def get_overview_timeline(
 # ============================================================================
 
 @router.get("/activity/{actcode_code}", response_model=TUActivityAnalysisResponse)
-async def get_activity_analysis(
+def get_activity_analysis(
     actcode_code: str,
     year: Optional[int] = Query(None, description="Year filter"),
     include_subactivities: bool = Query(True, description="Include sub-activity breakdown"),
@@ -1070,7 +1070,7 @@ async def get_activity_analysis(
 
 
 @router.get("/activity/{actcode_code}/timeline", response_model=TUActivityTimelineResponse)
-async def get_activity_timeline(
+def get_activity_timeline(
     actcode_code: str,
     start_year: Optional[int] = Query(None, description="Start year"),
     end_year: Optional[int] = Query(None, description="End year"),
@@ -1147,7 +1147,7 @@ async def get_activity_timeline(
 # ============================================================================
 
 @router.get("/demographics/sex", response_model=TUSexComparisonResponse)
-async def get_sex_comparison(
+def get_sex_comparison(
     actcode_code: str = Query(..., description="Activity code"),
     year: Optional[int] = Query(None, description="Year filter"),
     db: Session = Depends(get_data_db)
@@ -1226,7 +1226,7 @@ async def get_sex_comparison(
 
 
 @router.get("/demographics/sex/bulk", response_model=TUSexBulkResponse)
-async def get_sex_comparison_bulk(
+def get_sex_comparison_bulk(
     actcode_codes: str = Query(..., description="Comma-separated activity codes"),
     year: Optional[int] = Query(None, description="Year filter"),
     db: Session = Depends(get_data_db)
@@ -1314,7 +1314,7 @@ async def get_sex_comparison_bulk(
 
 
 @router.get("/demographics/sex/timeline", response_model=TUSexTimelineResponse)
-async def get_sex_timeline(
+def get_sex_timeline(
     actcode_code: str = Query(..., description="Activity code"),
     start_year: Optional[int] = Query(None, description="Start year"),
     end_year: Optional[int] = Query(None, description="End year"),
@@ -1408,7 +1408,7 @@ async def get_sex_timeline(
 
 
 @router.get("/demographics/age", response_model=TUAgeComparisonResponse)
-async def get_age_comparison(
+def get_age_comparison(
     actcode_code: str = Query(..., description="Activity code"),
     year: Optional[int] = Query(None, description="Year filter"),
     db: Session = Depends(get_data_db)
@@ -1487,7 +1487,7 @@ async def get_age_comparison(
 
 
 @router.get("/demographics/age/timeline", response_model=TUAgeTimelineResponse)
-async def get_age_timeline(
+def get_age_timeline(
     actcode_code: str = Query(..., description="Activity code"),
     age_codes: str = Query(..., description="Comma-separated age codes"),
     start_year: Optional[int] = Query(None, description="Start year"),
@@ -1582,7 +1582,7 @@ async def get_age_timeline(
 
 
 @router.get("/demographics/age/bulk", response_model=TUAgeBulkResponse)
-async def get_age_comparison_bulk(
+def get_age_comparison_bulk(
     actcode_codes: str = Query(..., description="Comma-separated activity codes"),
     year: Optional[int] = Query(None, description="Year filter"),
     db: Session = Depends(get_data_db)
@@ -1671,7 +1671,7 @@ async def get_age_comparison_bulk(
 
 
 @router.get("/demographics/labor-force", response_model=TULaborForceComparisonResponse)
-async def get_labor_force_comparison(
+def get_labor_force_comparison(
     actcode_code: str = Query(..., description="Activity code"),
     year: Optional[int] = Query(None, description="Year filter"),
     db: Session = Depends(get_data_db)
@@ -1751,7 +1751,7 @@ async def get_labor_force_comparison(
 
 
 @router.get("/demographics/labor-force/timeline", response_model=TULaborForceTimelineResponse)
-async def get_labor_force_timeline(
+def get_labor_force_timeline(
     actcode_code: str = Query(..., description="Activity code"),
     lfstat_codes: str = Query(..., description="Comma-separated labor force status codes"),
     start_year: Optional[int] = Query(None, description="Start year"),
@@ -1847,7 +1847,7 @@ async def get_labor_force_timeline(
 
 
 @router.get("/demographics/labor-force/bulk", response_model=TULaborForceBulkResponse)
-async def get_labor_force_comparison_bulk(
+def get_labor_force_comparison_bulk(
     actcode_codes: str = Query(..., description="Comma-separated activity codes"),
     year: Optional[int] = Query(None, description="Year filter"),
     db: Session = Depends(get_data_db)
@@ -1941,7 +1941,7 @@ async def get_labor_force_comparison_bulk(
 # ============================================================================
 
 @router.get("/demographics/education", response_model=TUEducationComparisonResponse)
-async def get_education_comparison(
+def get_education_comparison(
     actcode_code: str = Query(..., description="Activity code"),
     year: Optional[int] = Query(None, description="Year filter"),
     db: Session = Depends(get_data_db)
@@ -2042,7 +2042,7 @@ async def get_education_comparison(
 
 
 @router.get("/demographics/education/timeline", response_model=TUEducationTimelineResponse)
-async def get_education_timeline(
+def get_education_timeline(
     actcode_code: str = Query(..., description="Activity code"),
     educ_codes: str = Query(..., description="Comma-separated education codes"),
     start_year: Optional[int] = Query(None, description="Start year"),
@@ -2166,7 +2166,7 @@ async def get_education_timeline(
 # ============================================================================
 
 @router.get("/demographics/race", response_model=TURaceComparisonResponse)
-async def get_race_comparison(
+def get_race_comparison(
     actcode_code: str = Query(..., description="Activity code"),
     year: Optional[int] = Query(None, description="Year filter"),
     db: Session = Depends(get_data_db)
@@ -2246,7 +2246,7 @@ async def get_race_comparison(
 
 
 @router.get("/demographics/race/timeline", response_model=TURaceTimelineResponse)
-async def get_race_timeline(
+def get_race_timeline(
     actcode_code: str = Query(..., description="Activity code"),
     race_codes: str = Query(..., description="Comma-separated race codes"),
     start_year: Optional[int] = Query(None, description="Start year"),
@@ -2357,7 +2357,7 @@ DAY_TYPE_NAMES = {
 
 
 @router.get("/demographics/day-type", response_model=TUDayTypeComparisonResponse)
-async def get_day_type_comparison(
+def get_day_type_comparison(
     actcode_code: str = Query(..., description="Activity code"),
     year: Optional[int] = Query(None, description="Year filter"),
     db: Session = Depends(get_data_db)
@@ -2427,7 +2427,7 @@ async def get_day_type_comparison(
 
 
 @router.get("/demographics/day-type/timeline", response_model=TUDayTypeTimelineResponse)
-async def get_day_type_timeline(
+def get_day_type_timeline(
     actcode_code: str = Query(..., description="Activity code"),
     pertype_codes: str = Query(..., description="Comma-separated day type codes"),
     start_year: Optional[int] = Query(None, description="Start year"),
@@ -2518,7 +2518,7 @@ async def get_day_type_timeline(
 # ============================================================================
 
 @router.get("/top-activities", response_model=TUTopActivitiesResponse)
-async def get_top_activities(
+def get_top_activities(
     ranking_type: str = Query("most_time", description="Ranking type: most_time, highest_participation"),
     limit: int = Query(10, le=20),
     year: Optional[int] = Query(None, description="Year filter"),
@@ -2607,7 +2607,7 @@ async def get_top_activities(
 # ============================================================================
 
 @router.get("/yoy-changes", response_model=TUYoYChangeResponse)
-async def get_yoy_changes(
+def get_yoy_changes(
     stattype: str = Query("avg_hours", description="Stat type"),
     limit: int = Query(5, le=10),
     year: Optional[int] = Query(None, description="Year to compare"),
@@ -2731,7 +2731,7 @@ async def get_yoy_changes(
 # ============================================================================
 
 @router.get("/regions", response_model=TURegionAnalysisResponse)
-async def get_region_comparison(
+def get_region_comparison(
     actcode_code: str = Query(..., description="Activity code"),
     year: Optional[int] = Query(None, description="Year filter"),
     db: Session = Depends(get_data_db)
@@ -2811,7 +2811,7 @@ async def get_region_comparison(
 
 
 @router.get("/regions/timeline", response_model=TURegionTimelineResponse)
-async def get_region_timeline(
+def get_region_timeline(
     actcode_code: str = Query(..., description="Activity code"),
     region_codes: str = Query(..., description="Comma-separated region codes"),
     start_year: Optional[int] = Query(None, description="Start year"),
@@ -64,7 +64,7 @@ def format_event_date(dt: datetime) -> str:
 
 
 @router.get("/debug")
-async def debug_calendar(
+def debug_calendar(
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -93,7 +93,7 @@ async def debug_calendar(
 
 
 @router.get("/upcoming")
-async def get_upcoming_events(
+def get_upcoming_events(
     days: int = Query(14, ge=1, le=90, description="Number of days to look ahead"),
     country: Optional[str] = Query(None, description="Filter by country code (e.g., 'US')"),
     impact: Optional[str] = Query(None, description="Filter by impact level ('High', 'Medium', 'Low')"),
@@ -170,7 +170,7 @@ async def get_upcoming_events(
 
 
 @router.get("/recent")
-async def get_recent_events(
+def get_recent_events(
     days: int = Query(7, ge=1, le=30, description="Number of days to look back"),
     country: Optional[str] = Query(None, description="Filter by country code"),
     impact: Optional[str] = Query(None, description="Filter by impact level"),
@@ -232,7 +232,7 @@ async def get_recent_events(
 
 
 @router.get("/week")
-async def get_this_week_events(
+def get_this_week_events(
     country: Optional[str] = Query("US", description="Filter by country code"),
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
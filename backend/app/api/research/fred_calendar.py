@@ -8,10 +8,10 @@ from typing import List, Dict, Any
 from datetime import datetime, date, timedelta
 from calendar import monthrange
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.app.database import get_data_db
+from backend.app.database import get_async_data_db
 from backend.app.data_models import (
     FredRelease, FredReleaseDate, FredSeries, FredSeriesRelease, FredObservationLatest
 )
@@ -25,25 +25,27 @@ router = APIRouter(prefix="/api/research/fred-calendar", tags=["FRED Calendar"])
 # Helper Functions
 # -----------------------------------------------------------------------------
 
-def get_releases_query(db: Session, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+async def get_releases_query(db: AsyncSession, start_date: date, end_date: date) -> List[Dict[str, Any]]:
     """
     Get all releases within a date range.
     Returns list of dicts with release_id, release_name, release_date, series_count.
     """
-    results = db.query(
-        FredReleaseDate.release_id,
-        FredRelease.name.label("release_name"),
-        FredReleaseDate.release_date,
-        FredRelease.series_count,
-    ).join(
-        FredRelease, FredReleaseDate.release_id == FredRelease.release_id
-    ).filter(
-        FredReleaseDate.release_date >= start_date,
-        FredReleaseDate.release_date <= end_date,
-    ).order_by(
-        FredReleaseDate.release_date,
-        FredRelease.name,
-    ).all()
+    results = (await db.execute(
+        select(
+            FredReleaseDate.release_id,
+            FredRelease.name.label("release_name"),
+            FredReleaseDate.release_date,
+            FredRelease.series_count,
+        ).join(
+            FredRelease, FredReleaseDate.release_id == FredRelease.release_id
+        ).where(
+            FredReleaseDate.release_date >= start_date,
+            FredReleaseDate.release_date <= end_date,
+        ).order_by(
+            FredReleaseDate.release_date,
+            FredRelease.name,
+        )
+    )).all()
 
     return [
         {
@@ -73,26 +75,30 @@ def group_by_date(releases: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, An
 
 @router.get("/stats")
 async def get_calendar_stats(
-    db: Session = Depends(get_data_db),
+    db: AsyncSession = Depends(get_async_data_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get calendar statistics."""
     today = date.today()
 
-    # Total release dates
-    total = db.query(func.count(FredReleaseDate.release_id)).scalar() or 0
-
-    # Future dates
-    future = db.query(func.count(FredReleaseDate.release_id)).filter(
-        FredReleaseDate.release_date > today
-    ).scalar() or 0
-
-    # Earliest and latest dates
-    min_date = db.query(func.min(FredReleaseDate.release_date)).scalar()
-    max_date = db.query(func.max(FredReleaseDate.release_date)).scalar()
+    # Total/future release dates, date range and release count in one round trip
+    stats = (await db.execute(
+        select(
+            func.count(FredReleaseDate.release_id).label("total"),
+            func.count(FredReleaseDate.release_id).filter(
+                FredReleaseDate.release_date > today
+            ).label("future"),
+            func.min(FredReleaseDate.release_date).label("min_date"),
+            func.max(FredReleaseDate.release_date).label("max_date"),
+            select(func.count(FredRelease.release_id)).scalar_subquery().label("total_releases"),
+        )
+    )).one()
 
-    # Total unique releases
-    total_releases = db.query(func.count(FredRelease.release_id)).scalar() or 0
+    total = stats.total or 0
+    future = stats.future or 0
+    min_date = stats.min_date
+    max_date = stats.max_date
+    total_releases = stats.total_releases or 0
 
     return {
         "total_dates": total,
@@ -107,7 +113,7 @@ async def get_calendar_stats(
 @router.get("/upcoming")
 async def get_upcoming_releases(
     days: int = Query(7, ge=1, le=90, description="Number of days to look ahead"),
-    db: Session = Depends(get_data_db),
+    db: AsyncSession = Depends(get_async_data_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -116,7 +122,7 @@ async def get_upcoming_releases(
     today = date.today()
     end_date = today + timedelta(days=days)
 
-    releases = get_releases_query(db, today, end_date)
+    releases = await get_releases_query(db, today, end_date)
 
     return {
         "days": days,
@@ -131,7 +137,7 @@ async def get_upcoming_releases(
 async def get_releases_by_month(
     year: int,
     month: int,
-    db: Session = Depends(get_data_db),
+    db: AsyncSession = Depends(get_async_data_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -147,7 +153,7 @@ async def get_releases_by_month(
     _, last_day = monthrange(year, month)
     end_date = date(year, month, last_day)
 
-    releases = get_releases_query(db, start_date, end_date)
+    releases = await get_releases_query(db, start_date, end_date)
 
     return {
         "year": year,
@@ -162,7 +168,7 @@ async def get_releases_by_month(
 async def get_releases_by_range(
     start: str = Query(..., description="Start date (YYYY-MM-DD)"),
     end: str = Query(..., description="End date (YYYY-MM-DD)"),
-    db: Session = Depends(get_data_db),
+    db: AsyncSession = Depends(get_async_data_db),
     current_user: User = Depends(get_current_user)
 ):
     """
@@ -177,7 +183,7 @@ async def get_releases_by_range(
     if start_date > end_date:
         raise HTTPException(status_code=400, detail="Start date must be before end date")
 
-    releases = get_releases_query(db, start_date, end_date)
+    releases = await get_releases_query(db, start_date, end_date)
 
     return {
         "start": start,
@@ -190,12 +196,12 @@ async def get_releases_by_range(
 
 @router.get("/today")
 async def get_todays_releases(
-    db: Session = Depends(get_data_db),
+    db: AsyncSession = Depends(get_async_data_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get releases scheduled for today."""
     today = date.today()
-    releases = get_releases_query(db, today, today)
+    releases = await get_releases_query(db, today, today)
 
     return {
         "date": today.isoformat(),
@@ -206,7 +212,7 @@ async def get_todays_releases(
 
 @router.get("/week")
 async def get_this_weeks_releases(
-    db: Session = Depends(get_data_db),
+    db: AsyncSession = Depends(get_async_data_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get releases for the current week (Mon-Sun)."""
@@ -215,7 +221,7 @@ async def get_this_weeks_releases(
     monday = today - timedelta(days=today.weekday())
     sunday = monday + timedelta(days=6)
 
-    releases = get_releases_query(db, monday, sunday)
+    releases = await get_releases_query(db, monday, sunday)
 
     return {
         "week_start": monday.isoformat(),
@@ -228,17 +234,19 @@ async def get_this_weeks_releases(
 
 @router.get("/releases")
 async def get_all_releases(
-    db: Session = Depends(get_data_db),
+    db: AsyncSession = Depends(get_async_data_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get list of all available releases with their info."""
-    releases = db.query(
-        FredRelease.release_id,
-        FredRelease.name,
-        FredRelease.link,
-        FredRelease.press_release,
-        FredRelease.series_count,
-    ).order_by(FredRelease.name).all()
+    releases = (await db.execute(
+        select(
+            FredRelease.release_id,
+            FredRelease.name,
+            FredRelease.link,
+            FredRelease.press_release,
+            FredRelease.series_count,
+        ).order_by(FredRelease.name)
+    )).all()
 
     return {
         "count": len(releases),
@@ -259,14 +267,14 @@ async def get_all_releases(
 async def get_release_dates(
     release_id: int,
     limit: int = Query(50, ge=1, le=200, description="Maximum number of dates to return"),
-    db: Session = Depends(get_data_db),
+    db: AsyncSession = Depends(get_async_data_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get historical and upcoming dates for a specific release."""
     # Get release info
-    release = db.query(FredRelease).filter(
-        FredRelease.release_id == release_id
-    ).first()
+    release = (await db.execute(
+        select(FredRelease).where(FredRelease.release_id == release_id)
+    )).scalars().first()
 
     if not release:
         raise HTTPException(status_code=404, detail="Release not found")
@@ -274,16 +282,20 @@ async def get_release_dates(
     today = date.today()
 
     # Get past dates (most recent first)
-    past_dates = db.query(FredReleaseDate.release_date).filter(
-        FredReleaseDate.release_id == release_id,
-        FredReleaseDate.release_date < today,
-    ).order_by(FredReleaseDate.release_date.desc()).limit(limit).all()
+    past_dates = (await db.execute(
+        select(FredReleaseDate.release_date).where(
+            FredReleaseDate.release_id == release_id,
+            FredReleaseDate.release_date < today,
+        ).order_by(FredReleaseDate.release_date.desc()).limit(limit)
+    )).all()
 
     # Get future dates
-    future_dates = db.query(FredReleaseDate.release_date).filter(
-        FredReleaseDate.release_id == release_id,
-        FredReleaseDate.release_date >= today,
-    ).order_by(FredReleaseDate.release_date).limit(limit).all()
+    future_dates = (await db.execute(
+        select(FredReleaseDate.release_date).where(
+            FredReleaseDate.release_id == release_id,
+            FredReleaseDate.release_date >= today,
+        ).order_by(FredReleaseDate.release_date).limit(limit)
+    )).all()
 
     return {
         "release_id": release_id,
@@ -302,53 +314,59 @@ async def get_release_series(
     offset: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(50, ge=1, le=250, description="Maximum number of series to return"),
     search: str = Query(None, description="Search filter for series ID or title"),
-    db: Session = Depends(get_data_db),
+    db: AsyncSession = Depends(get_async_data_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get all series belonging to a specific release."""
     # Get release info
-    release = db.query(FredRelease).filter(
-        FredRelease.release_id == release_id
-    ).first()
+    release = (await db.execute(
+        select(FredRelease).where(FredRelease.release_id == release_id)
+    )).scalars().first()
 
     if not release:
         raise HTTPException(status_code=404, detail="Release not found")
 
     # Build query for series in this release
-    query = db.query(FredSeries).join(
+    query = select(FredSeries).join(
         FredSeriesRelease,
         FredSeries.series_id == FredSeriesRelease.series_id
-    ).filter(
+    ).where(
         FredSeriesRelease.release_id == release_id
     )
 
     # Apply search filter if provided
     if search:
         search_pattern = f"%{search}%"
-        query = query.filter(
+        query = query.where(
             (FredSeries.series_id.ilike(search_pattern)) |
             (FredSeries.title.ilike(search_pattern))
         )
 
     # Get total count
-    total = query.count()
+    total = (await db.execute(
+        select(func.count()).select_from(query.subquery())
+    )).scalar() or 0
 
     # Get paginated results
-    series_list = query.order_by(
-        FredSeries.popularity.desc().nullslast(),
-        FredSeries.series_id
-    ).offset(offset).limit(limit).all()
+    series_list = (await db.execute(
+        query.order_by(
+            FredSeries.popularity.desc().nullslast(),
+            FredSeries.series_id
+        ).offset(offset).limit(limit)
+    )).scalars().all()
 
     # Get observation counts ONLY for the paginated series (fast!)
     series_ids = [s.series_id for s in series_list]
     obs_counts = {}
     if series_ids:
-        obs_query = db.query(
-            FredObservationLatest.series_id,
-            func.count(FredObservationLatest.date).label('count')
-        ).filter(
-            FredObservationLatest.series_id.in_(series_ids)
-        ).group_by(FredObservationLatest.series_id).all()
+        obs_query = (await db.execute(
+            select(
+                FredObservationLatest.series_id,
+                func.count(FredObservationLatest.date).label('count')
+            ).where(
+                FredObservationLatest.series_id.in_(series_ids)
+            ).group_by(FredObservationLatest.series_id)
+        )).all()
         obs_counts = {r.series_id: r.count for r in obs_query}
 
     return {
@@ -381,33 +399,37 @@ async def get_release_series(
 @router.get("/series/{series_id}")
 async def get_series_detail(
     series_id: str,
-    db: Session = Depends(get_data_db),
+    db: AsyncSession = Depends(get_async_data_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get detailed information about a specific series."""
     # Get series info
-    series = db.query(FredSeries).filter(
-        FredSeries.series_id == series_id
-    ).first()
+    series = (await db.execute(
+        select(FredSeries).where(FredSeries.series_id == series_id)
+    )).scalars().first()
 
     if not series:
         raise HTTPException(status_code=404, detail="Series not found")
 
     # Get observation count
-    obs_count = db.query(func.count(FredObservationLatest.date)).filter(
-        FredObservationLatest.series_id == series_id
-    ).scalar() or 0
+    obs_count = (await db.execute(
+        select(func.count(FredObservationLatest.date)).where(
+            FredObservationLatest.series_id == series_id
+        )
+    )).scalar() or 0
 
     # Get releases this series belongs to
-    releases = db.query(
-        FredRelease.release_id,
-        FredRelease.name
-    ).join(
-        FredSeriesRelease,
-        FredRelease.release_id == FredSeriesRelease.release_id
-    ).filter(
-        FredSeriesRelease.series_id == series_id
-    ).all()
+    releases = (await db.execute(
+        select(
+            FredRelease.release_id,
+            FredRelease.name
+        ).join(
+            FredSeriesRelease,
+            FredRelease.release_id == FredSeriesRelease.release_id
+        ).where(
+            FredSeriesRelease.series_id == series_id
+        )
+    )).all()
 
     return {
         "series_id": series.series_id,
@@ -437,23 +459,23 @@ async def get_series_observations(
     start_date: str = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: str = Query(None, description="End date (YYYY-MM-DD)"),
     limit: int = Query(5000, ge=1, le=10000, description="Maximum observations to return"),
-    db: Session = Depends(get_data_db),
+    db: AsyncSession = Depends(get_async_data_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get observation data for a series."""
     # Get series info
-    series = db.query(FredSeries).filter(
-        FredSeries.series_id == series_id
-    ).first()
+    series = (await db.execute(
+        select(FredSeries).where(FredSeries.series_id == series_id)
+    )).scalars().first()
 
     if not series:
         raise HTTPException(status_code=404, detail="Series not found")
 
     # Build query
-    query = db.query(
+    query = select(
         FredObservationLatest.date,
         FredObservationLatest.value
-    ).filter(
+    ).where(
         FredObservationLatest.series_id == series_id
     )
 
@@ -461,19 +483,21 @@ async def get_series_observations(
     if start_date:
         try:
             start = datetime.strptime(start_date, "%Y-%m-%d").date()
-            query = query.filter(FredObservationLatest.date >= start)
+            query = query.where(FredObservationLatest.date >= start)
         except ValueError:
             pass
 
     if end_date:
         try:
             end = datetime.strptime(end_date, "%Y-%m-%d").date()
-            query = query.filter(FredObservationLatest.date <= end)
+            query = query.where(FredObservationLatest.date <= end)
         except ValueError:
             pass
 
     # Get observations ordered by date
-    observations = query.order_by(FredObservationLatest.date).limit(limit).all()
+    observations = (await db.execute(
+        query.order_by(FredObservationLatest.date).limit(limit)
+    )).all()
 
     return {
         "series_id": series_id,
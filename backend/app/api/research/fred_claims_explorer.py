@@ -183,7 +183,7 @@ def get_latest_with_changes(
 
 @router.get("/overview")
 @cached("fred:claims:overview", category=DataCategory.CLAIMS_WEEKLY)
-async def get_claims_overview(
+def get_claims_overview(
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -220,7 +220,7 @@ async def get_claims_overview(
 
 
 @router.get("/overview/timeline")
-async def get_claims_timeline(
+def get_claims_timeline(
     weeks_back: int = Query(104, ge=4, le=2600, description="Number of weeks of history"),
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
@@ -265,7 +265,7 @@ async def get_claims_timeline(
 
 
 @router.get("/series/{series_id}")
-async def get_claims_series(
+def get_claims_series(
     series_id: str,
     weeks_back: int = Query(104, ge=4, le=2600, description="Number of weeks of history"),
     db: Session = Depends(get_data_db),
@@ -321,7 +321,7 @@ async def get_claims_series(
 
 
 @router.get("/compare")
-async def compare_claims_periods(
+def compare_claims_periods(
     weeks_back: int = Query(520, ge=4, le=2600, description="Number of weeks to compare"),
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
@@ -375,7 +375,7 @@ async def compare_claims_periods(
 
 
 @router.get("/states/overview")
-async def get_states_overview(
+def get_states_overview(
     weeks_back: int = Query(52, ge=1, le=520, description="Number of weeks of history for period comparison"),
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
@@ -472,7 +472,7 @@ async def get_states_overview(
 
 
 @router.get("/states/{state_code}")
-async def get_state_claims(
+def get_state_claims(
     state_code: str,
     weeks_back: int = Query(104, ge=4, le=2600, description="Number of weeks of history"),
     db: Session = Depends(get_data_db),
@@ -543,7 +543,7 @@ async def get_state_claims(
 
 
 @router.get("/states/rankings/{metric}")
-async def get_state_rankings(
+def get_state_rankings(
     metric: str,
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
@@ -128,7 +128,7 @@ def get_historical_values(
 
 
 @router.get("/yield-curve")
-async def get_yield_curve(
+def get_yield_curve(
     as_of_date: Optional[str] = Query(None, description="Date in YYYY-MM-DD format, defaults to latest"),
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
@@ -257,7 +257,7 @@ async def get_yield_curve(
 
 
 @router.get("/yield-curve/history")
-async def get_yield_curve_history(
+def get_yield_curve_history(
     tenor: str = Query("10Y", description="Tenor to get history for"),
     days: int = Query(365, ge=1, le=3650, description="Number of days of history"),
     db: Session = Depends(get_data_db),
@@ -300,7 +300,7 @@ async def get_yield_curve_history(
 
 
 @router.get("/yield-curve/spread-history")
-async def get_spread_history(
+def get_spread_history(
     spread: str = Query("2s10s", description="Spread to get history for (2s10s, 2s30s, 5s30s, 3m10y)"),
     days: int = Query(365, ge=1, le=3650, description="Number of days of history"),
     db: Session = Depends(get_data_db),
@@ -276,7 +276,7 @@ def find_rate_changes(history: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
 
 @router.get("/overview")
 @cached("fred:fedfunds:overview", category=DataCategory.FRED_SERIES)
-async def get_fedfunds_overview(
+def get_fedfunds_overview(
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -441,7 +441,7 @@ def build_comparison_data(
 
 @router.get("/timeline")
 @cached("fred:fedfunds:timeline", category=DataCategory.FRED_SERIES, param_keys=["years_back"])
-async def get_fedfunds_timeline(
+def get_fedfunds_timeline(
     years_back: int = Query(5, ge=1, le=50, description="Years of history"),
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
@@ -481,7 +481,7 @@ async def get_fedfunds_timeline(
 
 @router.get("/changes")
 @cached("fred:fedfunds:changes", category=DataCategory.FRED_SERIES, param_keys=["years_back"])
-async def get_rate_changes(
+def get_rate_changes(
     years_back: int = Query(5, ge=1, le=50, description="Years of history for changes"),
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
@@ -528,7 +528,7 @@ async def get_rate_changes(
 
 @router.get("/series/{series_id}")
 @cached("fred:fedfunds:series", category=DataCategory.FRED_SERIES, param_keys=["series_id", "days_back"])
-async def get_series_detail(
+def get_series_detail(
     series_id: str,
     days_back: int = Query(365, ge=1, le=18250, description="Days of history"),
     db: Session = Depends(get_data_db),
@@ -589,7 +589,7 @@ async def get_series_detail(
 
 @router.get("/compare-effective")
 @cached("fred:fedfunds:compare", category=DataCategory.FRED_SERIES, param_keys=["days_back"])
-async def compare_effective_to_target(
+def compare_effective_to_target(
     days_back: int = Query(365, ge=1, le=3650, description="Days of history"),
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
@@ -628,7 +628,7 @@ async def compare_effective_to_target(
 
 @router.get("/chart-data")
 @cached("fred:fedfunds:chart-data", category=DataCategory.FRED_SERIES, param_keys=["years_back"])
-async def get_combined_chart_data(
+def get_combined_chart_data(
     years_back: int = Query(5, ge=1, le=50, description="Years of history"),
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
@@ -707,7 +707,7 @@ async def get_combined_chart_data(
 
 @router.get("/sibling-series")
 @cached("fred:fedfunds:siblings", category=DataCategory.METADATA)
-async def get_sibling_series(
+def get_sibling_series(
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -764,7 +764,7 @@ async def get_sibling_series(
 
 @router.get("/historical-table")
 @cached("fred:fedfunds:table", category=DataCategory.FRED_SERIES, param_keys=["years_back", "frequency", "limit"])
-async def get_historical_table(
+def get_historical_table(
     years_back: int = Query(5, ge=0, le=100, description="Years of history (0 = all)"),
     frequency: str = Query("monthly", description="monthly or daily"),
     limit: int = Query(500, ge=1, le=5000, description="Max rows to return"),
@@ -868,7 +868,7 @@ async def get_historical_table(
 
 @router.get("/about")
 @cached("fred:fedfunds:about", category=DataCategory.METADATA)
-async def get_about_info(
+def get_about_info(
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -212,7 +212,7 @@ def classify_housing_level(value: float, metric: str) -> str:
 
 
 @router.get("/overview")
-async def get_housing_overview(
+def get_housing_overview(
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -288,7 +288,7 @@ async def get_housing_overview(
 
 
 @router.get("/timeline")
-async def get_housing_timeline(
+def get_housing_timeline(
     months_back: int = Query(60, ge=1, le=600, description="Months of history"),
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
@@ -330,7 +330,7 @@ async def get_housing_timeline(
 
 
 @router.get("/mortgage-rates")
-async def get_mortgage_rates(
+def get_mortgage_rates(
     months_back: int = Query(60, ge=1, le=600, description="Months of history"),
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
@@ -377,7 +377,7 @@ async def get_mortgage_rates(
 
 
 @router.get("/regional")
-async def get_regional_breakdown(
+def get_regional_breakdown(
     months_back: int = Query(60, ge=1, le=600, description="Months of history"),
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
@@ -418,7 +418,7 @@ async def get_regional_breakdown(
 
 
 @router.get("/compare-starts-permits")
-async def compare_starts_permits(
+def compare_starts_permits(
     months_back: int = Query(120, ge=12, le=600, description="Months for comparison"),
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
@@ -471,7 +471,7 @@ async def compare_starts_permits(
 
 
 @router.get("/series/{series_id}")
-async def get_series_detail(
+def get_series_detail(
     series_id: str,
     months_back: int = Query(60, ge=1, le=600, description="Months of history"),
     db: Session = Depends(get_data_db),
@@ -18,6 +18,7 @@ from backend.app.data_models import (
     FredSeries, FredObservationLatest, FredObservationRealtime
 )
 from backend.app.core.deps import get_current_user
+from backend.app.core.cache import cached, DataCategory
 from backend.app.models.user import User
 
 router = APIRouter(prefix="/api/research/fred/leading", tags=["FRED Leading Index"])
@@ -183,7 +184,8 @@ def get_recession_risk_level(probability: float) -> str:
 
 
 @router.get("/overview")
-async def get_leading_overview(
+@cached("fred:leading:overview", category=DataCategory.FRED_SERIES, local=True)
+def get_leading_overview(
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -259,7 +261,7 @@ async def get_leading_overview(
 
 
 @router.get("/timeline")
-async def get_leading_timeline(
+def get_leading_timeline(
     months_back: int = Query(120, ge=1, le=600, description="Months of history"),
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
@@ -298,7 +300,7 @@ async def get_leading_timeline(
 
 
 @router.get("/recessions")
-async def get_recession_history(
+def get_recession_history(
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -336,7 +338,7 @@ async def get_recession_history(
 
 
 @router.get("/signals")
-async def get_recession_signals(
+def get_recession_signals(
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -417,7 +419,7 @@ async def get_recession_signals(
 
 
 @router.get("/series/{series_id}")
-async def get_series_detail(
+def get_series_detail(
     series_id: str,
     months_back: int = Query(120, ge=1, le=600, description="Months of history"),
     db: Session = Depends(get_data_db),
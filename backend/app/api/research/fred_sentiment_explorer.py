@@ -157,7 +157,7 @@ def get_sentiment_level(value: float) -> str:
 
 
 @router.get("/overview")
-async def get_sentiment_overview(
+def get_sentiment_overview(
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -224,7 +224,7 @@ async def get_sentiment_overview(
 
 
 @router.get("/timeline")
-async def get_sentiment_timeline(
+def get_sentiment_timeline(
     months_back: int = Query(60, ge=1, le=600, description="Months of history"),
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
@@ -266,7 +266,7 @@ async def get_sentiment_timeline(
 
 
 @router.get("/compare-periods")
-async def compare_periods(
+def compare_periods(
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -338,7 +338,7 @@ async def compare_periods(
 
 
 @router.get("/series/{series_id}")
-async def get_series_detail(
+def get_series_detail(
     series_id: str,
     months_back: int = Query(60, ge=1, le=600, description="Months of history"),
     db: Session = Depends(get_data_db),
@@ -18,6 +18,7 @@ import logging
 from backend.app.database import get_data_db
 from backend.app.data_models import PriceDailyBulk
 from backend.app.core.deps import get_current_user
+from backend.app.core.cache import cached, DataCategory
 from backend.app.models.user import User
 from backend.app.config import settings
 
@@ -141,7 +142,8 @@ def get_market_status() -> str:
 
 
 @router.get("/indices")
-async def get_market_indices(
+@cached("market:indices", category=DataCategory.REALTIME, stale_ttl=0, local=True)
+def get_market_indices(
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -214,7 +216,7 @@ async def get_market_indices(
 
 
 @router.get("/indices/{symbol}/history")
-async def get_index_history(
+def get_index_history(
     symbol: str,
     days: int = Query(30, ge=1, le=365),
     db: Session = Depends(get_data_db),
@@ -5,10 +5,12 @@ Provides rich, detailed data for the Research portal including:
 - BLS: Employment by industry, CPI breakdowns, regional data, labor indicators
 - Treasury: Yield curves, auction details, spread analysis
 """
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from fastapi import APIRouter, Depends
 from sqlalchemy import text, desc
 from sqlalchemy.orm import Session
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 from pydantic import BaseModel
 from decimal import Decimal
 from datetime import datetime, date
@@ -211,452 +213,349 @@ class TreasuryPortalData(BaseModel):
 
 
 # ============================================================================
-# BLS COMPREHENSIVE ENDPOINT
+# CONCURRENT QUERY HELPERS
 # ============================================================================
 
-@router.get("/bls/comprehensive", response_model=BLSPortalData)
-@cached("portal:bls:comprehensive", category=DataCategory.BLS_MONTHLY)
-async def get_bls_comprehensive(db: Session = Depends(get_data_db)):
-    """Get comprehensive BLS portal data (cached for 24h)"""
-    print("[BLS_COMPREHENSIVE] Function called - DB queries starting...")  # Debug
-
-    labor_indicators = []
-
-    # --- LABOR INDICATORS ---
-
-    # 1. Unemployment Rate
-    try:
-        result = db.execute(text("""
-            WITH current AS (
-                SELECT value, year, period FROM bls_ln_data
-                WHERE series_id = 'LNS14000000' AND period != 'M13'
-                ORDER BY year DESC, period DESC LIMIT 1
-            ),
-            previous AS (
-                SELECT value FROM bls_ln_data
-                WHERE series_id = 'LNS14000000' AND period != 'M13'
-                ORDER BY year DESC, period DESC LIMIT 1 OFFSET 1
-            )
-            SELECT c.value, c.year, c.period, p.value as prev
-            FROM current c, previous p
-        """)).fetchone()
-        if result:
-            change = decimal_to_float(result[0]) - decimal_to_float(result[3]) if result[3] else None
-            labor_indicators.append(LaborIndicator(
-                id="unemployment_rate", name="Unemployment Rate",
-                value=decimal_to_float(result[0]), formatted_value=f"{result[0]}%",
-                change=round(change, 2) if change else None,
-                period=get_period_name(result[2]), year=result[1],
-                source="LN", frequency="Monthly"
-            ))
-    except Exception as e:
-        print(f"Error: {e}")
+# Threads (and so DATA-database connections) all portal requests together
+# run their queries on
+PORTAL_QUERY_WORKERS = 8
+# Sessions a single comprehensive request fans out to; its queries are
+# spread over them and run one after another on each
+PORTAL_SESSIONS_PER_REQUEST = 4
+
+_query_pool = ThreadPoolExecutor(max_workers=PORTAL_QUERY_WORKERS, thread_name_prefix="portal-query")
+
+# Observations fetched per series: enough for the 36-point trends, the
+# previous value and the same period a year earlier
+BLS_OBSERVATION_DEPTH = 36
+
+
+def run_queries_concurrently(db: Session, tasks: Dict[str, Callable[[Session], Any]]) -> Dict[str, Any]:
+    """
+    Run independent query functions in parallel on the shared portal query
+    pool, using at most PORTAL_SESSIONS_PER_REQUEST pooled connections from
+    the engine `db` is bound to. A failing task is logged and yields None so
+    the rest of the page still renders.
+    """
+    engine = db.get_bind()
+    items = list(tasks.items())
+    results: Dict[str, Any] = {}
+
+    def run(lane: List[tuple]) -> None:
+        session = Session(bind=engine)
+        try:
+            for name, fn in lane:
+                try:
+                    results[name] = fn(session)
+                except Exception as e:
+                    print(f"Error in portal query '{name}': {e}")
+                    # A failed statement aborts the transaction for the next task
+                    session.rollback()
+                    results[name] = None
+        finally:
+            session.close()
+
+    lanes = max(1, min(PORTAL_SESSIONS_PER_REQUEST, len(items)))
+    futures = [_query_pool.submit(run, items[i::lanes]) for i in range(lanes)]
+    for future in futures:
+        future.result()
+    return {name: results.get(name) for name in tasks}
+
+
+def fetch_latest_observations(db: Session, table: str, series_ids: List[str], depth: int) -> Dict[str, list]:
+    """
+    Latest `depth` monthly observations (M13 excluded) for many series in one
+    set-based query. Returns {series_id: [row, ...]} newest first; rows have
+    year, period and value.
+    """
+    rows = db.execute(text(f"""
+        SELECT series_id, year, period, value FROM (
+            SELECT series_id, year, period, value,
+                   ROW_NUMBER() OVER (PARTITION BY series_id ORDER BY year DESC, period DESC) AS rn
+            FROM {table}
+            WHERE series_id = ANY(:series_ids) AND period != 'M13'
+        ) ranked
+        WHERE rn <= :depth
+        ORDER BY series_id, rn
+    """), {"series_ids": list(series_ids), "depth": depth}).fetchall()
+
+    by_series: Dict[str, list] = {}
+    for row in rows:
+        by_series.setdefault(row.series_id, []).append(row)
+    return by_series
+
+
+def _previous(obs: list):
+    return obs[1].value if len(obs) > 1 else None
+
+
+def _year_ago(obs: list):
+    latest = obs[0]
+    for row in obs[1:]:
+        if row.year == latest.year - 1 and row.period == latest.period:
+            return row.value
+    return None
+
+
+def _pct_change(current, base, digits: int) -> Optional[float]:
+    if not base:
+        return None
+    return round(((decimal_to_float(current) - decimal_to_float(base)) / decimal_to_float(base)) * 100, digits)
 
-    # 2. Labor Force Participation Rate
-    try:
-        result = db.execute(text("""
-            SELECT value, year, period FROM bls_ln_data
-            WHERE series_id = 'LNS11300000' AND period != 'M13'
-            ORDER BY year DESC, period DESC LIMIT 1
-        """)).fetchone()
-        if result:
-            labor_indicators.append(LaborIndicator(
-                id="lfpr", name="Labor Force Participation Rate",
-                value=decimal_to_float(result[0]), formatted_value=f"{result[0]}%",
-                period=get_period_name(result[2]), year=result[1],
-                source="LN", frequency="Monthly"
-            ))
-    except Exception as e:
-        print(f"Error: {e}")
 
-    # 3. Total Nonfarm Payrolls
-    try:
-        result = db.execute(text("""
-            WITH current AS (
-                SELECT value, year, period FROM bls_ce_data
-                WHERE series_id = 'CES0000000001' AND period != 'M13'
-                ORDER BY year DESC, period DESC LIMIT 1
-            ),
-            previous AS (
-                SELECT value FROM bls_ce_data
-                WHERE series_id = 'CES0000000001' AND period != 'M13'
-                ORDER BY year DESC, period DESC LIMIT 1 OFFSET 1
-            )
-            SELECT c.value, c.year, c.period, p.value as prev
-            FROM current c, previous p
-        """)).fetchone()
-        if result:
-            change = decimal_to_float(result[0]) - decimal_to_float(result[3]) if result[3] else None
-            labor_indicators.append(LaborIndicator(
-                id="nonfarm_payrolls", name="Total Nonfarm Payrolls",
-                value=decimal_to_float(result[0]), formatted_value=f"{result[0]/1000:.1f}M",
-                change=round(change, 0) if change else None,
-                period=get_period_name(result[2]), year=result[1],
-                source="CE", frequency="Monthly"
-            ))
-    except Exception as e:
-        print(f"Error: {e}")
+# ============================================================================
+# BLS COMPREHENSIVE ENDPOINT
+# ============================================================================
 
-    # 4. Job Openings
-    try:
-        result = db.execute(text("""
-            WITH current AS (
-                SELECT value, year, period FROM bls_jt_data
-                WHERE series_id = 'JTS000000000000000JOL' AND period != 'M13'
-                ORDER BY year DESC, period DESC LIMIT 1
-            ),
-            previous AS (
-                SELECT value FROM bls_jt_data
-                WHERE series_id = 'JTS000000000000000JOL' AND period != 'M13'
-                ORDER BY year DESC, period DESC LIMIT 1 OFFSET 1
-            )
-            SELECT c.value, c.year, c.period, p.value as prev
-            FROM current c, previous p
-        """)).fetchone()
-        if result:
-            change = decimal_to_float(result[0]) - decimal_to_float(result[3]) if result[3] else None
-            labor_indicators.append(LaborIndicator(
-                id="job_openings", name="Job Openings (JOLTS)",
-                value=decimal_to_float(result[0]), formatted_value=f"{result[0]/1000:.1f}M",
-                change=round(change, 0) if change else None,
-                period=get_period_name(result[2]), year=result[1],
-                source="JT", frequency="Monthly"
-            ))
-    except Exception as e:
-        print(f"Error: {e}")
+# Headline indicators:
+# (id, name, table, series_id, measure, source, formatter, change digits)
+#   measure "level":      latest value
+#   measure "change":     latest value + change vs previous observation
+#   measure "level_yoy":  latest value + % change vs same period last year
+#   measure "yoy":        % change vs same period last year as the value
+BLS_INDICATORS = [
+    ("unemployment_rate", "Unemployment Rate", "bls_ln_data", "LNS14000000", "change", "LN", lambda v: f"{v}%", 2),
+    ("lfpr", "Labor Force Participation Rate", "bls_ln_data", "LNS11300000", "level", "LN", lambda v: f"{v}%", 2),
+    ("nonfarm_payrolls", "Total Nonfarm Payrolls", "bls_ce_data", "CES0000000001", "change", "CE", lambda v: f"{v/1000:.1f}M", 0),
+    ("job_openings", "Job Openings (JOLTS)", "bls_jt_data", "JTS000000000000000JOL", "change", "JT", lambda v: f"{v/1000:.1f}M", 0),
+    ("quits_rate", "Quits Rate", "bls_jt_data", "JTS000000000000000QUR", "level", "JT", lambda v: f"{v}%", 2),
+    ("avg_hourly_earnings", "Avg Hourly Earnings (YoY)", "bls_ce_data", "CES0500000003", "level_yoy", "CE", lambda v: f"${v:.2f}", 2),
+    ("cpi_yoy", "CPI All Items (YoY)", "bls_cu_data", "CUSR0000SA0", "yoy", "CU", lambda v: f"{v}%", 2),
+    ("cpi_core_yoy", "CPI Core (YoY)", "bls_cu_data", "CUSR0000SA0L1E", "yoy", "CU", lambda v: f"{v}%", 2),
+    ("ppi_yoy", "PPI Final Demand (YoY)", "bls_wp_data", "WPSFD4", "yoy", "WP", lambda v: f"{v}%", 2),
+    ("import_prices_yoy", "Import Prices (YoY)", "bls_ei_data", "EIUIR", "yoy", "EI", lambda v: f"{v}%", 2),
+]
+
+# Top supersectors: (employment, avg hourly earnings, avg weekly hours, name)
+BLS_SUPERSECTORS = [
+    ("CES0500000001", "CES0500000003", "CES0500000002", "Total Private"),
+    ("CES1000000001", "CES1000000003", "CES1000000002", "Mining and Logging"),
+    ("CES2000000001", "CES2000000003", "CES2000000002", "Construction"),
+    ("CES3000000001", "CES3000000003", "CES3000000002", "Manufacturing"),
+    ("CES4000000001", "CES4000000003", "CES4000000002", "Trade, Transportation, Utilities"),
+    ("CES5000000001", "CES5000000003", "CES5000000002", "Information"),
+    ("CES5500000001", "CES5500000003", "CES5500000002", "Financial Activities"),
+    ("CES6000000001", "CES6000000003", "CES6000000002", "Professional & Business Services"),
+    ("CES6500000001", "CES6500000003", "CES6500000002", "Education & Health Services"),
+    ("CES7000000001", "CES7000000003", "CES7000000002", "Leisure & Hospitality"),
+    ("CES8000000001", "CES8000000003", "CES8000000002", "Other Services"),
+    ("CES9000000001", "CES9000000003", "CES9000000002", "Government"),
+]
+
+BLS_CPI_ITEMS = [
+    ("CUSR0000SA0", "All Items"),
+    ("CUSR0000SA0L1E", "All Items Less Food and Energy"),
+    ("CUSR0000SAF1", "Food"),
+    ("CUSR0000SAH1", "Shelter"),
+    ("CUSR0000SETA01", "New Vehicles"),
+    ("CUSR0000SETA02", "Used Cars and Trucks"),
+    ("CUSR0000SAM", "Medical Care"),
+    ("CUSR0000SAA", "Apparel"),
+    ("CUSR0000SETB01", "Gasoline"),
+    ("CUSR0000SEHF01", "Electricity"),
+    ("CUSR0000SEHF02", "Utility Gas Service"),
+    ("CUSR0000SAE1", "Education"),
+]
+
+# 36-month trend charts: field -> (table, series_id)
+BLS_TRENDS = {
+    "unemployment_trend": ("bls_ln_data", "LNS14000000"),
+    "cpi_trend": ("bls_cu_data", "CUSR0000SA0"),
+    "payrolls_trend": ("bls_ce_data", "CES0000000001"),
+}
+
+BLS_STATE_NAMES = {
+    'ST0100000000000': 'Alabama', 'ST0200000000000': 'Alaska', 'ST0400000000000': 'Arizona',
+    'ST0500000000000': 'Arkansas', 'ST0600000000000': 'California', 'ST0800000000000': 'Colorado',
+    'ST0900000000000': 'Connecticut', 'ST1000000000000': 'Delaware', 'ST1100000000000': 'DC',
+    'ST1200000000000': 'Florida', 'ST1300000000000': 'Georgia', 'ST1500000000000': 'Hawaii',
+    'ST1600000000000': 'Idaho', 'ST1700000000000': 'Illinois', 'ST1800000000000': 'Indiana',
+    'ST1900000000000': 'Iowa', 'ST2000000000000': 'Kansas', 'ST2100000000000': 'Kentucky',
+    'ST2200000000000': 'Louisiana', 'ST2300000000000': 'Maine', 'ST2400000000000': 'Maryland',
+    'ST2500000000000': 'Massachusetts', 'ST2600000000000': 'Michigan', 'ST2700000000000': 'Minnesota',
+    'ST2800000000000': 'Mississippi', 'ST2900000000000': 'Missouri', 'ST3000000000000': 'Montana',
+    'ST3100000000000': 'Nebraska', 'ST3200000000000': 'Nevada', 'ST3300000000000': 'New Hampshire',
+    'ST3400000000000': 'New Jersey', 'ST3500000000000': 'New Mexico', 'ST3600000000000': 'New York',
+    'ST3700000000000': 'North Carolina', 'ST3800000000000': 'North Dakota', 'ST3900000000000': 'Ohio',
+    'ST4000000000000': 'Oklahoma', 'ST4100000000000': 'Oregon', 'ST4200000000000': 'Pennsylvania',
+    'ST4400000000000': 'Rhode Island', 'ST4500000000000': 'South Carolina', 'ST4600000000000': 'South Dakota',
+    'ST4700000000000': 'Tennessee', 'ST4800000000000': 'Texas', 'ST4900000000000': 'Utah',
+    'ST5000000000000': 'Vermont', 'ST5100000000000': 'Virginia', 'ST5300000000000': 'Washington',
+    'ST5400000000000': 'West Virginia', 'ST5500000000000': 'Wisconsin', 'ST5600000000000': 'Wyoming',
+}
+
+
+def _bls_series_by_table() -> Dict[str, List[str]]:
+    """All series the BLS portal needs, grouped by data table."""
+    by_table: Dict[str, List[str]] = {}
+
+    def add(table: str, series_id: str):
+        ids = by_table.setdefault(table, [])
+        if series_id not in ids:
+            ids.append(series_id)
+
+    for _, _, table, series_id, _, _, _, _ in BLS_INDICATORS:
+        add(table, series_id)
+    for emp_id, earnings_id, hours_id, _ in BLS_SUPERSECTORS:
+        for series_id in (emp_id, earnings_id, hours_id):
+            add("bls_ce_data", series_id)
+    for series_id, _ in BLS_CPI_ITEMS:
+        add("bls_cu_data", series_id)
+    for table, series_id in BLS_TRENDS.values():
+        add(table, series_id)
+    return by_table
+
+
+def _fetch_regional_unemployment(db: Session) -> list:
+    return db.execute(text("""
+        WITH latest AS (
+            SELECT DISTINCT ON (series_id) series_id, value, year, period
+            FROM bls_la_data
+            WHERE series_id LIKE 'LASST%03' AND period != 'M13'
+            ORDER BY series_id, year DESC, period DESC
+        ),
+        previous AS (
+            SELECT DISTINCT ON (series_id) series_id, value
+            FROM bls_la_data
+            WHERE series_id LIKE 'LASST%03' AND period != 'M13'
+              AND (year, period) < (SELECT year, period FROM latest LIMIT 1)
+            ORDER BY series_id, year DESC, period DESC
+        )
+        SELECT l.series_id, l.value, l.year, l.period,
+               COALESCE(p.value, l.value) as prev_value
+        FROM latest l
+        LEFT JOIN previous p ON l.series_id = p.series_id
+        ORDER BY l.value DESC
+        LIMIT 25
+    """)).fetchall()
+
+
+def _build_labor_indicator(spec, obs: list) -> Optional[LaborIndicator]:
+    indicator_id, name, _, _, measure, source, formatter, change_digits = spec
+    latest = obs[0]
+    fields = dict(
+        id=indicator_id, name=name,
+        period=get_period_name(latest.period), year=latest.year,
+        source=source, frequency="Monthly",
+    )
 
-    # 5. Quits Rate
-    try:
-        result = db.execute(text("""
-            SELECT value, year, period FROM bls_jt_data
-            WHERE series_id = 'JTS000000000000000QUR' AND period != 'M13'
-            ORDER BY year DESC, period DESC LIMIT 1
-        """)).fetchone()
-        if result:
-            labor_indicators.append(LaborIndicator(
-                id="quits_rate", name="Quits Rate",
-                value=decimal_to_float(result[0]), formatted_value=f"{result[0]}%",
-                period=get_period_name(result[2]), year=result[1],
-                source="JT", frequency="Monthly"
-            ))
-    except Exception as e:
-        print(f"Error: {e}")
+    if measure == "yoy":
+        yoy = _pct_change(latest.value, _year_ago(obs), 1)
+        if yoy is None:
+            return None
+        return LaborIndicator(value=yoy, formatted_value=formatter(yoy), **fields)
+
+    fields.update(value=decimal_to_float(latest.value), formatted_value=formatter(latest.value))
+    if measure == "change":
+        prev = _previous(obs)
+        change = decimal_to_float(latest.value) - decimal_to_float(prev) if prev else None
+        fields["change"] = round(change, change_digits) if change else None
+    elif measure == "level_yoy":
+        fields["change_pct"] = _pct_change(latest.value, _year_ago(obs), 1)
+    return LaborIndicator(**fields)
+
+
+def _trend_points(obs: list) -> List[TrendPoint]:
+    return [
+        TrendPoint(
+            date=f"{row.year}-{row.period[1:]}",
+            value=decimal_to_float(row.value),
+            period=get_period_name(row.period),
+            year=row.year
+        )
+        for row in reversed(obs)
+    ]
 
-    # 6. Average Hourly Earnings
-    try:
-        result = db.execute(text("""
-            WITH current AS (
-                SELECT value, year, period FROM bls_ce_data
-                WHERE series_id = 'CES0500000003' AND period != 'M13'
-                ORDER BY year DESC, period DESC LIMIT 1
-            ),
-            year_ago AS (
-                SELECT value FROM bls_ce_data
-                WHERE series_id = 'CES0500000003'
-                AND (year, period) = (
-                    SELECT year - 1, period FROM bls_ce_data
-                    WHERE series_id = 'CES0500000003' AND period != 'M13'
-                    ORDER BY year DESC, period DESC LIMIT 1
-                )
-            )
-            SELECT c.value, c.year, c.period, y.value as year_ago
-            FROM current c LEFT JOIN year_ago y ON true
-        """)).fetchone()
-        if result:
-            yoy = round(((decimal_to_float(result[0]) - decimal_to_float(result[3])) / decimal_to_float(result[3])) * 100, 1) if result[3] else None
-            labor_indicators.append(LaborIndicator(
-                id="avg_hourly_earnings", name="Avg Hourly Earnings (YoY)",
-                value=decimal_to_float(result[0]), formatted_value=f"${result[0]:.2f}",
-                change_pct=yoy,
-                period=get_period_name(result[2]), year=result[1],
-                source="CE", frequency="Monthly"
-            ))
-    except Exception as e:
-        print(f"Error: {e}")
 
-    # 7. CPI All Items YoY
-    try:
-        result = db.execute(text("""
-            WITH current AS (
-                SELECT value, year, period FROM bls_cu_data
-                WHERE series_id = 'CUSR0000SA0' AND period != 'M13'
-                ORDER BY year DESC, period DESC LIMIT 1
-            ),
-            year_ago AS (
-                SELECT value FROM bls_cu_data d
-                WHERE series_id = 'CUSR0000SA0'
-                AND year = (SELECT year - 1 FROM current)
-                AND period = (SELECT period FROM current)
-            )
-            SELECT c.value, c.year, c.period, y.value as year_ago
-            FROM current c, year_ago y
-        """)).fetchone()
-        if result and result[3]:
-            yoy = round(((decimal_to_float(result[0]) - decimal_to_float(result[3])) / decimal_to_float(result[3])) * 100, 1)
-            labor_indicators.append(LaborIndicator(
-                id="cpi_yoy", name="CPI All Items (YoY)",
-                value=yoy, formatted_value=f"{yoy}%",
-                period=get_period_name(result[2]), year=result[1],
-                source="CU", frequency="Monthly"
-            ))
-    except Exception as e:
-        print(f"Error: {e}")
+@router.get("/bls/comprehensive", response_model=BLSPortalData)
+@cached("portal:bls:comprehensive", category=DataCategory.BLS_MONTHLY)
+def get_bls_comprehensive(db: Session = Depends(get_data_db)):
+    """Get comprehensive BLS portal data (cached for 24h)"""
+    # One window-function query per BLS table plus the regional query, all in
+    # parallel: cold-cache latency is that of the slowest table, not the sum
+    series_by_table = _bls_series_by_table()
+    tasks: Dict[str, Callable[[Session], Any]] = {
+        table: partial(fetch_latest_observations, table=table, series_ids=ids, depth=BLS_OBSERVATION_DEPTH)
+        for table, ids in series_by_table.items()
+    }
+    tasks["regional"] = _fetch_regional_unemployment
+    results = run_queries_concurrently(db, tasks)
 
-    # 8. CPI Core YoY
-    try:
-        result = db.execute(text("""
-            WITH current AS (
-                SELECT value, year, period FROM bls_cu_data
-                WHERE series_id = 'CUSR0000SA0L1E' AND period != 'M13'
-                ORDER BY year DESC, period DESC LIMIT 1
-            ),
-            year_ago AS (
-                SELECT value FROM bls_cu_data
-                WHERE series_id = 'CUSR0000SA0L1E'
-                AND year = (SELECT year - 1 FROM current)
-                AND period = (SELECT period FROM current)
-            )
-            SELECT c.value, c.year, c.period, y.value as year_ago
-            FROM current c, year_ago y
-        """)).fetchone()
-        if result and result[3]:
-            yoy = round(((decimal_to_float(result[0]) - decimal_to_float(result[3])) / decimal_to_float(result[3])) * 100, 1)
-            labor_indicators.append(LaborIndicator(
-                id="cpi_core_yoy", name="CPI Core (YoY)",
-                value=yoy, formatted_value=f"{yoy}%",
-                period=get_period_name(result[2]), year=result[1],
-                source="CU", frequency="Monthly"
-            ))
-    except Exception as e:
-        print(f"Error: {e}")
+    observations: Dict[str, Dict[str, list]] = {
+        table: results.get(table) or {} for table in series_by_table
+    }
 
-    # 9. PPI Final Demand YoY
-    try:
-        result = db.execute(text("""
-            WITH current AS (
-                SELECT value, year, period FROM bls_wp_data
-                WHERE series_id = 'WPSFD4' AND period != 'M13'
-                ORDER BY year DESC, period DESC LIMIT 1
-            ),
-            year_ago AS (
-                SELECT value FROM bls_wp_data
-                WHERE series_id = 'WPSFD4'
-                AND year = (SELECT year - 1 FROM current)
-                AND period = (SELECT period FROM current)
-            )
-            SELECT c.value, c.year, c.period, y.value as year_ago
-            FROM current c, year_ago y
-        """)).fetchone()
-        if result and result[3]:
-            yoy = round(((decimal_to_float(result[0]) - decimal_to_float(result[3])) / decimal_to_float(result[3])) * 100, 1)
-            labor_indicators.append(LaborIndicator(
-                id="ppi_yoy", name="PPI Final Demand (YoY)",
-                value=yoy, formatted_value=f"{yoy}%",
-                period=get_period_name(result[2]), year=result[1],
-                source="WP", frequency="Monthly"
-            ))
-    except Exception as e:
-        print(f"Error: {e}")
+    def series(table: str, series_id: str) -> list:
+        return observations.get(table, {}).get(series_id, [])
 
-    # 10. Import Price Index YoY
-    try:
-        result = db.execute(text("""
-            WITH current AS (
-                SELECT value, year, period FROM bls_ei_data
-                WHERE series_id = 'EIUIR' AND period != 'M13'
-                ORDER BY year DESC, period DESC LIMIT 1
-            ),
-            year_ago AS (
-                SELECT value FROM bls_ei_data
-                WHERE series_id = 'EIUIR'
-                AND year = (SELECT year - 1 FROM current)
-                AND period = (SELECT period FROM current)
-            )
-            SELECT c.value, c.year, c.period, y.value as year_ago
-            FROM current c, year_ago y
-        """)).fetchone()
-        if result and result[3]:
-            yoy = round(((decimal_to_float(result[0]) - decimal_to_float(result[3])) / decimal_to_float(result[3])) * 100, 1)
-            labor_indicators.append(LaborIndicator(
-                id="import_prices_yoy", name="Import Prices (YoY)",
-                value=yoy, formatted_value=f"{yoy}%",
-                period=get_period_name(result[2]), year=result[1],
-                source="EI", frequency="Monthly"
-            ))
-    except Exception as e:
-        print(f"Error: {e}")
+    # --- LABOR INDICATORS ---
+    labor_indicators = []
+    for spec in BLS_INDICATORS:
+        obs = series(spec[2], spec[3])
+        if not obs:
+            continue
+        try:
+            indicator = _build_labor_indicator(spec, obs)
+            if indicator:
+                labor_indicators.append(indicator)
+        except Exception as e:
+            print(f"Error: {e}")
 
     # --- EMPLOYMENT BY INDUSTRY (Top supersectors) ---
     employment_by_industry = []
-    supersectors = [
-        ("CES0500000001", "CES0500000003", "CES0500000002", "Total Private"),
-        ("CES1000000001", "CES1000000003", "CES1000000002", "Mining and Logging"),
-        ("CES2000000001", "CES2000000003", "CES2000000002", "Construction"),
-        ("CES3000000001", "CES3000000003", "CES3000000002", "Manufacturing"),
-        ("CES4000000001", "CES4000000003", "CES4000000002", "Trade, Transportation, Utilities"),
-        ("CES5000000001", "CES5000000003", "CES5000000002", "Information"),
-        ("CES5500000001", "CES5500000003", "CES5500000002", "Financial Activities"),
-        ("CES6000000001", "CES6000000003", "CES6000000002", "Professional & Business Services"),
-        ("CES6500000001", "CES6500000003", "CES6500000002", "Education & Health Services"),
-        ("CES7000000001", "CES7000000003", "CES7000000002", "Leisure & Hospitality"),
-        ("CES8000000001", "CES8000000003", "CES8000000002", "Other Services"),
-        ("CES9000000001", "CES9000000003", "CES9000000002", "Government"),
-    ]
-
-    for emp_id, earnings_id, hours_id, name in supersectors:
+    for emp_id, earnings_id, hours_id, name in BLS_SUPERSECTORS:
         try:
-            result = db.execute(text("""
-                WITH current AS (
-                    SELECT value, year, period FROM bls_ce_data
-                    WHERE series_id = :emp_id AND period != 'M13'
-                    ORDER BY year DESC, period DESC LIMIT 1
-                ),
-                previous AS (
-                    SELECT value FROM bls_ce_data
-                    WHERE series_id = :emp_id AND period != 'M13'
-                    ORDER BY year DESC, period DESC LIMIT 1 OFFSET 1
-                ),
-                earnings AS (
-                    SELECT value FROM bls_ce_data
-                    WHERE series_id = :earnings_id AND period != 'M13'
-                    ORDER BY year DESC, period DESC LIMIT 1
-                ),
-                hours AS (
-                    SELECT value FROM bls_ce_data
-                    WHERE series_id = :hours_id AND period != 'M13'
-                    ORDER BY year DESC, period DESC LIMIT 1
-                )
-                SELECT c.value, c.year, c.period, p.value, e.value, h.value
-                FROM current c
-                LEFT JOIN previous p ON true
-                LEFT JOIN earnings e ON true
-                LEFT JOIN hours h ON true
-            """), {"emp_id": emp_id, "earnings_id": earnings_id, "hours_id": hours_id}).fetchone()
-
-            if result and result[0]:
-                change = decimal_to_float(result[0]) - decimal_to_float(result[3]) if result[3] else None
-                change_pct = round((change / decimal_to_float(result[3])) * 100, 2) if change and result[3] else None
-                employment_by_industry.append(IndustryEmployment(
-                    industry_code=emp_id[:6],
-                    industry_name=name,
-                    employment=decimal_to_float(result[0]),
-                    employment_change=round(change, 1) if change else None,
-                    employment_change_pct=change_pct,
-                    avg_hourly_earnings=decimal_to_float(result[4]),
-                    avg_weekly_hours=decimal_to_float(result[5]),
-                    period=get_period_name(result[2]),
-                    year=result[1]
-                ))
+            obs = series("bls_ce_data", emp_id)
+            if not obs or not obs[0].value:
+                continue
+            latest, prev = obs[0], _previous(obs)
+            earnings = series("bls_ce_data", earnings_id)
+            hours = series("bls_ce_data", hours_id)
+
+            change = decimal_to_float(latest.value) - decimal_to_float(prev) if prev else None
+            change_pct = round((change / decimal_to_float(prev)) * 100, 2) if change and prev else None
+            employment_by_industry.append(IndustryEmployment(
+                industry_code=emp_id[:6],
+                industry_name=name,
+                employment=decimal_to_float(latest.value),
+                employment_change=round(change, 1) if change else None,
+                employment_change_pct=change_pct,
+                avg_hourly_earnings=decimal_to_float(earnings[0].value) if earnings else None,
+                avg_weekly_hours=decimal_to_float(hours[0].value) if hours else None,
+                period=get_period_name(latest.period),
+                year=latest.year
+            ))
         except Exception as e:
             print(f"Error fetching {name}: {e}")
 
     # --- CPI CATEGORIES ---
     cpi_categories = []
-    cpi_items = [
-        ("CUSR0000SA0", "All Items"),
-        ("CUSR0000SA0L1E", "All Items Less Food and Energy"),
-        ("CUSR0000SAF1", "Food"),
-        ("CUSR0000SAH1", "Shelter"),
-        ("CUSR0000SETA01", "New Vehicles"),
-        ("CUSR0000SETA02", "Used Cars and Trucks"),
-        ("CUSR0000SAM", "Medical Care"),
-        ("CUSR0000SAA", "Apparel"),
-        ("CUSR0000SETB01", "Gasoline"),
-        ("CUSR0000SEHF01", "Electricity"),
-        ("CUSR0000SEHF02", "Utility Gas Service"),
-        ("CUSR0000SAE1", "Education"),
-    ]
-
-    for series_id, name in cpi_items:
+    for series_id, name in BLS_CPI_ITEMS:
         try:
-            result = db.execute(text("""
-                WITH current AS (
-                    SELECT value, year, period FROM bls_cu_data
-                    WHERE series_id = :sid AND period != 'M13'
-                    ORDER BY year DESC, period DESC LIMIT 1
-                ),
-                previous AS (
-                    SELECT value FROM bls_cu_data
-                    WHERE series_id = :sid AND period != 'M13'
-                    ORDER BY year DESC, period DESC LIMIT 1 OFFSET 1
-                ),
-                year_ago AS (
-                    SELECT value FROM bls_cu_data
-                    WHERE series_id = :sid
-                    AND year = (SELECT year - 1 FROM current)
-                    AND period = (SELECT period FROM current)
-                )
-                SELECT c.value, c.year, c.period, p.value, y.value
-                FROM current c
-                LEFT JOIN previous p ON true
-                LEFT JOIN year_ago y ON true
-            """), {"sid": series_id}).fetchone()
-
-            if result and result[0]:
-                mom = round(((decimal_to_float(result[0]) - decimal_to_float(result[3])) / decimal_to_float(result[3])) * 100, 2) if result[3] else None
-                yoy = round(((decimal_to_float(result[0]) - decimal_to_float(result[4])) / decimal_to_float(result[4])) * 100, 1) if result[4] else None
-                cpi_categories.append(CPICategory(
-                    item_code=series_id,
-                    item_name=name,
-                    index_value=decimal_to_float(result[0]),
-                    mom_change=mom,
-                    yoy_change=yoy,
-                    period=get_period_name(result[2]),
-                    year=result[1]
-                ))
+            obs = series("bls_cu_data", series_id)
+            if not obs or not obs[0].value:
+                continue
+            latest = obs[0]
+            cpi_categories.append(CPICategory(
+                item_code=series_id,
+                item_name=name,
+                index_value=decimal_to_float(latest.value),
+                mom_change=_pct_change(latest.value, _previous(obs), 2),
+                yoy_change=_pct_change(latest.value, _year_ago(obs), 1),
+                period=get_period_name(latest.period),
+                year=latest.year
+            ))
         except Exception as e:
             print(f"Error fetching CPI {name}: {e}")
 
-    # --- REGIONAL UNEMPLOYMENT (Top 20 states) ---
+    # --- REGIONAL UNEMPLOYMENT (Top 25 states) ---
     regional_unemployment = []
-    try:
-        result = db.execute(text("""
-            WITH latest AS (
-                SELECT DISTINCT ON (series_id) series_id, value, year, period
-                FROM bls_la_data
-                WHERE series_id LIKE 'LASST%03' AND period != 'M13'
-                ORDER BY series_id, year DESC, period DESC
-            ),
-            previous AS (
-                SELECT DISTINCT ON (series_id) series_id, value
-                FROM bls_la_data
-                WHERE series_id LIKE 'LASST%03' AND period != 'M13'
-                  AND (year, period) < (SELECT year, period FROM latest LIMIT 1)
-                ORDER BY series_id, year DESC, period DESC
-            )
-            SELECT l.series_id, l.value, l.year, l.period,
-                   COALESCE(p.value, l.value) as prev_value
-            FROM latest l
-            LEFT JOIN previous p ON l.series_id = p.series_id
-            ORDER BY l.value DESC
-            LIMIT 25
-        """)).fetchall()
-
-        state_codes = {
-            'ST0100000000000': 'Alabama', 'ST0200000000000': 'Alaska', 'ST0400000000000': 'Arizona',
-            'ST0500000000000': 'Arkansas', 'ST0600000000000': 'California', 'ST0800000000000': 'Colorado',
-            'ST0900000000000': 'Connecticut', 'ST1000000000000': 'Delaware', 'ST1100000000000': 'DC',
-            'ST1200000000000': 'Florida', 'ST1300000000000': 'Georgia', 'ST1500000000000': 'Hawaii',
-            'ST1600000000000': 'Idaho', 'ST1700000000000': 'Illinois', 'ST1800000000000': 'Indiana',
-            'ST1900000000000': 'Iowa', 'ST2000000000000': 'Kansas', 'ST2100000000000': 'Kentucky',
-            'ST2200000000000': 'Louisiana', 'ST2300000000000': 'Maine', 'ST2400000000000': 'Maryland',
-            'ST2500000000000': 'Massachusetts', 'ST2600000000000': 'Michigan', 'ST2700000000000': 'Minnesota',
-            'ST2800000000000': 'Mississippi', 'ST2900000000000': 'Missouri', 'ST3000000000000': 'Montana',
-            'ST3100000000000': 'Nebraska', 'ST3200000000000': 'Nevada', 'ST3300000000000': 'New Hampshire',
-            'ST3400000000000': 'New Jersey', 'ST3500000000000': 'New Mexico', 'ST3600000000000': 'New York',
-            'ST3700000000000': 'North Carolina', 'ST3800000000000': 'North Dakota', 'ST3900000000000': 'Ohio',
-            'ST4000000000000': 'Oklahoma', 'ST4100000000000': 'Oregon', 'ST4200000000000': 'Pennsylvania',
-            'ST4400000000000': 'Rhode Island', 'ST4500000000000': 'South Carolina', 'ST4600000000000': 'South Dakota',
-            'ST4700000000000': 'Tennessee', 'ST4800000000000': 'Texas', 'ST4900000000000': 'Utah',
-            'ST5000000000000': 'Vermont', 'ST5100000000000': 'Virginia', 'ST5300000000000': 'Washington',
-            'ST5400000000000': 'West Virginia', 'ST5500000000000': 'Wisconsin', 'ST5600000000000': 'Wyoming',
-        }
-
-        for row in result:
+    for row in results.get("regional") or []:
+        try:
             series_id = row[0]
             # Extract state code from series_id (LASST0100000000003 -> ST0100000000000)
             state_key = series_id[3:18]
-            state_name = state_codes.get(state_key, series_id[3:5])
+            state_name = BLS_STATE_NAMES.get(state_key, series_id[3:5])
             change = decimal_to_float(row[1]) - decimal_to_float(row[4]) if row[4] else None
             regional_unemployment.append(RegionalUnemployment(
                 area_code=series_id,
@@ -666,60 +565,14 @@ async def get_bls_comprehensive(db: Session = Depends(get_data_db)):
                 period=get_period_name(row[3]),
                 year=row[2]
             ))
-    except Exception as e:
-        print(f"Error fetching regional: {e}")
+        except Exception as e:
+            print(f"Error fetching regional: {e}")
 
     # --- TRENDS ---
-    unemployment_trend = []
-    try:
-        result = db.execute(text("""
-            SELECT year, period, value FROM bls_ln_data
-            WHERE series_id = 'LNS14000000' AND period != 'M13'
-            ORDER BY year DESC, period DESC LIMIT 36
-        """)).fetchall()
-        for row in reversed(result):
-            unemployment_trend.append(TrendPoint(
-                date=f"{row[0]}-{row[1][1:]}",
-                value=decimal_to_float(row[2]),
-                period=get_period_name(row[1]),
-                year=row[0]
-            ))
-    except Exception as e:
-        print(f"Error: {e}")
-
-    cpi_trend = []
-    try:
-        result = db.execute(text("""
-            SELECT year, period, value FROM bls_cu_data
-            WHERE series_id = 'CUSR0000SA0' AND period != 'M13'
-            ORDER BY year DESC, period DESC LIMIT 36
-        """)).fetchall()
-        for row in reversed(result):
-            cpi_trend.append(TrendPoint(
-                date=f"{row[0]}-{row[1][1:]}",
-                value=decimal_to_float(row[2]),
-                period=get_period_name(row[1]),
-                year=row[0]
-            ))
-    except Exception as e:
-        print(f"Error: {e}")
-
-    payrolls_trend = []
-    try:
-        result = db.execute(text("""
-            SELECT year, period, value FROM bls_ce_data
-            WHERE series_id = 'CES0000000001' AND period != 'M13'
-            ORDER BY year DESC, period DESC LIMIT 36
-        """)).fetchall()
-        for row in reversed(result):
-            payrolls_trend.append(TrendPoint(
-                date=f"{row[0]}-{row[1][1:]}",
-                value=decimal_to_float(row[2]),
-                period=get_period_name(row[1]),
-                year=row[0]
-            ))
-    except Exception as e:
-        print(f"Error: {e}")
+    trends = {
+        field: _trend_points(series(table, series_id))
+        for field, (table, series_id) in BLS_TRENDS.items()
+    }
 
     # --- SURVEYS ---
     surveys = [
@@ -756,9 +609,9 @@ async def get_bls_comprehensive(db: Session = Depends(get_data_db)):
         employment_by_industry=employment_by_industry,
         cpi_categories=cpi_categories,
         regional_unemployment=regional_unemployment,
-        unemployment_trend=unemployment_trend,
-        cpi_trend=cpi_trend,
-        payrolls_trend=payrolls_trend,
+        unemployment_trend=trends["unemployment_trend"],
+        cpi_trend=trends["cpi_trend"],
+        payrolls_trend=trends["payrolls_trend"],
         surveys=surveys,
         quick_studies=quick_studies,
         last_updated=datetime.now().isoformat()
@@ -771,8 +624,26 @@ async def get_bls_comprehensive(db: Session = Depends(get_data_db)):
 
 @router.get("/treasury/comprehensive", response_model=TreasuryPortalData)
 @cached("portal:treasury:comprehensive", category=DataCategory.TREASURY_YIELDS)
-async def get_treasury_comprehensive(db: Session = Depends(get_data_db)):
+def get_treasury_comprehensive(db: Session = Depends(get_data_db)):
     """Get comprehensive Treasury portal data (cached for 4h)"""
+    # Daily rates (one 90-day read serves the curve, the trends and the
+    # spreads), recent auctions and upcoming auctions are fetched in parallel
+    results = run_queries_concurrently(db, {
+        "rates": lambda s: s.query(TreasuryDailyRate).order_by(
+            desc(TreasuryDailyRate.rate_date)
+        ).limit(90).all(),
+        "auctions": lambda s: s.query(TreasuryAuction).filter(
+            TreasuryAuction.high_yield.isnot(None)
+        ).order_by(
+            desc(TreasuryAuction.auction_date)
+        ).limit(15).all(),
+        "upcoming": lambda s: s.query(TreasuryUpcomingAuction).filter(
+            TreasuryUpcomingAuction.auction_date >= date.today()
+        ).order_by(
+            TreasuryUpcomingAuction.auction_date
+        ).limit(20).all(),
+    })
+    trend_rates = results.get("rates") or []
 
     # --- YIELD CURVE ---
     yield_curve = []
@@ -784,10 +655,8 @@ async def get_treasury_comprehensive(db: Session = Depends(get_data_db)):
     ]
 
     try:
-        # Get the latest 30 days of data for change calculations using ORM
-        rates = db.query(TreasuryDailyRate).order_by(
-            desc(TreasuryDailyRate.rate_date)
-        ).limit(30).all()
+        # Latest 30 days of data for change calculations
+        rates = trend_rates[:30]
 
         if rates:
             latest = rates[0]
@@ -833,11 +702,6 @@ async def get_treasury_comprehensive(db: Session = Depends(get_data_db)):
     yield_trend_10y = []
     yield_trend_2y = []
     try:
-        # Get 90 days of rate data using ORM
-        trend_rates = db.query(TreasuryDailyRate).order_by(
-            desc(TreasuryDailyRate.rate_date)
-        ).limit(90).all()
-
         for rate in reversed(trend_rates):
             if rate.yield_10y is not None:
                 yield_trend_10y.append(TrendPoint(
@@ -855,10 +719,8 @@ async def get_treasury_comprehensive(db: Session = Depends(get_data_db)):
     # --- SPREADS ---
     spreads = []
     try:
-        # Get latest rate for spread calculations using ORM
-        latest_rate = db.query(TreasuryDailyRate).order_by(
-            desc(TreasuryDailyRate.rate_date)
-        ).first()
+        # Latest rate for spread calculations
+        latest_rate = trend_rates[0] if trend_rates else None
 
         if latest_rate:
             y2 = decimal_to_float(latest_rate.yield_2y)
@@ -884,12 +746,7 @@ async def get_treasury_comprehensive(db: Session = Depends(get_data_db)):
     # --- RECENT AUCTIONS ---
     recent_auctions = []
     try:
-        # Get recent auctions using ORM
-        auctions = db.query(TreasuryAuction).filter(
-            TreasuryAuction.high_yield.isnot(None)
-        ).order_by(
-            desc(TreasuryAuction.auction_date)
-        ).limit(15).all()
+        auctions = results.get("auctions") or []
 
         for auction in auctions:
             total_accepted = decimal_to_float(auction.total_accepted) or 1
@@ -914,12 +771,7 @@ async def get_treasury_comprehensive(db: Session = Depends(get_data_db)):
     # --- UPCOMING AUCTIONS ---
     upcoming_auctions = []
     try:
-        # Get upcoming auctions using ORM
-        upcoming = db.query(TreasuryUpcomingAuction).filter(
-            TreasuryUpcomingAuction.auction_date >= date.today()
-        ).order_by(
-            TreasuryUpcomingAuction.auction_date
-        ).limit(20).all()
+        upcoming = results.get("upcoming") or []
 
         for auction in upcoming:
             upcoming_auctions.append(UpcomingAuctionData(
@@ -958,14 +810,14 @@ async def get_treasury_comprehensive(db: Session = Depends(get_data_db)):
 
 @router.get("/bls/snapshot")
 @cached("portal:bls:comprehensive", category=DataCategory.BLS_MONTHLY)
-async def get_bls_snapshot(db: Session = Depends(get_data_db)):
+def get_bls_snapshot(db: Session = Depends(get_data_db)):
     """Legacy endpoint - same cache as comprehensive"""
     # Note: shares cache key with /bls/comprehensive
-    return await get_bls_comprehensive.__wrapped__(db)  # Call original function
+    return get_bls_comprehensive.__wrapped__(db)  # Call original function
 
 
 @router.get("/treasury/snapshot")
 @cached("portal:treasury:comprehensive", category=DataCategory.TREASURY_YIELDS)
-async def get_treasury_snapshot(db: Session = Depends(get_data_db)):
+def get_treasury_snapshot(db: Session = Depends(get_data_db)):
     """Legacy endpoint - same cache as comprehensive"""
-    return await get_treasury_comprehensive.__wrapped__(db)
+    return get_treasury_comprehensive.__wrapped__(db)
@@ -125,7 +125,7 @@ class UpcomingAuctionResponse(BaseModel):
 # ===================== API Endpoints ===================== #
 
 @router.get("/terms", response_model=List[TermSummaryResponse])
-async def get_term_summaries(
+def get_term_summaries(
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -168,7 +168,7 @@ async def get_term_summaries(
 
 
 @router.get("/auctions", response_model=List[AuctionResponse])
-async def get_auctions(
+def get_auctions(
     security_term: Optional[str] = None,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
@@ -224,7 +224,7 @@ async def get_auctions(
 
 
 @router.get("/auctions/{auction_id}", response_model=AuctionDetailResponse)
-async def get_auction_detail(
+def get_auction_detail(
     auction_id: int,
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
@@ -274,7 +274,7 @@ async def get_auction_detail(
 
 
 @router.get("/history/{security_term}", response_model=YieldHistoryResponse)
-async def get_yield_history(
+def get_yield_history(
     security_term: str,
     years: int = Query(5, ge=1, le=50),
     include_reopenings: bool = Query(True, description="Include reopenings for benchmark terms"),
@@ -314,7 +314,7 @@ async def get_yield_history(
 
 
 @router.get("/upcoming", response_model=List[UpcomingAuctionResponse])
-async def get_upcoming_auctions(
+def get_upcoming_auctions(
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -342,7 +342,7 @@ async def get_upcoming_auctions(
 
 
 @router.get("/compare")
-async def compare_terms(
+def compare_terms(
     terms: str = Query("10-Year,30-Year", description="Comma-separated list of terms"),
     years: int = Query(5, ge=1, le=50),
     db: Session = Depends(get_data_db),
@@ -374,7 +374,7 @@ async def compare_terms(
 
 
 @router.get("/snapshot")
-async def get_auction_snapshot(
+def get_auction_snapshot(
     db: Session = Depends(get_data_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -19,7 +19,16 @@ class Settings(BaseSettings):
     DATA_DB_MAX_OVERFLOW: int = 10
     DATA_DB_POOL_RECYCLE: int = 3600
 
+    # Threadpool for sync (def) endpoints; anyio's default (40) unless set.
+    # Requests on the DATA database are limited separately, to its pool size
+    # + overflow (see database.data_db_slot)
+    THREADPOOL_MAX_WORKERS: Optional[int] = None
+
     FRONTEND_URL: str = "http://localhost:3000"
+
+    # Public URL of this API; report pages link their static bundle and
+    # chart data from here (they are shown in an iframe on the frontend origin)
+    API_PUBLIC_URL: str = "http://localhost:8000"
     
     # Security
     SECRET_KEY: str
@@ -31,6 +40,32 @@ class Settings(BaseSettings):
     FMP_API_KEY: Optional[str] = None
     FRED_API_KEY: Optional[str] = None
     FINNHUB_API_KEY: Optional[str] = None
+
+    # FMP collection engine (Phase A)
+    FMP_MAX_CONCURRENCY: int = 8          # in-flight requests per collection
+    FMP_RATE_LIMIT_PER_MINUTE: int = 300  # plan quota, shared by all requests of a collection
+    # Phase A source: "auto" reads tickers the DATA database holds current copies of
+    # (per table_update_tracking) from it and fetches only the rest from FMP; "fmp" = FMP only
+    COLLECTION_SOURCE: str = "auto"
+    COLLECTION_DB_GRACE_HOURS: int = 24   # tolerate tables this far past next_update_due
+    # Shared cache of raw FMP/FRED responses (see data_collection/response_cache.py)
+    RESPONSE_CACHE_BACKEND: str = "redis"  # redis | disk | off; redis falls back to disk
+
+    # Section generation (Phase B)
+    SECTION_WORKERS: int = 4              # shared process-pool size; 1 = sequential, in-process
+    SECTION_RELOAD_MODULES: bool = False  # reload section modules edited since import (only with DEBUG)
+
+    # Job queue for collection/generation (see app/jobs)
+    JOB_QUEUE_BACKEND: str = "redis"      # redis | memory (single process; also the fallback without Redis)
+    JOB_WORKER_IN_API: bool = True        # run a worker inside the API process; False with dedicated workers
+    JOB_WORKER_CONCURRENCY: int = 2       # jobs run at once per worker process
+    JOB_MAX_RUNNING_PER_USER: int = 2     # running jobs per user across all workers (0 = unlimited)
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_RETRY_BACKOFF_SECONDS: int = 30   # doubled after each failed attempt
+    JOB_STALE_SECONDS: int = 300          # running jobs without a heartbeat this long are requeued
+
+    # In-process cache of unpickled collectors (0 disables)
+    COLLECTOR_CACHE_MAX_BYTES: int = 1024 * 1024 * 1024
     
     # File Storage
     DATA_DIR: str = "./data"
@@ -56,6 +91,23 @@ class Settings(BaseSettings):
     # Cache Settings
     CACHE_ENABLED: bool = True
     CACHE_PREFIX: str = "finexus"
+    CACHE_SERIALIZER: str = "orjson"  # orjson | msgpack | json
+    CACHE_COMPRESSION_MIN_BYTES: int = 16 * 1024  # zstd above this size; 0 disables
+    REDIS_MAX_CONNECTIONS: int = 50
+
+    # Cache expiry / stampede protection (see core/cache/decorators.py)
+    CACHE_STALE_TTL: int = 300              # serve stale this long past TTL while refreshing
+    CACHE_EARLY_EXPIRATION_BETA: float = 1.0  # XFetch beta; 0 disables early refresh
+    CACHE_LOCK_TIMEOUT: int = 30            # recompute lock timeout (seconds)
+    CACHE_WAIT_TIMEOUT: int = 5             # max wait for another worker's recompute of a miss
+    CACHE_REFRESH_WORKERS: int = 4          # threads for background refresh of sync endpoints
+
+    # In-process L1 cache in front of Redis (opt-in per endpoint)
+    CACHE_LOCAL_TTL: int = 30
+    CACHE_LOCAL_MAX_BYTES: int = 64 * 1024 * 1024
+
+    # Background cache warm-up after /cache/webhook
+    CACHE_WARMUP_CONCURRENCY: int = 4
 
     # Cache webhook (for DATA project to trigger cache clear)
     CACHE_WEBHOOK_SECRET: str = "change-me-in-production"
@@ -66,6 +118,7 @@ class Settings(BaseSettings):
     CACHE_TTL_CLAIMS: int = 900       # 15 min - session scope
     CACHE_TTL_FRED: int = 900         # 15 min - session scope
     CACHE_TTL_AUTH: int = 1800        # 30 min - user auth
+    CACHE_TTL_REALTIME: int = 15      # 15 sec - live market data
     CACHE_TTL_DEFAULT: int = 900      # 15 min - fallback
 
     class Config:
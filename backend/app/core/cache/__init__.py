@@ -5,14 +5,36 @@ Provides decorator-based caching with graceful degradation.
 If Redis is unavailable, the app continues to work normally.
 """
 
-from .client import get_redis_client, redis_client
+from .client import (
+    get_redis_client,
+    redis_client,
+    get_async_redis_client,
+    cache_get,
+    cache_set,
+    cache_mget,
+    cache_mset,
+    cache_delete,
+    cache_delete_pattern,
+)
 from .decorators import cached
+from .local import local_cache, publish_invalidation
+from .metrics import cache_metrics
 from .ttl import DataCategory, get_ttl
 from .keys import make_cache_key
 
 __all__ = [
     "get_redis_client",
     "redis_client",
+    "get_async_redis_client",
+    "cache_get",
+    "cache_set",
+    "cache_mget",
+    "cache_mset",
+    "cache_delete",
+    "cache_delete_pattern",
+    "cache_metrics",
+    "local_cache",
+    "publish_invalidation",
     "cached",
     "DataCategory",
     "get_ttl",
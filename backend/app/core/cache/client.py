@@ -2,28 +2,47 @@
 Redis Client with Graceful Degradation
 
 Features:
-- Connection pooling for performance
+- Connection pooling for performance (sync client and redis.asyncio client)
 - Graceful degradation if Redis unavailable
 - 5-second socket timeout to prevent blocking
 - Singleton pattern for connection reuse
+- Binary values (see serialization.py); clients don't decode responses
+- SCAN + UNLINK invalidation and pipelined multi-get/multi-set
 """
 
-import json
 import logging
-from typing import Any, Optional
+import time
+from typing import Any, Dict, List, Optional
 
 import redis
+import redis.asyncio as aioredis
 from redis import Redis
 
 from ...config import settings
+from .local import invalidation_channel, local_cache, publish_invalidation
+from .metrics import cache_metrics
+from .serialization import decode, encode
 
 logger = logging.getLogger(__name__)
 
-# Singleton Redis client
+# Keys deleted per UNLINK call during pattern invalidation
+SCAN_BATCH_SIZE = 500
+
+# Singleton Redis clients
 _redis_client: Optional[Redis] = None
+_async_redis_client: Optional[aioredis.Redis] = None
 _connection_failed: bool = False
 
 
+def _client_kwargs() -> dict:
+    return {
+        "decode_responses": False,
+        "socket_timeout": 5.0,
+        "socket_connect_timeout": 5.0,
+        "max_connections": settings.REDIS_MAX_CONNECTIONS,
+    }
+
+
 def get_redis_client() -> Optional[Redis]:
     """
     Get Redis client instance (singleton).
@@ -49,21 +68,14 @@ def get_redis_client() -> Optional[Redis]:
     try:
         # Build connection URL
         if settings.REDIS_URL:
-            client = redis.from_url(
-                settings.REDIS_URL,
-                decode_responses=True,
-                socket_timeout=5.0,
-                socket_connect_timeout=5.0,
-            )
+            client = redis.from_url(settings.REDIS_URL, **_client_kwargs())
         else:
             client = Redis(
                 host=settings.REDIS_HOST,
                 port=settings.REDIS_PORT,
                 db=settings.REDIS_DB,
                 password=settings.REDIS_PASSWORD,
-                decode_responses=True,
-                socket_timeout=5.0,
-                socket_connect_timeout=5.0,
+                **_client_kwargs(),
             )
 
         # Test connection
@@ -87,68 +99,198 @@ def redis_client() -> Optional[Redis]:
     return get_redis_client()
 
 
-async def cache_get(key: str) -> Optional[Any]:
+async def get_async_redis_client() -> Optional[aioredis.Redis]:
+    """
+    Get the redis.asyncio client instance (singleton).
+
+    Shares the failure flag with the sync client, so a Redis outage
+    disables caching for both.
+    """
+    global _async_redis_client, _connection_failed
+
+    if not settings.CACHE_ENABLED or _connection_failed:
+        return None
+
+    if _async_redis_client is not None:
+        return _async_redis_client
+
+    try:
+        if settings.REDIS_URL:
+            client = aioredis.from_url(settings.REDIS_URL, **_client_kwargs())
+        else:
+            client = aioredis.Redis(
+                host=settings.REDIS_HOST,
+                port=settings.REDIS_PORT,
+                db=settings.REDIS_DB,
+                password=settings.REDIS_PASSWORD,
+                **_client_kwargs(),
+            )
+
+        await client.ping()
+        _async_redis_client = client
+        logger.info(f"Async Redis connected: {settings.REDIS_HOST}:{settings.REDIS_PORT}")
+        return _async_redis_client
+
+    except Exception as e:
+        logger.warning(f"Async Redis connection failed, caching disabled: {e}")
+        _connection_failed = True
+        return None
+
+
+async def close_async_redis_client() -> None:
+    """Close the async client's connection pool (app shutdown)."""
+    global _async_redis_client
+    if _async_redis_client is not None:
+        await _async_redis_client.aclose()
+        _async_redis_client = None
+
+
+def serialize_value(value: Any) -> bytes:
+    """Serialize a value for storage, handling Pydantic models."""
+    return encode(value)[0]
+
+
+# =============================================================================
+# Async API
+# =============================================================================
+
+async def cache_get(
+    key: str, namespace: Optional[str] = None, track: bool = True, local_ttl: Optional[int] = None
+) -> Optional[Any]:
     """
     Get value from cache.
 
     Args:
         key: Cache key
+        namespace: Metrics namespace (optional)
+        track: Record the lookup in cache_metrics (False for re-checks)
+        local_ttl: Read through the in-process L1 tier, keeping entries
+            there for up to this many seconds (None = Redis only)
 
     Returns:
-        Cached value (deserialized from JSON) or None
+        Cached value (deserialized) or None
     """
-    client = get_redis_client()
+    client = await get_async_redis_client()
     if not client:
         return None
 
+    if local_ttl:
+        value = local_cache.get(key)
+        if value is not None:
+            if track:
+                cache_metrics.incr("local_hits", namespace)
+            return value
+
     try:
-        value = client.get(key)
-        if value:
-            return json.loads(value)
-        return None
+        data = await client.get(key)
+        if data is None:
+            if track:
+                cache_metrics.miss(namespace)
+            return None
+        if track:
+            cache_metrics.hit(namespace, len(data))
+        value = decode(data)
+        if local_ttl:
+            local_cache.put(key, value, len(data), local_ttl)
+        return value
     except Exception as e:
+        cache_metrics.error(namespace)
         logger.warning(f"Cache get error for {key}: {e}")
         return None
 
 
-def serialize_value(value: Any) -> str:
-    """Serialize value to JSON, handling Pydantic models."""
-    # Handle Pydantic models (v2)
-    if hasattr(value, "model_dump"):
-        return json.dumps(value.model_dump(), default=str)
-    # Handle Pydantic models (v1)
-    if hasattr(value, "dict"):
-        return json.dumps(value.dict(), default=str)
-    # Handle regular dicts/lists
-    return json.dumps(value, default=str)
-
-
-async def cache_set(key: str, value: Any, ttl: int) -> bool:
+async def cache_set(
+    key: str, value: Any, ttl: int, namespace: Optional[str] = None, local_ttl: Optional[int] = None
+) -> bool:
     """
     Set value in cache with TTL.
 
     Args:
         key: Cache key
-        value: Value to cache (will be serialized to JSON)
+        value: Value to cache
         ttl: Time-to-live in seconds
+        namespace: Metrics namespace (optional)
+        local_ttl: Also keep the value in the in-process L1 tier this long
 
     Returns:
         True if successful, False otherwise
     """
-    client = get_redis_client()
+    client = await get_async_redis_client()
     if not client:
         return False
 
     try:
-        serialized = serialize_value(value)
-        client.setex(key, ttl, serialized)
-        logger.info(f"Cache SET: {key} (TTL: {ttl}s)")
+        data, compressed = encode(value)
+        await client.set(key, data, ex=ttl)
+        cache_metrics.set(namespace, len(data), compressed)
+        if local_ttl:
+            local_cache.put(key, value, len(data), local_ttl)
+        logger.debug(f"Cache SET: {key} ({len(data)} bytes, TTL: {ttl}s)")
         return True
     except Exception as e:
+        cache_metrics.error(namespace)
         logger.warning(f"Cache set error for {key}: {e}")
         return False
 
 
+async def cache_mget(keys: List[str]) -> List[Optional[Any]]:
+    """
+    Get several values in one round trip.
+
+    Returns:
+        Values in the order of `keys`; None for misses and decode errors
+    """
+    if not keys:
+        return []
+    client = await get_async_redis_client()
+    if not client:
+        return [None] * len(keys)
+
+    try:
+        raw = await client.mget(keys)
+    except Exception as e:
+        cache_metrics.error()
+        logger.warning(f"Cache mget error ({len(keys)} keys): {e}")
+        return [None] * len(keys)
+
+    values: List[Optional[Any]] = []
+    for key, data in zip(keys, raw):
+        if data is None:
+            cache_metrics.miss()
+            values.append(None)
+            continue
+        try:
+            values.append(decode(data))
+            cache_metrics.hit(nbytes=len(data))
+        except Exception as e:
+            cache_metrics.error()
+            logger.warning(f"Cache decode error for {key}: {e}")
+            values.append(None)
+    return values
+
+
+async def cache_mset(items: Dict[str, Any], ttl: int) -> bool:
+    """Set several values with the same TTL in one pipelined round trip."""
+    if not items:
+        return True
+    client = await get_async_redis_client()
+    if not client:
+        return False
+
+    try:
+        async with client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                data, compressed = encode(value)
+                pipe.set(key, data, ex=ttl)
+                cache_metrics.set(nbytes=len(data), compressed=compressed)
+            await pipe.execute()
+        return True
+    except Exception as e:
+        cache_metrics.error()
+        logger.warning(f"Cache mset error ({len(items)} keys): {e}")
+        return False
+
+
 async def cache_delete(key: str) -> bool:
     """
     Delete a key from cache.
@@ -159,41 +301,183 @@ async def cache_delete(key: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    client = get_redis_client()
+    client = await get_async_redis_client()
     if not client:
         return False
 
     try:
-        client.delete(key)
+        await client.unlink(key)
+        local_cache.invalidate(key)
+        await client.publish(invalidation_channel(), key)
         return True
     except Exception as e:
         logger.warning(f"Cache delete error for {key}: {e}")
         return False
 
 
-async def cache_delete_pattern(pattern: str) -> int:
+async def cache_delete_pattern(pattern: str, exclude_prefix: Optional[str] = None) -> int:
     """
-    Delete all keys matching a pattern.
+    Delete all keys matching a pattern (SCAN + UNLINK, never KEYS).
 
     Args:
         pattern: Redis pattern (e.g., "finexus:portal:bls:*")
+        exclude_prefix: Keys starting with this prefix are kept
 
     Returns:
         Number of keys deleted
     """
-    client = get_redis_client()
+    client = await get_async_redis_client()
     if not client:
         return 0
 
+    deleted = 0
+    batch: List[bytes] = []
     try:
-        keys = client.keys(pattern)
-        if keys:
-            return client.delete(*keys)
-        return 0
+        async for key in client.scan_iter(match=pattern, count=SCAN_BATCH_SIZE):
+            if _excluded(key, exclude_prefix):
+                continue
+            batch.append(key)
+            if len(batch) >= SCAN_BATCH_SIZE:
+                deleted += await client.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += await client.unlink(*batch)
     except Exception as e:
         logger.warning(f"Cache delete pattern error for {pattern}: {e}")
+
+    # Drop in-process L1 copies in every worker
+    local_cache.invalidate(pattern)
+    try:
+        await client.publish(invalidation_channel(), pattern)
+    except Exception as e:
+        logger.warning(f"Cache invalidation publish failed for {pattern}: {e}")
+    return deleted
+
+
+# =============================================================================
+# Sync API (sync endpoints run in the threadpool)
+# =============================================================================
+
+def cache_get_sync(
+    key: str, namespace: Optional[str] = None, track: bool = True, local_ttl: Optional[int] = None
+) -> Optional[Any]:
+    """Synchronous cache get."""
+    client = get_redis_client()
+    if not client:
+        return None
+    if local_ttl:
+        value = local_cache.get(key)
+        if value is not None:
+            if track:
+                cache_metrics.incr("local_hits", namespace)
+            return value
+
+    try:
+        data = client.get(key)
+        if data is None:
+            if track:
+                cache_metrics.miss(namespace)
+            return None
+        if track:
+            cache_metrics.hit(namespace, len(data))
+        value = decode(data)
+        if local_ttl:
+            local_cache.put(key, value, len(data), local_ttl)
+        return value
+    except Exception as e:
+        cache_metrics.error(namespace)
+        logger.warning(f"Cache get error for {key}: {e}")
+        return None
+
+
+def cache_set_sync(
+    key: str, value: Any, ttl: int, namespace: Optional[str] = None, local_ttl: Optional[int] = None
+) -> bool:
+    """Synchronous cache set."""
+    client = get_redis_client()
+    if not client:
+        return False
+    try:
+        data, compressed = encode(value)
+        client.set(key, data, ex=ttl)
+        cache_metrics.set(namespace, len(data), compressed)
+        if local_ttl:
+            local_cache.put(key, value, len(data), local_ttl)
+        logger.debug(f"Cache SET: {key} ({len(data)} bytes, TTL: {ttl}s)")
+        return True
+    except Exception as e:
+        cache_metrics.error(namespace)
+        logger.warning(f"Cache set error for {key}: {e}")
+        return False
+
+
+def cache_mget_sync(keys: List[str]) -> List[Optional[Any]]:
+    """Synchronous multi-get; values in the order of `keys`."""
+    if not keys:
+        return []
+    client = get_redis_client()
+    if not client:
+        return [None] * len(keys)
+    try:
+        raw = client.mget(keys)
+    except Exception as e:
+        cache_metrics.error()
+        logger.warning(f"Cache mget error ({len(keys)} keys): {e}")
+        return [None] * len(keys)
+
+    values: List[Optional[Any]] = []
+    for key, data in zip(keys, raw):
+        if data is None:
+            cache_metrics.miss()
+            values.append(None)
+            continue
+        try:
+            values.append(decode(data))
+            cache_metrics.hit(nbytes=len(data))
+        except Exception as e:
+            cache_metrics.error()
+            logger.warning(f"Cache decode error for {key}: {e}")
+            values.append(None)
+    return values
+
+
+def delete_pattern_sync(pattern: str, exclude_prefix: Optional[str] = None) -> int:
+    """
+    Synchronous SCAN + UNLINK invalidation.
+
+    UNLINK frees memory in a background thread on the Redis side, so large
+    namespaces don't block the server the way DEL (or KEYS) would.
+    """
+    client = get_redis_client()
+    if not client:
         return 0
 
+    deleted = 0
+    batch: List[bytes] = []
+    try:
+        for key in client.scan_iter(match=pattern, count=SCAN_BATCH_SIZE):
+            if _excluded(key, exclude_prefix):
+                continue
+            batch.append(key)
+            if len(batch) >= SCAN_BATCH_SIZE:
+                deleted += client.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += client.unlink(*batch)
+    except Exception as e:
+        logger.warning(f"Cache delete pattern error for {pattern}: {e}")
+
+    # Drop in-process L1 copies in every worker
+    publish_invalidation(pattern)
+    return deleted
+
+
+def _excluded(key: Any, exclude_prefix: Optional[str]) -> bool:
+    if not exclude_prefix:
+        return False
+    key_str = key if isinstance(key, str) else key.decode()
+    return key_str.startswith(exclude_prefix)
+
 
 def get_cache_stats() -> dict:
     """
@@ -209,20 +493,27 @@ def get_cache_stats() -> dict:
             "connected": False,
             "enabled": settings.CACHE_ENABLED,
             "reason": "connection_failed" if _connection_failed else "disabled",
+            "app": cache_metrics.snapshot(),
         }
 
     try:
+        started = time.perf_counter()
         info = client.info("stats")
+        latency_ms = (time.perf_counter() - started) * 1000
         return {
             "connected": True,
             "enabled": True,
             "hits": info.get("keyspace_hits", 0),
             "misses": info.get("keyspace_misses", 0),
             "keys": client.dbsize(),
+            "latency_ms": round(latency_ms, 2),
+            "app": cache_metrics.snapshot(),
+            "local": local_cache.stats(),
         }
     except Exception as e:
         return {
             "connected": False,
             "enabled": True,
             "reason": str(e),
+            "app": cache_metrics.snapshot(),
         }
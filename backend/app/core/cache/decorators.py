@@ -17,45 +17,158 @@ Works with both sync and async endpoints:
 import asyncio
 import functools
 import inspect
-import json
 import logging
-from typing import Callable, List, Optional
-
-from .client import get_redis_client, serialize_value
+import math
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastapi import params as fastapi_params
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ...config import settings
+from .client import (
+    cache_get,
+    cache_get_sync,
+    cache_set,
+    cache_set_sync,
+    get_async_redis_client,
+    get_redis_client,
+)
 from .keys import make_cache_key
+from .metrics import cache_metrics
+from .serialization import to_plain
+from .singleflight import (
+    acquire_lock,
+    acquire_lock_sync,
+    async_locks,
+    release_lock,
+    release_lock_sync,
+    thread_locks,
+    wait_for_value,
+    wait_for_value_sync,
+)
 from .ttl import DataCategory, get_ttl
 
 logger = logging.getLogger(__name__)
 
+# Cached values are wrapped so readers know their age and recompute cost
+ENVELOPE_MARKER = "__cache_envelope__"
+
+# Background refreshes for sync endpoints
+_refresh_executor = ThreadPoolExecutor(
+    max_workers=settings.CACHE_REFRESH_WORKERS, thread_name_prefix="cache-refresh"
+)
+_refreshing: set = set()
+_refreshing_guard = threading.Lock()
+# Strong references to in-flight refresh tasks for async endpoints
+_background_tasks: set = set()
+
+# namespace -> decorated endpoint, used by the warm-up registry. The first
+# registration wins; legacy aliases share a namespace with the real endpoint.
+_cached_endpoints: Dict[str, Callable] = {}
+
+
+def get_cached_endpoint(namespace: str) -> Optional[Callable]:
+    """Return the @cached endpoint registered for a namespace."""
+    return _cached_endpoints.get(namespace)
+
+
+def _warm_kwargs(func: Callable, params: dict, db: Session) -> dict:
+    """
+    Build the keyword arguments FastAPI would pass for a request with
+    `params`: Query/Path defaults are resolved, Session dependencies get
+    `db` and other dependencies (current_user) get None.
+    """
+    kwargs = {}
+    for name, param in inspect.signature(func).parameters.items():
+        if name in params:
+            kwargs[name] = params[name]
+            continue
+        default = param.default
+        if isinstance(default, fastapi_params.Depends):
+            kwargs[name] = db if param.annotation is Session or name == "db" else None
+        elif isinstance(default, fastapi_params.Param):
+            kwargs[name] = default.default
+        elif default is not inspect.Parameter.empty:
+            kwargs[name] = default
+        else:
+            raise ValueError(f"Missing required parameter '{name}' for {func.__name__}")
+    return kwargs
+
+
+def _envelope(value: Any, delta: float) -> dict:
+    return {ENVELOPE_MARKER: 1, "value": to_plain(value), "created": time.time(), "delta": delta}
+
+
+def _unwrap(entry: Any) -> Any:
+    if isinstance(entry, dict) and ENVELOPE_MARKER in entry:
+        return entry["value"]
+    return entry
 
-def _sync_cache_get(key: str):
-    """Synchronous cache get."""
-    client = get_redis_client()
-    if not client:
-        return None
-    try:
-        value = client.get(key)
-        if value:
-            return json.loads(value)
-        return None
-    except Exception as e:
-        logger.warning(f"Cache get error for {key}: {e}")
-        return None
-
-
-def _sync_cache_set(key: str, value, ttl: int) -> bool:
-    """Synchronous cache set."""
-    client = get_redis_client()
-    if not client:
+
+def _needs_refresh(entry: Any, ttl: int, beta: float, namespace: str) -> bool:
+    """
+    Decide whether a cached entry should be refreshed in the background.
+
+    Past the soft TTL the entry is stale (still served). Before that,
+    probabilistic early expiration (XFetch) refreshes with a probability
+    that grows as expiry approaches and with how long the value took to
+    compute, so expensive keys are renewed before they ever go stale.
+    """
+    if not isinstance(entry, dict) or ENVELOPE_MARKER not in entry:
         return False
-    try:
-        serialized = serialize_value(value)
-        client.setex(key, ttl, serialized)
-        print(f"[CACHE] SET: {key} (TTL: {ttl}s)")
+
+    age = time.time() - entry["created"]
+    if age >= ttl:
+        cache_metrics.incr("stale_served", namespace)
+        return True
+
+    delta = entry.get("delta") or 0
+    if beta > 0 and delta > 0:
+        if age - delta * beta * math.log(1.0 - random.random()) >= ttl:
+            cache_metrics.incr("early_refreshes", namespace)
+            return True
+    return False
+
+
+def _detach_sessions(args: tuple, kwargs: dict) -> Tuple[tuple, dict, list]:
+    """
+    Give a background refresh its own DB sessions.
+
+    The request's sessions (from Depends) are closed when the response is
+    sent, so any Session argument is replaced by a new one on the same bind.
+    """
+    opened = []
+
+    def swap(value):
+        if isinstance(value, AsyncSession):
+            session = AsyncSession(bind=value.bind)
+            opened.append(session)
+            return session
+        if isinstance(value, Session):
+            session = Session(bind=value.get_bind())
+            opened.append(session)
+            return session
+        return value
+
+    return tuple(swap(a) for a in args), {k: swap(v) for k, v in kwargs.items()}, opened
+
+
+def _claim_refresh(cache_key: str) -> bool:
+    with _refreshing_guard:
+        if cache_key in _refreshing:
+            return False
+        _refreshing.add(cache_key)
         return True
-    except Exception as e:
-        logger.warning(f"Cache set error for {key}: {e}")
-        return False
+
+
+def _release_refresh(cache_key: str) -> None:
+    with _refreshing_guard:
+        _refreshing.discard(cache_key)
 
 
 def cached(
@@ -63,16 +176,40 @@ def cached(
     category: DataCategory = DataCategory.DEFAULT,
     ttl: Optional[int] = None,
     param_keys: Optional[List[str]] = None,
+    stale_ttl: Optional[int] = None,
+    early_expiration: Optional[float] = None,
+    lock_timeout: Optional[int] = None,
+    local: bool = False,
 ):
     """
     Decorator to cache endpoint responses in Redis.
 
+    Async endpoints use the redis.asyncio client; sync endpoints (which
+    FastAPI runs in the threadpool) use the sync client. Hits, misses and
+    sets are recorded per namespace in cache_metrics.
+
+    Expiry is designed to keep TTL rollovers off the DATA database:
+
+    - Misses are single-flight: one caller per key computes (per-key lock
+      in-process, Redis lock across workers) and the others wait for it,
+      for at most CACHE_WAIT_TIMEOUT seconds before computing themselves.
+    - After `ttl` an entry is stale but is still served for `stale_ttl`
+      more seconds while one worker refreshes it in the background.
+    - With `early_expiration` (XFetch beta) > 0, entries may be refreshed
+      shortly before `ttl`, weighted by how long they took to compute.
+
     Args:
         namespace: Cache key namespace (e.g., "portal:bls:comprehensive")
         category: Data category for TTL selection
         ttl: Override TTL in seconds (uses category TTL if not provided)
         param_keys: List of parameter names to include in cache key
                    (if None, no params are included in key)
+        stale_ttl: Seconds a stale entry may be served (CACHE_STALE_TTL)
+        early_expiration: XFetch beta; 0 disables (CACHE_EARLY_EXPIRATION_BETA)
+        lock_timeout: Seconds to hold the recompute lock (CACHE_LOCK_TIMEOUT); waiters
+                      give up after CACHE_WAIT_TIMEOUT at most
+        local: Also keep responses in the in-process L1 tier (see local.py)
+                for up to CACHE_LOCAL_TTL seconds; for hot dashboard payloads
 
     Example:
         @cached("portal:bls:comprehensive", category=DataCategory.BLS_MONTHLY)
@@ -88,63 +225,153 @@ def cached(
         # Check if function is async or sync
         is_async = inspect.iscoroutinefunction(func)
 
-        if is_async:
-            @functools.wraps(func)
-            async def async_wrapper(*args, **kwargs):
-                cache_params = {}
-                if param_keys:
-                    cache_params = {k: kwargs.get(k) for k in param_keys if k in kwargs}
-
-                cache_key = make_cache_key(namespace, cache_params, param_keys)
-                print(f"[CACHE] Checking key: {cache_key}")
+        cache_ttl = ttl if ttl is not None else get_ttl(category)
+        stale = stale_ttl if stale_ttl is not None else settings.CACHE_STALE_TTL
+        beta = early_expiration if early_expiration is not None else settings.CACHE_EARLY_EXPIRATION_BETA
+        lock_ttl = lock_timeout if lock_timeout is not None else settings.CACHE_LOCK_TIMEOUT
+        wait_timeout = min(lock_ttl, settings.CACHE_WAIT_TIMEOUT)
+        local_ttl = min(cache_ttl, settings.CACHE_LOCAL_TTL) if local else None
 
-                # Try cache (sync call is fine here)
-                cached_value = _sync_cache_get(cache_key)
-                if cached_value is not None:
-                    print(f"[CACHE] HIT: {cache_key}")
-                    return cached_value
-
-                print(f"[CACHE] MISS: {cache_key} - calling function...")
+        def build_key(kwargs) -> str:
+            cache_params = {}
+            if param_keys:
+                cache_params = {k: kwargs.get(k) for k in param_keys if k in kwargs}
+            return make_cache_key(namespace, cache_params, param_keys)
 
-                # Call async function
+        if is_async:
+            async def compute(cache_key, args, kwargs):
+                started = time.monotonic()
                 result = await func(*args, **kwargs)
-                print(f"[CACHE] Function returned, result type: {type(result)}")
-
-                # Cache result
-                cache_ttl = ttl if ttl is not None else get_ttl(category)
-                _sync_cache_set(cache_key, result, cache_ttl)
-
+                await cache_set(cache_key, _envelope(result, time.monotonic() - started),
+                                cache_ttl + stale, namespace, local_ttl)
                 return result
 
+            async def refresh(cache_key, args, kwargs):
+                args, kwargs, sessions = _detach_sessions(args, kwargs)
+                try:
+                    lock = await acquire_lock(cache_key, lock_ttl)
+                    if lock is None:
+                        return  # another worker is refreshing
+                    try:
+                        await compute(cache_key, args, kwargs)
+                        cache_metrics.incr("refreshes", namespace)
+                    finally:
+                        await release_lock(lock)
+                except Exception as e:
+                    cache_metrics.error(namespace)
+                    logger.warning(f"Background refresh failed for {cache_key}: {e}")
+                finally:
+                    for session in sessions:
+                        if isinstance(session, AsyncSession):
+                            await session.close()
+                        else:
+                            session.close()
+                    _release_refresh(cache_key)
+
+            async def warm(db: Session, **params):
+                """Recompute and store one entry, bypassing the read path."""
+                kwargs = _warm_kwargs(func, params, db)
+                return await compute(build_key(kwargs), (), kwargs)
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                cache_key = build_key(kwargs)
+
+                entry = await cache_get(cache_key, namespace, local_ttl=local_ttl)
+                if entry is not None:
+                    if _needs_refresh(entry, cache_ttl, beta, namespace) and _claim_refresh(cache_key):
+                        task = asyncio.get_running_loop().create_task(refresh(cache_key, args, kwargs))
+                        _background_tasks.add(task)
+                        task.add_done_callback(_background_tasks.discard)
+                    return _unwrap(entry)
+
+                if await get_async_redis_client() is None:
+                    return await func(*args, **kwargs)
+
+                async with async_locks.hold(cache_key):
+                    entry = await cache_get(cache_key, track=False)
+                    if entry is not None:
+                        cache_metrics.incr("coalesced", namespace)
+                        return _unwrap(entry)
+
+                    lock = await acquire_lock(cache_key, lock_ttl)
+                    if lock is None:
+                        entry = await wait_for_value(cache_key, wait_timeout)
+                        if entry is not None:
+                            cache_metrics.incr("coalesced", namespace)
+                            return _unwrap(entry)
+                    try:
+                        return await compute(cache_key, args, kwargs)
+                    finally:
+                        await release_lock(lock)
+
+            async_wrapper.warm = warm
+            _cached_endpoints.setdefault(namespace, async_wrapper)
             return async_wrapper
         else:
-            @functools.wraps(func)
-            def sync_wrapper(*args, **kwargs):
-                cache_params = {}
-                if param_keys:
-                    cache_params = {k: kwargs.get(k) for k in param_keys if k in kwargs}
-
-                cache_key = make_cache_key(namespace, cache_params, param_keys)
-                print(f"[CACHE] Checking key: {cache_key}")
-
-                # Try cache
-                cached_value = _sync_cache_get(cache_key)
-                if cached_value is not None:
-                    print(f"[CACHE] HIT: {cache_key}")
-                    return cached_value
-
-                print(f"[CACHE] MISS: {cache_key} - calling function...")
-
-                # Call sync function
+            def compute(cache_key, args, kwargs):
+                started = time.monotonic()
                 result = func(*args, **kwargs)
-                print(f"[CACHE] Function returned, result type: {type(result)}")
-
-                # Cache result
-                cache_ttl = ttl if ttl is not None else get_ttl(category)
-                _sync_cache_set(cache_key, result, cache_ttl)
-
+                cache_set_sync(cache_key, _envelope(result, time.monotonic() - started),
+                               cache_ttl + stale, namespace, local_ttl)
                 return result
 
+            def refresh(cache_key, args, kwargs):
+                args, kwargs, sessions = _detach_sessions(args, kwargs)
+                try:
+                    lock = acquire_lock_sync(cache_key, lock_ttl)
+                    if lock is None:
+                        return  # another worker is refreshing
+                    try:
+                        compute(cache_key, args, kwargs)
+                        cache_metrics.incr("refreshes", namespace)
+                    finally:
+                        release_lock_sync(lock)
+                except Exception as e:
+                    cache_metrics.error(namespace)
+                    logger.warning(f"Background refresh failed for {cache_key}: {e}")
+                finally:
+                    for session in sessions:
+                        session.close()
+                    _release_refresh(cache_key)
+
+            def warm(db: Session, **params):
+                """Recompute and store one entry, bypassing the read path."""
+                kwargs = _warm_kwargs(func, params, db)
+                return compute(build_key(kwargs), (), kwargs)
+
+            @functools.wraps(func)
+            def sync_wrapper(*args, **kwargs):
+                cache_key = build_key(kwargs)
+
+                entry = cache_get_sync(cache_key, namespace, local_ttl=local_ttl)
+                if entry is not None:
+                    if _needs_refresh(entry, cache_ttl, beta, namespace) and _claim_refresh(cache_key):
+                        _refresh_executor.submit(refresh, cache_key, args, kwargs)
+                    return _unwrap(entry)
+
+                if get_redis_client() is None:
+                    return func(*args, **kwargs)
+
+                with thread_locks.hold(cache_key):
+                    entry = cache_get_sync(cache_key, track=False)
+                    if entry is not None:
+                        cache_metrics.incr("coalesced", namespace)
+                        return _unwrap(entry)
+
+                    lock = acquire_lock_sync(cache_key, lock_ttl)
+                    if lock is None:
+                        entry = wait_for_value_sync(cache_key, wait_timeout)
+                        if entry is not None:
+                            cache_metrics.incr("coalesced", namespace)
+                            return _unwrap(entry)
+                    try:
+                        return compute(cache_key, args, kwargs)
+                    finally:
+                        release_lock_sync(lock)
+
+            sync_wrapper.warm = warm
+            _cached_endpoints.setdefault(namespace, sync_wrapper)
             return sync_wrapper
 
     return decorator
@@ -159,44 +386,6 @@ def cached_sync(
     """
     Decorator for synchronous functions (non-async).
 
-    Same as @cached but for sync functions.
+    Kept for compatibility; @cached already handles sync functions.
     """
-    import asyncio
-
-    def decorator(func: Callable):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            cache_params = {}
-            if param_keys:
-                cache_params = {k: kwargs.get(k) for k in param_keys if k in kwargs}
-
-            cache_key = make_cache_key(namespace, cache_params, param_keys)
-
-            # Try to get from cache (run async in sync context)
-            loop = asyncio.new_event_loop()
-            try:
-                cached_value = loop.run_until_complete(cache_get(cache_key))
-                if cached_value is not None:
-                    logger.debug(f"Cache HIT: {cache_key}")
-                    return cached_value
-            finally:
-                loop.close()
-
-            logger.debug(f"Cache MISS: {cache_key}")
-
-            # Call the actual function
-            result = func(*args, **kwargs)
-
-            # Cache the result
-            cache_ttl = ttl if ttl is not None else get_ttl(category)
-            loop = asyncio.new_event_loop()
-            try:
-                loop.run_until_complete(cache_set(cache_key, result, cache_ttl))
-            finally:
-                loop.close()
-
-            return result
-
-        return wrapper
-
-    return decorator
+    return cached(namespace, category=category, ttl=ttl, param_keys=param_keys)
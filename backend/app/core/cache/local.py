@@ -0,0 +1,177 @@
+"""
+In-process L1 Cache
+
+A small TTL + LRU tier in front of Redis for hot dashboard payloads, so a
+repeat request skips the Redis round trip and the decode of a large value.
+Opt in per endpoint with @cached(..., local=True).
+
+Each uvicorn worker has its own L1. Invalidations are broadcast on a Redis
+pub/sub channel ("{prefix}:cache:invalidate") and every worker's listener
+thread drops matching entries, so DELETE /cache and /cache/webhook clear
+all workers together.
+"""
+
+import fnmatch
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from ...config import settings
+from .metrics import cache_metrics
+
+logger = logging.getLogger(__name__)
+
+
+def invalidation_channel() -> str:
+    return f"{settings.CACHE_PREFIX}:cache:invalidate"
+
+
+class LocalCache:
+    """
+    Thread-safe TTL/LRU cache bounded by total payload bytes.
+
+    Sizes are the encoded Redis payload sizes, which is a cheap and stable
+    proxy for the decoded object's footprint.
+    """
+
+    def __init__(self, max_bytes: int, default_ttl: int):
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        # key -> (value, nbytes, expires_at)
+        self._entries: "OrderedDict[str, Tuple[Any, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, nbytes, expires_at = entry
+            if expires_at <= time.monotonic():
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: Any, nbytes: int, ttl: Optional[int] = None) -> None:
+        if self.max_bytes <= 0 or nbytes > self.max_bytes:
+            return
+        ttl = min(ttl or self.default_ttl, self.default_ttl)
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = (value, nbytes, time.monotonic() + ttl)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions += 1
+
+    def invalidate(self, pattern: str) -> int:
+        """Drop entries whose key matches a Redis-style glob pattern."""
+        with self._lock:
+            if pattern in ("*", f"{settings.CACHE_PREFIX}:*"):
+                count = len(self._entries)
+                self._entries.clear()
+                self._bytes = 0
+                return count
+            keys = [k for k in self._entries if fnmatch.fnmatchcase(k, pattern)]
+            for key in keys:
+                self._drop(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self.evictions,
+            }
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+
+local_cache = LocalCache(
+    max_bytes=settings.CACHE_LOCAL_MAX_BYTES,
+    default_ttl=settings.CACHE_LOCAL_TTL,
+)
+
+
+# =============================================================================
+# Pub/sub invalidation
+# =============================================================================
+
+_listener_thread: Optional[threading.Thread] = None
+_listener_stop = threading.Event()
+
+
+def publish_invalidation(pattern: str) -> None:
+    """Drop matching L1 entries here and tell the other workers to do the same."""
+    local_cache.invalidate(pattern)
+
+    from .client import get_redis_client
+
+    client = get_redis_client()
+    if not client:
+        return
+    try:
+        client.publish(invalidation_channel(), pattern)
+    except Exception as e:
+        logger.warning(f"Cache invalidation publish failed for {pattern}: {e}")
+
+
+def _listen() -> None:
+    from .client import get_redis_client
+
+    while not _listener_stop.is_set():
+        client = get_redis_client()
+        if not client:
+            return
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        try:
+            pubsub.subscribe(invalidation_channel())
+            while not _listener_stop.is_set():
+                message = pubsub.get_message(timeout=1.0)
+                if not message or message.get("type") != "message":
+                    continue
+                data = message["data"]
+                pattern = data.decode() if isinstance(data, bytes) else str(data)
+                dropped = local_cache.invalidate(pattern)
+                cache_metrics.incr("local_invalidations", amount=dropped)
+        except Exception as e:
+            logger.warning(f"Cache invalidation listener error, reconnecting: {e}")
+            # Entries may have been invalidated while we were disconnected
+            local_cache.clear()
+            _listener_stop.wait(2.0)
+        finally:
+            try:
+                pubsub.close()
+            except Exception:
+                pass
+
+
+def start_invalidation_listener() -> None:
+    """Start this worker's pub/sub listener (app startup)."""
+    global _listener_thread
+    if _listener_thread is not None and _listener_thread.is_alive():
+        return
+    _listener_stop.clear()
+    _listener_thread = threading.Thread(target=_listen, name="cache-invalidation", daemon=True)
+    _listener_thread.start()
+
+
+def stop_invalidation_listener() -> None:
+    """Stop the pub/sub listener (app shutdown)."""
+    _listener_stop.set()
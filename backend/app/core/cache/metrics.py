@@ -0,0 +1,60 @@
+"""
+Cache Metrics
+
+In-process counters for cache activity, reported by /health/cache.
+Replaces the per-request HIT/MISS/SET prints.
+"""
+
+import threading
+from collections import defaultdict
+from typing import Dict
+
+
+class CacheMetrics:
+    """Thread-safe counters, overall and per namespace."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals: Dict[str, int] = defaultdict(int)
+        self._namespaces: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def incr(self, event: str, namespace: str = None, amount: int = 1) -> None:
+        with self._lock:
+            self._totals[event] += amount
+            if namespace:
+                self._namespaces[namespace][event] += amount
+
+    def hit(self, namespace: str = None, nbytes: int = 0) -> None:
+        self.incr("hits", namespace)
+        if nbytes:
+            self.incr("bytes_read", amount=nbytes)
+
+    def miss(self, namespace: str = None) -> None:
+        self.incr("misses", namespace)
+
+    def set(self, namespace: str = None, nbytes: int = 0, compressed: bool = False) -> None:
+        self.incr("sets", namespace)
+        self.incr("bytes_written", amount=nbytes)
+        if compressed:
+            self.incr("compressed_sets")
+
+    def error(self, namespace: str = None) -> None:
+        self.incr("errors", namespace)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            totals = dict(self._totals)
+            lookups = totals.get("hits", 0) + totals.get("misses", 0)
+            totals["hit_rate"] = round(totals.get("hits", 0) / lookups, 3) if lookups else 0.0
+            return {
+                "totals": totals,
+                "namespaces": {ns: dict(counts) for ns, counts in self._namespaces.items()},
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._totals.clear()
+            self._namespaces.clear()
+
+
+cache_metrics = CacheMetrics()
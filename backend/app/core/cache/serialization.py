@@ -0,0 +1,137 @@
+"""
+Cache Value Serialization
+
+Values are stored as a 1-byte header followed by the payload:
+
+    header = codec | (ZSTD_FLAG if compressed)
+    codec  = 0x01 orjson, 0x02 msgpack, 0x03 json
+
+Large payloads (BLS timelines, OE rankings) are zstd-compressed when they
+exceed CACHE_COMPRESSION_MIN_BYTES. Values written by the v1 cache (plain
+JSON text) have no header and are still readable.
+
+orjson, msgpack and zstandard are optional; missing libraries fall back to
+the stdlib json codec and uncompressed payloads.
+"""
+
+import json
+import logging
+from typing import Any, Tuple
+
+from ...config import settings
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+CODEC_ORJSON = 0x01
+CODEC_MSGPACK = 0x02
+CODEC_JSON = 0x03
+ZSTD_FLAG = 0x80
+
+_CODECS = (CODEC_ORJSON, CODEC_MSGPACK, CODEC_JSON)
+
+_zstd_compressor = zstandard.ZstdCompressor(level=3) if zstandard else None
+_zstd_decompressor = zstandard.ZstdDecompressor() if zstandard else None
+
+
+def to_plain(value: Any) -> Any:
+    """Convert Pydantic models to plain dicts before encoding."""
+    # Handle Pydantic models (v2)
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    # Handle Pydantic models (v1)
+    if hasattr(value, "dict") and not isinstance(value, dict):
+        return value.dict()
+    return value
+
+
+def _msgpack_default(obj: Any) -> Any:
+    obj = to_plain(obj)
+    if isinstance(obj, (dict, list)):
+        return obj
+    return str(obj)
+
+
+def _select_codec() -> int:
+    name = (settings.CACHE_SERIALIZER or "orjson").lower()
+    if name == "msgpack" and msgpack is not None:
+        return CODEC_MSGPACK
+    if name in ("orjson", "msgpack") and orjson is not None:
+        return CODEC_ORJSON
+    return CODEC_JSON
+
+
+def _json_default(obj: Any) -> Any:
+    return to_plain(obj) if hasattr(obj, "model_dump") else str(obj)
+
+
+def _dump(codec: int, value: Any) -> bytes:
+    if codec == CODEC_ORJSON:
+        return orjson.dumps(
+            value,
+            default=_json_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    if codec == CODEC_MSGPACK:
+        return msgpack.packb(value, default=_msgpack_default, use_bin_type=True)
+    return json.dumps(value, default=_json_default).encode()
+
+
+def _load(codec: int, payload: bytes) -> Any:
+    if codec == CODEC_ORJSON:
+        return orjson.loads(payload)
+    if codec == CODEC_MSGPACK:
+        return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+    return json.loads(payload)
+
+
+def encode(value: Any) -> Tuple[bytes, bool]:
+    """
+    Serialize a value for Redis.
+
+    Returns:
+        (encoded bytes, whether the payload was compressed)
+    """
+    codec = _select_codec()
+    payload = _dump(codec, to_plain(value))
+
+    threshold = settings.CACHE_COMPRESSION_MIN_BYTES
+    if _zstd_compressor is not None and threshold > 0 and len(payload) >= threshold:
+        return bytes([codec | ZSTD_FLAG]) + _zstd_compressor.compress(payload), True
+    return bytes([codec]) + payload, False
+
+
+def decode(data: Any) -> Any:
+    """Deserialize a value read from Redis (v2 binary or v1 JSON text)."""
+    if data is None:
+        return None
+    if isinstance(data, str):
+        return json.loads(data)
+
+    header = data[0]
+    codec = header & ~ZSTD_FLAG
+    if codec not in _CODECS:
+        # v1 value: plain JSON text
+        return json.loads(data)
+
+    payload = bytes(data[1:])
+    if header & ZSTD_FLAG:
+        if _zstd_decompressor is None:
+            raise ValueError("zstd-compressed cache value but zstandard is not installed")
+        payload = _zstd_decompressor.decompress(payload)
+    return _load(codec, payload)
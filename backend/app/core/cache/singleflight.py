@@ -0,0 +1,174 @@
+"""
+Single-flight Coalescing for Cache Misses
+
+Keeps one computation per cache key in flight at a time:
+
+- In-process: concurrent callers of the same key queue on a per-key lock;
+  the first computes, the rest re-read the cache when it finishes.
+- Across workers: a short-lived Redis lock ("{key}:lock"). Workers that
+  don't get it poll the cache for the winner's result (backing off, for at
+  most CACHE_WAIT_TIMEOUT seconds) and then compute themselves.
+
+If Redis is unavailable the lock is treated as acquired, so callers
+degrade to computing directly.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Dict, List, Optional
+
+from redis.exceptions import LockError
+
+from .client import cache_get, cache_get_sync, get_async_redis_client, get_redis_client
+
+logger = logging.getLogger(__name__)
+
+LOCK_SUFFIX = ":lock"
+POLL_INTERVAL = 0.05
+MAX_POLL_INTERVAL = 0.5
+
+
+class _NoLock:
+    """Stand-in lock when Redis can't be used for locking."""
+
+    def release(self):
+        pass
+
+
+class KeyedLocks:
+    """Per-key threading locks, dropped once no caller holds or waits on them."""
+
+    def __init__(self):
+        self._guard = threading.Lock()
+        self._locks: Dict[str, List[Any]] = {}
+
+    @contextmanager
+    def hold(self, key: str):
+        with self._guard:
+            entry = self._locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._guard:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    self._locks.pop(key, None)
+
+
+class AsyncKeyedLocks:
+    """Per-key asyncio locks (event-loop only, so no guard is needed)."""
+
+    def __init__(self):
+        self._locks: Dict[str, List[Any]] = {}
+
+    @asynccontextmanager
+    async def hold(self, key: str):
+        entry = self._locks.setdefault(key, [asyncio.Lock(), 0])
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                self._locks.pop(key, None)
+
+
+thread_locks = KeyedLocks()
+async_locks = AsyncKeyedLocks()
+
+
+# =============================================================================
+# Cross-worker lock
+# =============================================================================
+
+def acquire_lock_sync(key: str, timeout: int):
+    """
+    Try to take the Redis lock for a cache key without blocking.
+
+    Returns:
+        A lock to pass to release_lock_sync, or None if another worker holds it
+    """
+    client = get_redis_client()
+    if not client:
+        return _NoLock()
+    try:
+        lock = client.lock(key + LOCK_SUFFIX, timeout=timeout, blocking=False)
+        return lock if lock.acquire() else None
+    except Exception as e:
+        logger.warning(f"Cache lock error for {key}: {e}")
+        return _NoLock()
+
+
+def release_lock_sync(lock) -> None:
+    if lock is None:
+        return
+    try:
+        lock.release()
+    except LockError:
+        # Expired while we were computing; another worker may own it now
+        pass
+    except Exception as e:
+        logger.warning(f"Cache lock release error: {e}")
+
+
+async def acquire_lock(key: str, timeout: int):
+    """Async counterpart of acquire_lock_sync."""
+    client = await get_async_redis_client()
+    if not client:
+        return _NoLock()
+    try:
+        lock = client.lock(key + LOCK_SUFFIX, timeout=timeout, blocking=False)
+        return lock if await lock.acquire() else None
+    except Exception as e:
+        logger.warning(f"Cache lock error for {key}: {e}")
+        return _NoLock()
+
+
+async def release_lock(lock) -> None:
+    if lock is None or isinstance(lock, _NoLock):
+        return
+    try:
+        await lock.release()
+    except LockError:
+        pass
+    except Exception as e:
+        logger.warning(f"Cache lock release error: {e}")
+
+
+# =============================================================================
+# Waiting for another worker's result
+# =============================================================================
+
+def wait_for_value_sync(key: str, timeout: float) -> Optional[Any]:
+    """Poll the cache until the lock holder stores a value or `timeout` passes."""
+    deadline = time.monotonic() + timeout
+    interval = POLL_INTERVAL
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, MAX_POLL_INTERVAL)
+        value = cache_get_sync(key, track=False)
+        if value is not None:
+            return value
+
+
+async def wait_for_value(key: str, timeout: float) -> Optional[Any]:
+    deadline = time.monotonic() + timeout
+    interval = POLL_INTERVAL
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        await asyncio.sleep(min(interval, remaining))
+        interval = min(interval * 2, MAX_POLL_INTERVAL)
+        value = await cache_get(key, track=False)
+        if value is not None:
+            return value
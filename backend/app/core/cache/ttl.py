@@ -16,6 +16,7 @@ class DataCategory(str, Enum):
     CLAIMS_WEEKLY = "claims"         # Jobless claims
     TREASURY_YIELDS = "treasury"     # Treasury data
     FRED_SERIES = "fred"             # FRED series
+    REALTIME = "realtime"            # Live market prices
     AUTH = "auth"                    # User authentication
     METADATA = "metadata"            # Series info, descriptions
     DEFAULT = "default"              # Fallback
@@ -28,6 +29,7 @@ def get_ttl(category: DataCategory) -> int:
         DataCategory.CLAIMS_WEEKLY: settings.CACHE_TTL_CLAIMS,
         DataCategory.TREASURY_YIELDS: settings.CACHE_TTL_TREASURY,
         DataCategory.FRED_SERIES: settings.CACHE_TTL_FRED,
+        DataCategory.REALTIME: settings.CACHE_TTL_REALTIME,
         DataCategory.AUTH: settings.CACHE_TTL_AUTH,
         DataCategory.METADATA: settings.CACHE_TTL_BLS,
         DataCategory.DEFAULT: settings.CACHE_TTL_DEFAULT,
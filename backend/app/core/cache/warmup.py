@@ -0,0 +1,175 @@
+"""
+Cache Warm-up
+
+After the DATA project loads new BLS/FRED/Treasury data it calls
+/cache/webhook, which clears that source's keys. Instead of leaving the
+first user of each dashboard to pay the cold-query cost, the webhook
+schedules a warm-up that recomputes the common entries in the background.
+
+WARMUP_TARGETS lists, per webhook source, the @cached namespaces to warm
+and the parameter sets users hit most. Params omitted from a set take the
+endpoint's Query defaults, so {} warms the default view.
+
+The last run per source (duration, coverage, failures) is stored in Redis
+so GET /cache/warmup reports it from any worker.
+"""
+
+import asyncio
+import inspect
+import logging
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from ...config import settings
+from ...database import DataSessionLocal
+from .client import cache_mget, cache_set
+from .decorators import get_cached_endpoint
+
+logger = logging.getLogger(__name__)
+
+# Status entries outlive many data loads, but don't need to live forever
+WARMUP_STATUS_TTL = 7 * 24 * 3600
+MAX_REPORTED_ERRORS = 10
+
+# webhook source -> [(namespace, [params, ...]), ...]
+WARMUP_TARGETS: Dict[str, List[Tuple[str, List[dict]]]] = {
+    "bls": [
+        ("portal:bls:comprehensive", [{}]),
+        # US city average plus the four Census regions
+        ("bls:cu:overview", [
+            {"area_code": "0000"},
+            {"area_code": "0100"},
+            {"area_code": "0200"},
+            {"area_code": "0300"},
+            {"area_code": "0400"},
+        ]),
+        # Total nonfarm, total private, government
+        ("bls:jt:overview", [
+            {"industry_code": "000000", "state_code": "00"},
+            {"industry_code": "100000", "state_code": "00"},
+            {"industry_code": "900000", "state_code": "00"},
+        ]),
+        ("bls:ln:overview", [{}]),
+        ("bls:ce:overview", [{}]),
+        ("bls:wp:overview", [{}]),
+        ("bls:pc:overview", [{}]),
+    ],
+    "fred": [
+        ("fred:claims:overview", [{}]),
+        ("fred:leading:overview", [{}]),
+        ("fred:fedfunds:overview", [{}]),
+        ("fred:fedfunds:timeline", [{"years_back": 5}, {"years_back": 10}]),
+        ("fred:fedfunds:changes", [{"years_back": 5}]),
+        ("fred:fedfunds:chart-data", [{"years_back": 5}]),
+        ("fred:fedfunds:compare", [{"days_back": 365}]),
+        ("fred:fedfunds:series", [{"series_id": "DFF"}, {"series_id": "FEDFUNDS"}]),
+        ("fred:fedfunds:table", [{}]),
+    ],
+    "treasury": [
+        ("portal:treasury:comprehensive", [{}]),
+    ],
+}
+
+# Sources currently warming in this worker
+_running: set = set()
+
+
+def _status_key(source: str) -> str:
+    return f"{settings.CACHE_PREFIX}:cache:warmup:{source}"
+
+
+def warmup_sources(source: Optional[str] = None) -> List[str]:
+    """Sources a webhook call for `source` should warm (None = all)."""
+    if not source:
+        return list(WARMUP_TARGETS)
+    return [source] if source in WARMUP_TARGETS else []
+
+
+async def _warm_one(namespace: str, params: dict, semaphore: asyncio.Semaphore) -> Optional[str]:
+    """Warm one entry. Returns an error message, or None on success."""
+    endpoint = get_cached_endpoint(namespace)
+    if endpoint is None:
+        return f"{namespace}: no @cached endpoint registered"
+
+    async with semaphore:
+        db = DataSessionLocal()
+        try:
+            if inspect.iscoroutinefunction(endpoint.warm):
+                await endpoint.warm(db, **params)
+            else:
+                await run_in_threadpool(endpoint.warm, db, **params)
+            return None
+        except Exception as e:
+            return f"{namespace} {params}: {e}"
+        finally:
+            db.close()
+
+
+async def warm_source(source: str) -> dict:
+    """
+    Recompute every registered entry for one source with bounded concurrency.
+
+    Returns:
+        Status dict with duration, coverage and errors
+    """
+    targets = [(ns, params) for ns, param_sets in WARMUP_TARGETS.get(source, []) for params in param_sets]
+    status = {
+        "source": source,
+        "state": "running",
+        "started_at": datetime.utcnow().isoformat(),
+        "targets": len(targets),
+    }
+    await cache_set(_status_key(source), status, WARMUP_STATUS_TTL)
+
+    started = time.monotonic()
+    semaphore = asyncio.Semaphore(settings.CACHE_WARMUP_CONCURRENCY)
+    results = await asyncio.gather(*(_warm_one(ns, params, semaphore) for ns, params in targets))
+    errors = [r for r in results if r]
+
+    warmed = len(targets) - len(errors)
+    status.update({
+        "state": "completed",
+        "finished_at": datetime.utcnow().isoformat(),
+        "duration_seconds": round(time.monotonic() - started, 2),
+        "warmed": warmed,
+        "failed": len(errors),
+        "coverage": round(warmed / len(targets), 3) if targets else 1.0,
+        "errors": errors[:MAX_REPORTED_ERRORS],
+    })
+    await cache_set(_status_key(source), status, WARMUP_STATUS_TTL)
+
+    logger.info(
+        f"Cache warm-up '{source}': {warmed}/{len(targets)} entries "
+        f"in {status['duration_seconds']}s"
+    )
+    for error in errors:
+        logger.warning(f"Cache warm-up '{source}' failed: {error}")
+    return status
+
+
+async def warm_cache(source: Optional[str] = None) -> None:
+    """Background task scheduled by /cache/webhook."""
+    if DataSessionLocal is None:
+        logger.warning("Cache warm-up skipped: DATA_DATABASE_URL not configured")
+        return
+
+    sources = [s for s in warmup_sources(source) if s not in _running]
+    _running.update(sources)
+    try:
+        for s in sources:
+            try:
+                await warm_source(s)
+            except Exception as e:
+                logger.error(f"Cache warm-up '{s}' aborted: {e}")
+    finally:
+        _running.difference_update(sources)
+
+
+async def get_warmup_status() -> Dict[str, Optional[dict]]:
+    """Last warm-up status per source (None if never run or expired)."""
+    sources = list(WARMUP_TARGETS)
+    statuses = await cache_mget([_status_key(s) for s in sources])
+    return dict(zip(sources, statuses))
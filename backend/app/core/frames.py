@@ -0,0 +1,11 @@
+"""Copies of cached DataFrames that callers may modify"""
+import pandas as pd
+
+# With copy-on-write (the default from pandas 3) a shallow copy is private to
+# its holder: data is only duplicated when one side writes to it
+COPY_ON_WRITE = int(pd.__version__.split(".")[0]) >= 3 or pd.get_option("mode.copy_on_write") is True
+
+
+def private_copy(frame):
+    """Copy of a DataFrame/Series that doesn't share writes with the original"""
+    return frame.copy(deep=not COPY_ON_WRITE)
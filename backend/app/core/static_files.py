@@ -0,0 +1,22 @@
+"""Static file serving with cache headers for the report bundle"""
+import re
+
+from starlette.staticfiles import StaticFiles
+
+# report.<12 hex>.css / .js - content-hashed, never change once published
+HASHED_ASSET = re.compile(r"\.[0-9a-f]{12}\.(css|js)$")
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+DEFAULT_CACHE_CONTROL = "public, max-age=3600"
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers keep content-hashed files for a year"""
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if HASHED_ASSET.search(str(full_path)):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        else:
+            response.headers.setdefault("Cache-Control", DEFAULT_CACHE_CONTROL)
+        return response
@@ -1,10 +1,28 @@
-"""WebSocket connection manager for real-time updates"""
-from typing import Dict, Set
+"""
+WebSocket connection manager for real-time updates
+
+Collection and generation jobs may run in a worker process (app/jobs) or
+in another API process than the one holding the browser's socket. When
+the job queue's Redis is available, updates are published on a pub/sub
+channel and every API process delivers them to its own connections.
+Without Redis they go straight to this process's connections.
+"""
+from typing import Dict, Optional, Set
 from fastapi import WebSocket
 import json
 import asyncio
+import logging
 from datetime import datetime
 
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def relay_channel() -> str:
+    return f"{settings.CACHE_PREFIX}:ws:events"
+
+
 class ConnectionManager:
     """Manages WebSocket connections for real-time updates"""
     
@@ -13,6 +31,9 @@ class ConnectionManager:
         self.active_connections: Dict[str, Set[WebSocket]] = {}
         # Store connections by user_id for broadcasting
         self.user_connections: Dict[str, Set[WebSocket]] = {}
+        # Redis client while updates go through pub/sub
+        self._relay = None
+        self._relay_task: Optional[asyncio.Task] = None
     
     async def connect(self, websocket: WebSocket, analysis_id: str, user_id: str):
         """Accept and register a new WebSocket connection"""
@@ -48,15 +69,26 @@ class ConnectionManager:
     
     async def send_analysis_update(self, analysis_id: str, message: dict):
         """Send update to all connections watching a specific analysis"""
-        if analysis_id not in self.active_connections:
-            return
-        
         # Add timestamp to message
         message['timestamp'] = datetime.utcnow().isoformat()
+        if not await self._publish("analysis", analysis_id, message):
+            await self._deliver("analysis", analysis_id, message)
+    
+    async def send_user_update(self, user_id: str, message: dict):
+        """Send update to all connections for a specific user"""
+        message['timestamp'] = datetime.utcnow().isoformat()
+        if not await self._publish("user", user_id, message):
+            await self._deliver("user", user_id, message)
+    
+    async def _deliver(self, scope: str, key: str, message: dict):
+        """Send to this process's connections for an analysis or user"""
+        connections = self.active_connections if scope == "analysis" else self.user_connections
+        if key not in connections:
+            return
         
-        # Send to all connected clients for this analysis
+        # Send to all connected clients
         disconnected = set()
-        for connection in self.active_connections[analysis_id]:
+        for connection in list(connections[key]):
             try:
                 await connection.send_json(message)
             except Exception as e:
@@ -65,25 +97,66 @@ class ConnectionManager:
         
         # Clean up disconnected clients
         for connection in disconnected:
-            self.active_connections[analysis_id].discard(connection)
+            connections.get(key, set()).discard(connection)
     
-    async def send_user_update(self, user_id: str, message: dict):
-        """Send update to all connections for a specific user"""
-        if user_id not in self.user_connections:
-            return
+    async def _publish(self, scope: str, key: str, message: dict) -> bool:
+        """Hand an update to the relay. False if it must be delivered locally."""
+        if self._relay is None:
+            return False
+        try:
+            payload = json.dumps({"scope": scope, "key": key, "message": message}, default=str)
+            await self._relay.publish(relay_channel(), payload)
+            return True
+        except Exception as e:
+            logger.warning(f"WebSocket relay publish failed, delivering locally: {e}")
+            return False
+    
+    async def start_relay(self, listen: bool = True) -> bool:
+        """
+        Route updates through Redis pub/sub (app and worker startup).
         
-        message['timestamp'] = datetime.utcnow().isoformat()
+        API processes listen and deliver; worker processes (listen=False)
+        only publish. Returns False if Redis isn't available.
+        """
+        from ..jobs.queue import get_job_redis
         
-        disconnected = set()
-        for connection in self.user_connections[user_id]:
+        client = await get_job_redis()
+        if client is None:
+            return False
+        self._relay = client
+        if listen and self._relay_task is None:
+            self._relay_task = asyncio.create_task(self._listen())
+        return True
+    
+    async def stop_relay(self):
+        """Stop the relay listener (shutdown)"""
+        self._relay = None
+        if self._relay_task is not None:
+            self._relay_task.cancel()
+            await asyncio.gather(self._relay_task, return_exceptions=True)
+            self._relay_task = None
+    
+    async def _listen(self):
+        while self._relay is not None:
+            pubsub = self._relay.pubsub(ignore_subscribe_messages=True)
             try:
-                await connection.send_json(message)
+                await pubsub.subscribe(relay_channel())
+                while True:
+                    event = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if not event or event.get("type") != "message":
+                        continue
+                    data = json.loads(event["data"])
+                    await self._deliver(data["scope"], data["key"], data["message"])
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                print(f"Error sending to WebSocket: {e}")
-                disconnected.add(connection)
-        
-        for connection in disconnected:
-            self.user_connections[user_id].discard(connection)
+                logger.warning(f"WebSocket relay listener error, reconnecting: {e}")
+                await asyncio.sleep(2.0)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
     
     async def broadcast_progress(
         self, 
@@ -0,0 +1,162 @@
+# async_http.py — concurrent HTTP engine for the FMP collectors
+
+import asyncio
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+from .response_cache import ResponseCache
+
+
+class TokenBucket:
+    """
+    Async token bucket used to stay under the FMP per-minute quota.
+
+    `rate_per_minute` tokens are refilled continuously; up to `capacity`
+    tokens may be spent in a burst. Each request consumes one token.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[int] = None):
+        self.rate = max(float(rate_per_minute), 1.0) / 60.0   # tokens per second
+        self.capacity = float(capacity or max(1, int(rate_per_minute // 60) or 1))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+
+class AsyncHTTPEngine:
+    """
+    Fan-out GET engine on top of httpx.AsyncClient.
+
+      - `max_concurrency` caps in-flight requests (asyncio.Semaphore)
+      - `rate_per_minute` feeds a TokenBucket shared by every request
+      - retries 429/5xx and transport errors with non-blocking exponential backoff
+      - optional ResponseCache: hits skip the network (and the rate limit) entirely
+
+    Use as an async context manager; the underlying client is closed on exit.
+    """
+
+    RETRY_STATUS = (429, 500, 502, 503, 504)
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_concurrency: int = 8,
+        rate_per_minute: int = 300,
+        timeout: int = 30,
+        retries: int = 3,
+        backoff: float = 0.7,
+        sleep_sec: float = 0.0,
+        user_agent: str = "CollectorV3/1.3",
+        cache: Optional[ResponseCache] = None,
+    ):
+        self.api_key = api_key
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.timeout = int(timeout)
+        self.retries = int(retries)
+        self.backoff = float(backoff)
+        self.sleep_sec = float(sleep_sec)
+        self.user_agent = user_agent
+        self.cache = cache
+
+        self._bucket = TokenBucket(rate_per_minute, capacity=self.max_concurrency)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._client: Optional[httpx.AsyncClient] = None
+
+        # simple counters, reported at the end of a collection run
+        self.requests_made = 0
+        self.requests_failed = 0
+        self.cache_hits = 0
+
+    async def __aenter__(self) -> "AsyncHTTPEngine":
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            headers={"User-Agent": self.user_agent},
+            limits=httpx.Limits(max_connections=self.max_concurrency,
+                                max_keepalive_connections=self.max_concurrency),
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+        self._client = None
+        self._semaphore = None
+
+    async def get_json(self, url: str, params: Optional[dict] = None) -> Any:
+        """GET `url` and return the decoded JSON body, or None on failure."""
+        return (await self.get_many([(url, params)]))[0]
+
+    async def _fetch(self, url: str, params: Optional[dict]) -> Any:
+        if self._client is None or self._semaphore is None:
+            raise RuntimeError("AsyncHTTPEngine must be used inside 'async with'")
+
+        params = dict(params or {})
+        if self.api_key:
+            params["apikey"] = self.api_key
+
+        async with self._semaphore:
+            for i in range(self.retries):
+                # No backoff after the last attempt; nothing is retried
+                backoff = self.backoff * (2 ** i) if i < self.retries - 1 else 0.0
+                await self._bucket.acquire()
+                self.requests_made += 1
+                try:
+                    r = await self._client.get(url, params=params)
+                    if r.status_code == 200:
+                        try:
+                            return r.json()
+                        except Exception:
+                            return None
+                    if r.status_code in self.RETRY_STATUS:
+                        if backoff:
+                            await asyncio.sleep(backoff)
+                        continue
+                    break
+                except Exception:
+                    if backoff:
+                        await asyncio.sleep(backoff)
+                finally:
+                    if self.sleep_sec:
+                        await asyncio.sleep(self.sleep_sec)
+        self.requests_failed += 1
+        return None
+
+    async def get_many(self, calls: Iterable[Tuple[str, dict]]) -> List[Any]:
+        """
+        Run several GETs concurrently; results are returned in input order.
+        Cached responses are looked up in one batch first; only misses are fetched.
+        """
+        calls = list(calls)
+        if self.cache is None:
+            return list(await asyncio.gather(*(self._fetch(url, params) for url, params in calls)))
+
+        results = await asyncio.to_thread(self.cache.get_many, calls)
+        misses = [i for i, value in enumerate(results) if value is None]
+        self.cache_hits += len(calls) - len(misses)
+        fetched = await asyncio.gather(*(self._fetch(*calls[i]) for i in misses))
+        for i, value in zip(misses, fetched):
+            results[i] = value
+        await asyncio.to_thread(
+            self.cache.set_many, [(calls[i][0], calls[i][1], value) for i, value in zip(misses, fetched)]
+        )
+        return results
+
+    def stats(self) -> Dict[str, int]:
+        return {"requests": self.requests_made, "failed": self.requests_failed, "cache_hits": self.cache_hits}
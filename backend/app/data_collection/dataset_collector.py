@@ -2,7 +2,6 @@
 import os
 import re
 from pathlib import Path
-import glob
 import time
 from datetime import datetime, date
 from typing import Dict, List, Optional, Tuple
@@ -10,7 +9,10 @@ from typing import Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
 import requests
-from .fred_collector import FREDCollector
+from .fred_collector import build_macro_store, refresh_macro_store_in_background
+from .macro_store import load_macro_panel, snapshot_age_days
+from .local_source import LocalDataSource
+from .response_cache import get_response_cache
 
 def _ensure_dir(p: str) -> None:
     os.makedirs(p, exist_ok=True)
@@ -21,6 +23,9 @@ class DatasetCollection:
     The following is borrowed and adapted from FinancialDataCollection, with additional features:
     Reference to FinancialDataCollection for details unless explicitly noted below.
     Enhanced to include:
+      - Optional local_source (local_source.py): endpoint/ticker pairs the DATA database holds
+        current copies of are bulk-loaded from it up front; only the rest go to FMP.
+      - FMP responses go through the shared response cache (response_cache.py) unless use_response_cache=False.
     """
 
     ENDPOINTS = {
@@ -56,7 +61,9 @@ class DatasetCollection:
         retries: int = 3,
         backoff: float = 0.7,
         export_dir: Path = Path("export"),
-        econ_dir: Path =Path("export")
+        econ_dir: Path =Path("export"),
+        local_source: Optional[LocalDataSource] = None,
+        use_response_cache: bool = True,
     ):
         self.api_key = api_key
         self.companies = {k: (v or "").upper().strip() for k, v in companies.items()}
@@ -77,6 +84,11 @@ class DatasetCollection:
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": "CollectorV3/1.3"})
 
+        # DATA-database backend; endpoint key -> {symbol: FMP-shaped json} it served
+        self.local_source = local_source
+        self._local: Dict[str, Dict[str, list]] = {}
+        self.use_response_cache = use_response_cache
+
         # Raw per-company stores
         self.profiles: Dict[str, dict] = {}
         self.is_hist: Dict[str, list] = {}
@@ -125,6 +137,56 @@ class DatasetCollection:
                 time.sleep(self.backoff * (2 ** i))
         return None
 
+    def _get_json(self, key: str, params: dict):
+        """
+        JSON for one endpoint call: the DATA database copy if it served one,
+        else the shared response cache, else FMP.
+        """
+        local = self._local.get(key, {})
+        if params.get("symbol") in local:
+            return local[params["symbol"]]
+        url = self.ENDPOINTS[key]
+        cache = get_response_cache() if getattr(self, "use_response_cache", True) else None
+        js = cache.get(url, params) if cache else None
+        if js is None:
+            js = self._json_safe(self._get(url, params))
+            if cache:
+                cache.set(url, params, js)
+        return js
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["local_source"] = None
+        state["_local"] = {}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.local_source = None
+        self._local = {}
+
+    def _price_start(self) -> str:
+        return (pd.Timestamp.today().normalize() - pd.DateOffset(years=self.years + 1)).strftime("%Y-%m-%d")
+
+    def _load_local(self) -> None:
+        """Bulk-load every endpoint the DATA database holds current data for."""
+        self._local = {}
+        if self.local_source is None:
+            return
+        keys = ["profile", "income_statement", "balance_sheet", "cash_flow", "ratios", "key_metrics",
+                "enterprise_values", "employee_history", "prices_full"]
+        if self.include_institutional:
+            keys += ["insider_trading_search", "institutional_ownership_summary", "insider_trading_statistics"]
+        if self.include_analyst:
+            keys += ["analyst_estimates", "price_target_consensus"]
+        symbols = list(self.companies.values()) + (["^GSPC"] if self.include_sp500 else [])
+        try:
+            self._local = self.local_source.fetch(keys, symbols, self.years,
+                                                  pd.Timestamp(self._price_start()).date())
+        except Exception as e:
+            print(f"⚠️ DATA database unavailable, collecting from FMP only: {e}")
+            self._local = {}
+
     @staticmethod
     def _to_df(obj) -> pd.DataFrame:
         if obj is None:
@@ -156,8 +218,7 @@ class DatasetCollection:
         new_profiles  = {}
         new_companies = {}
         for name, sym in self.companies.items():
-            r  = self._get(self.ENDPOINTS["profile"], {"symbol": sym})
-            js = self._json_safe(r)
+            js = self._get_json("profile", {"symbol": sym})
             rec = js[0] if isinstance(js, list) and js else (js if isinstance(js, dict) else {})
             if not rec or not isinstance(rec, dict) or not rec.get("symbol"):
                 print(
@@ -191,8 +252,7 @@ class DatasetCollection:
         ]
         for name, sym in self.companies.items():
             for key, store in stores:
-                r = self._get(self.ENDPOINTS[key], {"symbol": sym, "period": "annual", "limit": lim})
-                js = self._json_safe(r)
+                js = self._get_json(key, {"symbol": sym, "period": "annual", "limit": lim})
                 if isinstance(js, dict):
                     js = [js]
                 store[name] = js or []
@@ -202,9 +262,7 @@ class DatasetCollection:
     def _collect_ev(self):
         lim = self.years + 1
         for name, sym in self.companies.items():
-            r = self._get(self.ENDPOINTS["enterprise_values"],
-                          {"symbol": sym, "period": "annual", "limit": lim})
-            js = self._json_safe(r)
+            js = self._get_json("enterprise_values", {"symbol": sym, "period": "annual", "limit": lim})
             df = self._to_df(js)
 
             if "date" in df.columns:
@@ -225,8 +283,7 @@ class DatasetCollection:
     def _collect_employees(self):
         lim = self.years + 1
         for name, sym in self.companies.items():
-            r = self._get(self.ENDPOINTS["employee_history"], {"symbol": sym, "limit": lim})
-            js = self._json_safe(r)
+            js = self._get_json("employee_history", {"symbol": sym, "limit": lim})
             df = self._to_df(js)
             if "periodOfReport" in df.columns:
                 df["periodOfReport"] = pd.to_datetime(df["periodOfReport"], errors="coerce")
@@ -243,11 +300,10 @@ class DatasetCollection:
         Also provide a monthly resample (export-only) that uses 'last' per month across all columns when possible.
         NEW: Also collect S&P 500 (^GSPC) prices if include_sp500=True.
         """
-        start_date = (pd.Timestamp.today().normalize() - pd.DateOffset(years=self.years + 1)).strftime("%Y-%m-%d")
+        start_date = self._price_start()
 
         for name, sym in self.companies.items():
-            r = self._get(self.ENDPOINTS["prices_full"], {"symbol": sym, "from": start_date})
-            js = self._json_safe(r)
+            js = self._get_json("prices_full", {"symbol": sym, "from": start_date})
 
             if isinstance(js, list):
                 arr = js
@@ -290,8 +346,7 @@ class DatasetCollection:
 
         # NEW: Collect S&P 500 index prices
         if self.include_sp500:
-            r = self._get(self.ENDPOINTS["prices_full"], {"symbol": "^GSPC", "from": start_date})
-            js = self._json_safe(r)
+            js = self._get_json("prices_full", {"symbol": "^GSPC", "from": start_date})
 
             if isinstance(js, list):
                 arr = js
@@ -338,14 +393,12 @@ class DatasetCollection:
             return
         lim = self.years + 1
         for name, sym in self.companies.items():
-            r1 = self._get(self.ENDPOINTS["analyst_estimates"], {"symbol": sym, "period": "annual", "limit": lim})
-            df1 = self._to_df(self._json_safe(r1))
+            df1 = self._to_df(self._get_json("analyst_estimates", {"symbol": sym, "period": "annual", "limit": lim}))
             if "date" in df1.columns:
                 df1["date"] = pd.to_datetime(df1["date"], errors="coerce")
             self.analyst_estimates[name] = df1.sort_values("date" if "date" in df1.columns else df1.columns[0]).reset_index(drop=True)
 
-            r2 = self._get(self.ENDPOINTS["price_target_consensus"], {"symbol": sym})
-            df2 = self._to_df(self._json_safe(r2))
+            df2 = self._to_df(self._get_json("price_target_consensus", {"symbol": sym}))
             if "publishedDate" in df2.columns:
                 df2["publishedDate"] = pd.to_datetime(df2["publishedDate"], errors="coerce")
             self.price_targets[name] = df2
@@ -363,9 +416,7 @@ class DatasetCollection:
             return
             
         for name, sym in self.companies.items():
-            r = self._get(self.ENDPOINTS["insider_trading_search"], 
-                          {"symbol": sym, "page": 1, "limit": 1000})
-            js = self._json_safe(r)
+            js = self._get_json("insider_trading_search", {"symbol": sym, "page": 1, "limit": 1000})
             df = self._to_df(js)
             
             date_cols = ["filingDate", "transactionDate"]
@@ -391,15 +442,23 @@ class DatasetCollection:
         current_year = datetime.now().year
         quarters = [1, 2, 3, 4]
         
+        local = self._local.get("institutional_ownership_summary", {})
         for name, sym in self.companies.items():
             all_quarters = []
-            
-            for year_offset in [0, 1]:
+
+            if sym in local:
+                df = self._to_df(local[sym])
+                if not df.empty:
+                    if "date" in df.columns:
+                        df["date"] = pd.to_datetime(df["date"], errors="coerce")
+                    df["Company"] = name
+                    df["Symbol"] = sym
+                    all_quarters.append(df)
+
+            for year_offset in ([] if sym in local else [0, 1]):
                 year = current_year - year_offset
                 for quarter in quarters:
-                    r = self._get(self.ENDPOINTS["institutional_ownership_summary"], 
-                                  {"symbol": sym, "year": year, "quarter": quarter})
-                    js = self._json_safe(r)
+                    js = self._get_json("institutional_ownership_summary", {"symbol": sym, "year": year, "quarter": quarter})
                     df = self._to_df(js)
                     
                     if not df.empty:
@@ -435,9 +494,7 @@ class DatasetCollection:
             return
             
         for name, sym in self.companies.items():
-            r = self._get(self.ENDPOINTS["insider_trading_statistics"], 
-                          {"symbol": sym})
-            js = self._json_safe(r)
+            js = self._get_json("insider_trading_statistics", {"symbol": sym})
             df = self._to_df(js)
             
             df["Company"] = name
@@ -460,9 +517,7 @@ class DatasetCollection:
         Returns:
             DataFrame with 13F holdings data
         """
-        r = self._get(self.ENDPOINTS["institutional_13f_extract"], 
-                      {"cik": cik, "year": year, "quarter": quarter})
-        js = self._json_safe(r)
+        js = self._get_json("institutional_13f_extract", {"cik": cik, "year": year, "quarter": quarter})
         df = self._to_df(js)
         
         date_cols = ["date", "acceptedDate"]
@@ -723,91 +778,29 @@ class DatasetCollection:
         self.metrics_df = out[["Company", "Year"] + [c for c in numeric_cols if c != "Year"]].copy()
 
     # ------------------------ Economics integration ------------------------
-    def _parse_econ_ts_from_name(self, path: str) -> Optional[pd.Timestamp]:
-        try:
-            base = os.path.basename(path)
-            stem, _ = os.path.splitext(base)
-            parts = stem.split("_")
-            dt_token = parts[-2] + parts[-1]
-            return pd.to_datetime(dt_token, format="%Y%m%d%H%M", errors="coerce")
-        except Exception:
-            return None
-
-    def _find_latest_econ_file(self, econ_dir: str = "economics") -> Optional[str]:
-        pattern = os.path.join(econ_dir, "fred_full_history_*.xlsx")
-        files = glob.glob(pattern)
-        if not files:
-            return None
-        def sort_key(p):
-            ts = self._parse_econ_ts_from_name(p)
-            return (ts is not None, ts or pd.Timestamp(os.path.getmtime(p), unit="s"))
-        files.sort(key=sort_key, reverse=True)
-        return files[0]
-
-    def _load_econ_from_workbook(self, path: str) -> Dict[str, pd.DataFrame]:
-        out = {}
-        try:
-            xl = pd.ExcelFile(path)
-            for sheet in ("Raw_Long", "Monthly_Panel", "Quarterly_Panel", "Meta"):
-                if sheet in xl.sheet_names:
-                    out[sheet] = xl.parse(sheet)
-        except Exception:
-            out = {}
-        return out
-
-    def _build_econ_annual_from_book(self, book: Dict[str, pd.DataFrame]) -> pd.DataFrame:
-        if "Monthly_Panel" in book and not book["Monthly_Panel"].empty:
-            mp = book["Monthly_Panel"].copy()
-            if "Date" not in mp.columns:
-                return pd.DataFrame()
-            mp["Date"] = pd.to_datetime(mp["Date"], errors="coerce")
-            mp = mp.dropna(subset=["Date"]).sort_values("Date").set_index("Date")
-            ann = mp.resample("YE-DEC").last().reset_index()
-            ann["Year"] = ann["Date"].dt.year.astype("Int64")
-            cols = ["Year"] + [c for c in ann.columns if c not in ("Year")]
-            return ann[cols]
-        if "Raw_Long" in book and not book["Raw_Long"].empty:
-            rl = book["Raw_Long"].copy()
-            if not set(["Date", "Series", "Value"]).issubset(rl.columns):
-                return pd.DataFrame()
-            rl["Date"] = pd.to_datetime(rl["Date"], errors="coerce")
-            rl = rl.dropna(subset=["Date"])
-            wide = rl.pivot_table(index="Date", columns="Series", values="Value", aggfunc="last")
-            ann = wide.resample("YE-DEC").last().reset_index()
-            ann["Year"] = ann["Date"].dt.year.astype("Int64")
-            cols = ["Year"] + [c for c in ann.columns if c not in ("Year")]
-            return ann[cols]
-        return pd.DataFrame()
-
-    def get_economic(self, force_refresh: bool = False, econ_dir: str = "economics",
+    def get_economic(self, force_refresh: bool = False, econ_dir: Optional[str] = None,
                      stale_days: int = 5) -> pd.DataFrame:
+        """
+        Annual macro panel from the shared macro store. Only blocks on FRED when
+        there is no store yet; a stale store is used as is and refreshed
+        incrementally in the background.
+        """
         existing = self.raw_tables.get("Economic_Annual")
         if isinstance(existing, pd.DataFrame) and not existing.empty and not force_refresh:
             return existing
 
-        econ_path = None
-        latest = self._find_latest_econ_file(econ_dir)
-        use_fallback = False
-
-        if latest is None:
-            use_fallback = True
-        else:
-            ts = self._parse_econ_ts_from_name(latest)
-            if ts is None:
-                ts = pd.to_datetime(os.path.getmtime(latest), unit="s", errors="coerce")
-            if pd.isna(ts) or (pd.Timestamp.now() - ts).days > int(stale_days):
-                use_fallback = True
-
-        if use_fallback:
-            print("ℹ️ No recent macro workbook found - running FREDCollector to build one...")
-            fc = FREDCollector(fmp_api_key=self.api_key, export_dir = str(self.econ_dir))
-            econ_path = fc.run_export_single()
+        econ_dir = econ_dir or str(self.econ_dir)
+        econ_annual = load_macro_panel(econ_dir, "annual")
+        if econ_annual is None:
+            print("ℹ️ No macro store found - running FREDCollector to build one...")
+            econ_annual = build_macro_store(econ_dir, fmp_api_key=self.api_key)
+        elif snapshot_age_days(econ_dir) > stale_days:
+            print(f"ℹ️ Macro store in {econ_dir} is stale - refreshing it in the background")
+            refresh_macro_store_in_background(econ_dir, fmp_api_key=self.api_key)
         else:
-            econ_path = latest
-            print(f"ℹ️ Using existing macro workbook: {econ_path}")
-
-        book = self._load_econ_from_workbook(econ_path)
-        econ_annual = self._build_econ_annual_from_book(book)
+            print(f"ℹ️ Using the shared macro store in {econ_dir}")
+        if econ_annual is None:
+            econ_annual = pd.DataFrame()
 
         self.raw_tables["Economic_Annual"] = econ_annual
         return econ_annual
@@ -816,6 +809,7 @@ class DatasetCollection:
     def collect(self, force: bool = False):
         if self._collected and not force:
             return
+        self._load_local()
         print("Collecting profiles ..."); self._collect_profiles()
         if not self.availability:
             return
@@ -2,7 +2,6 @@
 import os
 import re
 from pathlib import Path
-import glob
 import time
 import asyncio
 from datetime import datetime, date
@@ -11,7 +10,11 @@ from typing import Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
 import requests
-from .fred_collector import FREDCollector
+from .fred_collector import build_macro_store, refresh_macro_store_in_background
+from .macro_store import load_macro_panel, snapshot_age_days
+from .async_http import AsyncHTTPEngine
+from .local_source import LocalDataSource
+from .response_cache import get_response_cache
 
 def _ensure_dir(p: str) -> None:
     os.makedirs(p, exist_ok=True)
@@ -49,8 +52,11 @@ class FinancialDataCollection:
       - All_Financial_Data keeps ALL original fields from the five accounting/metric blocks;
         collisions resolved by precedence (later overwrites earlier).
       - Adds absolute YoY deltas for a set of key numeric indicators as <col>_YoY (no %).
-      - Economic indicators: load latest economics/fred_full_history_YYYYMMDD_HHMM.xlsx;
-        if missing/stale, calls FREDCollector to build a new workbook. Exports Economic_Annual sheet.
+      - Economic indicators: annual panel memory-mapped from the shared macro store
+        (macro_store.py); built by FREDCollector if missing, refreshed in the background when stale. Exports Economic_Annual sheet.
+      - Optional local_source (local_source.py): endpoint/ticker pairs the DATA database holds
+        current copies of are bulk-loaded from it up front; only the rest go to FMP.
+      - FMP responses go through the shared response cache (response_cache.py) unless use_response_cache=False.
     """
 
     ENDPOINTS = {
@@ -88,7 +94,11 @@ class FinancialDataCollection:
         export_dir: Path = Path("export"),
         econ_dir: Path =Path("export"),
         websocket_manager=None,      # ← NEW
-        analysis_id: str = None        # ← NEW
+        analysis_id: str = None,       # ← NEW
+        max_concurrency: int = 8,
+        rate_limit_per_minute: int = 300,
+        local_source: Optional[LocalDataSource] = None,
+        use_response_cache: bool = True,
     ):
         self.api_key = api_key
         self.companies = {k: (v or "").upper().strip() for k, v in companies.items()}
@@ -101,13 +111,23 @@ class FinancialDataCollection:
         self.timeout = int(timeout)
         self.retries = int(retries)
         self.backoff = float(backoff)
+        self.max_concurrency = int(max_concurrency)
+        self.rate_limit_per_minute = int(rate_limit_per_minute)
 
         self.export_dir = Path(export_dir)
         _ensure_dir(self.export_dir)
         self.econ_dir = econ_dir
 
+        # sync session is kept for one-off calls (collect_13f_data);
+        # bulk collection goes through the async engine created in collect()
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": "CollectorV3/1.3"})
+        self._engine: Optional[AsyncHTTPEngine] = None
+
+        # DATA-database backend; endpoint key -> {symbol: FMP-shaped json} it served
+        self.local_source = local_source
+        self._local: Dict[str, Dict[str, list]] = {}
+        self.use_response_cache = use_response_cache
 
         # Raw per-company stores
         self.profiles: Dict[str, dict] = {}
@@ -150,6 +170,9 @@ class FinancialDataCollection:
         # Remove unpicklable attributes
         state['websocket_manager'] = None
         state['analysis_id'] = None
+        state['_engine'] = None
+        state['local_source'] = None
+        state['_local'] = {}
         return state
     
     def __setstate__(self, state):
@@ -160,6 +183,10 @@ class FinancialDataCollection:
             self.websocket_manager = None
         if not hasattr(self, 'analysis_id'):
             self.analysis_id = None
+        self._engine = None
+        self.local_source = getattr(self, 'local_source', None)
+        self._local = {}
+
     async def _broadcast_progress(self, progress: int, message: str):
         """Broadcast progress via WebSocket if available"""
         if self.websocket_manager and self.analysis_id:
@@ -211,13 +238,59 @@ class FinancialDataCollection:
 
 
 
+    # ------------------------ Async fetch helpers ------------------------
+    async def _aget_json(self, url: str, params: dict):
+        """Fetch JSON through the shared async engine (only valid inside collect())."""
+        if self._engine is None:
+            raise RuntimeError("HTTP engine not initialised; call collect() instead")
+        return await self._engine.get_json(url, params)
+
+    async def _aget_per_company(self, key: str, params_for) -> Dict[str, object]:
+        """
+        Fan out one endpoint across every company.
+        `params_for(sym)` builds the query params; returns {company_name: json}.
+        Companies the DATA database already served are not requested from FMP.
+        """
+        local = self._local.get(key, {})
+        out = {n: local[s] for n, s in self.companies.items() if s in local}
+        names = [n for n in self.companies if n not in out]
+        results = await self._engine.get_many(
+            (self.ENDPOINTS[key], params_for(self.companies[n])) for n in names
+        )
+        out.update(zip(names, results))
+        return out
+
+    def _price_start(self) -> str:
+        return (pd.Timestamp.today().normalize() - pd.DateOffset(years=self.years + 1)).strftime("%Y-%m-%d")
+
+    async def _load_local(self) -> None:
+        """Bulk-load every endpoint the DATA database holds current data for."""
+        self._local = {}
+        if self.local_source is None:
+            return
+        keys = ["profile", "income_statement", "balance_sheet", "cash_flow", "ratios", "key_metrics",
+                "enterprise_values", "employee_history", "prices_full"]
+        if self.include_institutional:
+            keys += ["insider_trading_search", "institutional_ownership_summary", "insider_trading_statistics"]
+        if self.include_analyst:
+            keys += ["analyst_estimates", "price_target_consensus"]
+        symbols = list(self.companies.values()) + (["^GSPC"] if self.include_sp500 else [])
+        try:
+            self._local = await asyncio.to_thread(
+                self.local_source.fetch, keys, symbols, self.years,
+                pd.Timestamp(self._price_start()).date(),
+            )
+        except Exception as e:
+            print(f"⚠️ DATA database unavailable, collecting from FMP only: {e}")
+            self._local = {}
+
     # ------------------------ Collection ------------------------
-    def _collect_profiles(self):
+    async def _collect_profiles(self):
         new_profiles  = {}
         new_companies = {}
+        fetched = await self._aget_per_company("profile", lambda sym: {"symbol": sym})
         for name, sym in self.companies.items():
-            r  = self._get(self.ENDPOINTS["profile"], {"symbol": sym})
-            js = self._json_safe(r)
+            js = fetched.get(name)
             rec = js[0] if isinstance(js, list) and js else (js if isinstance(js, dict) else {})
             if not rec or not isinstance(rec, dict) or not rec.get("symbol"):
                 print(
@@ -234,13 +307,10 @@ class FinancialDataCollection:
             new_profiles[name]  = rec    # CHANGED: use 'name' as key
             new_companies[name] = real_sym  # CHANGED: use 'name' as key
 
-            if self.sleep_sec:
-                time.sleep(self.sleep_sec)
-
         self.profiles  = new_profiles
         self.companies = new_companies
 
-    def _collect_statements(self):
+    async def _collect_statements(self):
         lim = self.years + 1
         stores = [
             ("income_statement", self.is_hist),
@@ -249,23 +319,25 @@ class FinancialDataCollection:
             ("ratios", self.ratios_hist),
             ("key_metrics", self.km_hist),
         ]
-        for name, sym in self.companies.items():
-            for key, store in stores:
-                r = self._get(self.ENDPOINTS[key], {"symbol": sym, "period": "annual", "limit": lim})
-                js = self._json_safe(r)
+        # all 5 statement endpoints x all companies in one fan-out
+        fetched = await asyncio.gather(*(
+            self._aget_per_company(key, lambda sym: {"symbol": sym, "period": "annual", "limit": lim})
+            for key, _ in stores
+        ))
+        for (key, store), by_name in zip(stores, fetched):
+            for name in self.companies:
+                js = by_name.get(name)
                 if isinstance(js, dict):
                     js = [js]
                 store[name] = js or []
-                if self.sleep_sec:
-                    time.sleep(self.sleep_sec)
 
-    def _collect_ev(self):
+    async def _collect_ev(self):
         lim = self.years + 1
+        fetched = await self._aget_per_company(
+            "enterprise_values", lambda sym: {"symbol": sym, "period": "annual", "limit": lim}
+        )
         for name, sym in self.companies.items():
-            r = self._get(self.ENDPOINTS["enterprise_values"],
-                          {"symbol": sym, "period": "annual", "limit": lim})
-            js = self._json_safe(r)
-            df = self._to_df(js)
+            df = self._to_df(fetched.get(name))
 
             if "date" in df.columns:
                 df["date"] = pd.to_datetime(df["date"], errors="coerce")
@@ -279,35 +351,42 @@ class FinancialDataCollection:
                 df = df.reset_index(drop=True)
 
             self.ev_hist[name] = df
-            if self.sleep_sec:
-                time.sleep(self.sleep_sec)
 
-    def _collect_employees(self):
+    async def _collect_employees(self):
         lim = self.years + 1
+        fetched = await self._aget_per_company(
+            "employee_history", lambda sym: {"symbol": sym, "limit": lim}
+        )
         for name, sym in self.companies.items():
-            r = self._get(self.ENDPOINTS["employee_history"], {"symbol": sym, "limit": lim})
-            js = self._json_safe(r)
-            df = self._to_df(js)
+            df = self._to_df(fetched.get(name))
             if "periodOfReport" in df.columns:
                 df["periodOfReport"] = pd.to_datetime(df["periodOfReport"], errors="coerce")
             if "filingDate" in df.columns:
                 df["filingDate"] = pd.to_datetime(df["filingDate"], errors="coerce")
             self.emp_hist[name] = df.sort_values("periodOfReport" if "periodOfReport" in df.columns else df.columns[0]).reset_index(drop=True)
-            if self.sleep_sec:
-                time.sleep(self.sleep_sec)
 
-    def _collect_prices(self):
+    async def _collect_prices(self):
         """
         FIX 1: Use ?from=YYYY-MM-DD to cover (years+1) years back from 'today'.
         FIX 2: Preserve response columns exactly; do not guess or rename. Add Company/Symbol for ID only.
         Also provide a monthly resample (export-only) that uses 'last' per month across all columns when possible.
         NEW: Also collect S&P 500 (^GSPC) prices if include_sp500=True.
         """
-        start_date = (pd.Timestamp.today().normalize() - pd.DateOffset(years=self.years + 1)).strftime("%Y-%m-%d")
+        start_date = self._price_start()
+
+        company_task = self._aget_per_company("prices_full", lambda sym: {"symbol": sym, "from": start_date})
+        if self.include_sp500 and "^GSPC" in self._local.get("prices_full", {}):
+            fetched, sp_js = await company_task, self._local["prices_full"]["^GSPC"]
+        elif self.include_sp500:
+            fetched, sp_js = await asyncio.gather(
+                company_task,
+                self._aget_json(self.ENDPOINTS["prices_full"], {"symbol": "^GSPC", "from": start_date}),
+            )
+        else:
+            fetched, sp_js = await company_task, None
 
         for name, sym in self.companies.items():
-            r = self._get(self.ENDPOINTS["prices_full"], {"symbol": sym, "from": start_date})
-            js = self._json_safe(r)
+            js = fetched.get(name)
 
             if isinstance(js, list):
                 arr = js
@@ -345,13 +424,9 @@ class FinancialDataCollection:
             else:
                 self.prices_monthly[name] = pd.DataFrame()
 
-            if self.sleep_sec:
-                time.sleep(self.sleep_sec)
-
         # NEW: Collect S&P 500 index prices
         if self.include_sp500:
-            r = self._get(self.ENDPOINTS["prices_full"], {"symbol": "^GSPC", "from": start_date})
-            js = self._json_safe(r)
+            js = sp_js
 
             if isinstance(js, list):
                 arr = js
@@ -390,43 +465,39 @@ class FinancialDataCollection:
             else:
                 self.sp500_monthly = pd.DataFrame()
 
-            if self.sleep_sec:
-                time.sleep(self.sleep_sec)
-
-    def _collect_analyst(self):
+    async def _collect_analyst(self):
         if not self.include_analyst:
             return
         lim = self.years + 1
+        estimates, targets = await asyncio.gather(
+            self._aget_per_company("analyst_estimates", lambda sym: {"symbol": sym, "period": "annual", "limit": lim}),
+            self._aget_per_company("price_target_consensus", lambda sym: {"symbol": sym}),
+        )
         for name, sym in self.companies.items():
-            r1 = self._get(self.ENDPOINTS["analyst_estimates"], {"symbol": sym, "period": "annual", "limit": lim})
-            df1 = self._to_df(self._json_safe(r1))
+            df1 = self._to_df(estimates.get(name))
             if "date" in df1.columns:
                 df1["date"] = pd.to_datetime(df1["date"], errors="coerce")
             self.analyst_estimates[name] = df1.sort_values("date" if "date" in df1.columns else df1.columns[0]).reset_index(drop=True)
 
-            r2 = self._get(self.ENDPOINTS["price_target_consensus"], {"symbol": sym})
-            df2 = self._to_df(self._json_safe(r2))
+            df2 = self._to_df(targets.get(name))
             if "publishedDate" in df2.columns:
                 df2["publishedDate"] = pd.to_datetime(df2["publishedDate"], errors="coerce")
             self.price_targets[name] = df2
 
-            if self.sleep_sec:
-                time.sleep(self.sleep_sec)
-
     # ------------------------ Institutional & Insider Collection ------------------------
-    def _collect_insider_trading_latest(self):
+    async def _collect_insider_trading_latest(self):
         """
         Collect insider trading activity for each company using the search endpoint.
         Uses page=1 and limit=1000 for optimal data retrieval.
         """
         if not self.include_institutional:
             return
-            
+
+        fetched = await self._aget_per_company(
+            "insider_trading_search", lambda sym: {"symbol": sym, "page": 1, "limit": 1000}
+        )
         for name, sym in self.companies.items():
-            r = self._get(self.ENDPOINTS["insider_trading_search"], 
-                          {"symbol": sym, "page": 1, "limit": 1000})
-            js = self._json_safe(r)
-            df = self._to_df(js)
+            df = self._to_df(fetched.get(name))
             
             date_cols = ["filingDate", "transactionDate"]
             for col in date_cols:
@@ -440,42 +511,54 @@ class FinancialDataCollection:
                 df = df.sort_values("transactionDate", ascending=False)
             
             self.insider_trading_latest[name] = df.reset_index(drop=True)
-            
-            if self.sleep_sec:
-                time.sleep(self.sleep_sec)
 
-    def _collect_institutional_ownership(self):
+    async def _collect_institutional_ownership(self):
         if not self.include_institutional:
             return
             
         current_year = datetime.now().year
         quarters = [1, 2, 3, 4]
-        
+        periods = [(current_year - year_offset, quarter) for year_offset in [0, 1] for quarter in quarters]
+
+        by_company: Dict[str, list] = {name: [] for name in self.companies}
+        local = self._local.get("institutional_ownership_summary", {})
         for name, sym in self.companies.items():
-            all_quarters = []
-            
-            for year_offset in [0, 1]:
-                year = current_year - year_offset
-                for quarter in quarters:
-                    r = self._get(self.ENDPOINTS["institutional_ownership_summary"], 
-                                  {"symbol": sym, "year": year, "quarter": quarter})
-                    js = self._json_safe(r)
-                    df = self._to_df(js)
-                    
-                    if not df.empty:
-                        if "date" in df.columns:
-                            df["date"] = pd.to_datetime(df["date"], errors="coerce")
-                        
-                        df["Company"] = name
-                        df["Symbol"] = sym
-                        df["CollectedYear"] = year
-                        df["CollectedQuarter"] = quarter
-                        
-                        all_quarters.append(df)
-                        
-                    if self.sleep_sec:
-                        time.sleep(self.sleep_sec)
-            
+            df = self._to_df(local.get(sym))
+            if df.empty:
+                continue
+            if "date" in df.columns:
+                df["date"] = pd.to_datetime(df["date"], errors="coerce")
+            df["Company"] = name
+            df["Symbol"] = sym
+            by_company[name].append(df)
+
+        # every (company, year, quarter) summary call goes out in one fan-out
+        calls = [
+            (name, sym, year, quarter)
+            for name, sym in self.companies.items()
+            if sym not in local
+            for year, quarter in periods
+        ]
+        results = await self._engine.get_many(
+            (self.ENDPOINTS["institutional_ownership_summary"], {"symbol": sym, "year": year, "quarter": quarter})
+            for _, sym, year, quarter in calls
+        )
+
+        for (name, sym, year, quarter), js in zip(calls, results):
+            df = self._to_df(js)
+            if df.empty:
+                continue
+            if "date" in df.columns:
+                df["date"] = pd.to_datetime(df["date"], errors="coerce")
+
+            df["Company"] = name
+            df["Symbol"] = sym
+            df["CollectedYear"] = year
+            df["CollectedQuarter"] = quarter
+
+            by_company[name].append(df)
+
+        for name, all_quarters in by_company.items():
             if all_quarters:
                 combined = pd.concat(all_quarters, ignore_index=True)
                 if "date" in combined.columns:
@@ -486,27 +569,19 @@ class FinancialDataCollection:
                 self.institutional_ownership[name] = combined.head(4).reset_index(drop=True)
             else:
                 self.institutional_ownership[name] = pd.DataFrame()
-                
-            if self.sleep_sec:
-                time.sleep(self.sleep_sec)
 
-    def _collect_insider_statistics(self):
+    async def _collect_insider_statistics(self):
         if not self.include_institutional:
             return
-            
+
+        fetched = await self._aget_per_company("insider_trading_statistics", lambda sym: {"symbol": sym})
         for name, sym in self.companies.items():
-            r = self._get(self.ENDPOINTS["insider_trading_statistics"], 
-                          {"symbol": sym})
-            js = self._json_safe(r)
-            df = self._to_df(js)
+            df = self._to_df(fetched.get(name))
             
             df["Company"] = name
             df["Symbol"] = sym
             
             self.insider_statistics[name] = df.reset_index(drop=True)
-                
-            if self.sleep_sec:
-                time.sleep(self.sleep_sec)
 
     def collect_13f_data(self, cik: str, year: int, quarter: int) -> pd.DataFrame:
         """
@@ -783,91 +858,29 @@ class FinancialDataCollection:
         self.metrics_df = out[["Company", "Year"] + [c for c in numeric_cols if c != "Year"]].copy()
 
     # ------------------------ Economics integration ------------------------
-    def _parse_econ_ts_from_name(self, path: str) -> Optional[pd.Timestamp]:
-        try:
-            base = os.path.basename(path)
-            stem, _ = os.path.splitext(base)
-            parts = stem.split("_")
-            dt_token = parts[-2] + parts[-1]
-            return pd.to_datetime(dt_token, format="%Y%m%d%H%M", errors="coerce")
-        except Exception:
-            return None
-
-    def _find_latest_econ_file(self, econ_dir: str = "economics") -> Optional[str]:
-        pattern = os.path.join(econ_dir, "fred_full_history_*.xlsx")
-        files = glob.glob(pattern)
-        if not files:
-            return None
-        def sort_key(p):
-            ts = self._parse_econ_ts_from_name(p)
-            return (ts is not None, ts or pd.Timestamp(os.path.getmtime(p), unit="s"))
-        files.sort(key=sort_key, reverse=True)
-        return files[0]
-
-    def _load_econ_from_workbook(self, path: str) -> Dict[str, pd.DataFrame]:
-        out = {}
-        try:
-            xl = pd.ExcelFile(path)
-            for sheet in ("Raw_Long", "Monthly_Panel", "Quarterly_Panel", "Meta"):
-                if sheet in xl.sheet_names:
-                    out[sheet] = xl.parse(sheet)
-        except Exception:
-            out = {}
-        return out
-
-    def _build_econ_annual_from_book(self, book: Dict[str, pd.DataFrame]) -> pd.DataFrame:
-        if "Monthly_Panel" in book and not book["Monthly_Panel"].empty:
-            mp = book["Monthly_Panel"].copy()
-            if "Date" not in mp.columns:
-                return pd.DataFrame()
-            mp["Date"] = pd.to_datetime(mp["Date"], errors="coerce")
-            mp = mp.dropna(subset=["Date"]).sort_values("Date").set_index("Date")
-            ann = mp.resample("YE-DEC").last().reset_index()
-            ann["Year"] = ann["Date"].dt.year.astype("Int64")
-            cols = ["Year"] + [c for c in ann.columns if c not in ("Year")]
-            return ann[cols]
-        if "Raw_Long" in book and not book["Raw_Long"].empty:
-            rl = book["Raw_Long"].copy()
-            if not set(["Date", "Series", "Value"]).issubset(rl.columns):
-                return pd.DataFrame()
-            rl["Date"] = pd.to_datetime(rl["Date"], errors="coerce")
-            rl = rl.dropna(subset=["Date"])
-            wide = rl.pivot_table(index="Date", columns="Series", values="Value", aggfunc="last")
-            ann = wide.resample("YE-DEC").last().reset_index()
-            ann["Year"] = ann["Date"].dt.year.astype("Int64")
-            cols = ["Year"] + [c for c in ann.columns if c not in ("Year")]
-            return ann[cols]
-        return pd.DataFrame()
-
-    def get_economic(self, force_refresh: bool = False, econ_dir: str = "economics",
+    def get_economic(self, force_refresh: bool = False, econ_dir: Optional[str] = None,
                      stale_days: int = 5) -> pd.DataFrame:
+        """
+        Annual macro panel from the shared macro store. Only blocks on FRED when
+        there is no store yet; a stale store is used as is and refreshed
+        incrementally in the background.
+        """
         existing = self.raw_tables.get("Economic_Annual")
         if isinstance(existing, pd.DataFrame) and not existing.empty and not force_refresh:
             return existing
 
-        econ_path = None
-        latest = self._find_latest_econ_file(econ_dir)
-        use_fallback = False
-
-        if latest is None:
-            use_fallback = True
-        else:
-            ts = self._parse_econ_ts_from_name(latest)
-            if ts is None:
-                ts = pd.to_datetime(os.path.getmtime(latest), unit="s", errors="coerce")
-            if pd.isna(ts) or (pd.Timestamp.now() - ts).days > int(stale_days):
-                use_fallback = True
-
-        if use_fallback:
-            print("ℹ️ No recent macro workbook found - running FREDCollector to build one...")
-            fc = FREDCollector(fmp_api_key=self.api_key, export_dir = str(self.econ_dir))
-            econ_path = fc.run_export_single()
+        econ_dir = econ_dir or str(self.econ_dir)
+        econ_annual = load_macro_panel(econ_dir, "annual")
+        if econ_annual is None:
+            print("ℹ️ No macro store found - running FREDCollector to build one...")
+            econ_annual = build_macro_store(econ_dir, fmp_api_key=self.api_key)
+        elif snapshot_age_days(econ_dir) > stale_days:
+            print(f"ℹ️ Macro store in {econ_dir} is stale - refreshing it in the background")
+            refresh_macro_store_in_background(econ_dir, fmp_api_key=self.api_key)
         else:
-            econ_path = latest
-            print(f"ℹ️ Using existing macro workbook: {econ_path}")
-
-        book = self._load_econ_from_workbook(econ_path)
-        econ_annual = self._build_econ_annual_from_book(book)
+            print(f"ℹ️ Using the shared macro store in {econ_dir}")
+        if econ_annual is None:
+            econ_annual = pd.DataFrame()
 
         self.raw_tables["Economic_Annual"] = econ_annual
         return econ_annual
@@ -877,47 +890,89 @@ class FinancialDataCollection:
         if self._collected and not force:
             return
         await self._broadcast_progress(0, "Starting data collection...")
-        self._collect_profiles()
+        async with AsyncHTTPEngine(
+            api_key=self.api_key,
+            max_concurrency=self.max_concurrency,
+            rate_per_minute=self.rate_limit_per_minute,
+            timeout=self.timeout,
+            retries=self.retries,
+            backoff=self.backoff,
+            sleep_sec=self.sleep_sec,
+            cache=get_response_cache() if getattr(self, "use_response_cache", True) else None,
+        ) as engine:
+            self._engine = engine
+            try:
+                await self._run_collection_stages()
+            finally:
+                self._engine = None
+        print(f"HTTP engine: {engine.stats()}")
+
+    async def _run_collection_stages(self):
+        self._collected = False
+        await self._load_local()
+        await self._collect_profiles()
         if not self.availability:
             return
         await self._broadcast_progress(10, "✓ Company profiles collected")
-        
-        await self._broadcast_progress(15, "Collecting financial statements...")
-        self._collect_statements()
-        await self._broadcast_progress(30, "✓ Financial statements collected")
 
-        await self._broadcast_progress(35, "Collecting enterprise values...")
-        self._collect_ev()
-        await self._broadcast_progress(40, "✓ Enterprise values collected")
-        
-        await self._broadcast_progress(45, "Collecting employee history...")
-        self._collect_employees()
-        await self._broadcast_progress(50, "✓ Employee history collected")
-
-        await self._broadcast_progress(55, "Collecting price histories...")
-        self._collect_prices()
-        await self._broadcast_progress(70, "✓ Price histories collected")
-                
+        # Profiles settle the canonical symbols; every later stage is independent,
+        # so they are all started together and awaited in the usual order to keep
+        # the per-stage progress messages.
+        tasks = {
+            "statements": self._collect_statements(),
+            "ev": self._collect_ev(),
+            "employees": self._collect_employees(),
+            "prices": self._collect_prices(),
+        }
         if self.include_institutional:
-            await self._broadcast_progress(72, "Collecting insider trading...")
-            self._collect_insider_trading_latest()
+            tasks["insider"] = self._collect_insider_trading_latest()
+            tasks["institutional"] = self._collect_institutional_ownership()
+            tasks["insider_stats"] = self._collect_insider_statistics()
+        if self.include_analyst:
+            tasks["analyst"] = self._collect_analyst()
+        tasks = {k: asyncio.create_task(coro) for k, coro in tasks.items()}
 
-            await self._broadcast_progress(77, "Collecting institutional ownership...")
-            self._collect_institutional_ownership()
+        try:
+            await self._broadcast_progress(15, "Collecting financial statements...")
+            await tasks["statements"]
+            await self._broadcast_progress(30, "✓ Financial statements collected")
 
-            await self._broadcast_progress(82, "Collecting insider statistics...")
-            self._collect_insider_statistics()
+            await self._broadcast_progress(35, "Collecting enterprise values...")
+            await tasks["ev"]
+            await self._broadcast_progress(40, "✓ Enterprise values collected")
+
+            await self._broadcast_progress(45, "Collecting employee history...")
+            await tasks["employees"]
+            await self._broadcast_progress(50, "✓ Employee history collected")
+
+            await self._broadcast_progress(55, "Collecting price histories...")
+            await tasks["prices"]
+            await self._broadcast_progress(70, "✓ Price histories collected")
+
+            if self.include_institutional:
+                await self._broadcast_progress(72, "Collecting insider trading...")
+                await tasks["insider"]
+
+                await self._broadcast_progress(77, "Collecting institutional ownership...")
+                await tasks["institutional"]
+
+                await self._broadcast_progress(82, "Collecting insider statistics...")
+                await tasks["insider_stats"]
+
+                await self._broadcast_progress(85, "✓ Institutional data collected")
+            else:
+                await self._broadcast_progress(85, "Skipping institutional data collection")
+            if self.include_analyst:
+                await self._broadcast_progress(88, "Collecting analyst estimates...")
+                await tasks["analyst"]
+                await self._broadcast_progress(95, "✓ Analyst estimates collected")
+            else:
+                await self._broadcast_progress(95, "Skipping analyst estimates collection")
+        except BaseException:
+            for t in tasks.values():
+                t.cancel()
+            raise
 
-            await self._broadcast_progress(85, "✓ Institutional data collected")
-        else:
-            await self._broadcast_progress(85, "Skipping institutional data collection")
-        if self.include_analyst:
-            await self._broadcast_progress(88, "Collecting analyst estimates...")
-            self._collect_analyst()
-            await self._broadcast_progress(95, "✓ Analyst estimates collected")
-        else:
-            await self._broadcast_progress(95, "Skipping analyst estimates collection")
-        
         self._collected = True
         await self._broadcast_progress(95, "Data collection complete.")
         
@@ -949,7 +1004,11 @@ class FinancialDataCollection:
         _ensure_dir(self.export_dir)                   # ← Path ok
 
         try:
-            econ_ann = self.get_economic(force_refresh=False, econ_dir = str(self.econ_dir),)
+            # May build the macro store (FRED fetch) or wait for another
+            # process building it - keep that off the event loop
+            econ_ann = await asyncio.to_thread(
+                self.get_economic, force_refresh=False, econ_dir=str(self.econ_dir),
+            )
         except Exception:
             econ_ann = pd.DataFrame()
 
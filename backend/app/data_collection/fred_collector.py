@@ -1,7 +1,10 @@
 # fred_collector.py — Finalized with FMP enrichment, QC, and Meta sheet
 
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from io import StringIO
 from datetime import datetime
@@ -9,6 +12,41 @@ from typing import Dict, List, Optional
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+
+from .macro_store import (
+    BUILD_WAIT_SECONDS,
+    current_snapshot,
+    days_since,
+    load_macro_panel,
+    publish_macro_store,
+    refresh_lock,
+)
+from .response_cache import get_response_cache
+
+
+class HostLimiter:
+    """
+    Thread-safe per-host throttle: at most `max_concurrency` requests in
+    flight, and request starts spaced at least `min_interval` seconds apart.
+    """
+
+    def __init__(self, max_concurrency: int, min_interval: float):
+        self.min_interval = min_interval
+        self._slots = threading.BoundedSemaphore(max(int(max_concurrency), 1))
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    @contextmanager
+    def slot(self):
+        with self._slots:
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_start)
+                self._next_start = start + self.min_interval
+            if start > now:
+                time.sleep(start - now)
+            yield
 
 
 class FREDCollector:
@@ -19,11 +57,23 @@ class FREDCollector:
       - Full Treasury curve from FMP (fills & extends)
       - S&P 500 from FMP (^GSPC) to extend price history
 
-    Exports a workbook with:
+    Publishes the panels to the shared columnar macro store (macro_store.py),
+    which the collectors read, and exports a workbook with:
       • Raw_Long (Date, Series, Value)
       • Monthly_Panel (month-end, last)
       • Quarterly_Panel (QE-DEC, last)
       • Meta (provenance & coverage snapshot)
+
+    Requests fan out over a thread pool, throttled per host (FRED and FMP
+    have separate limits), and panels are resampled in one groupby pass.
+    Responses are shared through the response cache (response_cache.py)
+    unless use_response_cache=False.
+
+    run_refresh() updates an existing store incrementally: each series is
+    re-fetched only from its last stored observation minus `revision_days`
+    (to pick up revisions), merged into the stored history, and only the
+    panel columns of series that changed are rebuilt. A full download runs
+    when there is no store or the last one is older than `full_refresh_days`.
     """
 
     # ---------- Core FRED indicators (friendly_name -> FRED series id) ----------
@@ -97,7 +147,15 @@ class FREDCollector:
         retries: int = 3,
         backoff: float = 0.8,
         fmp_api_key: Optional[str] = None,
-        export_dir: Path = Path("economics")
+        export_dir: Path = Path("economics"),
+        revision_days: int = 120,
+        full_refresh_days: int = 30,
+        max_workers: int = 8,
+        fred_concurrency: int = 4,
+        fred_min_interval: float = 0.05,   # polite to FRED
+        fmp_concurrency: int = 4,
+        fmp_rate_per_minute: int = 300,
+        use_response_cache: bool = True,
     ):
         self.indicators = indicators.copy() if indicators else self.DEFAULT_INDICATORS.copy()
         self.export_dir = export_dir
@@ -107,12 +165,20 @@ class FREDCollector:
         self.timeout = timeout
         self.retries = retries
         self.backoff = backoff
+        self.revision_days = revision_days
+        self.full_refresh_days = full_refresh_days
 
         self.fmp_api_key = fmp_api_key
         self.fmp_from = "1900-01-01"  # internal default for full span
 
+        self.max_workers = max(int(max_workers), 1)
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": "FREDCollector/1.1"})
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_workers)
+        self.session.mount("https://", adapter)
+        self._fred_limiter = HostLimiter(fred_concurrency, fred_min_interval)
+        self._fmp_limiter = HostLimiter(fmp_concurrency, 60.0 / max(fmp_rate_per_minute, 1))
+        self.response_cache = get_response_cache() if use_response_cache else None
 
         # raw_frames[name] = DataFrame with columns ['Date', name]
         self.raw_frames: Dict[str, pd.DataFrame] = {}
@@ -120,15 +186,29 @@ class FREDCollector:
         # will collect coverage snapshot for Meta
         self._coverage_snapshot: Optional[pd.DataFrame] = None
 
+        # Incremental refresh: series -> first date to re-fetch (empty = full history),
+        # and the store state it started from
+        self._since: Dict[str, pd.Timestamp] = {}
+        self._stored: Optional[dict] = None
+        self._full_fetch_at: Optional[str] = None
+
     # ------------------------- HTTP helpers -------------------------
 
-    def _get_fred_csv(self, series_id: str) -> Optional[str]:
-        """Download full-history CSV for a single FRED series via fredgraph.csv."""
+    def _get_fred_csv(self, series_id: str, start: Optional[str] = None) -> Optional[str]:
+        """Download the CSV for a single FRED series via fredgraph.csv (full history, or from `start`)."""
         url = f"https://fred.stlouisfed.org/graph/fredgraph.csv?id={series_id}"
+        if start:
+            url += f"&cosd={start}"
+        cached = self.response_cache.get(url) if self.response_cache else None
+        if cached is not None:
+            return cached
         for i in range(self.retries):
             try:
-                r = self.session.get(url, timeout=self.timeout)
+                with self._fred_limiter.slot():
+                    r = self.session.get(url, timeout=self.timeout)
                 if r.status_code == 200 and r.text.strip():
+                    if self.response_cache:
+                        self.response_cache.set(url, None, r.text)
                     return r.text
                 if r.status_code in (429, 500, 502, 503, 504):
                     time.sleep(self.backoff * (2 ** i))
@@ -142,13 +222,20 @@ class FREDCollector:
         """Generic FMP GET returning JSON dict/list, or None."""
         if not self.fmp_api_key:
             return None
+        cached = self.response_cache.get(url, params) if self.response_cache else None
+        if cached is not None:
+            return cached
         p = params.copy()
         p["apikey"] = self.fmp_api_key
         for i in range(self.retries):
             try:
-                r = self.session.get(url, params=p, timeout=self.timeout)
+                with self._fmp_limiter.slot():
+                    r = self.session.get(url, params=p, timeout=self.timeout)
                 if r.status_code == 200:
-                    return r.json()
+                    js = r.json()
+                    if self.response_cache:
+                        self.response_cache.set(url, params, js)
+                    return js
                 if r.status_code in (429, 500, 502, 503, 504):
                     time.sleep(self.backoff * (2 ** i))
                     continue
@@ -159,7 +246,7 @@ class FREDCollector:
 
     # ---------------------- FMP econ/treasury helpers ----------------------
 
-    def _get_fmp_econ(self, fmp_name: str, friendly: str) -> Optional[pd.DataFrame]:
+    def _get_fmp_econ(self, fmp_name: str, friendly: str, start: Optional[str] = None) -> Optional[pd.DataFrame]:
         """
         Pull an FMP economic indicator by 'name' param.
         Returns standardized DataFrame ['Date', friendly].
@@ -167,7 +254,7 @@ class FREDCollector:
         if not self.fmp_api_key:
             return None
         url = "https://financialmodelingprep.com/stable/economic-indicators"
-        params = {"name": fmp_name, "from": self.fmp_from}
+        params = {"name": fmp_name, "from": start or self.fmp_from}
         data = self._get_fmp_json(url, params)
         if not data or not isinstance(data, list):
             return None
@@ -191,7 +278,7 @@ class FREDCollector:
         df = df.dropna(subset=["Date"]).sort_values("Date").reset_index(drop=True)
         return df
 
-    def _get_fmp_treasury(self) -> Optional[pd.DataFrame]:
+    def _get_fmp_treasury(self, start: Optional[str] = None) -> Optional[pd.DataFrame]:
         """
         Pulls the full Treasury curve from FMP, from self.fmp_from to present.
         Returns wide DF with columns: Date, month1, month2, month3, ..., year30
@@ -199,7 +286,7 @@ class FREDCollector:
         if not self.fmp_api_key:
             return None
         url = "https://financialmodelingprep.com/stable/treasury-rates"
-        params = {"from": self.fmp_from}
+        params = {"from": start or self.fmp_from}
         data = self._get_fmp_json(url, params)
         if not data or not isinstance(data, list):
             return None
@@ -218,7 +305,7 @@ class FREDCollector:
 
     # ---------------------- FMP S&P augment helpers ----------------------
 
-    def _get_fmp_index_prices(self, symbol: str) -> Optional[pd.DataFrame]:
+    def _get_fmp_index_prices(self, symbol: str, start: Optional[str] = None) -> Optional[pd.DataFrame]:
         """
         Pull daily historical prices for an index (e.g., '^GSPC') from FMP.
         Uses the full EOD endpoint. Returns ['Date','Value'] where Value=adjClose (or close).
@@ -226,7 +313,7 @@ class FREDCollector:
         if not self.fmp_api_key:
             return None
         url = "https://financialmodelingprep.com/stable/historical-price-eod/full"
-        params = {"symbol": symbol, "from": self.fmp_from}
+        params = {"symbol": symbol, "from": start or self.fmp_from}
         data = self._get_fmp_json(url, params)
         if not data:
             return None
@@ -264,17 +351,19 @@ class FREDCollector:
         out = out.dropna(subset=["Value"])
         return out
 
-    def _augment_sp500_with_fmp(self) -> None:
+    def _augment_sp500_with_fmp(self, fmp: Optional[pd.DataFrame] = None) -> None:
         """
         Extend/patch S&P_500_Index series using FMP '^GSPC' adjClose (or close).
         Keeps FRED as primary; uses FMP to fill gaps and extend earlier history.
+        `fmp` is the already fetched ^GSPC frame, if any.
         """
         if not self.fmp_api_key:
             return
 
         base_name = "S&P_500_Index"
         base = self.raw_frames.get(base_name, pd.DataFrame(columns=["Date", base_name])).copy()
-        fmp = self._get_fmp_index_prices("^GSPC")
+        if fmp is None:
+            fmp = self._get_fmp_index_prices("^GSPC", self._start(base_name))
         if fmp is None or fmp.empty:
             return
 
@@ -293,35 +382,46 @@ class FREDCollector:
 
     # ---------------------- Fetch & prepare raw ----------------------
 
+    def _start(self, name: str) -> Optional[str]:
+        """First date to fetch for a series (None = full history)."""
+        since = self._since.get(name)
+        return since.strftime("%Y-%m-%d") if since is not None else None
+
+    def _upsert(self, name: str, df: pd.DataFrame) -> None:
+        """Replace a series' stored observations from its fetch start on with freshly fetched ones."""
+        base = self.raw_frames.get(name)
+        since = self._since.get(name)
+        if since is None or base is None or base.empty:
+            self.raw_frames[name] = df
+            return
+        if df is None or df.empty:
+            return  # nothing fetched; keep what the store had
+        keep = base[base["Date"] < since]
+        merged = pd.concat([keep, df], ignore_index=True)
+        merged = merged.drop_duplicates(subset=["Date"], keep="last").sort_values("Date")
+        self.raw_frames[name] = merged.reset_index(drop=True)
+
+    def _get_fred_series(self, friendly_name: str, series_id: str) -> Optional[pd.DataFrame]:
+        """One FRED series as ['Date', friendly_name], or None if the download failed."""
+        csv_text = self._get_fred_csv(series_id, self._start(friendly_name))
+        if not csv_text:
+            return None
+        df = pd.read_csv(StringIO(csv_text))
+        df.columns = ["Date", friendly_name]
+        df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
+        df = df.dropna(subset=["Date"]).sort_values("Date").reset_index(drop=True)
+        df[friendly_name] = pd.to_numeric(df[friendly_name], errors="coerce")
+        return df
+
     def fetch_all(self) -> None:
         """
         Fetch all FRED series; enrich with FMP econ & Treasuries; compute spreads; augment S&P.
         Each frame has columns: ['Date', <friendly_name>] and Date is datetime64[ns].
-        """
-        # 1) FRED baseline
-        for friendly_name, series_id in self.indicators.items():
-            csv_text = self._get_fred_csv(series_id)
-            time.sleep(0.05)  # polite to FRED; FMP has no sleep
-            if not csv_text:
-                self.raw_frames[friendly_name] = pd.DataFrame(columns=["Date", friendly_name])
-                continue
-            df = pd.read_csv(StringIO(csv_text))
-            df.columns = ["Date", friendly_name]
-            df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-            df = df.dropna(subset=["Date"]).sort_values("Date").reset_index(drop=True)
-            df[friendly_name] = pd.to_numeric(df[friendly_name], errors="coerce")
-            self.raw_frames[friendly_name] = df
-
-        # 2) Extra FMP economic indicators (add only if not already present)
-        for friendly, fmp_name in self.FMP_ECON_SERIES.items():
-            if friendly in self.raw_frames and not self.raw_frames[friendly].empty:
-                continue
-            fdf = self._get_fmp_econ(fmp_name, friendly)
-            if fdf is not None and not fdf.empty:
-                self.raw_frames[friendly] = fdf
+        During an incremental refresh only observations from each series' start are fetched.
 
-        # 3) Treasuries from FMP — fill & extend; add missing tenors
-        tdf = self._get_fmp_treasury()
+        All downloads run concurrently; results are merged afterwards in the
+        fixed order below, so the output doesn't depend on completion order.
+        """
         tenor_map = {
             "month1": "Treasury_1M",
             "month2": "Treasury_2M",
@@ -336,6 +436,48 @@ class FREDCollector:
             "year20": "Treasury_20Y",
             "year30": "Treasury_30Y",
         }
+        # One request covers every tenor, so start from the earliest one needed
+        tenor_starts = [self._since.get(name) for name in tenor_map.values()]
+        treasury_start = None if any(t is None for t in tenor_starts) else min(tenor_starts).strftime("%Y-%m-%d")
+        # FMP indicators FRED already provides are only fetched if FRED comes back empty
+        fmp_econ = {f: n for f, n in self.FMP_ECON_SERIES.items() if f not in self.indicators}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="fred-fetch") as pool:
+            fred_futures = {
+                name: pool.submit(self._get_fred_series, name, series_id)
+                for name, series_id in self.indicators.items()
+            }
+            fmp_futures = {
+                friendly: pool.submit(self._get_fmp_econ, fmp_name, friendly, self._start(friendly))
+                for friendly, fmp_name in fmp_econ.items()
+            }
+            treasury_future = pool.submit(self._get_fmp_treasury, treasury_start)
+            sp500_future = pool.submit(self._get_fmp_index_prices, "^GSPC", self._start("S&P_500_Index"))
+
+            # 1) FRED baseline
+            for friendly_name, future in fred_futures.items():
+                df = future.result()
+                if df is None:
+                    if friendly_name not in self.raw_frames:
+                        self.raw_frames[friendly_name] = pd.DataFrame(columns=["Date", friendly_name])
+                    continue
+                self._upsert(friendly_name, df)
+
+            # 2) Extra FMP economic indicators (add only if FRED doesn't provide them)
+            for friendly, fmp_name in self.FMP_ECON_SERIES.items():
+                if friendly in fmp_futures:
+                    fdf = fmp_futures[friendly].result()
+                elif self.raw_frames[friendly].empty:
+                    fdf = self._get_fmp_econ(fmp_name, friendly, self._start(friendly))
+                else:
+                    continue
+                if fdf is not None and not fdf.empty:
+                    self._upsert(friendly, fdf)
+
+            tdf = treasury_future.result()
+            sp500 = sp500_future.result()
+
+        # 3) Treasuries from FMP — fill & extend; add missing tenors
         if tdf is not None and not tdf.empty:
             for raw_col, friendly in tenor_map.items():
                 if raw_col not in tdf.columns:
@@ -345,7 +487,7 @@ class FREDCollector:
                 add[col] = pd.to_numeric(add[col], errors="coerce")
                 add = add.dropna(subset=["Date"]).sort_values("Date").reset_index(drop=True)
 
-                if col in self.raw_frames and not self.raw_frames[col].empty:
+                if col in self.indicators and col in self.raw_frames and not self.raw_frames[col].empty:
                     # FRED primary: fill only missing
                     merged = self.raw_frames[col].merge(add, on="Date", how="outer", suffixes=("", "_fmp"))
                     merged[col] = pd.to_numeric(merged[col], errors="coerce")
@@ -354,7 +496,7 @@ class FREDCollector:
                     merged = merged[["Date", col]].sort_values("Date").reset_index(drop=True)
                     self.raw_frames[col] = merged
                 else:
-                    self.raw_frames[col] = add
+                    self._upsert(col, add)
 
         # 4) Compute spreads (prefer existing FRED for named spreads; else compute from Treasuries)
         def _get_series(name):
@@ -363,6 +505,11 @@ class FREDCollector:
         def _merge_two(left: pd.DataFrame, right: pd.DataFrame, lname: str, rname: str) -> pd.DataFrame:
             return left.merge(right, on="Date", how="inner", suffixes=(f"_{lname}", f"_{rname}"))
 
+        # Spreads computed here are derived data: recompute them from the merged tenors
+        for derived in ("Spread_10Y_3M", "Spread_5Y_3M"):
+            if derived not in self.indicators:
+                self.raw_frames.pop(derived, None)
+
         t3m = _get_series("Treasury_3M")
         t10 = _get_series("Treasury_10Y")
         t2y = _get_series("Treasury_2Y")
@@ -402,54 +549,47 @@ class FREDCollector:
                 self.raw_frames["Yield_Curve_10Y_2Y"] = m[["Date", "Yield_Curve_10Y_2Y"]].dropna()
 
         # 5) Augment S&P 500 coverage with FMP (^GSPC) while keeping FRED primary
-        self._augment_sp500_with_fmp()
+        self._augment_sp500_with_fmp(sp500)
 
     # ---------------------- Resampling helpers ----------------------
 
-    def _resample(self, df: pd.DataFrame, col: str, rule: str, how: str) -> pd.DataFrame:
+    def _resample_panel(self, names: List[str], rule: str, how: str) -> pd.DataFrame:
         """
+        Date-indexed wide panel of the given series, resampled in one pass:
+        the series are stacked into one long frame and grouped by series.
+        Series without data come out as all-NaN columns.
+
         rule: 'ME' (month-end) or 'QE-DEC' (quarter-end, Dec-anchored) recommended.
         how : 'last'|'mean'|'max'|'min'
         """
-        if df is None or df.empty:
-            return pd.DataFrame(columns=["Date", col])
-        rule = "ME" if rule == "M" else ("QE-DEC" if rule == "Q" else rule)
-        ts = df.set_index("Date")[col]
-        if how == "last":
-            out = ts.resample(rule).last()
-        elif how == "mean":
-            out = ts.resample(rule).mean()
-        elif how == "max":
-            out = ts.resample(rule).max()
-        elif how == "min":
-            out = ts.resample(rule).min()
-        else:
+        if how not in ("last", "mean", "max", "min"):
             raise ValueError(f"Unsupported aggregation: {how}")
-        out = out.to_frame().reset_index()
-        out.columns = ["Date", col]
-        return out
+        rule = "ME" if rule == "M" else ("QE-DEC" if rule == "Q" else rule)
+        frames = [
+            self.raw_frames[name].rename(columns={name: "Value"}).assign(Series=name)
+            for name in names
+            if self.raw_frames.get(name) is not None and not self.raw_frames[name].empty
+        ]
+        if not frames:
+            return pd.DataFrame(columns=names, index=pd.DatetimeIndex([], name="Date"), dtype=float)
+
+        long = pd.concat(frames, ignore_index=True)
+        long["Value"] = pd.to_numeric(long["Value"], errors="coerce")
+        resampler = long.set_index("Date").groupby("Series", sort=False)["Value"].resample(rule)
+        wide = getattr(resampler, how)().unstack("Series")
+        return wide.reindex(columns=names).rename_axis("Date").rename_axis(None, axis=1)
+
+    def _build_panel(self, rule: str, how: str) -> pd.DataFrame:
+        names = list(self.raw_frames.keys())
+        if not names:
+            return pd.DataFrame(columns=["Date"])
+        return self._resample_panel(names, rule, how).sort_index().reset_index()
 
     def build_monthly_panel(self) -> pd.DataFrame:
-        frames = []
-        for name, df in self.raw_frames.items():
-            frames.append(self._resample(df, name, "ME", self.monthly_agg))
-        panel = None
-        for f in frames:
-            panel = f if panel is None else panel.merge(f, on="Date", how="outer")
-        if panel is None:
-            return pd.DataFrame(columns=["Date"] + list(self.raw_frames.keys()))
-        return panel.sort_values("Date").reset_index(drop=True)
+        return self._build_panel("ME", self.monthly_agg)
 
     def build_quarterly_panel(self) -> pd.DataFrame:
-        frames = []
-        for name, df in self.raw_frames.items():
-            frames.append(self._resample(df, name, "QE-DEC", self.quarterly_agg))
-        panel = None
-        for f in frames:
-            panel = f if panel is None else panel.merge(f, on="Date", how="outer")
-        if panel is None:
-            return pd.DataFrame(columns=["Date"] + list(self.raw_frames.keys()))
-        return panel.sort_values("Date").reset_index(drop=True)
+        return self._build_panel("QE-DEC", self.quarterly_agg)
 
     # --------------------------- Export helpers ----------------------------
 
@@ -538,7 +678,35 @@ class FREDCollector:
         cleaned = "".join(ch for ch in str(name) if ch not in bad)[:31]
         return cleaned or "Sheet"
 
-    def export_single_workbook(self) -> str:
+    def _meta_items(self) -> List[tuple]:
+        return [
+            ("Generated_At", datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+            ("FRED_Primary", "Yes"),
+            ("FMP_Enrichment", "Economic Indicators + Treasuries + S&P (^GSPC)"),
+            ("FMP_From", self.fmp_from),
+            ("Monthly_Agg", self.monthly_agg),
+            ("Quarterly_Agg", self.quarterly_agg),
+            ("Series_Count", len(self.raw_frames)),
+            ("Refresh_Mode", "incremental" if self._since else "full"),
+            ("Full_Fetch_At", self._full_fetch_at or datetime.now().isoformat()),
+        ]
+
+    def publish_store(self, raw_long: Optional[pd.DataFrame] = None,
+                      monthly: Optional[pd.DataFrame] = None,
+                      quarterly: Optional[pd.DataFrame] = None) -> str:
+        """Publish the panels as the current macro store snapshot (read by the collectors)."""
+        snapshot = publish_macro_store(
+            self.export_dir,
+            raw_long=raw_long if raw_long is not None else self.build_raw_long(),
+            monthly=monthly if monthly is not None else self.build_monthly_panel(),
+            quarterly=quarterly if quarterly is not None else self.build_quarterly_panel(),
+            meta=dict(self._meta_items()),
+        )
+        return str(snapshot)
+
+    def export_single_workbook(self, raw_long: Optional[pd.DataFrame] = None,
+                               monthly: Optional[pd.DataFrame] = None,
+                               quarterly: Optional[pd.DataFrame] = None) -> str:
         """
         Write ONE workbook:
           - Raw_Long
@@ -550,21 +718,12 @@ class FREDCollector:
         ts = datetime.now().strftime("%Y%m%d_%H%M")
         xlsx_path = os.path.join(str(self.export_dir), f"{self.filename_base}_{ts}.xlsx")
 
-        raw_long  = self.build_raw_long()
-        monthly   = self.build_monthly_panel()
-        quarterly = self.build_quarterly_panel()
+        raw_long  = raw_long if raw_long is not None else self.build_raw_long()
+        monthly   = monthly if monthly is not None else self.build_monthly_panel()
+        quarterly = quarterly if quarterly is not None else self.build_quarterly_panel()
 
         # Build Meta sheet
-        meta_rows = []
-        meta_rows.append({"Key": "Generated_At", "Value": datetime.now().strftime("%Y-%m-%d %H:%M:%S")})
-        meta_rows.append({"Key": "FRED_Primary", "Value": "Yes"})
-        meta_rows.append({"Key": "FMP_Enrichment", "Value": "Economic Indicators + Treasuries + S&P (^GSPC)"})
-        meta_rows.append({"Key": "FMP_From", "Value": self.fmp_from})
-        meta_rows.append({"Key": "Monthly_Agg", "Value": self.monthly_agg})
-        meta_rows.append({"Key": "Quarterly_Agg", "Value": self.quarterly_agg})
-        meta_rows.append({"Key": "Series_Count", "Value": len(self.raw_frames)})
-
-        meta_df = pd.DataFrame(meta_rows)
+        meta_df = pd.DataFrame([{"Key": k, "Value": v} for k, v in self._meta_items()])
 
         with pd.ExcelWriter(xlsx_path, engine="openpyxl") as writer:
             raw_long.to_excel(writer, sheet_name="Raw_Long", index=False)
@@ -580,10 +739,136 @@ class FREDCollector:
         print(f"Saved: {os.path.relpath(xlsx_path)}")
         return xlsx_path
 
+    # --------------------------- Incremental refresh ----------------------------
+
+    def load_store(self) -> Optional[dict]:
+        """Seed raw_frames and the panels from the current macro store. Returns its meta, or None."""
+        current = current_snapshot(self.export_dir)
+        if current is None:
+            return None
+        _, meta = current
+        raw_long = load_macro_panel(self.export_dir, "raw_long")
+        monthly = load_macro_panel(self.export_dir, "monthly")
+        quarterly = load_macro_panel(self.export_dir, "quarterly")
+        if raw_long is None or monthly is None or quarterly is None:
+            return None
+
+        frames = {
+            name: g[["Date", "Value"]].rename(columns={"Value": name}).reset_index(drop=True)
+            for name, g in raw_long.groupby("Series", sort=False)
+        }
+        # Keep the stored panel's column order
+        order = [c for c in monthly.columns if c != "Date" and c in frames]
+        self.raw_frames = {name: frames[name] for name in order}
+        self.raw_frames.update({name: f for name, f in frames.items() if name not in self.raw_frames})
+        self._stored = {"frames": dict(self.raw_frames), "monthly": monthly, "quarterly": quarterly}
+        return meta
+
+    def _changed_series(self) -> List[str]:
+        before = self._stored["frames"]
+        return [
+            name for name, df in self.raw_frames.items()
+            if name not in before or not before[name].reset_index(drop=True).equals(df.reset_index(drop=True))
+        ]
+
+    def _update_panel(self, panel: pd.DataFrame, changed: List[str], rule: str, how: str) -> pd.DataFrame:
+        """Re-resample only the changed series' columns of a stored panel."""
+        if not changed:
+            return panel
+        order = [c for c in panel.columns if c != "Date"] + [c for c in changed if c not in panel.columns]
+        base = panel.set_index("Date").drop(columns=[c for c in changed if c in panel.columns])
+        out = base.join(self._resample_panel(changed, rule, how), how="outer").sort_index()
+        out = out.rename_axis("Date").reset_index()
+        return out[["Date"] + order]
+
+    def run_refresh(self, export_excel: bool = False, full: bool = False) -> str:
+        """
+        Bring the macro store up to date, incrementally when possible.
+        Returns the new store snapshot (or the workbook path with export_excel).
+        """
+        meta = None if full else self.load_store()
+        if meta is None or days_since(meta.get("Full_Fetch_At")) > self.full_refresh_days:
+            self.raw_frames, self._stored, self._since = {}, None, {}
+            return self.run_export_single(export_excel=export_excel)
+
+        started = time.monotonic()
+        window = pd.Timedelta(days=self.revision_days)
+        self._since = {
+            name: pd.Timestamp(last) - window
+            for name, last in (meta.get("last_observation") or {}).items()
+            if name in self.raw_frames
+        }
+        self._full_fetch_at = meta.get("Full_Fetch_At")
+        try:
+            self.fetch_all()
+            self.qc_dedupe_series()
+            changed = self._changed_series()
+            raw_long  = self.build_raw_long()
+            monthly   = self._update_panel(self._stored["monthly"], changed, "ME", self.monthly_agg)
+            quarterly = self._update_panel(self._stored["quarterly"], changed, "QE-DEC", self.quarterly_agg)
+            snapshot = self.publish_store(raw_long, monthly, quarterly)
+        finally:
+            self._since = {}
+        print(f"Incremental macro refresh: {len(changed)}/{len(self.raw_frames)} series changed "
+              f"in {time.monotonic() - started:.1f}s")
+        if not export_excel:
+            return snapshot
+        return self.export_single_workbook(raw_long, monthly, quarterly)
+
     # Convenience one-shots
-    def run_export_single(self) -> str:
+    def run_export_single(self, export_excel: bool = True) -> str:
+        """Fetch full history, publish the macro store and (optionally) the workbook. Returns the workbook path, or the store snapshot."""
+        self._full_fetch_at = datetime.now().isoformat()
         self.fetch_all()
         # QC is optional but recommended in normal runs
         self.qc_dedupe_series()
         # self.print_coverage_summary(min_years=15)
-        return self.export_single_workbook()
+        raw_long  = self.build_raw_long()
+        monthly   = self.build_monthly_panel()
+        quarterly = self.build_quarterly_panel()
+        snapshot = self.publish_store(raw_long, monthly, quarterly)
+        if not export_excel:
+            return snapshot
+        return self.export_single_workbook(raw_long, monthly, quarterly)
+
+
+def refresh_macro_store_in_background(econ_dir, fmp_api_key: Optional[str] = None) -> None:
+    """
+    Refresh the macro store in a daemon thread, so a collection that finds
+    it stale keeps using the current snapshot. No-op while another process
+    or thread is refreshing the same store.
+    """
+    def _run():
+        with refresh_lock(econ_dir) as acquired:
+            if not acquired:
+                return
+            try:
+                FREDCollector(fmp_api_key=fmp_api_key, export_dir=econ_dir).run_refresh()
+            except Exception as e:
+                print(f"⚠️ Macro store refresh failed: {e}")
+
+    threading.Thread(target=_run, name="macro-store-refresh", daemon=True).start()
+
+
+def build_macro_store(econ_dir, fmp_api_key: Optional[str] = None, panel: str = "annual",
+                      wait_seconds: float = BUILD_WAIT_SECONDS, poll_seconds: float = 5.0) -> Optional[pd.DataFrame]:
+    """
+    Build the macro store when there is none yet and return `panel` of it.
+    If another process is already building it, wait up to `wait_seconds`
+    for its snapshot instead of fetching FRED a second time, then return
+    None (callers go on without macro data).
+
+    Blocks: call it from a thread, not from the event loop.
+    """
+    with refresh_lock(econ_dir) as acquired:
+        if acquired:
+            FREDCollector(fmp_api_key=fmp_api_key, export_dir=econ_dir).run_refresh()
+            return load_macro_panel(econ_dir, panel)
+
+    print(f"ℹ️ Macro store in {econ_dir} is being built by another process - waiting for it...")
+    deadline = time.monotonic() + wait_seconds
+    while True:
+        panel_df = load_macro_panel(econ_dir, panel)
+        if panel_df is not None or time.monotonic() >= deadline:
+            return panel_df
+        time.sleep(poll_seconds)
@@ -0,0 +1,221 @@
+# local_source.py — DATA-database backend for Phase A collection
+
+"""
+The DATA project keeps FMP company data in its own database (see
+data_models/models.py). LocalDataSource reads it for the collectors in a
+few set-based queries — one per table for all requested symbols — and
+returns it in the shape of the FMP response the collector would otherwise
+fetch (camelCase keys, ISO date strings, newest first), so the parsing
+code downstream is shared by both sources.
+
+A (table, symbol) pair is served from the database only while
+table_update_tracking says it is current (due date set and not passed,
+no error on the last update) and the table has rows for the symbol;
+every other pair is left out and the collector fetches it from FMP as
+before. Prices are the exception (see WHOLE_PANEL).
+
+    source = LocalDataSource.create()
+    served = source.fetch(["income_statement", "prices_full"], ["AAPL", "MSFT"], years=10)
+    served["income_statement"]["AAPL"]   # -> [ {...}, ... ] like /stable/income-statement
+"""
+
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import pandas as pd
+from sqlalchemy import func, select
+
+from ..data_models.models import (
+    AnalystEstimate,
+    BalanceSheet,
+    CashFlow,
+    Company,
+    EmployeeHistory,
+    EnterpriseValue,
+    FinancialRatio,
+    IncomeStatement,
+    InsiderStatistics,
+    InsiderTrading,
+    InstitutionalOwnership,
+    KeyMetric,
+    PriceDaily,
+    PriceTarget,
+    TableUpdateTracking,
+)
+
+# Collector endpoint key -> (model, order column, rows per symbol, annual only)
+# Rows per symbol: "years" = years + 1 (the FMP `limit` the collectors send),
+# "window" = everything since the price window start, int = fixed, None = all.
+ENDPOINT_TABLES = {
+    "profile": (Company, None, 1, False),
+    "income_statement": (IncomeStatement, "date", "years", True),
+    "balance_sheet": (BalanceSheet, "date", "years", True),
+    "cash_flow": (CashFlow, "date", "years", True),
+    "ratios": (FinancialRatio, "date", "years", True),
+    "key_metrics": (KeyMetric, "date", "years", True),
+    "enterprise_values": (EnterpriseValue, "date", "years", False),
+    "employee_history": (EmployeeHistory, "period_of_report", "years", False),
+    "prices_full": (PriceDaily, "date", "window", False),
+    "analyst_estimates": (AnalystEstimate, "date", "years", False),
+    "price_target_consensus": (PriceTarget, "published_date", 1, False),
+    "insider_trading_search": (InsiderTrading, "transaction_date", 1000, False),
+    "institutional_ownership_summary": (InstitutionalOwnership, "date", 8, False),
+    "insider_trading_statistics": (InsiderStatistics, None, None, False),
+}
+
+# Endpoints served only if every requested symbol is: prices_daily holds
+# dividend-adjusted OHLC where historical-price-eod/full is unadjusted, so a
+# partly served price panel would mix two price bases across companies.
+WHOLE_PANEL = {"prices_full"}
+
+# DATA columns whose FMP name isn't the plain camelCase of the column
+FMP_NAMES = {
+    "adj_open": "open",
+    "adj_high": "high",
+    "adj_low": "low",
+    "adj_close": "close",
+    "ev_to_ebitda": "evToEBITDA",
+    "net_debt_to_ebitda": "netDebtToEBITDA",
+    "net_income_per_ebt": "netIncomePerEBT",
+    "collected_year": "CollectedYear",
+    "collected_quarter": "CollectedQuarter",
+}
+
+# Bookkeeping columns FMP doesn't return
+SKIP_COLUMNS = {"id", "created_at", "updated_at", "company_id"}
+
+
+def fmp_name(column: str) -> str:
+    if column in FMP_NAMES:
+        return FMP_NAMES[column]
+    head, *rest = column.split("_")
+    return head + "".join(part[:1].upper() + part[1:] for part in rest)
+
+
+class LocalDataSource:
+    """Reads Phase A inputs from the DATA database (read-only)."""
+
+    def __init__(self, session_factory, grace_hours: int = 24):
+        self.session_factory = session_factory
+        self.grace = timedelta(hours=grace_hours)
+
+    @classmethod
+    def create(cls, grace_hours: int = 24) -> Optional["LocalDataSource"]:
+        """A source on the configured DATA database, or None if there is none."""
+        from ..database import DataSessionLocal
+
+        if DataSessionLocal is None:
+            return None
+        return cls(DataSessionLocal, grace_hours=grace_hours)
+
+    # ------------------------------------------------------------------
+
+    def _current_pairs(self, db, tables: Set[str], symbols: List[str]) -> Set[Tuple[str, str]]:
+        """(table, symbol) pairs that table_update_tracking reports as up to date."""
+        stmt = select(
+            TableUpdateTracking.table_name,
+            TableUpdateTracking.symbol,
+            TableUpdateTracking.next_update_due,
+            TableUpdateTracking.last_error,
+        ).where(
+            TableUpdateTracking.table_name.in_(tables),
+            TableUpdateTracking.symbol.in_(symbols),
+        )
+        cutoff = datetime.now() - self.grace
+        return {
+            (table, symbol)
+            for table, symbol, next_due, last_error in db.execute(stmt)
+            if next_due is not None and next_due >= cutoff and not last_error
+        }
+
+    def _query(self, key: str, symbols: List[str], years: int, start: date):
+        model, order_col, per_symbol, annual = ENDPOINT_TABLES[key]
+        table = model.__table__
+        columns = [c for c in table.columns if c.name not in SKIP_COLUMNS]
+        conditions = [table.c.symbol.in_(symbols)]
+        if annual:
+            conditions.append(table.c.period == "FY")
+        if per_symbol == "window":
+            conditions.append(table.c[order_col] >= start)
+
+        limit = years + 1 if per_symbol == "years" else per_symbol
+        if order_col is None or not isinstance(limit, int):
+            stmt = select(*columns).where(*conditions)
+            if order_col is not None:
+                stmt = stmt.order_by(table.c.symbol, table.c[order_col].desc())
+            return stmt
+
+        # Newest `limit` rows of every symbol in one pass
+        rank = func.row_number().over(
+            partition_by=table.c.symbol, order_by=table.c[order_col].desc()
+        ).label("_rank")
+        ranked = select(*columns, rank).where(*conditions).subquery()
+        return (
+            select(*[ranked.c[c.name] for c in columns])
+            .where(ranked.c._rank <= limit)
+            .order_by(ranked.c.symbol, ranked.c[order_col].desc())
+        )
+
+    @staticmethod
+    def _to_records(df: pd.DataFrame) -> Dict[str, list]:
+        """
+        Group query rows per symbol as FMP-style records. Symbols without
+        rows are left out, so the collector fetches them from FMP.
+        """
+        for col in df.columns:
+            if pd.api.types.is_datetime64_any_dtype(df[col]):
+                fmt = "%Y-%m-%d" if (df[col].dropna().dt.normalize() == df[col].dropna()).all() else "%Y-%m-%d %H:%M:%S"
+                df[col] = df[col].dt.strftime(fmt)
+            elif df[col].dtype == object:
+                first = df[col].dropna().head(1)
+                if not first.empty and isinstance(first.iloc[0], (date, datetime)):
+                    df[col] = df[col].map(lambda v: v.isoformat(sep=" ") if isinstance(v, datetime)
+                                          else (v.isoformat() if isinstance(v, date) else v))
+        df = df.astype(object).where(df.notna(), None)
+        df.columns = [fmp_name(c) for c in df.columns]
+
+        out: Dict[str, list] = {}
+        for sym, rows in df.groupby("symbol", sort=False):
+            out[sym] = rows.to_dict("records")
+        return out
+
+    def fetch(self, keys: Iterable[str], symbols: Iterable[str], years: int,
+              start: Optional[date] = None) -> Dict[str, Dict[str, list]]:
+        """
+        FMP-shaped responses for the current (endpoint, symbol) pairs:
+        {endpoint key: {symbol: [records]}}. Pairs not listed must come from FMP.
+        `start` bounds the price window (prices_full).
+        """
+        keys = [k for k in keys if k in ENDPOINT_TABLES]
+        symbols = sorted({s for s in symbols if s})
+        if not keys or not symbols:
+            return {}
+        start = start or (date.today() - timedelta(days=366 * (years + 1)))
+
+        t0 = time.perf_counter()
+        served: Dict[str, Dict[str, list]] = {}
+        db = self.session_factory()
+        try:
+            tables = {ENDPOINT_TABLES[k][0].__tablename__ for k in keys}
+            current = self._current_pairs(db, tables, symbols)
+            for key in keys:
+                tablename = ENDPOINT_TABLES[key][0].__tablename__
+                wanted = [s for s in symbols if (tablename, s) in current]
+                if not wanted:
+                    continue
+                df = pd.read_sql(self._query(key, wanted, years, start), db.connection(), coerce_float=True)
+                records = self._to_records(df)
+                if key in WHOLE_PANEL and len(records) < len(symbols):
+                    print(f"DATA database: {key} current for {len(records)}/{len(symbols)} symbols "
+                          f"- fetching all of it from FMP")
+                    continue
+                if records:
+                    served[key] = records
+        finally:
+            db.close()
+
+        pairs = sum(len(v) for v in served.values())
+        print(f"DATA database: {pairs}/{len(keys) * len(symbols)} endpoint/symbol pairs "
+              f"served in {time.perf_counter() - t0:.2f}s")
+        return served
@@ -0,0 +1,309 @@
+# macro_store.py — shared, versioned columnar store of the FRED/FMP macro panels
+
+"""
+FREDCollector publishes each run as an immutable snapshot next to the Excel
+export:
+
+    <econ_dir>/macro_store/
+        CURRENT                     -> name of the newest snapshot
+        20250101_093000_123456_1f2e3d4c/
+            raw_long.arrow          (Date, Series, Value)
+            monthly.arrow           (month-end panel)
+            quarterly.arrow         (QE-DEC panel)
+            annual.arrow            (Year, Date, <series>...; YE-DEC last)
+            meta.json
+
+Panels are uncompressed Arrow IPC (Feather v2) files, so readers memory-map
+them instead of parsing a workbook, and the annual panel every collector
+needs is computed once at publish time. Snapshot names are unique and a
+snapshot is never rewritten; its directory is complete before CURRENT
+points at it. The memory-mapped Arrow table of each panel is kept per
+process, keyed by snapshot and file mtime, and converted to pandas once;
+callers get a copy-on-write copy, or convert only the `columns` they ask for.
+
+meta.json records each series' last observation date, from which
+FREDCollector.run_refresh fetches only newer data (plus a revision window).
+
+The Excel workbook remains an export only. An existing workbook without a
+store is converted once on first read.
+"""
+
+import glob
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
+import pandas as pd
+import pyarrow as pa
+from pyarrow import feather
+
+from ..core.frames import private_copy
+
+# Bump when the panel layout or the annual aggregation changes
+MACRO_STORE_VERSION = 1
+
+STORE_DIRNAME = "macro_store"
+PANELS = ("raw_long", "monthly", "quarterly", "annual")
+# Snapshots kept besides the current one (readers may still hold older maps)
+KEEP_SNAPSHOTS = 2
+
+WORKBOOK_PATTERN = "fred_full_history_*.xlsx"
+
+# A refresh lock older than this is left over from a crashed process
+REFRESH_LOCK_SECONDS = 30 * 60
+# How long a collection waits for a store another process is building before
+# going on without macro data; below the job queue's JOB_STALE_SECONDS
+BUILD_WAIT_SECONDS = 120
+
+# (snapshot dir, panel, file mtime_ns) -> (mapped table, its DataFrame once converted)
+_loaded: Dict[Tuple[str, str, int], Tuple[pa.Table, Optional[pd.DataFrame]]] = {}
+# Collections, the store refresh thread and sync endpoints load panels concurrently
+_loaded_lock = threading.Lock()
+
+
+def store_root(econ_dir) -> Path:
+    return Path(econ_dir) / STORE_DIRNAME
+
+
+def build_annual_panel(monthly: pd.DataFrame) -> pd.DataFrame:
+    """Year-end (last) values from the monthly panel: Year, Date, <series>..."""
+    if monthly is None or monthly.empty or "Date" not in monthly.columns:
+        return pd.DataFrame()
+    mp = monthly.copy()
+    mp["Date"] = pd.to_datetime(mp["Date"], errors="coerce")
+    mp = mp.dropna(subset=["Date"]).sort_values("Date").set_index("Date")
+    ann = mp.resample("YE-DEC").last().reset_index()
+    ann["Year"] = ann["Date"].dt.year.astype("Int64")
+    cols = ["Year"] + [c for c in ann.columns if c != "Year"]
+    return ann[cols]
+
+
+def _monthly_from_raw_long(raw_long: pd.DataFrame) -> pd.DataFrame:
+    rl = raw_long.copy()
+    rl["Date"] = pd.to_datetime(rl["Date"], errors="coerce")
+    rl = rl.dropna(subset=["Date"])
+    wide = rl.pivot_table(index="Date", columns="Series", values="Value", aggfunc="last")
+    return wide.resample("ME").last().reset_index()
+
+
+def publish_macro_store(econ_dir, raw_long: pd.DataFrame, monthly: pd.DataFrame,
+                        quarterly: pd.DataFrame, meta: Optional[dict] = None,
+                        generated_at: Optional[datetime] = None) -> Path:
+    """Write a snapshot and make it current. Returns the snapshot directory."""
+    root = store_root(econ_dir)
+    root.mkdir(parents=True, exist_ok=True)
+    generated_at = generated_at or datetime.now()
+    # Unique even for publishes within the same second (or from several processes)
+    name = f"{generated_at:%Y%m%d_%H%M%S_%f}_{uuid.uuid4().hex[:8]}"
+
+    if (monthly is None or monthly.empty) and raw_long is not None and not raw_long.empty:
+        monthly = _monthly_from_raw_long(raw_long)
+    panels = {
+        "raw_long": raw_long,
+        "monthly": monthly,
+        "quarterly": quarterly,
+        "annual": build_annual_panel(monthly),
+    }
+
+    tmp_dir = root / f".{name}.{os.getpid()}.tmp"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    tmp_dir.mkdir()
+    for panel, df in panels.items():
+        df = df if df is not None else pd.DataFrame()
+        feather.write_feather(df.reset_index(drop=True), tmp_dir / f"{panel}.arrow",
+                              compression="uncompressed")
+
+    series = [c for c in panels["monthly"].columns if c != "Date"] if not panels["monthly"].empty else []
+    store_meta = {
+        "version": MACRO_STORE_VERSION,
+        "generated_at": generated_at.isoformat(),
+        "series": series,
+        "last_observation": _last_observations(raw_long),
+        **(meta or {}),
+    }
+    with open(tmp_dir / "meta.json", "w", encoding="utf-8") as f:
+        json.dump(store_meta, f, indent=2, default=str)
+
+    snapshot = root / name
+    os.replace(tmp_dir, snapshot)
+
+    current_tmp = root / f"CURRENT.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp"
+    current_tmp.write_text(name, encoding="utf-8")
+    os.replace(current_tmp, root / "CURRENT")
+
+    _prune(root, keep=name)
+    print(f"Published macro store: {snapshot}")
+    return snapshot
+
+
+def _last_observations(raw_long: Optional[pd.DataFrame]) -> Dict[str, str]:
+    """Series -> date of its latest non-missing value."""
+    if raw_long is None or raw_long.empty:
+        return {}
+    rl = raw_long.dropna(subset=["Value"])
+    last = pd.to_datetime(rl["Date"], errors="coerce").groupby(rl["Series"]).max()
+    return {str(name): d.strftime("%Y-%m-%d") for name, d in last.items() if pd.notna(d)}
+
+
+def _prune(root: Path, keep: str) -> None:
+    snapshots = sorted(p for p in root.iterdir() if p.is_dir() and not p.name.startswith("."))
+    old = [p for p in snapshots if p.name != keep][:-KEEP_SNAPSHOTS or None]
+    for path in old:
+        # Windows refuses while another process has a panel mapped; next publish retries
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def current_snapshot(econ_dir) -> Optional[Tuple[Path, dict]]:
+    """(snapshot dir, meta) of the current snapshot, or None if there is no usable one."""
+    root = store_root(econ_dir)
+    try:
+        name = (root / "CURRENT").read_text(encoding="utf-8").strip()
+        snapshot = root / name
+        with open(snapshot / "meta.json", "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta.get("version") != MACRO_STORE_VERSION:
+        return None
+    return snapshot, meta
+
+
+def days_since(timestamp) -> float:
+    """Age in days of an ISO timestamp from meta.json (inf if missing)."""
+    ts = pd.to_datetime(timestamp, errors="coerce")
+    if pd.isna(ts):
+        return float("inf")
+    return (pd.Timestamp.now() - ts).total_seconds() / 86400
+
+
+def snapshot_age_days(econ_dir) -> float:
+    """Age of the current snapshot in days (inf if there is none)."""
+    current = current_snapshot(econ_dir)
+    return days_since(current[1].get("generated_at")) if current else float("inf")
+
+
+@contextmanager
+def refresh_lock(econ_dir):
+    """
+    Cross-process lock around a store refresh. Yields False without
+    waiting if another process is already refreshing.
+    """
+    root = store_root(econ_dir)
+    root.mkdir(parents=True, exist_ok=True)
+    path = root / "refresh.lock"
+    fd = None
+    for _ in range(2):
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - path.stat().st_mtime < REFRESH_LOCK_SECONDS:
+                    break
+                path.unlink()
+            except FileNotFoundError:
+                pass
+    if fd is None:
+        yield False
+        return
+    try:
+        os.write(fd, str(os.getpid()).encode())
+        yield True
+    finally:
+        os.close(fd)
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def load_macro_panel(econ_dir, panel: str = "annual",
+                     max_age_days: Optional[float] = None,
+                     columns: Optional[Sequence[str]] = None) -> Optional[pd.DataFrame]:
+    """
+    A panel of the current snapshot, or None if there is none (or it's
+    older than max_age_days). Returns a copy the caller may modify.
+
+    With `columns`, only those (that exist) are converted from the mapped
+    table, in the order given.
+    """
+    if panel not in PANELS:
+        raise ValueError(f"Unknown macro panel '{panel}'")
+
+    current = current_snapshot(econ_dir)
+    if current is None:
+        current = _convert_latest_workbook(econ_dir)
+        if current is None:
+            return None
+    snapshot, meta = current
+    if max_age_days is not None and days_since(meta.get("generated_at")) > max_age_days:
+        return None
+
+    path = snapshot / f"{panel}.arrow"
+    try:
+        key = (str(snapshot), panel, path.stat().st_mtime_ns)
+    except OSError:
+        return None
+    with _loaded_lock:
+        if key not in _loaded:
+            # Panels of older snapshots (or an older copy of this one) are no longer needed
+            for stale in [k for k in _loaded if k[0] != key[0] or k[1] == panel]:
+                _loaded.pop(stale, None)
+            _loaded[key] = (feather.read_table(path, memory_map=True), None)
+        table, frame = _loaded[key]
+        if columns is None and frame is None:
+            frame = table.to_pandas()
+            _loaded[key] = (table, frame)
+
+    if columns is not None:
+        return table.select([c for c in columns if c in table.column_names]).to_pandas()
+    return private_copy(frame)
+
+
+# ----------------------------------------------------------------------------
+# One-time conversion of an Excel export
+# ----------------------------------------------------------------------------
+
+def _workbook_timestamp(path: str) -> pd.Timestamp:
+    stem = Path(path).stem.split("_")
+    ts = pd.to_datetime(stem[-2] + stem[-1], format="%Y%m%d%H%M", errors="coerce") if len(stem) >= 2 else pd.NaT
+    if pd.isna(ts):
+        ts = pd.Timestamp(os.path.getmtime(path), unit="s")
+    return ts
+
+
+def _convert_latest_workbook(econ_dir) -> Optional[Tuple[Path, dict]]:
+    """Publish the newest fred_full_history workbook as a snapshot (pre-store exports)."""
+    files = glob.glob(os.path.join(str(econ_dir), WORKBOOK_PATTERN))
+    if not files:
+        return None
+    latest = max(files, key=_workbook_timestamp)
+    try:
+        xl = pd.ExcelFile(latest)
+        book = {sheet: xl.parse(sheet) for sheet in ("Raw_Long", "Monthly_Panel", "Quarterly_Panel")
+                if sheet in xl.sheet_names}
+    except Exception as e:
+        print(f"⚠️ Could not read macro workbook {latest}: {e}")
+        return None
+
+    raw_long = book.get("Raw_Long", pd.DataFrame(columns=["Date", "Series", "Value"]))
+    monthly = book.get("Monthly_Panel", pd.DataFrame())
+    if "Date" in monthly.columns:
+        monthly["Date"] = pd.to_datetime(monthly["Date"], errors="coerce")
+    print(f"ℹ️ Converting macro workbook to the columnar store: {latest}")
+    publish_macro_store(
+        econ_dir,
+        raw_long=raw_long,
+        monthly=monthly,
+        quarterly=book.get("Quarterly_Panel", pd.DataFrame()),
+        meta={"source_workbook": os.path.basename(latest)},
+        generated_at=_workbook_timestamp(latest).to_pydatetime(),
+    )
+    return current_snapshot(econ_dir)
@@ -0,0 +1,218 @@
+# response_cache.py — shared cache of raw FMP/FRED responses
+
+"""
+Collections of popular tickers request the same FMP endpoints over and
+over. Successful responses are cached here, shared by every collection
+(FinancialDataCollection, DatasetCollection, FREDCollector) and, with the
+Redis backend, by every worker:
+
+    key   = <CACHE_PREFIX>-http:<sha256 of host+path, query and params>
+    value = the decoded JSON (or CSV text), encoded by core/cache/serialization
+            (zstd above CACHE_COMPRESSION_MIN_BYTES)
+
+The API key is not part of the key. Keys live outside the <CACHE_PREFIX>:*
+namespace of the API cache, so DELETE /cache and the data webhook (which
+clear API responses after data updates) leave them alone. Each endpoint
+belongs to a TTL class (ENDPOINT_CLASSES); endpoints without one are never
+cached. Failed requests, FMP error payloads and empty results (which FMP
+returns for symbols it has no data for yet) are not stored.
+
+RESPONSE_CACHE_BACKEND selects redis, disk (<DATA_DIR>/response_cache) or
+off; redis falls back to disk while Redis is unavailable or a Redis call
+fails. Disk entries expire by file age and are removed when read after
+expiry.
+"""
+
+import hashlib
+import json
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from ..config import settings
+from ..core.cache.client import get_redis_client
+from ..core.cache.serialization import decode, encode
+
+# TTL class -> seconds
+RESPONSE_TTLS = {
+    "daily": 24 * 3600,
+    "weekly": 7 * 24 * 3600,
+    "quarterly": 90 * 24 * 3600,
+}
+
+# URL fragment -> TTL class (first match wins)
+ENDPOINT_CLASSES: Tuple[Tuple[str, str], ...] = (
+    # prices and macro series move every trading day
+    ("historical-price-eod", "daily"),
+    ("treasury-rates", "daily"),
+    ("economic-indicators", "daily"),
+    ("fredgraph.csv", "daily"),
+    ("insider-trading", "daily"),
+    ("institutional-ownership", "daily"),
+    # filings change with the reporting cycle
+    ("income-statement", "quarterly"),
+    ("balance-sheet-statement", "quarterly"),
+    ("cash-flow-statement", "quarterly"),
+    ("key-metrics", "quarterly"),
+    ("ratios", "quarterly"),
+    ("enterprise-values", "quarterly"),
+    ("historical-employee-count", "quarterly"),
+    # profiles and analyst views
+    ("profile", "weekly"),
+    ("analyst-estimates", "weekly"),
+    ("price-target-consensus", "weekly"),
+)
+
+_SECRET_PARAMS = {"apikey", "api_key"}
+
+
+def _cacheable(value: Any) -> bool:
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return False
+    if isinstance(value, (list, dict)) and not value:
+        return False
+    # FMP reports quota and plan errors as a 200 with an error object
+    return not (isinstance(value, dict) and ("Error Message" in value or "error" in value))
+
+
+class ResponseCache:
+    """Get/set raw responses by (URL, params); see the module docstring."""
+
+    def __init__(self, backend: Optional[str] = None, root: Optional[Path] = None):
+        self.backend = (backend or settings.RESPONSE_CACHE_BACKEND).lower()
+        self.root = Path(root or Path(settings.DATA_DIR) / "response_cache")
+        # per process, reported by the collectors
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def ttl_for(url: str) -> Optional[int]:
+        for fragment, ttl_class in ENDPOINT_CLASSES:
+            if fragment in url:
+                return RESPONSE_TTLS[ttl_class]
+        return None
+
+    @staticmethod
+    def key_for(url: str, params: Optional[dict] = None) -> str:
+        parsed = urlparse(url)
+        query = {k: str(v) for k, v in (params or {}).items() if k.lower() not in _SECRET_PARAMS}
+        ident = json.dumps([parsed.netloc + parsed.path, parsed.query, query], sort_keys=True)
+        return hashlib.sha256(ident.encode()).hexdigest()
+
+    def _redis(self):
+        return get_redis_client() if self.backend == "redis" else None
+
+    def _redis_key(self, digest: str) -> str:
+        return f"{settings.CACHE_PREFIX}-http:{digest}"
+
+    def _path(self, digest: str) -> Path:
+        return self.root / digest[:2] / f"{digest}.bin"
+
+    def _disk_get(self, digest: str, ttl: int) -> Any:
+        path = self._path(digest)
+        try:
+            if time.time() - path.stat().st_mtime > ttl:
+                path.unlink()
+                return None
+            return decode(path.read_bytes())
+        except Exception:
+            return None
+
+    def _disk_set(self, digest: str, data: bytes) -> None:
+        path = self._path(digest)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+
+    def get_many(self, calls: Iterable[Tuple[str, Optional[dict]]]) -> List[Any]:
+        """Cached responses for (url, params) calls, None for misses; input order."""
+        calls = list(calls)
+        out: List[Any] = [None] * len(calls)
+        if self.backend == "off":
+            return out
+
+        wanted = []
+        for i, (url, params) in enumerate(calls):
+            ttl = self.ttl_for(url)
+            if ttl:
+                wanted.append((i, self.key_for(url, params), ttl))
+        if not wanted:
+            return out
+
+        raw = None
+        client = self._redis()
+        if client is not None:
+            try:
+                raw = client.mget([self._redis_key(digest) for _, digest, _ in wanted])
+            except Exception:
+                raw = None
+        if raw is not None:
+            for (i, _, _), data in zip(wanted, raw):
+                if data is not None:
+                    try:
+                        out[i] = decode(data)
+                    except Exception:
+                        pass
+        else:
+            for i, digest, ttl in wanted:
+                out[i] = self._disk_get(digest, ttl)
+
+        found = sum(1 for i, _, _ in wanted if out[i] is not None)
+        self.hits += found
+        self.misses += len(wanted) - found
+        return out
+
+    def set_many(self, items: Iterable[Tuple[str, Optional[dict], Any]]) -> None:
+        """Store successful (url, params, value) responses of cacheable endpoints."""
+        if self.backend == "off":
+            return
+        entries = []
+        for url, params, value in items:
+            ttl = self.ttl_for(url)
+            if ttl and _cacheable(value):
+                entries.append((self.key_for(url, params), ttl, encode(value)[0]))
+        if not entries:
+            return
+
+        client = self._redis()
+        if client is not None:
+            try:
+                pipe = client.pipeline(transaction=False)
+                for digest, ttl, data in entries:
+                    pipe.set(self._redis_key(digest), data, ex=ttl)
+                pipe.execute()
+                return
+            except Exception:
+                pass
+
+        for digest, _, data in entries:
+            self._disk_set(digest, data)
+
+    def get(self, url: str, params: Optional[dict] = None) -> Any:
+        return self.get_many([(url, params)])[0]
+
+    def set(self, url: str, params: Optional[dict], value: Any) -> None:
+        self.set_many([(url, params, value)])
+
+    def stats(self) -> dict:
+        return {"backend": self.backend, "hits": self.hits, "misses": self.misses}
+
+
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """Process-wide ResponseCache singleton."""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+    return _response_cache
@@ -1,7 +1,11 @@
 """Database connection and session management"""
+import anyio
+from fastapi import Depends
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from typing import Optional
 from .config import settings
 
 
@@ -66,7 +70,27 @@ if settings.DATA_DATABASE_URL:
     DataSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=data_engine)
 
 
-def get_data_db():
+# Created on first use; anyio limiters need a running event loop
+_data_db_limiter: Optional[anyio.CapacityLimiter] = None
+
+
+async def data_db_slot():
+    """
+    Hold one of the DATA connection slots for the duration of a request.
+
+    Sync endpoints run in anyio's shared threadpool. Requests beyond what the
+    DATA connection pool can serve wait here, on the event loop, instead of
+    holding a thread while they wait for a connection, so they can't starve
+    the other sync endpoints of threads.
+    """
+    global _data_db_limiter
+    if _data_db_limiter is None:
+        _data_db_limiter = anyio.CapacityLimiter(settings.DATA_DB_POOL_SIZE + settings.DATA_DB_MAX_OVERFLOW)
+    async with _data_db_limiter:
+        yield
+
+
+def get_data_db(_slot: None = Depends(data_db_slot)):
     """Get database session for DATA database (read-only)"""
     if DataSessionLocal is None:
         raise RuntimeError("DATA_DATABASE_URL not configured")
@@ -74,4 +98,45 @@ def get_data_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+# =============================================================================
+# DATA Database - async access (asyncpg)
+# =============================================================================
+# Used by research endpoints that are ported to AsyncSession so they don't
+# hold the event loop while PostgreSQL works. Endpoints still on the sync
+# session are plain `def` handlers and run in the (bounded) threadpool.
+
+def get_async_database_url(database_url: str) -> Optional[str]:
+    """Map a sync PostgreSQL URL to its asyncpg equivalent (None if unsupported)."""
+    url = make_url(database_url)
+    if url.get_backend_name() != "postgresql":
+        return None
+    return url.set(drivername="postgresql+asyncpg").render_as_string(hide_password=False)
+
+
+data_async_engine = None
+AsyncDataSessionLocal = None
+
+if settings.DATA_DATABASE_URL and get_async_database_url(settings.DATA_DATABASE_URL):
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    data_async_engine = create_async_engine(
+        get_async_database_url(settings.DATA_DATABASE_URL),
+        pool_size=settings.DATA_DB_POOL_SIZE,
+        max_overflow=settings.DATA_DB_MAX_OVERFLOW,
+        pool_pre_ping=True,
+        pool_recycle=settings.DATA_DB_POOL_RECYCLE,
+    )
+    AsyncDataSessionLocal = async_sessionmaker(
+        data_async_engine, autoflush=False, expire_on_commit=False
+    )
+
+
+async def get_async_data_db():
+    """Get async database session for DATA database (read-only)"""
+    if AsyncDataSessionLocal is None:
+        raise RuntimeError("DATA_DATABASE_URL not configured for async (PostgreSQL) access")
+    async with AsyncDataSessionLocal() as db:
+        yield db
@@ -0,0 +1,8 @@
+"""
+Background jobs: data collection and report generation run by workers
+(see worker.py) from a persistent, prioritized queue.
+"""
+from .service import enqueue_job, cancel_job, cancel_resource_jobs, get_active_job, get_user_jobs
+from .tasks import JOB_TYPES
+
+__all__ = ["enqueue_job", "cancel_job", "cancel_resource_jobs", "get_active_job", "get_user_jobs", "JOB_TYPES"]
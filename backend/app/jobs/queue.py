@@ -0,0 +1,211 @@
+"""
+Job Queue
+
+Queued job ids wait in one list per lane. Workers always take from the
+interactive lane (analyses a user is watching) before the batch lane
+(dataset collections), so a large batch backlog never delays a report.
+Jobs waiting out a retry backoff sit in a sorted set scored by due time
+and are moved back to their lane once due.
+
+The queue only carries ids; the jobs table (models/job.py) holds the job
+state. Workers claim a job with a conditional status update (see
+service.py), so an id that reaches the queue twice still runs once.
+
+RedisQueue is shared by the API and every worker process. MemoryQueue is
+the in-process stand-in for tests, development and deployments without
+Redis; only a worker running inside the API process can drain it.
+"""
+
+import asyncio
+import heapq
+import logging
+import time
+from collections import deque
+from typing import Dict, Optional, Set, Tuple
+
+import redis.asyncio as aioredis
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+# Highest priority first
+LANES = ("interactive", "batch")
+
+# Seconds a worker blocks waiting for a job before checking for shutdown
+POP_TIMEOUT = 5
+
+# Due retries promoted per pop
+PROMOTE_BATCH = 100
+
+
+def _key(*parts: str) -> str:
+    return ":".join((settings.CACHE_PREFIX, "jobs") + parts)
+
+
+class RedisQueue:
+    """Lanes are Redis lists (LPUSH/BRPOP, FIFO); backoffs a sorted set."""
+
+    shared = True
+
+    def __init__(self, client: aioredis.Redis):
+        self.client = client
+
+    async def push(self, job_id: str, lane: str, delay: float = 0) -> None:
+        if delay > 0:
+            await self.client.zadd(_key("delayed"), {f"{lane}:{job_id}": time.time() + delay})
+        else:
+            await self.client.lpush(_key("lane", lane), job_id)
+
+    async def pop(self, timeout: float = POP_TIMEOUT) -> Optional[Tuple[str, str]]:
+        """Next (job_id, lane) by lane priority, or None after `timeout` seconds."""
+        await self._promote_due()
+        item = await self.client.brpop([_key("lane", lane) for lane in LANES], timeout=timeout)
+        if not item:
+            return None
+        key, job_id = item
+        return job_id, key.rsplit(":", 1)[1]
+
+    async def _promote_due(self) -> None:
+        due = await self.client.zrangebyscore(_key("delayed"), 0, time.time(), start=0, num=PROMOTE_BATCH)
+        for member in due:
+            # ZREM succeeds for exactly one of the workers racing on a member
+            if await self.client.zrem(_key("delayed"), member):
+                lane, job_id = member.split(":", 1)
+                await self.client.lpush(_key("lane", lane), job_id)
+
+    async def sizes(self) -> Dict[str, int]:
+        sizes = {lane: await self.client.llen(_key("lane", lane)) for lane in LANES}
+        sizes["delayed"] = await self.client.zcard(_key("delayed"))
+        return sizes
+
+    async def queued_ids(self) -> Set[str]:
+        """Ids waiting in a lane or a backoff."""
+        ids = set()
+        for lane in LANES:
+            ids.update(await self.client.lrange(_key("lane", lane), 0, -1))
+        ids.update(member.split(":", 1)[1] for member in await self.client.zrange(_key("delayed"), 0, -1))
+        return ids
+
+
+class MemoryQueue:
+    """Same interface as RedisQueue, held in this process."""
+
+    shared = False
+
+    def __init__(self):
+        self._lanes = {lane: deque() for lane in LANES}
+        # (due, lane, job_id)
+        self._delayed: list = []
+        self._wakeup = asyncio.Event()
+
+    async def push(self, job_id: str, lane: str, delay: float = 0) -> None:
+        if delay > 0:
+            heapq.heappush(self._delayed, (time.time() + delay, lane, job_id))
+        else:
+            self._lanes[lane].appendleft(job_id)
+        self._wakeup.set()
+
+    async def pop(self, timeout: float = POP_TIMEOUT) -> Optional[Tuple[str, str]]:
+        deadline = time.monotonic() + timeout
+        while True:
+            while self._delayed and self._delayed[0][0] <= time.time():
+                _, lane, job_id = heapq.heappop(self._delayed)
+                self._lanes[lane].appendleft(job_id)
+            for lane in LANES:
+                if self._lanes[lane]:
+                    return self._lanes[lane].pop(), lane
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            self._wakeup.clear()
+            try:
+                # Wake at least once a second for due retries
+                await asyncio.wait_for(self._wakeup.wait(), min(remaining, 1.0))
+            except asyncio.TimeoutError:
+                pass
+
+    async def sizes(self) -> Dict[str, int]:
+        sizes = {lane: len(self._lanes[lane]) for lane in LANES}
+        sizes["delayed"] = len(self._delayed)
+        return sizes
+
+    async def queued_ids(self) -> Set[str]:
+        ids = {job_id for lane in self._lanes.values() for job_id in lane}
+        ids.update(job_id for _, _, job_id in self._delayed)
+        return ids
+
+
+# =============================================================================
+# Connections (one per process / event loop)
+# =============================================================================
+
+_redis: Optional[aioredis.Redis] = None
+_queue = None
+_connect_lock: Optional[asyncio.Lock] = None
+
+
+async def get_job_redis() -> Optional[aioredis.Redis]:
+    """
+    Redis client for the queue and the websocket event relay.
+
+    None with JOB_QUEUE_BACKEND=memory or when Redis can't be reached.
+    Unlike the cache client it ignores CACHE_ENABLED and decodes responses.
+    """
+    global _redis, _connect_lock
+    if settings.JOB_QUEUE_BACKEND != "redis":
+        return None
+    if _redis is not None:
+        return _redis
+
+    if _connect_lock is None:
+        _connect_lock = asyncio.Lock()
+    async with _connect_lock:
+        if _redis is None:
+            kwargs = {
+                "decode_responses": True,
+                # Must outlast a blocking BRPOP
+                "socket_timeout": POP_TIMEOUT + 10.0,
+                "socket_connect_timeout": 5.0,
+            }
+            if settings.REDIS_URL:
+                client = aioredis.from_url(settings.REDIS_URL, **kwargs)
+            else:
+                client = aioredis.Redis(
+                    host=settings.REDIS_HOST,
+                    port=settings.REDIS_PORT,
+                    db=settings.REDIS_DB,
+                    password=settings.REDIS_PASSWORD,
+                    **kwargs,
+                )
+            try:
+                await client.ping()
+            except Exception as e:
+                logger.warning(f"Job queue: Redis unavailable ({e})")
+                await client.aclose()
+                return None
+            _redis = client
+    return _redis
+
+
+async def get_queue():
+    """This process's job queue; falls back to MemoryQueue without Redis."""
+    global _queue
+    if _queue is None:
+        client = await get_job_redis()
+        if client is not None:
+            _queue = RedisQueue(client)
+        else:
+            if settings.JOB_QUEUE_BACKEND == "redis":
+                logger.warning("Job queue: using the in-process queue; jobs run in the API process")
+            _queue = MemoryQueue()
+    return _queue
+
+
+async def close_job_redis() -> None:
+    global _redis, _queue
+    if _redis is not None:
+        await _redis.aclose()
+    _redis = None
+    _queue = None
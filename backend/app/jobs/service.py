@@ -0,0 +1,292 @@
+"""
+Job State
+
+Enqueueing and the state transitions of the jobs table:
+
+    queued -> running -> succeeded
+                      -> retrying -> running ...   (retryable types, with backoff)
+                      -> failed
+    queued/retrying/running -> cancelled
+
+Worker-side transitions open their own session and run in a thread.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..database import SessionLocal
+from ..models.analysis import Analysis
+from ..models.dataset import Dataset
+from ..models.job import Job
+from ..models.user import User
+from .queue import get_queue
+from .tasks import JOB_TYPES, is_interruptible
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ("queued", "running", "retrying")
+CLAIMABLE_STATUSES = ("queued", "retrying")
+
+# Seconds before a job held back by the per-user limit is looked at again
+USER_BUSY_DELAY = 5
+
+
+def _snapshot(job: Job) -> Dict[str, Any]:
+    return {
+        "job_id": job.job_id,
+        "job_type": job.job_type,
+        "user_id": job.user_id,
+        "resource_id": job.resource_id,
+        "args": list(job.args or []),
+        "lane": job.lane,
+        "attempts": job.attempts,
+        "max_attempts": job.max_attempts,
+    }
+
+
+def get_active_job(db: Session, job_type: str, resource_id: str,
+                   args: Optional[List[Any]] = None) -> Optional[Job]:
+    """A queued or running job of this type for a resource (and these args, if given)."""
+    jobs = db.query(Job).filter(
+        Job.job_type == job_type,
+        Job.resource_id == resource_id,
+        Job.status.in_(ACTIVE_STATUSES),
+    ).all()
+    for job in jobs:
+        if args is None or list(job.args or []) == list(args):
+            return job
+    return None
+
+
+async def enqueue_job(db: Session, job_type: str, user_id: str, resource_id: str, *args: Any) -> Job:
+    """
+    Record a job and queue it. Returns the already active job instead if
+    the same job (type, resource and args) is still queued or running.
+    """
+    lane, retryable, _ = JOB_TYPES[job_type]
+    existing = get_active_job(db, job_type, resource_id, list(args))
+    if existing:
+        return existing
+
+    job = Job(
+        user_id=user_id,
+        job_type=job_type,
+        resource_id=resource_id,
+        args=list(args),
+        lane=lane,
+        status="queued",
+        max_attempts=max(settings.JOB_MAX_ATTEMPTS, 1) if retryable else 1,
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+
+    try:
+        queue = await get_queue()
+        await queue.push(job.job_id, lane)
+    except Exception as e:
+        job.status = "failed"
+        job.error = f"Could not enqueue: {e}"
+        job.finished_at = datetime.utcnow()
+        db.commit()
+        raise
+    return job
+
+
+def get_user_jobs(db: Session, user_id: str, status: Optional[str] = None,
+                  resource_id: Optional[str] = None, limit: int = 50) -> List[Job]:
+    query = db.query(Job).filter(Job.user_id == user_id)
+    if status:
+        query = query.filter(Job.status == status)
+    if resource_id:
+        query = query.filter(Job.resource_id == resource_id)
+    return query.order_by(Job.created_at.desc()).limit(limit).all()
+
+
+def cancel_job(db: Session, job: Job) -> Job:
+    """
+    Cancel a job. Waiting jobs are cancelled at once; running ones are
+    flagged and stopped by their worker at its next heartbeat (section
+    generation running in a thread stops before its next section).
+
+    Raises ValueError if the job has finished or can't be interrupted.
+    """
+    if job.status in CLAIMABLE_STATUSES:
+        job.status = "cancelled"
+        job.finished_at = datetime.utcnow()
+    elif job.status == "running":
+        if not is_interruptible(job.job_type):
+            raise ValueError(f"A running {job.job_type} job can't be interrupted")
+        job.cancel_requested = True
+    else:
+        raise ValueError(f"Job is already {job.status}")
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def cancel_resource_jobs(db: Session, resource_id: str) -> int:
+    """Cancel whatever is still queued or running for an analysis/dataset being deleted."""
+    cancelled = 0
+    for job in db.query(Job).filter(Job.resource_id == resource_id, Job.status.in_(ACTIVE_STATUSES)).all():
+        try:
+            cancel_job(db, job)
+            cancelled += 1
+        except ValueError:
+            pass
+    return cancelled
+
+
+# =============================================================================
+# Worker-side transitions (sync, own session)
+# =============================================================================
+
+def claim_job(job_id: str, worker: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    Take a popped job for this worker.
+
+    Returns ("claimed", job), ("busy", job) when the user is at the running
+    job limit, or ("skip", None) for ids that are gone, finished, cancelled
+    or claimed by another worker.
+
+    With a per-user limit, the user's row is locked for the count and the
+    claim, so concurrent workers can't both take the user's last slot.
+    """
+    db = SessionLocal()
+    try:
+        job = db.query(Job).filter(Job.job_id == job_id).first()
+        if job is None or job.status not in CLAIMABLE_STATUSES:
+            return "skip", None
+
+        limit = settings.JOB_MAX_RUNNING_PER_USER
+        if limit > 0:
+            db.query(User.user_id).filter(User.user_id == job.user_id).with_for_update().first()
+            running = db.query(Job).filter(Job.user_id == job.user_id, Job.status == "running").count()
+            if running >= limit:
+                return "busy", _snapshot(job)
+
+        now = datetime.utcnow()
+        claimed = db.query(Job).filter(
+            Job.job_id == job_id,
+            Job.status.in_(CLAIMABLE_STATUSES),
+        ).update({
+            Job.status: "running",
+            Job.attempts: Job.attempts + 1,
+            Job.worker: worker,
+            Job.started_at: now,
+            Job.heartbeat_at: now,
+            Job.run_after: None,
+        }, synchronize_session=False)
+        db.commit()
+        if not claimed:
+            return "skip", None
+
+        db.refresh(job)
+        return "claimed", _snapshot(job)
+    finally:
+        db.close()
+
+
+def heartbeat_job(job_id: str) -> bool:
+    """Mark a running job alive. Returns True if cancellation was requested."""
+    db = SessionLocal()
+    try:
+        job = db.query(Job).filter(Job.job_id == job_id).first()
+        if job is None:
+            return True
+        job.heartbeat_at = datetime.utcnow()
+        db.commit()
+        return bool(job.cancel_requested)
+    finally:
+        db.close()
+
+
+def finish_job(job_id: str, status: str, error: Optional[str] = None,
+               retry_delay: Optional[float] = None) -> None:
+    """Record the outcome of a run (status "retrying" needs retry_delay)."""
+    db = SessionLocal()
+    try:
+        job = db.query(Job).filter(Job.job_id == job_id).first()
+        if job is None:
+            return
+        job.status = status
+        job.error = error
+        job.worker = None
+        if status == "retrying":
+            job.run_after = datetime.utcnow() + timedelta(seconds=retry_delay or 0)
+        elif status == "queued":
+            # Handed back on worker shutdown; the interrupted run doesn't count
+            job.attempts = max((job.attempts or 1) - 1, 0)
+        else:
+            job.finished_at = datetime.utcnow()
+        db.commit()
+    finally:
+        db.close()
+
+
+def retry_delay(attempts: int) -> float:
+    """Backoff before the next attempt: base, 2x base, 4x base, ..."""
+    return settings.JOB_RETRY_BACKOFF_SECONDS * (2 ** max(attempts - 1, 0))
+
+
+def restore_cancelled_resource(job: Dict[str, Any]) -> Optional[str]:
+    """Put a cancelled job's analysis/dataset back in a startable status."""
+    _, _, cancel_status = JOB_TYPES[job["job_type"]]
+    if cancel_status is None or not job["resource_id"]:
+        return None
+
+    model = Analysis if job["job_type"].startswith("analysis.") else Dataset
+    key = Analysis.analysis_id if model is Analysis else Dataset.dataset_id
+    db = SessionLocal()
+    try:
+        resource = db.query(model).filter(key == job["resource_id"]).first()
+        if resource is None:
+            return None
+        resource.status = cancel_status
+        resource.error_log = "Cancelled by user"
+        db.commit()
+        return cancel_status
+    finally:
+        db.close()
+
+
+def recover_jobs() -> List[Tuple[str, str, float]]:
+    """
+    Jobs that should be in the queue, as (job_id, lane, delay).
+
+    Running jobs whose worker stopped heartbeating count as a failed
+    attempt and are retried if attempts remain. Queued/retrying jobs are
+    listed as well, so ones the queue lost (a MemoryQueue after a restart,
+    a flushed Redis, a failed push) are pushed again; the worker skips ids
+    still in the queue.
+    """
+    db = SessionLocal()
+    try:
+        now = datetime.utcnow()
+        stale = db.query(Job).filter(
+            Job.status == "running",
+            Job.heartbeat_at < now - timedelta(seconds=settings.JOB_STALE_SECONDS),
+        ).all()
+        for job in stale:
+            logger.warning(f"Job {job.job_id} lost its worker ({job.worker})")
+            job.worker = None
+            job.error = "Worker stopped while running the job"
+            if job.attempts < job.max_attempts:
+                job.status = "queued"
+            else:
+                job.status = "failed"
+                job.finished_at = now
+        db.commit()
+
+        jobs = db.query(Job).filter(Job.status.in_(CLAIMABLE_STATUSES)).all()
+        pushes = {}
+        for job in jobs:
+            delay = (job.run_after - now).total_seconds() if job.run_after else 0
+            pushes[job.job_id] = (job.job_id, job.lane, max(delay, 0))
+        return list(pushes.values())
+    finally:
+        db.close()
@@ -0,0 +1,83 @@
+"""
+Job Types
+
+job_type -> (lane, retryable, status to restore on cancel)
+
+The handler for a type receives the job's args. Collection jobs are
+retried (their failures are usually API/network errors); section
+generation isn't, as its failures are recorded per section and a rerun
+would fail the same way. When a running job is cancelled, its analysis or
+dataset goes back to the given status so the user can start it again
+(None leaves it alone).
+
+Blocking work runs through run_blocking, so a cancelled job only finishes
+once its thread has returned and is never requeued while still running.
+"""
+
+import asyncio
+import inspect
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+JOB_TYPES: Dict[str, Tuple[str, bool, Optional[str]]] = {
+    # Phase A for one analysis
+    "analysis.collect": ("interactive", True, "created"),
+    # Phase B for one analysis
+    "analysis.generate": ("interactive", False, "collection_complete"),
+    # Rebuild one section of a finished analysis
+    "analysis.regenerate_section": ("interactive", False, None),
+    # Dataset collection (many companies, no one watching live)
+    "dataset.collect": ("batch", True, "failed"),
+}
+
+
+def get_handler(job_type: str) -> Callable:
+    # Imported here so workers load the collection/report stack on first use
+    from ..services.data_collection_service import data_collection_service
+    from ..report_generation.section_runner import run_section_generation, run_section_regeneration
+
+    handlers = {
+        "analysis.collect": data_collection_service.collect_data_for_analysis,
+        "analysis.generate": run_section_generation,
+        "analysis.regenerate_section": run_section_regeneration,
+        "dataset.collect": data_collection_service.collect_data_for_dataset,
+    }
+    if job_type not in handlers:
+        raise KeyError(f"Unknown job type '{job_type}'")
+    return handlers[job_type]
+
+
+def is_interruptible(job_type: str) -> bool:
+    """Whether a running job of this type stops when cancelled (async handlers only)."""
+    return inspect.iscoroutinefunction(get_handler(job_type))
+
+
+async def run_blocking(func: Callable, *args: Any, cancel: Optional[threading.Event] = None) -> Any:
+    """
+    asyncio.to_thread that doesn't abandon its thread when cancelled.
+
+    On cancellation `cancel` is set, for functions that check it between
+    steps, and the CancelledError is only raised once the thread has
+    returned, so the session and files it uses aren't released under it.
+    """
+    work = asyncio.ensure_future(asyncio.to_thread(func, *args))
+    try:
+        return await asyncio.shield(work)
+    except asyncio.CancelledError:
+        if cancel is not None:
+            cancel.set()
+        while not work.done():
+            try:
+                await asyncio.wait({work})
+            except asyncio.CancelledError:
+                pass
+        if not work.cancelled():
+            work.exception()  # retrieved; the job is reported as cancelled
+        raise
+
+
+async def run_job(job_type: str, args: List[Any]) -> Any:
+    handler = get_handler(job_type)
+    if inspect.iscoroutinefunction(handler):
+        return await handler(*args)
+    return await run_blocking(handler, *args)
@@ -0,0 +1,291 @@
+"""
+Job Worker
+
+Runs queued collection and report jobs outside the API process:
+
+    python -m backend.app.jobs.worker
+
+A worker runs up to JOB_WORKER_CONCURRENCY jobs at once; section
+generation additionally fans out to the worker's own section process
+pool, so capacity grows by starting more worker processes or hosts.
+With JOB_WORKER_IN_API the API process runs a worker as well, which is
+also what drains the in-process queue when Redis isn't available.
+
+Running jobs heartbeat every HEARTBEAT_SECONDS. The heartbeat is where a
+cancel request is noticed, and a job whose heartbeat goes stale (its
+worker died) is requeued by whichever worker checks next, which also
+pushes waiting jobs the queue has lost. On shutdown, running jobs are
+interrupted and handed back to the queue.
+
+Work a job runs in a thread can't be interrupted: it stops at its next
+cancel check (between sections for section generation) or runs to the
+end, and the job keeps heartbeating until then. A job is only handed back
+once its thread has returned, and one that finished meanwhile is recorded
+as such rather than requeued.
+
+Websocket progress from a dedicated worker is published on Redis and
+forwarded to the browser by the API processes (core/websocket_manager.py).
+"""
+
+import asyncio
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Dict, Optional
+
+from ..config import settings
+from ..core.websocket_manager import manager
+from .queue import get_queue, close_job_redis
+from .service import (
+    USER_BUSY_DELAY,
+    claim_job,
+    finish_job,
+    heartbeat_job,
+    recover_jobs,
+    restore_cancelled_resource,
+    retry_delay,
+)
+from .tasks import run_job
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_SECONDS = 5
+# How often a worker looks for jobs orphaned by a dead worker
+RECOVERY_INTERVAL = 60
+
+
+class JobWorker:
+    """Pops jobs by lane priority and runs them with bounded concurrency."""
+
+    def __init__(self, concurrency: Optional[int] = None):
+        self.concurrency = max(concurrency or settings.JOB_WORKER_CONCURRENCY, 1)
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._stopping = False
+
+    async def run(self) -> None:
+        queue = await get_queue()
+        slots = asyncio.Semaphore(self.concurrency)
+        logger.info(f"Job worker {self.name} started ({self.concurrency} slots, "
+                    f"{'shared' if queue.shared else 'in-process'} queue)")
+
+        # An in-process queue starts empty after a restart; the table doesn't
+        await self._recover(queue)
+        next_recovery = time.monotonic() + RECOVERY_INTERVAL
+
+        while not self._stopping:
+            if time.monotonic() >= next_recovery:
+                await self._recover(queue)
+                next_recovery = time.monotonic() + RECOVERY_INTERVAL
+
+            await slots.acquire()
+            try:
+                item = await queue.pop()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Job queue unavailable: {e}")
+                slots.release()
+                await asyncio.sleep(HEARTBEAT_SECONDS)
+                continue
+
+            if item is None:
+                slots.release()
+                continue
+            job_id, lane = item
+            if self._stopping:
+                await queue.push(job_id, lane)
+                slots.release()
+                break
+
+            task = asyncio.create_task(self._execute(queue, job_id))
+            self._tasks[job_id] = task
+            task.add_done_callback(lambda _t, job_id=job_id: (self._tasks.pop(job_id, None), slots.release()))
+
+    async def stop(self) -> None:
+        """Interrupt running jobs and hand them back to the queue."""
+        self._stopping = True
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _recover(self, queue) -> None:
+        try:
+            pushes = await asyncio.to_thread(recover_jobs)
+            queued = await queue.queued_ids()
+            for job_id, lane, delay in pushes:
+                if job_id not in queued:
+                    await queue.push(job_id, lane, delay)
+        except Exception as e:
+            logger.error(f"Job recovery failed: {e}")
+
+    async def _execute(self, queue, job_id: str) -> None:
+        outcome, job = await asyncio.to_thread(claim_job, job_id, self.name)
+        if outcome == "busy":
+            await queue.push(job_id, job["lane"], USER_BUSY_DELAY)
+        if outcome != "claimed":
+            return
+
+        label = f"Job {job_id} ({job['job_type']} {job['resource_id']})"
+        logger.info(f"{label} started, attempt {job['attempts']}/{job['max_attempts']}")
+        started = time.monotonic()
+        task = asyncio.create_task(run_job(job["job_type"], job["args"]))
+
+        try:
+            cancelled = await self._supervise(job_id, task)
+        except asyncio.CancelledError:
+            # Worker shutting down; blocking work finishes its current step first
+            task.cancel()
+            while not task.done():
+                try:
+                    await asyncio.wait({task})
+                except asyncio.CancelledError:
+                    pass
+            if not task.cancelled() and task.exception() is None:
+                await asyncio.to_thread(finish_job, job_id, "succeeded")
+                logger.info(f"{label} finished during shutdown")
+            else:
+                await asyncio.to_thread(finish_job, job_id, "queued")
+                await queue.push(job_id, job["lane"])
+                logger.info(f"{label} interrupted by shutdown, requeued")
+            raise
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            if job["attempts"] < job["max_attempts"]:
+                delay = retry_delay(job["attempts"])
+                await asyncio.to_thread(finish_job, job_id, "retrying", error, delay)
+                await queue.push(job_id, job["lane"], delay)
+                logger.warning(f"{label} failed, retrying in {delay:.0f}s: {error}")
+            else:
+                await asyncio.to_thread(finish_job, job_id, "failed", error)
+                logger.error(f"{label} failed: {error}")
+            return
+
+        elapsed = time.monotonic() - started
+        if cancelled:
+            await asyncio.to_thread(finish_job, job_id, "cancelled")
+            status = await asyncio.to_thread(restore_cancelled_resource, job)
+            if status and job["job_type"].startswith("analysis."):
+                await manager.broadcast_progress(
+                    analysis_id=job["resource_id"],
+                    progress=0,
+                    message="Cancelled",
+                    status=status,
+                )
+            logger.info(f"{label} cancelled after {elapsed:.1f}s")
+        else:
+            await asyncio.to_thread(finish_job, job_id, "succeeded")
+            logger.info(f"{label} succeeded in {elapsed:.1f}s")
+
+    async def _supervise(self, job_id: str, task: asyncio.Task) -> bool:
+        """
+        Wait for a job, heartbeating. Returns True if it was cancelled; re-raises its error.
+
+        A cancelled job keeps heartbeating until its task has actually
+        stopped, so it isn't taken for orphaned and requeued meanwhile.
+        """
+        cancelling = False
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=HEARTBEAT_SECONDS)
+            if done:
+                if task.cancelled():
+                    return True
+                task.result()
+                return False
+            try:
+                cancel_requested = await asyncio.to_thread(heartbeat_job, job_id)
+            except Exception as e:
+                logger.warning(f"Job {job_id} heartbeat failed: {e}")
+                continue
+            if cancel_requested and not cancelling:
+                task.cancel()
+                cancelling = True
+
+
+# =============================================================================
+# Worker inside the API process
+# =============================================================================
+
+_api_worker: Optional[JobWorker] = None
+_api_worker_task: Optional[asyncio.Task] = None
+
+
+async def start_api_worker() -> None:
+    """Run a worker in the API process if configured, or if the queue is in-process (app startup)."""
+    global _api_worker, _api_worker_task
+    queue = await get_queue()
+    if not settings.JOB_WORKER_IN_API and queue.shared:
+        return
+    if not settings.JOB_WORKER_IN_API:
+        logger.warning("JOB_WORKER_IN_API is off, but only this process can drain the in-process queue")
+
+    _api_worker = JobWorker()
+    _api_worker_task = asyncio.create_task(_api_worker.run())
+
+
+async def stop_api_worker() -> None:
+    """Hand the API worker's running jobs back to the queue (app shutdown)."""
+    global _api_worker, _api_worker_task
+    if _api_worker is None:
+        return
+    await _api_worker.stop()
+    _api_worker_task.cancel()
+    await asyncio.gather(_api_worker_task, return_exceptions=True)
+    _api_worker = _api_worker_task = None
+
+
+# =============================================================================
+# Dedicated worker process
+# =============================================================================
+
+async def _serve() -> None:
+    from ..report_generation.section_runner import shutdown_section_pool
+
+    queue = await get_queue()
+    if not queue.shared:
+        logger.error("A dedicated worker needs the Redis queue (JOB_QUEUE_BACKEND=redis and Redis reachable)")
+        return
+
+    # Progress goes to the API processes through Redis
+    await manager.start_relay(listen=False)
+
+    worker = JobWorker()
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stopping.set)
+        except NotImplementedError:  # Windows
+            pass
+
+    runner = asyncio.create_task(worker.run())
+    try:
+        await stopping.wait()
+    finally:
+        logger.info(f"Job worker {worker.name} stopping")
+        await worker.stop()
+        runner.cancel()
+        await asyncio.gather(runner, return_exceptions=True)
+        await manager.stop_relay()
+        await close_job_redis()
+        shutdown_section_pool()
+
+
+def main() -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler(sys.stdout)],
+    )
+    try:
+        asyncio.run(_serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
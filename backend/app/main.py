@@ -1,5 +1,5 @@
 """FastAPI application entry point"""
-from fastapi import FastAPI, HTTPException, Request,status, Depends
+from fastapi import FastAPI, HTTPException, Request,status, Depends, BackgroundTasks
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from fastapi.openapi.docs import get_swagger_ui_html
 
@@ -7,7 +7,9 @@ from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 import secrets
-from .api import auth, tickers, analyses, websocket, datasets
+import asyncio
+import anyio
+from .api import auth, tickers, analyses, websocket, datasets, jobs
 from .api.stocks import router as stocks_router
 from .api.research import treasury as treasury_research
 from .api.research import fred_explorer as fred_research
@@ -41,7 +43,17 @@ from .api.research import bea_explorer as bea_research
 from .api.research import fred_calendar as fred_calendar_research
 from .api.research.market_indices import start_polling, get_market_status
 from .config import settings
-from .core.cache.client import get_redis_client, get_cache_stats
+from .database import data_async_engine
+from .core.cache.client import get_redis_client, get_cache_stats, delete_pattern_sync, close_async_redis_client
+from .core.cache.local import start_invalidation_listener, stop_invalidation_listener
+from .core.cache.warmup import warm_cache, warmup_sources, get_warmup_status
+from .core.static_files import CachedStaticFiles
+from .core.websocket_manager import manager as websocket_manager
+from .jobs.queue import close_job_redis
+from .jobs.worker import start_api_worker, stop_api_worker
+from .report_generation.bundle import BUNDLE_DIR, BUNDLE_URL_PATH, STATIC_DIR, publish_report_bundle
+from .report_generation.section_runner import shutdown_section_pool
+from .services.collector_loader_service import collector_loader_service
 
 import logging
 import sys
@@ -91,6 +103,7 @@ app.include_router(tickers.router)
 app.include_router(analyses.router)
 app.include_router(websocket.router)
 app.include_router(datasets.router)
+app.include_router(jobs.router)
 
 # Stocks module (Stock Screener)
 app.include_router(stocks_router)
@@ -137,6 +150,11 @@ app.include_router(bea_research.router)
 # FRED Calendar API
 app.include_router(fred_calendar_research.router)
 
+# Static files (report bundle; content-hashed files are cached for a year).
+# The bundle is published under DATA_DIR, so its mount comes first.
+app.mount(BUNDLE_URL_PATH, CachedStaticFiles(directory=BUNDLE_DIR, check_dir=False), name="report_bundle")
+app.mount("/static", CachedStaticFiles(directory=STATIC_DIR), name="static")
+
 def get_current_username(credentials: HTTPBasicCredentials = Depends(security)):
     """
     Compares the provided credentials with the secure ones.
@@ -181,6 +199,7 @@ def cache_health_check():
     stats = get_cache_stats()
     return {
         "cache": stats,
+        "collectors": collector_loader_service.get_cache_stats(),
         "config": {
             "enabled": settings.CACHE_ENABLED,
             "host": settings.REDIS_HOST,
@@ -199,26 +218,25 @@ def clear_data_cache(username: str = Depends(get_current_username)):
     prefix = settings.CACHE_PREFIX
     auth_prefix = f"{prefix}:auth:"
 
-    deleted = 0
-    for key in client.scan_iter(f"{prefix}:*"):
-        key_str = key if isinstance(key, str) else key.decode()
-        if not key_str.startswith(auth_prefix):
-            client.delete(key)
-            deleted += 1
+    deleted = delete_pattern_sync(f"{prefix}:*", exclude_prefix=auth_prefix)
 
     return {"deleted": deleted}
 
 
 @app.delete("/cache/webhook", tags=["Webhook"])
 def cache_webhook(
+    background_tasks: BackgroundTasks,
     source: str = None,
-    x_webhook_key: str = None
+    x_webhook_key: str = None,
+    warm: bool = True,
 ):
     """
     Webhook for DATA project to clear cache after data updates.
 
     - source: Optional, e.g. "bls", "fred", "treasury" to clear specific cache
     - x_webhook_key: Secret key (pass as query param or header)
+    - warm: Recompute the common entries for the source in the background
+      (progress at GET /cache/warmup)
     """
     # Check secret key
     if x_webhook_key != settings.CACHE_WEBHOOK_SECRET:
@@ -237,14 +255,19 @@ def cache_webhook(
     else:
         search_pattern = f"{prefix}:*"
 
-    deleted = 0
-    for key in client.scan_iter(search_pattern):
-        key_str = key if isinstance(key, str) else key.decode()
-        if not key_str.startswith(auth_prefix):
-            client.delete(key)
-            deleted += 1
+    deleted = delete_pattern_sync(search_pattern, exclude_prefix=auth_prefix)
+
+    warming = warmup_sources(source) if warm else []
+    if warming:
+        background_tasks.add_task(warm_cache, source)
+
+    return {"deleted": deleted, "source": source or "all", "warming": warming}
 
-    return {"deleted": deleted, "source": source or "all"}
+
+@app.get("/cache/warmup", tags=["Admin"])
+async def cache_warmup_status(username: str = Depends(get_current_username)):
+    """Last cache warm-up per source: duration, coverage and failures. Admin only."""
+    return await get_warmup_status()
 
 
 # Debug endpoint to verify WebSocket route is registered
@@ -288,16 +311,42 @@ async def generic_handler(request: Request, exc: Exception):
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup."""
+    # Sync endpoints run in anyio's threadpool. DATA database requests are
+    # limited on their own (database.data_db_slot), so the pool only changes
+    # size if configured.
+    thread_limiter = anyio.to_thread.current_default_thread_limiter()
+    if settings.THREADPOOL_MAX_WORKERS:
+        thread_limiter.total_tokens = settings.THREADPOOL_MAX_WORKERS
+    logger.info(f"Threadpool size: {thread_limiter.total_tokens}")
+
+    # Report CSS/JS, so pages rendered by any worker find them on this host
+    try:
+        bundle = await asyncio.to_thread(publish_report_bundle)
+        logger.info(f"Report bundle published: {sorted(bundle.values())}")
+    except Exception as e:
+        logger.error(f"Failed to publish the report bundle: {e}")
+
     # Initialize Redis cache connection
     try:
         redis = get_redis_client()
         if redis:
             logger.info("Redis cache connected successfully")
+            # Listen for L1 invalidations published by other workers
+            start_invalidation_listener()
         else:
             logger.warning("Redis cache not available - running without cache")
     except Exception as e:
         logger.warning(f"Redis cache initialization failed: {e}")
 
+    # Job queue: relay worker progress to this process's websockets, and run
+    # a worker here unless dedicated workers are deployed
+    try:
+        if await websocket_manager.start_relay():
+            logger.info("WebSocket updates relayed through Redis")
+        await start_api_worker()
+    except Exception as e:
+        logger.error(f"Failed to start job queue: {e}")
+
     # Start yfinance polling for real-time index prices
     try:
         market_status = get_market_status()
@@ -306,4 +355,17 @@ async def startup_event():
         await start_polling()
         logger.info("yfinance polling started for real-time index prices")
     except Exception as e:
-        logger.error(f"Failed to start yfinance polling: {e}")
\ No newline at end of file
+        logger.error(f"Failed to start yfinance polling: {e}")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Requeue running jobs, then release pooled DATA database and Redis connections and section workers."""
+    await stop_api_worker()
+    await websocket_manager.stop_relay()
+    await close_job_redis()
+    if data_async_engine is not None:
+        await data_async_engine.dispose()
+    shutdown_section_pool()
+    stop_invalidation_listener()
+    await close_async_redis_client()
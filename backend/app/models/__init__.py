@@ -4,5 +4,6 @@ from .analysis import Analysis
 from .section import Section
 from .dataset import Dataset, Dashboard, SavedQuery
 from .stocks import SavedScreen, ScreenRun
+from .job import Job
 
-__all__ = ["User", "Analysis", "Section", "Dataset", "Dashboard", "SavedQuery", "SavedScreen", "ScreenRun"]
\ No newline at end of file
+__all__ = ["User", "Analysis", "Section", "Dataset", "Dashboard", "SavedQuery", "SavedScreen", "ScreenRun", "Job"]
\ No newline at end of file
@@ -0,0 +1,35 @@
+"""Background job database model"""
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, Text, ForeignKey, JSON, Index
+from datetime import datetime
+import uuid
+
+from ..database import Base
+
+def generate_uuid():
+    return str(uuid.uuid4())
+
+class Job(Base):
+    __tablename__ = "jobs"
+    
+    job_id = Column(String, primary_key=True, default=generate_uuid)
+    user_id = Column(String, ForeignKey("users.user_id"), nullable=False)
+    job_type = Column(String, nullable=False)  # see app/jobs/tasks.py
+    resource_id = Column(String, nullable=True)  # analysis_id / dataset_id the job works on
+    args = Column(JSON, nullable=False, default=list)
+    lane = Column(String, default="interactive")  # interactive, batch
+    status = Column(String, default="queued")  # queued, running, retrying, succeeded, failed, cancelled
+    attempts = Column(Integer, default=0)
+    max_attempts = Column(Integer, default=3)
+    cancel_requested = Column(Boolean, default=False)
+    error = Column(Text, nullable=True)
+    worker = Column(String, nullable=True)  # host:pid of the worker running it
+    created_at = Column(DateTime, default=datetime.utcnow)
+    run_after = Column(DateTime, nullable=True)  # retry backoff
+    started_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_jobs_user_status", "user_id", "status"),
+        Index("ix_jobs_resource", "resource_id"),
+    )
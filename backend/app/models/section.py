@@ -22,6 +22,8 @@ class Section(Base):
     completed_at = Column(DateTime, nullable=True)
     processing_time_seconds = Column(Float, nullable=True)
     html_path = Column(String, nullable=True)
+    # Hash of the inputs the HTML was generated from (see report_generation/fingerprint.py)
+    input_fingerprint = Column(String(64), nullable=True)
     
     # Relationship
     analysis = relationship("Analysis", back_populates="sections")
\ No newline at end of file
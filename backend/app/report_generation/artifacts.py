@@ -0,0 +1,270 @@
+"""Per-analysis store of derived results shared between report sections.
+
+Sections that compute the same intermediate results (benchmark betas,
+regression models, ...) publish them here once and later sections or
+re-runs load them instead of recomputing:
+
+    data/analyses/<analysis_id>/artifacts/
+        beta_analysis.msgpack
+        beta_analysis.meta.json
+        ...
+
+Every key is declared in ARTIFACTS with its storage format, the section
+that produces it and a version to bump when the computation changes.
+Shared artifacts (producer None) are computed by whichever consuming
+section asks first.
+Sections list the keys they write and read in module-level PRODUCES and
+CONSUMES; the section runner schedules consumers after the producers.
+
+Formats:
+    frame  - DataFrame, stored as Parquet
+    dict   - plain data (dicts/lists/numbers/strings), stored as msgpack
+    object - anything else (e.g. fitted statsmodels results), pickled
+
+An artifact is only reused while the collector pickle it was derived from
+and the source of the module that computes it (the producing section, or
+the module listed in SHARED_ARTIFACT_MODULES) are unchanged. Writes are atomic (temp file + os.replace, metadata last),
+and every writer has its own temp files, so concurrent section workers
+putting the same shared artifact never read or publish a partial one.
+"""
+
+import ast
+import json
+import logging
+import os
+import pickle
+import uuid
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..services.file_service import file_service
+from .fingerprint import REPORT_DIR, SECTIONS_DIR, file_digest
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+# key -> (format, producing section or None if shared, version)
+ARTIFACTS: Dict[str, Tuple[str, Optional[int], int]] = {
+    # Section 9: macro signal discovery
+    "s9_correlation_analysis": ("object", 9, 2),
+    "s9_univariate_models": ("object", 9, 2),
+    "s9_multifactor_models": ("object", 9, 2),
+    "s9_model_diagnostics": ("dict", 9, 2),
+    # Section 16: rolling/up/down betas and correlations vs the S&P 500
+    "beta_analysis": ("dict", 16, 2),
+    # Indicator panel for all tickers (see indicators.py), used by 15-17
+    "technical_indicators": ("frame", None, 1),
+}
+
+# Shared artifact key -> module (in report_generation/) that computes it
+SHARED_ARTIFACT_MODULES: Dict[str, str] = {
+    "technical_indicators": "indicators.py",
+}
+
+_EXTENSIONS = {"frame": ".parquet", "dict": ".msgpack", "object": ".pkl"}
+
+
+def _tmp_path(path: Path) -> Path:
+    """A temp file next to `path` private to this writer."""
+    return path.with_name(f"{path.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp")
+
+
+def _msgpack_default(obj: Any) -> Any:
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Cannot serialize {type(obj).__name__}")
+
+
+def producer_digest(key: str) -> Optional[str]:
+    """sha256 of the source of the module computing an artifact, if known."""
+    _, producer, _ = ARTIFACTS[key]
+    if producer is not None:
+        path = SECTIONS_DIR / f"section_{producer:02d}.py"
+    elif key in SHARED_ARTIFACT_MODULES:
+        path = REPORT_DIR / SHARED_ARTIFACT_MODULES[key]
+    else:
+        return None
+    try:
+        return file_digest(path)
+    except OSError:
+        return None
+
+
+class ArtifactStore:
+    """Read-through store of one analysis's artifacts (memoized per instance)."""
+
+    def __init__(self, analysis_id: str):
+        self.analysis_id = analysis_id
+        self.root = file_service.get_artifacts_dir(analysis_id)
+        self._memo: Dict[str, Any] = {}
+        self._source_mtime: Optional[float] = None
+
+    def _source_signature(self) -> float:
+        if self._source_mtime is None:
+            pickle_path = file_service.get_collector_pickle_path(self.analysis_id)
+            self._source_mtime = pickle_path.stat().st_mtime if pickle_path.exists() else 0.0
+        return self._source_mtime
+
+    @staticmethod
+    def _spec(key: str) -> Tuple[str, Optional[int], int]:
+        if key not in ARTIFACTS:
+            raise KeyError(f"Unknown artifact '{key}'; declare it in ARTIFACTS")
+        return ARTIFACTS[key]
+
+    def _meta_path(self, key: str) -> Path:
+        return self.root / f"{key}.meta.json"
+
+    def _load_meta(self, key: str) -> Optional[dict]:
+        meta_path = self._meta_path(key)
+        if not meta_path.exists():
+            return None
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        _, _, version = self._spec(key)
+        if meta.get("version") != version:
+            return None
+        if abs(meta.get("source_mtime", -1) - self._source_signature()) > 1:
+            return None
+        if meta.get("code_digest") != producer_digest(key):
+            return None
+        return meta
+
+    def has(self, key: str) -> bool:
+        return key in self._memo or self._load_meta(key) is not None
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a stored artifact, or None if missing or stale."""
+        if key in self._memo:
+            return self._memo[key]
+
+        meta = self._load_meta(key)
+        if meta is None:
+            return None
+
+        path = self.root / meta["file"]
+        try:
+            fmt = meta["format"]
+            if fmt == "frame":
+                value = pd.read_parquet(path)
+            elif fmt == "dict":
+                with open(path, "rb") as f:
+                    value = msgpack.unpackb(f.read(), raw=False, strict_map_key=False)
+            else:
+                with open(path, "rb") as f:
+                    value = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Unreadable artifact {self.analysis_id}/{key}, recomputing: {e}")
+            return None
+
+        self._memo[key] = value
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Persist an artifact. Falls back to pickle if the declared format can't hold it."""
+        fmt, producer, version = self._spec(key)
+        self._memo[key] = value
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        payload: Optional[bytes] = None
+        if fmt == "dict" and msgpack is not None:
+            try:
+                payload = msgpack.packb(value, default=_msgpack_default, use_bin_type=True)
+            except (TypeError, ValueError, OverflowError):
+                payload = None
+            if payload is None:
+                fmt = "object"
+        elif fmt == "dict":
+            fmt = "object"
+
+        path = self.root / f"{key}{_EXTENSIONS[fmt]}"
+        tmp_path = _tmp_path(path)
+        meta_tmp = _tmp_path(self._meta_path(key))
+        try:
+            if fmt == "frame":
+                value.to_parquet(tmp_path, compression="zstd")
+            elif fmt == "dict":
+                with open(tmp_path, "wb") as f:
+                    f.write(payload)
+            else:
+                with open(tmp_path, "wb") as f:
+                    pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+
+            meta = {
+                "key": key,
+                "format": fmt,
+                "file": path.name,
+                "version": version,
+                "producer": producer,
+                "code_digest": producer_digest(key),
+                "source_mtime": self._source_signature(),
+                "created_at": datetime.utcnow().isoformat(),
+            }
+            with open(meta_tmp, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(meta_tmp, self._meta_path(key))
+        except Exception as e:
+            # The in-memory copy still serves this run
+            logger.warning(f"Could not persist artifact {self.analysis_id}/{key}: {e}")
+            tmp_path.unlink(missing_ok=True)
+            meta_tmp.unlink(missing_ok=True)
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        """Load an artifact, computing and persisting it on a miss."""
+        value = self.get(key)
+        if value is not None:
+            return value
+        value = compute()
+        if value is not None:
+            self.put(key, value)
+        return value
+
+
+# ----------------------------------------------------------------------------
+# Section declarations
+# ----------------------------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def section_declarations(section_number: int) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    (PRODUCES, CONSUMES) declared by a section module.
+
+    Read from the module source rather than by importing it, so the
+    scheduler doesn't pull every section's dependencies into the API process.
+    """
+    module_file = Path(__file__).parent / "sections" / f"section_{section_number:02d}.py"
+    if not module_file.exists():
+        return (), ()
+
+    declared: Dict[str, Tuple[str, ...]] = {"PRODUCES": (), "CONSUMES": ()}
+    tree = ast.parse(module_file.read_text(encoding="utf-8"))
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target = node.targets[0]
+            if isinstance(target, ast.Name) and target.id in declared:
+                declared[target.id] = tuple(ast.literal_eval(node.value))
+    return declared["PRODUCES"], declared["CONSUMES"]
+
+
+def artifact_dependencies(section_number: int) -> List[int]:
+    """Sections producing the artifacts a section consumes."""
+    _, consumes = section_declarations(section_number)
+    producers = {ARTIFACTS[key][1] for key in consumes if key in ARTIFACTS}
+    producers.discard(section_number)
+    producers.discard(None)
+    return sorted(producers)
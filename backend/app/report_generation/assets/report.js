@@ -0,0 +1,187 @@
+/* ============================================================
+   JAVASCRIPT FUNCTIONALITY
+   Theme Toggle, Scroll Animations, Lazy Charts, Initialization
+============================================================ */
+
+// Theme Toggle Functionality
+function toggleTheme() {
+    const body = document.body;
+    const icon = document.getElementById('theme-icon');
+    const text = document.getElementById('theme-text');
+
+    body.classList.toggle('dark-theme');
+
+    if (body.classList.contains('dark-theme')) {
+        icon.textContent = '☀️';
+        text.textContent = 'Light Mode';
+        localStorage.setItem('theme', 'dark');
+    } else {
+        icon.textContent = '🌙';
+        text.textContent = 'Dark Mode';
+        localStorage.setItem('theme', 'light');
+    }
+}
+
+// Load saved theme preference
+window.addEventListener('DOMContentLoaded', function() {
+    const savedTheme = localStorage.getItem('theme');
+    if (savedTheme === 'dark') {
+        document.body.classList.add('dark-theme');
+        document.getElementById('theme-icon').textContent = '☀️';
+        document.getElementById('theme-text').textContent = 'Light Mode';
+    }
+
+    // Initialize scroll animations
+    initializeScrollAnimations();
+
+    // Load chart data kept in sidecar files as charts come into view
+    initializeLazyCharts();
+
+    // Initialize DataTables if present
+    if (typeof $ !== 'undefined' && $.fn.DataTable) {
+        $('.data-table').DataTable({
+            pageLength: 10,
+            lengthMenu: [[10, 25, 50, -1], [10, 25, 50, "All"]],
+            order: [],
+            language: {
+                search: "Search:",
+                lengthMenu: "Show _MENU_ entries",
+                info: "Showing _START_ to _END_ of _TOTAL_ entries",
+                paginate: {
+                    first: "First",
+                    last: "Last",
+                    next: "Next",
+                    previous: "Previous"
+                }
+            }
+        });
+    }
+});
+
+// Scroll Animations with Intersection Observer
+function initializeScrollAnimations() {
+    const observerOptions = {
+        threshold: 0.1,
+        rootMargin: '0px 0px -50px 0px'
+    };
+
+    const observer = new IntersectionObserver(function(entries) {
+        entries.forEach(entry => {
+            if (entry.isIntersecting) {
+                entry.target.style.opacity = '1';
+                entry.target.style.transform = 'translateY(0)';
+                entry.target.classList.add('visible');
+            }
+        });
+    }, observerOptions);
+
+    // Observe all animatable elements
+    document.querySelectorAll('.stat-card, .info-box, .plotly-chart, .data-table').forEach(el => {
+        el.style.opacity = '0';
+        el.style.transform = 'translateY(20px)';
+        el.style.transition = 'all 0.6s ease';
+        observer.observe(el);
+    });
+}
+
+// Lazy Charts: large figures are written to sidecar JSON files
+// (data-chart-src) and fetched only when they scroll into view
+function initializeLazyCharts() {
+    const charts = document.querySelectorAll('[data-chart-src]');
+    if (!charts.length) {
+        return;
+    }
+
+    // Sections render in a srcdoc iframe, which shares the app's origin
+    // and therefore its login token
+    const token = localStorage.getItem('token');
+    const headers = token ? { 'Authorization': 'Bearer ' + token } : {};
+
+    function renderChart(el) {
+        if (el.dataset.chartLoaded) {
+            return;
+        }
+        el.dataset.chartLoaded = '1';
+        fetch(el.dataset.chartSrc, { headers: headers })
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error('HTTP ' + response.status);
+                }
+                return response.json();
+            })
+            .then(fig => Plotly.newPlot(el, fig.data, fig.layout, { responsive: true }))
+            .catch(error => {
+                console.warn('Chart ' + el.id + ' could not be loaded:', error);
+                el.innerHTML = '<p class="chart-error">Chart could not be loaded.</p>';
+            });
+    }
+
+    if (!('IntersectionObserver' in window)) {
+        charts.forEach(renderChart);
+        return;
+    }
+
+    const observer = new IntersectionObserver(function(entries) {
+        entries.forEach(entry => {
+            if (entry.isIntersecting) {
+                observer.unobserve(entry.target);
+                renderChart(entry.target);
+            }
+        });
+    }, { rootMargin: '300px 0px' });
+
+    charts.forEach(el => observer.observe(el));
+}
+
+// Smooth scroll to top function
+function scrollToTop() {
+    window.scrollTo({
+        top: 0,
+        behavior: 'smooth'
+    });
+}
+
+// Add scroll-to-top button if page is long
+window.addEventListener('scroll', function() {
+    const scrollTop = window.pageYOffset || document.documentElement.scrollTop;
+
+    // Create scroll-to-top button if it doesn't exist
+    let scrollBtn = document.getElementById('scroll-to-top');
+    if (!scrollBtn && scrollTop > 300) {
+        scrollBtn = document.createElement('div');
+        scrollBtn.id = 'scroll-to-top';
+        scrollBtn.innerHTML = '↑';
+        scrollBtn.style.cssText = `
+            position: fixed;
+            bottom: 30px;
+            right: 30px;
+            width: 50px;
+            height: 50px;
+            background: linear-gradient(135deg, var(--primary-gradient-start), var(--primary-gradient-end));
+            color: white;
+            border-radius: 50%;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            font-size: 1.5rem;
+            font-weight: bold;
+            cursor: pointer;
+            box-shadow: var(--shadow-md);
+            transition: var(--transition-smooth);
+            z-index: 999;
+        `;
+        scrollBtn.onclick = scrollToTop;
+        document.body.appendChild(scrollBtn);
+    }
+
+    // Show/hide scroll button
+    if (scrollBtn) {
+        if (scrollTop > 300) {
+            scrollBtn.style.opacity = '1';
+            scrollBtn.style.transform = 'scale(1)';
+        } else {
+            scrollBtn.style.opacity = '0';
+            scrollBtn.style.transform = 'scale(0.8)';
+        }
+    }
+});
@@ -0,0 +1,220 @@
+"""Benchmark-relative return statistics for every ticker in one pass.
+
+Section 16 (and Section 1 through the beta artifact) needs rolling betas,
+correlations, up/down-market betas and drawdowns of each company against
+the S&P 500. Rather than aligning each company with the benchmark and
+calling pandas rolling cov/var per company and window, the daily returns
+are laid out as a T x N matrix and every statistic is derived from
+cumulative sums of x, y, xy, x^2 and y^2:
+
+    sum over a window [t-w+1, t] = cumsum[t] - cumsum[t-w]
+
+Each column is first "bottom-aligned": its valid observations (company and
+benchmark both present) are moved to the last rows in order, so a window
+of w rows is exactly the company's last w aligned observations, matching
+pd.DataFrame({'company': ..., 'market': ...}).dropna().rolling(w).
+
+    returns, market = build_return_panel(daily_prices, sp500_daily, companies)
+    relative = relative_metrics(returns, market)
+    relative["Apple"]["rolling"][252]["beta"]["current"]
+"""
+
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+
+BETA_WINDOWS = (60, 120, 252)
+
+# Up/down-market betas need more than this many observations
+MIN_REGIME_OBSERVATIONS = 20
+
+# Drawdown is considered recovered once back within 1% of the prior peak
+RECOVERY_THRESHOLD = -0.01
+
+
+def _daily_returns(prices: pd.DataFrame) -> pd.Series:
+    close = prices.set_index("date")["close"].sort_index()
+    close = close[~close.index.duplicated(keep="last")]
+    return close.pct_change().dropna()
+
+
+def build_return_panel(daily_prices: pd.DataFrame, benchmark_daily: pd.DataFrame,
+                       companies: Dict[str, str]) -> Tuple[pd.DataFrame, pd.Series]:
+    """
+    Daily returns of every company plus the benchmark.
+
+    Returns:
+        (returns, market): returns is date x company name (outer-joined,
+        NaN where a company has no price), market the benchmark's returns
+    """
+    market = _daily_returns(benchmark_daily) if not benchmark_daily.empty else pd.Series(dtype=float)
+
+    columns = {}
+    if not daily_prices.empty and "Symbol" in daily_prices.columns:
+        by_symbol = {symbol: group for symbol, group in daily_prices.groupby("Symbol", sort=False)}
+        for company_name, ticker in companies.items():
+            prices = by_symbol.get(ticker)
+            if prices is not None and len(prices) > 1:
+                columns[company_name] = _daily_returns(prices)
+
+    returns = pd.DataFrame(columns).sort_index() if columns else pd.DataFrame()
+    return returns, market
+
+
+def _bottom_align(mask: np.ndarray, *arrays: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Move each column's masked-in rows to the bottom (order kept); others become 0."""
+    order = np.argsort(mask, axis=0, kind="stable")
+    valid = np.take_along_axis(mask, order, axis=0)
+    aligned = tuple(np.where(valid, np.take_along_axis(a, order, axis=0), 0.0) for a in arrays)
+    return (order, valid) + aligned
+
+
+def _window_sums(a: np.ndarray, window: int) -> np.ndarray:
+    """Trailing window sums for every row >= window-1 (row i -> window ending at i+window-1)."""
+    c = np.cumsum(a, axis=0)
+    c = np.vstack([np.zeros((1, a.shape[1])), c])
+    return c[window:] - c[:-window]
+
+
+def _beta(n, sx, sy, sxy, sxx) -> np.ndarray:
+    return (n * sxy - sx * sy) / (n * sxx - sx * sx)
+
+
+def _correlation(n, sx, sy, sxy, sxx, syy) -> np.ndarray:
+    return (n * sxy - sx * sy) / np.sqrt((n * sxx - sx * sx) * (n * syy - sy * sy))
+
+
+def _conditional_beta(x: np.ndarray, y: np.ndarray, mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Full-sample beta over the masked rows of each column, and the row counts."""
+    n = mask.sum(axis=0)
+    xm = np.where(mask, x, 0.0)
+    ym = np.where(mask, y, 0.0)
+    sx, sy = xm.sum(axis=0), ym.sum(axis=0)
+    sxy, sxx = (xm * ym).sum(axis=0), (xm * xm).sum(axis=0)
+    var_num = n * sxx - sx * sx
+    beta = np.where(var_num > 0, (n * sxy - sx * sy) / np.where(var_num > 0, var_num, 1.0), 1.0)
+    return beta, n
+
+
+def relative_metrics(returns: pd.DataFrame, market: pd.Series,
+                     windows: Iterable[int] = BETA_WINDOWS) -> Dict[str, Dict]:
+    """
+    Benchmark-relative statistics for every company column.
+
+    Returns:
+        {company: {
+            'observations': aligned company/benchmark observations,
+            'returns': the company's own daily returns,
+            'rolling': {window: {'beta': {current, mean, std, min, max},
+                                 'correlation': latest window correlation}},
+            'correlation_full', 'up_beta', 'down_beta',
+            'downside_capture_ratio', 'tracking_error',
+            'max_drawdown', 'drawdown_start', 'recovery_date'
+        }}
+        'rolling' only has windows the company has enough observations for.
+    """
+    if returns.empty or market.empty:
+        return {}
+
+    names = list(returns.columns)
+    y_raw = returns.to_numpy(dtype=float)
+    x_raw = np.broadcast_to(market.reindex(returns.index).to_numpy(dtype=float)[:, None], y_raw.shape)
+    pair = ~np.isnan(y_raw) & ~np.isnan(x_raw)
+    n = pair.sum(axis=0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Center each column: co-moments are shift invariant and the
+        # cumulative sums stay well-conditioned
+        x_mean = np.where(pair, x_raw, 0.0).sum(axis=0) / np.maximum(n, 1)
+        y_mean = np.where(pair, y_raw, 0.0).sum(axis=0) / np.maximum(n, 1)
+        x_c = x_raw - x_mean
+        y_c = y_raw - y_mean
+
+        _, valid, x, y = _bottom_align(pair, x_c, y_c)
+        xy, xx, yy = x * y, x * x, y * y
+        total = len(returns)
+
+        rolling: Dict[int, Dict[str, pd.DataFrame]] = {}
+        for window in windows:
+            if window > total:
+                continue
+            count = _window_sums(valid.astype(float), window)
+            sx, sy = _window_sums(x, window), _window_sums(y, window)
+            sxy, sxx, syy = _window_sums(xy, window), _window_sums(xx, window), _window_sums(yy, window)
+            full = count == window
+            rolling[window] = {
+                "beta": pd.DataFrame(np.where(full, _beta(window, sx, sy, sxy, sxx), np.nan), columns=names),
+                "correlation": pd.DataFrame(
+                    np.where(full, _correlation(window, sx, sy, sxy, sxx, syy), np.nan), columns=names
+                ),
+            }
+
+        sx, sy = x.sum(axis=0), y.sum(axis=0)
+        correlation_full = _correlation(n, sx, sy, xy.sum(axis=0), xx.sum(axis=0), yy.sum(axis=0))
+
+        up_beta, n_up = _conditional_beta(x_c, y_c, pair & (x_raw > 0))
+        down_beta, n_down = _conditional_beta(x_c, y_c, pair & (x_raw < 0))
+        up_beta = np.where(n_up > MIN_REGIME_OBSERVATIONS, up_beta, 1.0)
+        down_beta = np.where(n_down > MIN_REGIME_OBSERVATIONS, down_beta, 1.0)
+
+        tracking_error = pd.DataFrame(np.where(pair, y_raw - x_raw, np.nan)).std().to_numpy() * np.sqrt(252)
+
+        # Drawdowns of each company's own return series
+        own = ~np.isnan(y_raw)
+        order, own_valid, growth = _bottom_align(own, 1.0 + np.nan_to_num(y_raw))
+        wealth = np.where(own_valid, np.cumprod(np.where(own_valid, growth, 1.0), axis=0), np.nan)
+        peak = np.fmax.accumulate(wealth, axis=0)
+        drawdown = (wealth - peak) / peak
+
+    beta_stats = {
+        window: panels["beta"].agg(["mean", "std", "min", "max"])
+        for window, panels in rolling.items()
+    }
+
+    metrics = {}
+    for j, name in enumerate(names):
+        if not own[:, j].any():
+            continue
+
+        company_rolling = {}
+        for window, panels in rolling.items():
+            if n[j] < window:
+                continue
+            summary = beta_stats[window][name]
+            company_rolling[window] = {
+                "beta": {
+                    "current": panels["beta"][name].iloc[-1],
+                    "mean": summary["mean"],
+                    "std": summary["std"],
+                    "min": summary["min"],
+                    "max": summary["max"],
+                },
+                "correlation": panels["correlation"][name].iloc[-1],
+            }
+
+        column_drawdown = drawdown[:, j]
+        max_drawdown = np.nanmin(column_drawdown)
+        drawdown_start = recovery_date = None
+        if max_drawdown < 0:
+            trough = int(np.nanargmin(column_drawdown))
+            drawdown_start = returns.index[order[trough, j]]
+            after = np.flatnonzero(column_drawdown[trough + 1:] > RECOVERY_THRESHOLD)
+            if after.size:
+                recovery_date = returns.index[order[trough + 1 + after[0], j]]
+
+        metrics[name] = {
+            "observations": int(n[j]),
+            "returns": returns[name].dropna(),
+            "rolling": company_rolling,
+            "correlation_full": correlation_full[j],
+            "up_beta": up_beta[j],
+            "down_beta": down_beta[j],
+            "downside_capture_ratio": down_beta[j] / up_beta[j] if up_beta[j] != 0 else 1.0,
+            "tracking_error": tracking_error[j] if n[j] > 0 else 0,
+            "max_drawdown": max_drawdown,
+            "drawdown_start": drawdown_start,
+            "recovery_date": recovery_date,
+        }
+
+    return metrics
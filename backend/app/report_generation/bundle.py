@@ -0,0 +1,108 @@
+"""Shared, content-hashed static bundle for report sections.
+
+Every section page used to inline the full report stylesheet and script.
+They now live in report_generation/assets/ and are published once per
+content version to a directory under DATA_DIR, which the API and the job
+workers share and which outlives deploys:
+
+    <DATA_DIR>/report_bundle/
+        report.<hash>.css
+        report.<hash>.js
+
+The hash changes whenever an asset changes, so the files are served with
+long-lived immutable cache headers (see core/static_files.py) and a new
+report picks up new styling without any cache busting. Published versions
+are never removed: a section page keeps the hash it was rendered with.
+The API publishes the current version at startup, so whichever process
+renders a report, the host serving it has the files.
+
+Section pages are displayed in a srcdoc iframe on the frontend origin, so
+asset URLs are absolute, rooted at settings.API_PUBLIC_URL; the URL is part
+of every section fingerprint, so changing it regenerates the pages. The
+published files are build output and not tracked in git.
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import uuid
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+ASSETS_DIR = Path(__file__).parent / "assets"
+STATIC_DIR = Path(__file__).resolve().parents[2] / "static"
+BUNDLE_DIR = Path(settings.DATA_DIR) / "report_bundle"
+BUNDLE_URL_PATH = "/static/report"
+# Where earlier versions published the bundle (inside the code tree)
+LEGACY_BUNDLE_DIR = STATIC_DIR / "report"
+
+# asset kind -> source file in ASSETS_DIR
+BUNDLE_ASSETS = {
+    "css": "report.css",
+    "js": "report.js",
+}
+
+HASH_LENGTH = 12
+
+
+def _publish(source: Path) -> str:
+    """Write a source asset under its content-hashed name; returns that name."""
+    content = source.read_bytes()
+    digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+    name = f"{source.stem}.{digest}{source.suffix}"
+    target = BUNDLE_DIR / name
+
+    if not target.exists():
+        BUNDLE_DIR.mkdir(parents=True, exist_ok=True)
+        # Several section workers may publish at once; each writes its own
+        # temp file and the rename is atomic
+        tmp_path = target.with_name(f"{name}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, target)
+        except OSError as e:
+            logger.warning(f"Could not publish report asset {name}: {e}")
+            if tmp_path.exists():
+                tmp_path.unlink()
+    return name
+
+
+def _adopt_legacy_bundle() -> None:
+    """Copy versions published in the code tree, which older reports still link to."""
+    if not LEGACY_BUNDLE_DIR.is_dir():
+        return
+    for source in LEGACY_BUNDLE_DIR.glob("report.*.*"):
+        target = BUNDLE_DIR / source.name
+        if source.suffix in (".css", ".js") and not target.exists():
+            try:
+                BUNDLE_DIR.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(source, target)
+            except OSError as e:
+                logger.warning(f"Could not adopt report asset {source.name}: {e}")
+
+
+def publish_report_bundle() -> Dict[str, str]:
+    """Publish the current bundle and any legacy versions (API startup)."""
+    _adopt_legacy_bundle()
+    return report_bundle()
+
+
+@lru_cache(maxsize=1)
+def report_bundle() -> Dict[str, str]:
+    """
+    Publish the report bundle (once per process) and return its URLs.
+
+    Returns:
+        Dict of asset kind ('css', 'js') -> absolute URL
+    """
+    base_url = settings.API_PUBLIC_URL.rstrip("/") + BUNDLE_URL_PATH
+    return {
+        kind: f"{base_url}/{_publish(ASSETS_DIR / filename)}"
+        for kind, filename in BUNDLE_ASSETS.items()
+    }
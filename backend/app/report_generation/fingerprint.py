@@ -0,0 +1,198 @@
+"""Input fingerprints of report sections.
+
+A section's HTML is a function of the collector data it reads, the code
+that renders it and the sections it builds on. Its fingerprint hashes all
+three:
+
+- the content of every collector table the section accesses
+  (collector.get_prices_daily(), collector.companies, ...), found by
+  scanning the section source;
+- the section module plus the shared rendering code (html_utils, the
+  artifact modules, the report bundle assets). A process keeps running
+  the section source it imported until the module is reloaded, so the
+  runner passes the digest of that source where it knows it;
+- the fingerprints of the sections it depends on;
+- settings.API_PUBLIC_URL, which the bundle and chart URLs in the HTML
+  are rooted at.
+
+The runner stores the fingerprint with each generated section and skips
+sections whose fingerprint hasn't changed on the next run.
+"""
+
+import ast
+import hashlib
+import json
+import logging
+import pickle
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional
+
+import pandas as pd
+
+from ..config import settings
+from ..services.file_service import file_service
+
+logger = logging.getLogger(__name__)
+
+REPORT_DIR = Path(__file__).parent
+SECTIONS_DIR = REPORT_DIR / "sections"
+
+# Bump to invalidate every stored fingerprint (e.g. after changing how they are computed)
+FINGERPRINT_VERSION = 1
+
+# Modules in report_generation/ that don't affect rendered output
+NON_RENDERING_MODULES = {"__init__.py", "section_runner.py", "compression.py", "fingerprint.py"}
+
+# collector attribute used by sections -> how to read it without side effects.
+# get_economic() may fetch from FRED when the table is missing, so the cached
+# table is read directly.
+COLLECTOR_INPUTS: Dict[str, Callable[[Any], Any]] = {
+    "companies": lambda c: c.companies,
+    "years": lambda c: c.years,
+    "get_all_financial_data": lambda c: c.get_all_financial_data(),
+    "get_economic": lambda c: c.raw_tables.get("Economic_Annual"),
+    "get_prices_daily": lambda c: c.get_prices_daily(),
+    "get_prices_monthly": lambda c: c.get_prices_monthly(),
+    "get_profiles": lambda c: c.get_profiles(),
+    "get_enterprise_values": lambda c: c.get_enterprise_values(),
+    "get_analyst_estimates": lambda c: c.get_analyst_estimates(),
+    "get_institutional_ownership": lambda c: c.get_institutional_ownership(),
+    "get_insider_trading_latest": lambda c: c.get_insider_trading_latest(),
+    "get_insider_statistics": lambda c: c.get_insider_statistics(),
+}
+
+# Collector settings that don't change what a section renders
+IGNORED_ATTRIBUTES = {"sleep_sec"}
+
+
+@lru_cache(maxsize=64)
+def _parse_inputs(path: str, mtime_ns: int) -> FrozenSet[str]:
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"))
+    return frozenset(
+        node.attr for node in ast.walk(tree)
+        if isinstance(node, ast.Attribute)
+        and isinstance(node.value, ast.Name) and node.value.id == "collector"
+        and node.attr not in IGNORED_ATTRIBUTES
+    )
+
+
+def section_inputs(section_number: int) -> FrozenSet[str]:
+    """Collector attributes a section reads (collector.<name>), from its source."""
+    module_file = SECTIONS_DIR / f"section_{section_number:02d}.py"
+    if not module_file.exists():
+        return frozenset()
+    return _parse_inputs(str(module_file), module_file.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=256)
+def _cached_file_digest(path: str, mtime_ns: int, size: int) -> str:
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def file_digest(path: Path) -> str:
+    """sha256 of a file's current content (re-read only when it changes)."""
+    stat = path.stat()
+    return _cached_file_digest(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _shared_code_files() -> List[Path]:
+    files = [p for p in REPORT_DIR.glob("*.py") if p.name not in NON_RENDERING_MODULES]
+    files += list((REPORT_DIR / "assets").glob("*"))
+    return sorted(files)
+
+
+def code_version(section_number: int, module_digest: Optional[str] = None) -> str:
+    """
+    Hash of the section module and the shared rendering code.
+
+    `module_digest` is the digest of the section source the rendering
+    process imported (section_runner.loaded_section_digest); without it
+    the file on disk is hashed.
+    """
+    digest = hashlib.sha256(str(FINGERPRINT_VERSION).encode())
+    # Asset and chart URLs are absolute (see bundle.py)
+    digest.update(settings.API_PUBLIC_URL.rstrip("/").encode())
+    module_file = SECTIONS_DIR / f"section_{section_number:02d}.py"
+    for path in [module_file] + _shared_code_files():
+        if path == module_file and module_digest is not None:
+            digest.update(path.name.encode())
+            digest.update(module_digest.encode())
+        elif path.exists():
+            digest.update(path.name.encode())
+            digest.update(file_digest(path).encode())
+    return digest.hexdigest()
+
+
+def _hash_value(value: Any, digest: "hashlib._Hash") -> None:
+    """Feed a collector value into a digest, hashing DataFrames by content."""
+    if isinstance(value, pd.DataFrame):
+        digest.update(repr((list(value.columns), [str(t) for t in value.dtypes])).encode())
+        try:
+            digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+        except TypeError:
+            # Unhashable cells (lists, dicts); fall back to the pickled frame
+            digest.update(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    elif isinstance(value, (tuple, list)) and any(isinstance(v, pd.DataFrame) for v in value):
+        for item in value:
+            _hash_value(item, digest)
+    else:
+        digest.update(json.dumps(value, sort_keys=True, default=str).encode())
+
+
+class SectionFingerprints:
+    """
+    Fingerprints of one analysis's sections.
+
+    Each collector table is hashed at most once, however many sections read it.
+    """
+
+    def __init__(self, analysis_id: str, collector, dependencies: Callable[[int], Iterable[int]]):
+        self.analysis_id = analysis_id
+        self.collector = collector
+        self.dependencies = dependencies
+        self._inputs: Dict[str, str] = {}
+        self._fingerprints: Dict[int, str] = {}
+
+    def _input_digest(self, name: str) -> str:
+        if name not in self._inputs:
+            digest = hashlib.sha256(name.encode())
+            reader = COLLECTOR_INPUTS.get(name)
+            try:
+                if reader is None:
+                    # Unknown accessor: fall back to the collector file itself,
+                    # so any change to the collected data counts
+                    stat = file_service.get_collector_pickle_path(self.analysis_id).stat()
+                    digest.update(f"{stat.st_mtime_ns}:{stat.st_size}".encode())
+                else:
+                    _hash_value(reader(self.collector), digest)
+            except Exception as e:
+                # An input we can't hash must never match a stored fingerprint
+                logger.warning(f"Could not fingerprint collector input '{name}': {e}")
+                digest.update(repr(e).encode() + str(id(self)).encode())
+            self._inputs[name] = digest.hexdigest()
+        return self._inputs[name]
+
+    def get(self, section_number: int, module_digest: Optional[str] = None,
+            _visiting: FrozenSet[int] = frozenset()) -> str:
+        """
+        Fingerprint of a section (memoized). `module_digest` is the section
+        source the renderer ran, if known (see code_version).
+        """
+        if section_number in self._fingerprints and module_digest is None:
+            return self._fingerprints[section_number]
+
+        digest = hashlib.sha256(f"section:{section_number}".encode())
+        digest.update(code_version(section_number, module_digest).encode())
+        for name in sorted(section_inputs(section_number)):
+            digest.update(f"{name}:{self._input_digest(name)}".encode())
+
+        visiting = _visiting | {section_number}
+        for dependency in sorted(self.dependencies(section_number)):
+            if dependency not in visiting:
+                digest.update(f"dep:{dependency}:{self.get(dependency, _visiting=visiting)}".encode())
+
+        if module_digest is not None:
+            return digest.hexdigest()
+        self._fingerprints[section_number] = digest.hexdigest()
+        return self._fingerprints[section_number]
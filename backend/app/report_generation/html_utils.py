@@ -4,8 +4,19 @@ Provides sophisticated UI components with glassmorphism, animations, and profess
 """
 
 import pandas as pd
+import numpy as np
 import json
-from typing import List, Dict, Optional, Any, Union
+import hashlib
+import math
+import os
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Optional, Any, Union, Iterable, Iterator, Tuple
+
+from .bundle import report_bundle
 
 
 # =============================================================================
@@ -24,6 +35,9 @@ def generate_section_wrapper(section_number: int, section_title: str, content: s
     - Custom scrollbar
     - Responsive design
     
+    The styles and scripts live in the shared, content-hashed report
+    bundle (see bundle.py), so sections only link to them.
+    
     Args:
         section_number: Section number (0-19)
         section_title: Title of the section
@@ -33,6 +47,8 @@ def generate_section_wrapper(section_number: int, section_title: str, content: s
         Complete HTML document string
     """
     
+    bundle = report_bundle()
+    
     html = f"""<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -46,685 +62,8 @@ def generate_section_wrapper(section_number: int, section_title: str, content: s
     <script src="https://cdn.datatables.net/1.13.6/js/jquery.dataTables.min.js"></script>
     <link rel="stylesheet" href="https://cdn.datatables.net/1.13.6/css/jquery.dataTables.min.css">
     
-    <style>
-        /* ============================================================
-           ENHANCED SOPHISTICATED STYLING
-           Features: Glassmorphism, Gradients, Animations, Dark Mode
-        ============================================================ */
-        
-        /* === BASE RESET === */
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        
-        /* === ROOT VARIABLES FOR THEMING === */
-        :root {{
-            /* Light Theme Colors */
-            --bg-gradient-start: #f8fafc;
-            --bg-gradient-mid: #e2e8f0;
-            --bg-gradient-end: #cbd5e1;
-            
-            --primary-gradient-start: #667eea;
-            --primary-gradient-end: #764ba2;
-            
-            --card-bg: rgba(255, 255, 255, 0.95);
-            --card-border: rgba(255, 255, 255, 0.2);
-            --text-primary: #1e293b;
-            --text-secondary: #64748b;
-            --text-tertiary: #94a3b8;
-            
-            --success-color: #10b981;
-            --warning-color: #f59e0b;
-            --danger-color: #ef4444;
-            --info-color: #3b82f6;
-            
-            --shadow-sm: 0 10px 30px rgba(0, 0, 0, 0.1);
-            --shadow-md: 0 15px 40px rgba(0, 0, 0, 0.15);
-            --shadow-lg: 0 20px 60px rgba(0, 0, 0, 0.3);
-            --shadow-colored: 0 25px 60px rgba(102, 126, 234, 0.3);
-            
-            --transition-smooth: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-            --transition-fast: all 0.3s ease;
-        }}
-        
-        /* === DARK THEME VARIABLES === */
-        body.dark-theme {{
-            --bg-gradient-start: #1a1a2e;
-            --bg-gradient-mid: #16213e;
-            --bg-gradient-end: #0f3460;
-            
-            --card-bg: rgba(30, 41, 59, 0.9);
-            --card-border: rgba(255, 255, 255, 0.1);
-            --text-primary: #e2e8f0;
-            --text-secondary: #cbd5e1;
-            --text-tertiary: #94a3b8;
-            
-            --shadow-sm: 0 10px 30px rgba(0, 0, 0, 0.5);
-            --shadow-md: 0 15px 40px rgba(0, 0, 0, 0.6);
-            --shadow-lg: 0 20px 60px rgba(0, 0, 0, 0.8);
-        }}
-        
-        /* === BODY BASE STYLES === */
-        html {{
-            scroll-behavior: smooth;
-        }}
-        
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            background: linear-gradient(135deg, 
-                var(--bg-gradient-start) 0%, 
-                var(--bg-gradient-mid) 50%, 
-                var(--bg-gradient-end) 100%);
-            background-attachment: fixed;
-            color: var(--text-primary);
-            line-height: 1.6;
-            overflow-x: hidden;
-            transition: var(--transition-fast);
-            min-height: 100vh;
-        }}
-        
-        /* === CUSTOM SCROLLBAR === */
-        ::-webkit-scrollbar {{
-            width: 12px;
-            height: 12px;
-        }}
-        
-        ::-webkit-scrollbar-track {{
-            background: rgba(0, 0, 0, 0.1);
-        }}
-        
-        ::-webkit-scrollbar-thumb {{
-            background: linear-gradient(180deg, var(--primary-gradient-start), var(--primary-gradient-end));
-            border-radius: 6px;
-            transition: var(--transition-fast);
-        }}
-        
-        ::-webkit-scrollbar-thumb:hover {{
-            background: linear-gradient(180deg, var(--primary-gradient-end), var(--bg-gradient-end));
-        }}
-        
-        /* === THEME TOGGLE BUTTON === */
-        .theme-toggle {{
-            position: fixed;
-            top: 30px;
-            right: 30px;
-            z-index: 1000;
-            background: var(--card-bg);
-            backdrop-filter: blur(20px) saturate(180%);
-            border-radius: 50px;
-            padding: 12px 24px;
-            box-shadow: var(--shadow-md);
-            border: 1px solid var(--card-border);
-            cursor: pointer;
-            transition: var(--transition-smooth);
-            display: flex;
-            align-items: center;
-            gap: 10px;
-            font-weight: 600;
-            color: var(--text-primary);
-        }}
-        
-        .theme-toggle:hover {{
-            transform: scale(1.05);
-            box-shadow: var(--shadow-colored);
-        }}
-        
-        .theme-toggle:active {{
-            transform: scale(0.98);
-        }}
-        
-        /* === REPORT CONTAINER === */
-        .report-container {{
-            max-width: 1400px;
-            margin: 40px auto;
-            padding: 0 20px 80px 20px;
-        }}
-        
-        /* === SECTION WRAPPER WITH GLASSMORPHISM === */
-        .section {{
-            background: var(--card-bg);
-            backdrop-filter: blur(20px) saturate(180%);
-            border-radius: 24px;
-            padding: 50px;
-            margin: 30px 0;
-            box-shadow: var(--shadow-lg), 0 0 0 1px rgba(255, 255, 255, 0.1);
-            border: 1px solid var(--card-border);
-            position: relative;
-            overflow: hidden;
-            animation: slideIn 0.6s cubic-bezier(0.4, 0, 0.2, 1);
-        }}
-        
-        /* Animated gradient top border */
-        .section::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            height: 4px;
-            background: linear-gradient(90deg, 
-                var(--primary-gradient-start), 
-                var(--primary-gradient-end), 
-                var(--bg-gradient-end), 
-                var(--primary-gradient-start));
-            background-size: 200% 100%;
-            animation: shimmer 3s linear infinite;
-        }}
-        
-        @keyframes shimmer {{
-            0% {{ background-position: 0% 0%; }}
-            100% {{ background-position: 200% 0%; }}
-        }}
-        
-        @keyframes slideIn {{
-            from {{
-                opacity: 0;
-                transform: translateY(30px);
-            }}
-            to {{
-                opacity: 1;
-                transform: translateY(0);
-            }}
-        }}
-        
-        /* === SECTION HEADER === */
-        .section-header {{
-            text-align: center;
-            margin-bottom: 50px;
-            position: relative;
-        }}
-        
-        .section-title {{
-            font-size: 3rem;
-            font-weight: 900;
-            background: linear-gradient(135deg, 
-                var(--primary-gradient-start) 0%, 
-                var(--primary-gradient-end) 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            margin-bottom: 15px;
-            letter-spacing: -1px;
-            line-height: 1.2;
-        }}
-        
-        .section-subtitle {{
-            font-size: 1.2rem;
-            color: var(--text-secondary);
-            font-weight: 500;
-            letter-spacing: 0.5px;
-        }}
-        
-        /* === STAT CARDS WITH 3D EFFECTS === */
-        .stat-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-            gap: 25px;
-            margin: 35px 0;
-        }}
-        
-        .stat-card {{
-            background: linear-gradient(135deg, 
-                var(--card-bg) 0%, 
-                var(--card-bg) 100%);
-            backdrop-filter: blur(10px);
-            border-radius: 20px;
-            padding: 30px;
-            text-align: center;
-            border: 1px solid var(--card-border);
-            box-shadow: var(--shadow-md), 0 5px 15px rgba(0, 0, 0, 0.1);
-            transition: var(--transition-smooth);
-            position: relative;
-            overflow: hidden;
-        }}
-        
-        /* Gradient overlay on hover */
-        .stat-card::before {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(135deg, 
-                transparent 0%, 
-                rgba(102, 126, 234, 0.1) 100%);
-            opacity: 0;
-            transition: opacity 0.4s ease;
-        }}
-        
-        .stat-card:hover {{
-            transform: translateY(-10px) scale(1.02);
-            box-shadow: var(--shadow-colored), 0 10px 30px rgba(0, 0, 0, 0.2);
-        }}
-        
-        .stat-card:hover::before {{
-            opacity: 1;
-        }}
-        
-        /* Color variants with left border accent */
-        .stat-card.success {{
-            border-left: 5px solid var(--success-color);
-        }}
-        
-        .stat-card.warning {{
-            border-left: 5px solid var(--warning-color);
-        }}
-        
-        .stat-card.danger {{
-            border-left: 5px solid var(--danger-color);
-        }}
-        
-        .stat-card.info {{
-            border-left: 5px solid var(--info-color);
-        }}
-        
-        .stat-card.default {{
-            border-left: 5px solid var(--primary-gradient-start);
-        }}
-        
-        .stat-value {{
-            font-size: 2.5rem;
-            font-weight: 900;
-            background: linear-gradient(135deg, 
-                var(--primary-gradient-start) 0%, 
-                var(--primary-gradient-end) 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            margin-bottom: 12px;
-            line-height: 1.2;
-        }}
-        
-        .stat-label {{
-            font-size: 0.95rem;
-            color: var(--text-secondary);
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            margin-bottom: 8px;
-        }}
-        
-        .stat-description {{
-            font-size: 0.85rem;
-            color: var(--text-tertiary);
-            font-weight: 500;
-            line-height: 1.4;
-        }}
-        
-        /* === INFO BOXES WITH GRADIENT BORDERS === */
-        .info-box {{
-            background: var(--card-bg);
-            backdrop-filter: blur(10px);
-            border-radius: 16px;
-            padding: 30px;
-            margin: 25px 0;
-            border: 1px solid var(--card-border);
-            box-shadow: var(--shadow-sm);
-            position: relative;
-            overflow: hidden;
-            transition: var(--transition-fast);
-        }}
-        
-        /* Left gradient accent bar */
-        .info-box::before {{
-            content: '';
-            position: absolute;
-            left: 0;
-            top: 0;
-            bottom: 0;
-            width: 5px;
-            background: linear-gradient(180deg, 
-                var(--primary-gradient-start), 
-                var(--primary-gradient-end));
-        }}
-        
-        .info-box:hover {{
-            transform: translateX(5px);
-            box-shadow: 0 15px 40px rgba(102, 126, 234, 0.2);
-        }}
-        
-        .info-box.success::before {{
-            background: linear-gradient(180deg, #10b981, #059669);
-        }}
-        
-        .info-box.warning::before {{
-            background: linear-gradient(180deg, #f59e0b, #d97706);
-        }}
-        
-        .info-box.danger::before {{
-            background: linear-gradient(180deg, #ef4444, #dc2626);
-        }}
-        
-        .info-box.info::before {{
-            background: linear-gradient(180deg, #3b82f6, #2563eb);
-        }}
-        
-        .info-box h3,
-        .info-box h4 {{
-            color: var(--text-primary);
-            margin-bottom: 15px;
-            font-weight: 700;
-        }}
-        
-        .info-box p,
-        .info-box ul,
-        .info-box ol {{
-            color: var(--text-secondary);
-            line-height: 1.8;
-        }}
-        
-        .info-box ul,
-        .info-box ol {{
-            padding-left: 25px;
-            margin: 10px 0;
-        }}
-        
-        .info-box li {{
-            margin: 8px 0;
-        }}
-        
-        .info-box strong {{
-            color: var(--text-primary);
-            font-weight: 600;
-        }}
-        
-        /* === SECTION DIVIDER === */
-        .section-divider {{
-            height: 2px;
-            background: linear-gradient(90deg, 
-                transparent, 
-                var(--primary-gradient-start), 
-                var(--primary-gradient-end), 
-                transparent);
-            margin: 50px 0;
-            border: none;
-            opacity: 0.5;
-        }}
-        
-        /* === ENHANCED DATA TABLES === */
-        .data-table {{
-            width: 100%;
-            border-collapse: separate;
-            border-spacing: 0;
-            margin: 25px 0;
-            border-radius: 12px;
-            overflow: hidden;
-            box-shadow: var(--shadow-sm);
-            background: var(--card-bg);
-        }}
-        
-        .data-table thead {{
-            background: linear-gradient(135deg, 
-                var(--primary-gradient-start) 0%, 
-                var(--primary-gradient-end) 100%);
-        }}
-        
-        .data-table th {{
-            padding: 18px 15px;
-            text-align: left;
-            font-weight: 700;
-            color: white;
-            font-size: 0.9rem;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            border: none;
-        }}
-        
-        .data-table td {{
-            padding: 15px;
-            color: var(--text-primary);
-            border-bottom: 1px solid rgba(0, 0, 0, 0.05);
-        }}
-        
-        body.dark-theme .data-table td {{
-            border-bottom: 1px solid rgba(255, 255, 255, 0.05);
-        }}
-        
-        .data-table tbody tr {{
-            transition: var(--transition-fast);
-        }}
-        
-        .data-table tbody tr:hover {{
-            background: linear-gradient(90deg, 
-                rgba(102, 126, 234, 0.1), 
-                transparent);
-            transform: scale(1.005);
-        }}
-        
-        /* DataTables integration styling */
-        .dataTables_wrapper {{
-            padding: 20px;
-            background: var(--card-bg);
-            border-radius: 12px;
-            margin: 25px 0;
-            box-shadow: var(--shadow-sm);
-        }}
-        
-        .dataTables_filter input,
-        .dataTables_length select {{
-            background: var(--card-bg);
-            border: 1px solid var(--card-border);
-            color: var(--text-primary);
-            padding: 8px 12px;
-            border-radius: 8px;
-            transition: var(--transition-fast);
-        }}
-        
-        .dataTables_filter input:focus,
-        .dataTables_length select:focus {{
-            outline: none;
-            border-color: var(--primary-gradient-start);
-            box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-        }}
-        
-        /* === PLOTLY CHART CONTAINERS === */
-        .plotly-chart {{
-            margin: 30px 0;
-            padding: 25px;
-            background: var(--card-bg);
-            backdrop-filter: blur(10px);
-            border-radius: 16px;
-            box-shadow: var(--shadow-sm);
-            border: 1px solid var(--card-border);
-            transition: var(--transition-fast);
-        }}
-        
-        .plotly-chart:hover {{
-            box-shadow: var(--shadow-md);
-        }}
-        
-        /* === INFO SECTION === */
-        .info-section {{
-            margin: 40px 0;
-        }}
-        
-        .info-section h3 {{
-            font-size: 1.8rem;
-            font-weight: 700;
-            background: linear-gradient(135deg, 
-                var(--primary-gradient-start) 0%, 
-                var(--primary-gradient-end) 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            margin-bottom: 25px;
-            padding-bottom: 15px;
-            border-bottom: 2px solid rgba(102, 126, 234, 0.2);
-        }}
-        
-        .info-section h4 {{
-            font-size: 1.4rem;
-            font-weight: 600;
-            color: var(--text-primary);
-            margin: 30px 0 20px 0;
-        }}
-        
-        /* === COMPLETENESS BAR === */
-        .completeness-bar {{
-            width: 100%;
-            height: 30px;
-            background: rgba(0, 0, 0, 0.1);
-            border-radius: 15px;
-            overflow: hidden;
-            position: relative;
-            margin: 15px 0;
-            box-shadow: inset 0 2px 5px rgba(0, 0, 0, 0.1);
-        }}
-        
-        .completeness-fill {{
-            height: 100%;
-            background: linear-gradient(90deg, 
-                var(--primary-gradient-start), 
-                var(--primary-gradient-end));
-            border-radius: 15px;
-            transition: width 1s ease-out;
-            position: relative;
-            overflow: hidden;
-        }}
-        
-        .completeness-fill::after {{
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: linear-gradient(90deg, 
-                transparent, 
-                rgba(255, 255, 255, 0.3), 
-                transparent);
-            animation: shimmer 2s linear infinite;
-        }}
-        
-        .completeness-text {{
-            position: absolute;
-            top: 50%;
-            left: 50%;
-            transform: translate(-50%, -50%);
-            font-weight: 700;
-            font-size: 0.85rem;
-            color: white;
-            text-shadow: 0 1px 2px rgba(0, 0, 0, 0.3);
-        }}
-        
-        /* === RESPONSIVE DESIGN === */
-        @media (max-width: 1024px) {{
-            .section {{
-                padding: 40px 30px;
-            }}
-            
-            .section-title {{
-                font-size: 2.5rem;
-            }}
-        }}
-        
-        @media (max-width: 768px) {{
-            .report-container {{
-                padding: 0 15px 60px 15px;
-            }}
-            
-            .section {{
-                padding: 30px 20px;
-                border-radius: 16px;
-                margin: 20px 0;
-            }}
-            
-            .section-title {{
-                font-size: 2rem;
-            }}
-            
-            .section-subtitle {{
-                font-size: 1rem;
-            }}
-            
-            .stat-grid {{
-                grid-template-columns: 1fr;
-                gap: 15px;
-            }}
-            
-            .stat-card {{
-                padding: 25px;
-            }}
-            
-            .stat-value {{
-                font-size: 2rem;
-            }}
-            
-            .theme-toggle {{
-                top: 15px;
-                right: 15px;
-                padding: 10px 20px;
-                font-size: 0.9rem;
-            }}
-            
-            .data-table {{
-                font-size: 0.85rem;
-            }}
-            
-            .data-table th,
-            .data-table td {{
-                padding: 12px 10px;
-            }}
-        }}
-        
-        @media (max-width: 480px) {{
-            .section {{
-                padding: 25px 15px;
-            }}
-            
-            .section-title {{
-                font-size: 1.75rem;
-            }}
-            
-            .stat-value {{
-                font-size: 1.75rem;
-            }}
-            
-            .info-box {{
-                padding: 20px;
-            }}
-        }}
-        
-        /* === UTILITY CLASSES === */
-        .text-center {{
-            text-align: center;
-        }}
-        
-        .text-left {{
-            text-align: left;
-        }}
-        
-        .text-right {{
-            text-align: right;
-        }}
-        
-        .mb-0 {{ margin-bottom: 0; }}
-        .mb-1 {{ margin-bottom: 10px; }}
-        .mb-2 {{ margin-bottom: 20px; }}
-        .mb-3 {{ margin-bottom: 30px; }}
-        .mb-4 {{ margin-bottom: 40px; }}
-        
-        .mt-0 {{ margin-top: 0; }}
-        .mt-1 {{ margin-top: 10px; }}
-        .mt-2 {{ margin-top: 20px; }}
-        .mt-3 {{ margin-top: 30px; }}
-        .mt-4 {{ margin-top: 40px; }}
-        
-        /* === FADE-IN ANIMATION === */
-        .fade-in {{
-            opacity: 0;
-            transform: translateY(20px);
-            transition: opacity 0.6s ease, transform 0.6s ease;
-        }}
-        
-        .fade-in.visible {{
-            opacity: 1;
-            transform: translateY(0);
-        }}
-    </style>
+    <!-- Report Styles (shared bundle) -->
+    <link rel="stylesheet" href="{bundle['css']}">
 </head>
 <body>
     <!-- Theme Toggle Button -->
@@ -745,149 +84,50 @@ def generate_section_wrapper(section_number: int, section_title: str, content: s
         </div>
     </div>
     
-    <script>
-        /* ============================================================
-           JAVASCRIPT FUNCTIONALITY
-           Theme Toggle, Scroll Animations, Initialization
-        ============================================================ */
-        
-        // Theme Toggle Functionality
-        function toggleTheme() {{
-            const body = document.body;
-            const icon = document.getElementById('theme-icon');
-            const text = document.getElementById('theme-text');
-            
-            body.classList.toggle('dark-theme');
-            
-            if (body.classList.contains('dark-theme')) {{
-                icon.textContent = '☀️';
-                text.textContent = 'Light Mode';
-                localStorage.setItem('theme', 'dark');
-            }} else {{
-                icon.textContent = '🌙';
-                text.textContent = 'Dark Mode';
-                localStorage.setItem('theme', 'light');
-            }}
-        }}
-        
-        // Load saved theme preference
-        window.addEventListener('DOMContentLoaded', function() {{
-            const savedTheme = localStorage.getItem('theme');
-            if (savedTheme === 'dark') {{
-                document.body.classList.add('dark-theme');
-                document.getElementById('theme-icon').textContent = '☀️';
-                document.getElementById('theme-text').textContent = 'Light Mode';
-            }}
-            
-            // Initialize scroll animations
-            initializeScrollAnimations();
-            
-            // Initialize DataTables if present
-            if (typeof $ !== 'undefined' && $.fn.DataTable) {{
-                $('.data-table').DataTable({{
-                    pageLength: 10,
-                    lengthMenu: [[10, 25, 50, -1], [10, 25, 50, "All"]],
-                    order: [],
-                    language: {{
-                        search: "Search:",
-                        lengthMenu: "Show _MENU_ entries",
-                        info: "Showing _START_ to _END_ of _TOTAL_ entries",
-                        paginate: {{
-                            first: "First",
-                            last: "Last",
-                            next: "Next",
-                            previous: "Previous"
-                        }}
-                    }}
-                }});
-            }}
-        }});
-        
-        // Scroll Animations with Intersection Observer
-        function initializeScrollAnimations() {{
-            const observerOptions = {{
-                threshold: 0.1,
-                rootMargin: '0px 0px -50px 0px'
-            }};
-            
-            const observer = new IntersectionObserver(function(entries) {{
-                entries.forEach(entry => {{
-                    if (entry.isIntersecting) {{
-                        entry.target.style.opacity = '1';
-                        entry.target.style.transform = 'translateY(0)';
-                        entry.target.classList.add('visible');
-                    }}
-                }});
-            }}, observerOptions);
-            
-            // Observe all animatable elements
-            document.querySelectorAll('.stat-card, .info-box, .plotly-chart, .data-table').forEach(el => {{
-                el.style.opacity = '0';
-                el.style.transform = 'translateY(20px)';
-                el.style.transition = 'all 0.6s ease';
-                observer.observe(el);
-            }});
-        }}
-        
-        // Smooth scroll to top function
-        function scrollToTop() {{
-            window.scrollTo({{
-                top: 0,
-                behavior: 'smooth'
-            }});
-        }}
-        
-        // Add scroll-to-top button if page is long
-        window.addEventListener('scroll', function() {{
-            const scrollTop = window.pageYOffset || document.documentElement.scrollTop;
-            
-            // Create scroll-to-top button if it doesn't exist
-            let scrollBtn = document.getElementById('scroll-to-top');
-            if (!scrollBtn && scrollTop > 300) {{
-                scrollBtn = document.createElement('div');
-                scrollBtn.id = 'scroll-to-top';
-                scrollBtn.innerHTML = '↑';
-                scrollBtn.style.cssText = `
-                    position: fixed;
-                    bottom: 30px;
-                    right: 30px;
-                    width: 50px;
-                    height: 50px;
-                    background: linear-gradient(135deg, var(--primary-gradient-start), var(--primary-gradient-end));
-                    color: white;
-                    border-radius: 50%;
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    font-size: 1.5rem;
-                    font-weight: bold;
-                    cursor: pointer;
-                    box-shadow: var(--shadow-md);
-                    transition: var(--transition-smooth);
-                    z-index: 999;
-                `;
-                scrollBtn.onclick = scrollToTop;
-                document.body.appendChild(scrollBtn);
-            }}
-            
-            // Show/hide scroll button
-            if (scrollBtn) {{
-                if (scrollTop > 300) {{
-                    scrollBtn.style.opacity = '1';
-                    scrollBtn.style.transform = 'scale(1)';
-                }} else {{
-                    scrollBtn.style.opacity = '0';
-                    scrollBtn.style.transform = 'scale(0.8)';
-                }}
-            }}
-        }});
-    </script>
+    <script src="{bundle['js']}"></script>
 </body>
 </html>"""
     
     return html
 
 
+_CONTENT_MARKER = "\x00SECTION_CONTENT\x00"
+
+
+@lru_cache(maxsize=64)
+def section_document_parts(section_number: int, section_title: str) -> Tuple[str, str]:
+    """
+    The section document split around its content: (head, tail).
+    
+    Rendered once per section and reused, so streaming a section only
+    writes the cached head and tail (library tags, links to the shared
+    report bundle and the page chrome) around its chunks.
+    """
+    head, tail = generate_section_wrapper(section_number, section_title, _CONTENT_MARKER).split(_CONTENT_MARKER)
+    return head, tail
+
+
+def stream_section_wrapper(section_number: int, section_title: str, chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Streaming counterpart of generate_section_wrapper.
+    
+    Yields the document head, each content chunk as it is produced, then
+    the tail. Sections can return this from generate() so the runner
+    writes them to disk chunk by chunk instead of holding the whole page.
+    
+    Args:
+        section_number: Section number (0-19)
+        section_title: Title of the section
+        chunks: HTML fragments of the section body, in order
+    """
+    head, tail = section_document_parts(section_number, section_title)
+    yield head
+    for chunk in chunks:
+        if chunk:
+            yield chunk
+    yield tail
+
+
 # =============================================================================
 # STAT CARD COMPONENTS
 # =============================================================================
@@ -998,68 +238,7 @@ def build_section_divider() -> str:
 # DATA TABLE COMPONENT
 # =============================================================================
 
-def build_data_table(
-    df: pd.DataFrame,
-    table_id: str = "data-table",
-    sortable: bool = True,
-    searchable: bool = True,
-    page_length: int = 10
-) -> str:
-    """
-    Build an enhanced data table from DataFrame.
-    
-    Args:
-        df: Pandas DataFrame
-        table_id: Unique ID for the table
-        sortable: Enable DataTables sorting
-        searchable: Enable DataTables search
-        page_length: Initial page length (-1 for all)
-    
-    Returns:
-        HTML string for data table
-    """
-    
-    if df.empty:
-        return '<div class="info-box warning"><p>No data available for this table.</p></div>'
-    
-    # Generate table HTML
-    table_class = "data-table"
-    if sortable:
-        table_class += " sortable"
-    
-    table_html = f'<table id="{table_id}" class="{table_class}">'
-    
-    # Table header
-    table_html += "<thead><tr>"
-    for col in df.columns:
-        table_html += f"<th>{col}</th>"
-    table_html += "</tr></thead>"
-    
-    # Table body
-    table_html += "<tbody>"
-    for _, row in df.iterrows():
-        table_html += "<tr>"
-        for val in row:
-            # Handle different data types
-            if pd.isna(val):
-                display_val = "—"
-            elif isinstance(val, (int, float)):
-                if isinstance(val, float):
-                    display_val = f"{val:.2f}" if abs(val) < 1000 else f"{val:,.2f}"
-                else:
-                    display_val = f"{val:,}"
-            else:
-                display_val = str(val)
-            
-            table_html += f"<td>{display_val}</td>"
-        table_html += "</tr>"
-    table_html += "</tbody>"
-    
-    table_html += "</table>"
-    
-    # Add DataTables initialization if sortable
-    if sortable:
-        table_html += f"""
+_DATATABLE_SCRIPT = """
         <script>
             (function() {{
                 // Wait for DOM and jQuery to be ready
@@ -1080,7 +259,7 @@ def build_data_table(
                         pageLength: {page_length},
                         lengthMenu: [[10, 25, 50, -1], [10, 25, 50, "All"]],
                         order: [],
-                        searching: {'true' if searchable else 'false'},
+                        searching: {searching},
                         language: {{
                             search: "Search:",
                             lengthMenu: "Show _MENU_ entries",
@@ -1099,14 +278,198 @@ def build_data_table(
             }})();
         </script>
         """
+
+_EMPTY_TABLE_HTML = '<div class="info-box warning"><p>No data available for this table.</p></div>'
+
+# Rows per chunk when streaming a table body
+TABLE_CHUNK_ROWS = 500
+
+
+def _format_cell(val: Any) -> str:
+    """Display value of one table cell (object values)"""
+    if isinstance(val, (list, dict, tuple)):
+        return str(val)
+    if pd.isna(val):
+        return "—"
+    if isinstance(val, float):
+        return f"{val:.2f}" if abs(val) < 1000 else f"{val:,.2f}"
+    if isinstance(val, int):
+        # bools included, as 1/0
+        return f"{val:,}"
+    return str(val)
+
+
+def _format_values(values: np.ndarray) -> np.ndarray:
+    """Format one column of a block's values, by dtype rather than per cell"""
+    kind = values.dtype.kind
+    if kind == "f":
+        large = np.abs(values) >= 1000
+        formatted = np.char.mod("%.2f", values).astype(object)
+        formatted[large] = [f"{v:,.2f}" for v in values[large].tolist()]
+        formatted[np.isnan(values)] = "—"
+        return formatted
+    if kind in "iu":
+        return np.array([f"{v:,}" for v in values.tolist()], dtype=object)
+    if kind == "b":
+        return np.where(values, "1", "0").astype(object)
+    formatted = np.empty(len(values), dtype=object)
+    formatted[:] = [_format_cell(v) for v in values]
+    return formatted
+
+
+def _format_block(block: pd.DataFrame) -> List[np.ndarray]:
+    """
+    Formatted columns of a block of table rows.
     
-    return table_html
+    Values are taken from the block as one array, as DataFrame.iterrows()
+    does, so numbers render as they always have: ints in a frame that also
+    has float columns show as floats, and in mixed frames (strings,
+    nullable ints, ...) cells are formatted by their Python type.
+    """
+    values = block.to_numpy()
+    if values.dtype.kind in "mM":
+        # Timestamps/Timedeltas rather than raw datetime64 values
+        values = block.astype(object).to_numpy()
+    return [_format_values(values[:, k]) for k in range(values.shape[1])]
+
+
+def iter_data_table(
+    df: pd.DataFrame,
+    table_id: str = "data-table",
+    sortable: bool = True,
+    searchable: bool = True,
+    page_length: int = 10,
+    chunk_rows: int = TABLE_CHUNK_ROWS
+) -> Iterator[str]:
+    """
+    Render a data table as a sequence of HTML chunks.
+    
+    Columns are formatted once each and rows are joined in blocks of
+    chunk_rows, so large tables stream with bounded memory.
+    
+    Args:
+        df: Pandas DataFrame
+        table_id: Unique ID for the table
+        sortable: Enable DataTables sorting
+        searchable: Enable DataTables search
+        page_length: Initial page length (-1 for all)
+        chunk_rows: Table rows per yielded chunk
+    """
+    
+    if df.empty:
+        yield _EMPTY_TABLE_HTML
+        return
+    
+    table_class = "data-table sortable" if sortable else "data-table"
+    header = "".join(f"<th>{col}</th>" for col in df.columns)
+    yield f'<table id="{table_id}" class="{table_class}"><thead><tr>{header}</tr></thead><tbody>'
+    
+    for start in range(0, len(df), chunk_rows):
+        columns = _format_block(df.iloc[start:start + chunk_rows])
+        yield "".join(
+            "<tr><td>" + "</td><td>".join(cells) + "</td></tr>"
+            for cells in zip(*columns)
+        )
+    
+    yield "</tbody></table>"
+    
+    # Add DataTables initialization if sortable
+    if sortable:
+        yield _DATATABLE_SCRIPT.format(
+            table_id=table_id,
+            page_length=page_length,
+            searching='true' if searchable else 'false'
+        )
+
+
+def build_data_table(
+    df: pd.DataFrame,
+    table_id: str = "data-table",
+    sortable: bool = True,
+    searchable: bool = True,
+    page_length: int = 10
+) -> str:
+    """
+    Build an enhanced data table from DataFrame.
+    
+    Args:
+        df: Pandas DataFrame
+        table_id: Unique ID for the table
+        sortable: Enable DataTables sorting
+        searchable: Enable DataTables search
+        page_length: Initial page length (-1 for all)
+    
+    Returns:
+        HTML string for data table
+    """
+    return "".join(iter_data_table(df, table_id, sortable, searchable, page_length))
 
 
 # =============================================================================
 # PLOTLY CHART COMPONENT
 # =============================================================================
 
+# Figures whose JSON is larger than this go to sidecar files (while a
+# sidecar directory is active) and are fetched when scrolled into view
+CHART_INLINE_MAX_BYTES = 16 * 1024
+
+# (directory, URL prefix) for chart sidecars of the section being rendered
+_chart_sidecars: ContextVar[Optional[Tuple[Path, str]]] = ContextVar("chart_sidecars", default=None)
+
+
+@contextmanager
+def chart_sidecars(directory: Path, url_prefix: str):
+    """
+    Write large chart payloads rendered inside the block to sidecar files.
+    
+    Files are named by content hash, so identical figures are stored once
+    and a file never changes once written.
+    
+    Args:
+        directory: Where to write the JSON files
+        url_prefix: URL the files are served under
+    """
+    token = _chart_sidecars.set((Path(directory), url_prefix.rstrip("/")))
+    try:
+        yield
+    finally:
+        _chart_sidecars.reset(token)
+
+
+def _finite(obj: Any) -> Any:
+    """Replace NaN/inf with None so the figure is valid JSON (Plotly draws gaps)"""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(v) for v in obj]
+    return obj
+
+
+def _write_chart_sidecar(fig_data: Dict[str, Any]) -> Optional[str]:
+    """Store a figure as a sidecar file; returns its URL, or None to inline it"""
+    sidecars = _chart_sidecars.get()
+    if sidecars is None:
+        return None
+    directory, url_prefix = sidecars
+    
+    payload = json.dumps(_finite(fig_data), separators=(",", ":"), allow_nan=False).encode("utf-8")
+    name = hashlib.sha256(payload).hexdigest()[:16] + ".json"
+    path = directory / name
+    if not path.exists():
+        tmp_path = path.with_name(f"{name}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, path)
+        except OSError:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            return None
+    return f"{url_prefix}/{name}"
+
+
 def build_plotly_chart(
     fig_data: Dict[str, Any],
     div_id: str = "plotly-chart",
@@ -1115,6 +478,9 @@ def build_plotly_chart(
     """
     Build a Plotly chart with enhanced container.
     
+    Large figures are written to a sidecar file when chart_sidecars() is
+    active and loaded lazily; everything else is embedded inline.
+    
     Args:
         fig_data: Plotly figure data dictionary with 'data' and 'layout' keys
         div_id: Unique ID for the chart div
@@ -1143,13 +509,25 @@ def build_plotly_chart(
             fig_data['layout'][key] = value
     
     # Convert to JSON
-    fig_json = json.dumps(fig_data)
+    fig_json = json.dumps(fig_data, separators=(",", ":"))
+    
+    if len(fig_json) > CHART_INLINE_MAX_BYTES:
+        chart_url = _write_chart_sidecar(fig_data)
+        if chart_url:
+            return f"""
+    <div class="plotly-chart">
+        <div id="{div_id}" data-chart-src="{chart_url}" style="width:100%; height:{height}px;"></div>
+    </div>
+    """
     
     return f"""
     <div class="plotly-chart">
         <div id="{div_id}" style="width:100%; height:{height}px;"></div>
         <script>
-            Plotly.newPlot('{div_id}', {fig_json}.data, {fig_json}.layout, {{responsive: true}});
+            (function() {{
+                const fig = {fig_json};
+                Plotly.newPlot('{div_id}', fig.data, fig.layout, {{responsive: true}});
+            }})();
         </script>
     </div>
     """
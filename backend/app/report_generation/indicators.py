@@ -0,0 +1,156 @@
+"""Technical indicators for every ticker of an analysis, computed in one pass.
+
+Sections 15, 16 and 17 all need RSI, MACD, moving averages and volatility
+for each company. Instead of recomputing them per company on filtered
+copies of the price frame, each indicator is computed once for all
+symbols on the long frame with grouped (per-symbol) rolling/EWM operations.
+
+The result is a long frame (one row per symbol and date, OHLCV plus the
+indicator columns) stored as the "technical_indicators" artifact, so every
+section of an analysis reads the same precomputed values:
+
+    frame = get_indicators(artifacts, prices_df)
+    by_symbol = indicators_by_symbol(frame)
+    aapl = by_symbol.get("AAPL")    # sorted by date
+"""
+
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+from .artifacts import ArtifactStore
+
+ARTIFACT_KEY = "technical_indicators"
+
+PRICE_COLUMNS = ["close", "high", "low", "volume"]
+
+INDICATOR_COLUMNS = [
+    "sma_20", "sma_50", "sma_200",
+    "rsi_14",
+    "macd", "macd_signal", "macd_hist",
+    "bb_upper", "bb_lower",
+    "atr_14", "adx_14",
+    "roc_20", "roc_60",
+    "volatility_20", "volatility_60",
+    "volume_sma_20", "volume_ratio",
+]
+
+ANNUALIZATION = np.sqrt(252)
+
+
+def _rolling(values: pd.Series, symbols: pd.Series, window: int, how: str = "mean") -> pd.Series:
+    """Per-symbol rolling aggregate over each symbol's own rows."""
+    rolled = getattr(values.groupby(symbols, sort=False).rolling(window=window), how)()
+    return rolled.droplevel(0).reindex(values.index)
+
+
+def _ewm(values: pd.Series, symbols: pd.Series, span: int) -> pd.Series:
+    return values.groupby(symbols, sort=False).ewm(span=span, adjust=False).mean().droplevel(0).reindex(values.index)
+
+
+def _rsi(close: pd.Series, symbols: pd.Series, period: int) -> pd.Series:
+    delta = close.groupby(symbols, sort=False).diff()
+    gains = delta.where(delta > 0, 0)
+    losses = -delta.where(delta < 0, 0)
+    rs = _rolling(gains, symbols, period) / _rolling(losses, symbols, period)
+    return (100 - (100 / (1 + rs))).where(close.notna())
+
+
+def _atr(high: pd.Series, low: pd.Series, close: pd.Series, symbols: pd.Series, period: int) -> pd.Series:
+    prev_close = close.groupby(symbols, sort=False).shift()
+    true_range = np.fmax(np.fmax(high - low, (high - prev_close).abs()), (low - prev_close).abs())
+    return _rolling(true_range, symbols, period)
+
+
+def _adx(high: pd.Series, low: pd.Series, atr: pd.Series, symbols: pd.Series, period: int) -> pd.Series:
+    up_move = high.groupby(symbols, sort=False).diff()
+    down_move = -low.groupby(symbols, sort=False).diff()
+    dm_plus = up_move.where((up_move > down_move) & (up_move > 0), 0)
+    dm_minus = down_move.where((down_move > up_move) & (down_move > 0), 0)
+
+    di_plus = _rolling(dm_plus, symbols, period) / atr * 100
+    di_minus = _rolling(dm_minus, symbols, period) / atr * 100
+    dx = (di_plus - di_minus).abs() / (di_plus + di_minus) * 100
+    return _rolling(dx, symbols, period)
+
+
+def compute_indicators(prices_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compute all indicators for all symbols in a daily price frame.
+
+    Every window runs over each symbol's own trading days, so tickers
+    with different calendars don't leave gaps in each other's lookbacks.
+
+    Args:
+        prices_df: Daily prices with 'date', 'Symbol' and 'close'
+                   ('high', 'low', 'volume' used when present)
+
+    Returns:
+        Long frame sorted by Symbol and date with the price columns
+        and INDICATOR_COLUMNS (NaN where the lookback isn't filled yet)
+    """
+    columns = ["date", "Symbol"] + PRICE_COLUMNS + INDICATOR_COLUMNS
+    if prices_df is None or prices_df.empty or not {"date", "Symbol", "close"} <= set(prices_df.columns):
+        return pd.DataFrame(columns=columns)
+
+    present = [c for c in PRICE_COLUMNS if c in prices_df.columns]
+    result = prices_df[["date", "Symbol"] + present].copy()
+    result["date"] = pd.to_datetime(result["date"], errors="coerce")
+    result = (
+        result.dropna(subset=["date", "Symbol"])
+        .drop_duplicates(["Symbol", "date"], keep="last")
+        .sort_values(["Symbol", "date"])
+        .reset_index(drop=True)
+    )
+    for column in PRICE_COLUMNS:
+        if column not in result.columns:
+            result[column] = result["close"] if column in ("high", "low") else np.nan
+        result[column] = pd.to_numeric(result[column], errors="coerce")
+
+    symbols = result["Symbol"]
+    close, high, low, volume = result["close"], result["high"], result["low"], result["volume"]
+    prev_close = close.groupby(symbols, sort=False).shift()
+    returns = close / prev_close - 1
+
+    for window in (20, 50, 200):
+        result[f"sma_{window}"] = _rolling(close, symbols, window)
+
+    result["rsi_14"] = _rsi(close, symbols, 14)
+
+    ema_12 = _ewm(close, symbols, 12)
+    ema_26 = _ewm(close, symbols, 26)
+    result["macd"] = ema_12 - ema_26
+    result["macd_signal"] = _ewm(result["macd"], symbols, 9)
+    result["macd_hist"] = result["macd"] - result["macd_signal"]
+
+    bb_std = _rolling(close, symbols, 20, "std")
+    result["bb_upper"] = result["sma_20"] + 2 * bb_std
+    result["bb_lower"] = result["sma_20"] - 2 * bb_std
+
+    result["atr_14"] = _atr(high, low, close, symbols, 14)
+    result["adx_14"] = _adx(high, low, result["atr_14"], symbols, 14)
+
+    for window in (20, 60):
+        result[f"roc_{window}"] = (close / close.groupby(symbols, sort=False).shift(window) - 1) * 100
+        result[f"volatility_{window}"] = _rolling(returns, symbols, window, "std") * ANNUALIZATION * 100
+
+    result["volume_sma_20"] = _rolling(volume, symbols, 20)
+    result["volume_ratio"] = volume / result["volume_sma_20"]
+
+    return result[columns]
+
+
+def get_indicators(artifacts: ArtifactStore, prices_df: pd.DataFrame) -> pd.DataFrame:
+    """Indicator frame for an analysis, computed by the first section that asks."""
+    return artifacts.get_or_compute(ARTIFACT_KEY, lambda: compute_indicators(prices_df))
+
+
+def indicators_by_symbol(frame: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """Split the indicator frame into per-symbol frames (sorted by date)."""
+    if frame is None or frame.empty:
+        return {}
+    return {
+        symbol: group.reset_index(drop=True)
+        for symbol, group in frame.groupby("Symbol", sort=False)
+    }
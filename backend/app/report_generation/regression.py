@@ -0,0 +1,157 @@
+"""Batched correlation and OLS statistics for one target against many series.
+
+Section 9 relates each company's financial metrics to dozens of macro
+indicators. Calling scipy.stats.pearsonr / statsmodels OLS once per pair
+dominates its run time, so the screening statistics are computed here for
+all indicators at once as column-wise matrix operations:
+
+    r, p, n = correlate(revenue_growth, macro_matrix)
+    fits = univariate_ols(revenue_growth, macro_matrix)
+    fits["adj_r_squared"]     # one entry per macro column
+
+Every column uses its own pairwise-complete rows (rows where both the
+target and that column are present), like .dropna() on each pair. Results
+match scipy/statsmodels; only the finalists need a full statsmodels fit
+for residual diagnostics.
+"""
+
+from typing import Dict, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+
+def _pairwise(y, X) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    X = np.asarray(X, dtype=float)
+    if X.ndim == 1:
+        X = X[:, None]
+    Y = np.broadcast_to(np.asarray(y, dtype=float)[:, None], X.shape)
+    mask = ~np.isnan(Y) & ~np.isnan(X)
+    return Y, X, mask
+
+
+def _centered(Y: np.ndarray, X: np.ndarray, mask: np.ndarray, n: np.ndarray):
+    y_mean = np.where(mask, Y, 0.0).sum(axis=0) / np.maximum(n, 1)
+    x_mean = np.where(mask, X, 0.0).sum(axis=0) / np.maximum(n, 1)
+    dy = np.where(mask, Y - y_mean, 0.0)
+    dx = np.where(mask, X - x_mean, 0.0)
+    return y_mean, x_mean, dy, dx
+
+
+def correlate(y, X, method: str = "pearson", min_obs: int = 3) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Correlation of y with every column of X.
+
+    Args:
+        y: Target values, shape (T,)
+        X: Candidate series, shape (T, K)
+        method: "pearson" or "spearman"
+        min_obs: Minimum pairwise-complete observations
+
+    Returns:
+        (r, p_value, n) arrays of length K. r and p are NaN where n < min_obs
+        or either series is constant.
+    """
+    Y, X, mask = _pairwise(y, X)
+    if method == "spearman":
+        # Rank within each pair's complete rows (average ranks for ties)
+        Y = pd.DataFrame(np.where(mask, Y, np.nan)).rank().to_numpy()
+        X = pd.DataFrame(np.where(mask, X, np.nan)).rank().to_numpy()
+    elif method != "pearson":
+        raise ValueError(f"Unknown correlation method: {method}")
+
+    n = mask.sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        _, _, dy, dx = _centered(Y, X, mask, n)
+        r = (dx * dy).sum(axis=0) / np.sqrt((dx * dx).sum(axis=0) * (dy * dy).sum(axis=0))
+        r = np.clip(r, -1.0, 1.0)
+        df = n - 2
+        t = r * np.sqrt(df / (1.0 - r * r))
+        p = 2 * stats.t.sf(np.abs(t), df)
+
+    invalid = (n < min_obs) | ~np.isfinite(r)
+    r = np.where(invalid, np.nan, r)
+    p = np.where(invalid, np.nan, p)
+    return r, p, n
+
+
+def univariate_ols(y, X, min_obs: int = 4) -> Dict[str, np.ndarray]:
+    """
+    Closed-form fits of y = a + b*x for every column x of X.
+
+    Matches statsmodels OLS(y, add_constant(x)) on each pair's complete
+    rows. Entries are NaN where n < min_obs or x is constant.
+
+    Returns:
+        Dict of arrays (length K): slope, intercept, slope_tstat,
+        slope_pvalue, r_squared, adj_r_squared, f_statistic, f_pvalue,
+        aic, bic, residual_std_error, durbin_watson, n_observations
+    """
+    Y, X, mask = _pairwise(y, X)
+    n = mask.sum(axis=0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        y_mean, x_mean, dy, dx = _centered(Y, X, mask, n)
+        sxx = (dx * dx).sum(axis=0)
+        sxy = (dx * dy).sum(axis=0)
+        syy = (dy * dy).sum(axis=0)
+
+        slope = sxy / sxx
+        intercept = y_mean - slope * x_mean
+        ssr = np.maximum(syy - slope * sxy, 0.0)
+        df_resid = n - 2
+        mse = ssr / df_resid
+
+        tstat = slope / np.sqrt(mse / sxx)
+        pvalue = 2 * stats.t.sf(np.abs(tstat), df_resid)
+        r_squared = 1.0 - ssr / syy
+        adj_r_squared = 1.0 - (1.0 - r_squared) * (n - 1) / df_resid
+
+        # Gaussian log-likelihood, two parameters (constant + slope)
+        llf = -n / 2.0 * (np.log(2 * np.pi) + np.log(ssr / n) + 1.0)
+        aic = -2.0 * llf + 2 * 2
+        bic = -2.0 * llf + 2 * np.log(n)
+
+        # Durbin-Watson over each pair's residuals in row order: move the
+        # complete rows to the bottom so consecutive residuals are adjacent
+        resid = np.where(mask, Y - intercept - slope * X, 0.0)
+        order = np.argsort(mask, axis=0, kind="stable")
+        resid = np.take_along_axis(resid, order, axis=0)
+        both = np.take_along_axis(mask, order, axis=0)
+        steps = np.where(both[1:] & both[:-1], np.diff(resid, axis=0), 0.0)
+        durbin_watson = (steps * steps).sum(axis=0) / ssr
+
+    fits = {
+        "slope": slope,
+        "intercept": intercept,
+        "slope_tstat": tstat,
+        "slope_pvalue": pvalue,
+        "r_squared": r_squared,
+        "adj_r_squared": adj_r_squared,
+        # With one regressor F = t^2 and shares its p-value
+        "f_statistic": tstat * tstat,
+        "f_pvalue": pvalue,
+        "aic": aic,
+        "bic": bic,
+        "residual_std_error": np.sqrt(mse),
+        "durbin_watson": durbin_watson,
+    }
+    invalid = (n < min_obs) | ~(sxx > 0)
+    fits = {key: np.where(invalid, np.nan, values) for key, values in fits.items()}
+    fits["n_observations"] = n
+    return fits
+
+
+def variance_inflation_factors(X) -> np.ndarray:
+    """
+    VIF of each column of X (regressed on the others plus a constant).
+
+    Equal to the diagonal of the inverse correlation matrix, so it needs
+    one matrix inverse instead of one auxiliary regression per column.
+    """
+    corr = np.corrcoef(np.asarray(X, dtype=float), rowvar=False)
+    try:
+        return np.diag(np.linalg.inv(np.atleast_2d(corr)))
+    except np.linalg.LinAlgError:
+        return np.full(corr.shape[0] if corr.ndim else 1, np.inf)
@@ -1,17 +1,35 @@
 """Orchestrates the generation of all 20 sections."""
 
+import asyncio
+import importlib
 import logging
+import os
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict
+from types import ModuleType
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 from datetime import datetime
 from sqlalchemy.orm import Session
 
+from ..config import settings
+from ..core.websocket_manager import manager
+from ..database import SessionLocal
+from ..jobs.tasks import run_blocking
 from ..models.analysis import Analysis
 from ..models.section import Section
-from ..services.collector_loader_service import collector_loader_service
+from ..services.collector_loader_service import collector_loader_service, detached_copy
 from ..services.file_service import FileService
+from .artifacts import artifact_dependencies
+from .compression import precompress, remove_variants
+from .fingerprint import SectionFingerprints, file_digest
+from .html_utils import chart_sidecars, generate_section_wrapper
 
-import importlib
+SECTIONS_DIR = Path(__file__).parent / "sections"
 
 logger = logging.getLogger(__name__)
 file_service = FileService()
@@ -39,24 +57,293 @@ SECTIONS_METADATA = [
     {"number": 19, "name": "Appendix"},
 ]
 
+# Sections that summarise or build on other sections. A section is only
+# scheduled once every section it depends on has finished (complete or failed).
+# Producers of the artifacts a section CONSUMES are added automatically.
+SECTION_DEPENDENCIES: Dict[int, List[int]] = {
+    1: [3, 4, 8, 12, 16],   # Executive Summary draws on financial, profitability, macro, peer and benchmark results
+}
+
+
+def _section_dependencies(section_number: int) -> List[int]:
+    explicit = SECTION_DEPENDENCIES.get(section_number, [])
+    return sorted(set(explicit) | set(artifact_dependencies(section_number)))
+
+
+# ----------------------------------------------------------------------------
+# Section rendering (shared by the in-process path and pool workers)
+# ----------------------------------------------------------------------------
+
+def _generate_placeholder(section_number: int, section_name: str) -> str:
+    """Generate placeholder HTML for unimplemented sections."""
+    content = f"""
+    <div class="placeholder-section">
+        <h2>Section {section_number}: {section_name}</h2>
+        <p class="placeholder-message">This section is not yet implemented.</p>
+        <p>Create the section generator at:</p>
+        <code>backend/app/report_generation/sections/section_{section_number:02d}.py</code>
+    </div>
+    """
+    return generate_section_wrapper(section_number, section_name, content)
+
+
+# Section generator registry: modules are imported once per process (pool
+# workers preload them all) instead of re-executing their source per run.
+# section number -> (module, source mtime when imported, source digest)
+_section_modules: Dict[int, Tuple[ModuleType, int, str]] = {}
+
+
+def load_section_module(section_number: int) -> Tuple[ModuleType, float]:
+    """
+    Get a section generator module, importing it on first use.
+
+    With SECTION_RELOAD_MODULES (honoured only when DEBUG is on) a section
+    whose file changed since it was imported is reloaded, so edits show up
+    without restarting the server or the worker pool.
+
+    Returns:
+        (module, seconds spent importing; 0.0 if it was already loaded)
+    """
+    module_file = SECTIONS_DIR / f"section_{section_number:02d}.py"
+    if not module_file.exists():
+        raise ModuleNotFoundError(f"Section file not found: {module_file}")
+
+    mtime = module_file.stat().st_mtime_ns
+    cached = _section_modules.get(section_number)
+    reload_edited = settings.SECTION_RELOAD_MODULES and settings.DEBUG
+    if cached is not None and (not reload_edited or cached[1] == mtime):
+        return cached[0], 0.0
+
+    started = time.perf_counter()
+    digest = file_digest(module_file)
+    if cached is None:
+        module = importlib.import_module(f"{__package__}.sections.section_{section_number:02d}")
+    else:
+        logger.info(f"Reloading edited section {section_number}")
+        module = importlib.reload(cached[0])
+    _section_modules[section_number] = (module, mtime, digest)
+    return module, time.perf_counter() - started
+
+
+def loaded_section_digest(section_number: int) -> Optional[str]:
+    """Digest of the section source this process imported, or None if it hasn't."""
+    cached = _section_modules.get(section_number)
+    return cached[2] if cached is not None else None
+
+
+def preload_sections() -> None:
+    """Import every section generator (process-pool worker initializer)."""
+    started = time.perf_counter()
+    for section_meta in SECTIONS_METADATA:
+        try:
+            load_section_module(section_meta["number"])
+        except Exception as e:
+            # Reported again, with the placeholder, when the section is rendered
+            logger.warning(f"Could not preload section {section_meta['number']}: {e}")
+    logger.info(f"Preloaded {len(_section_modules)} section modules "
+                f"in {time.perf_counter() - started:.2f}s (pid {os.getpid()})")
+
+
+def render_section(collector, analysis_id: str, section_number: int,
+                   section_name: str, timings: Optional[Dict] = None) -> Union[str, Iterable[str]]:
+    """
+    Run a section generator and return its HTML, either as one string
+    or as an iterable of chunks (see html_utils.stream_section_wrapper).
+
+    If `timings` is given, the import time is recorded in timings["import"].
+    """
+    try:
+        section_module, import_seconds = load_section_module(section_number)
+        if timings is not None:
+            timings["import"] = import_seconds
+
+        return section_module.generate(
+            collector=collector,
+            analysis_id=analysis_id
+        )
+    except (ModuleNotFoundError, FileNotFoundError) as e:
+        logger.warning(f"Section {section_number} not implemented yet: {str(e)}")
+        return _generate_placeholder(section_number, section_name)
+
+
+def _chart_url_prefix(analysis_id: str) -> str:
+    """URL the chart sidecar files of an analysis are served under."""
+    return f"{settings.API_PUBLIC_URL.rstrip('/')}/api/analyses/{analysis_id}/charts"
+
+
+def write_section_html(section_path: str, html: Union[str, Iterable[str]]) -> None:
+    """
+    Write section HTML to disk, chunk by chunk if the section streams it,
+    followed by its precompressed variants.
+
+    Goes through a temp file and os.replace so a failed render never
+    leaves a truncated page where the previous one was. The old compressed
+    variants are removed before the page is replaced, so they are never
+    served for the new page.
+    """
+    tmp_path = f"{section_path}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            if isinstance(html, str):
+                f.write(html)
+            else:
+                for chunk in html:
+                    f.write(chunk)
+        remove_variants(section_path)
+        os.replace(tmp_path, section_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    precompress(section_path)
+
+
+# Process pool shared by all section runs, so workers (and the section
+# modules they preloaded) outlive a single analysis.
+_section_pool: Optional[ProcessPoolExecutor] = None
+_section_pool_size = 0
+
+
+def get_section_pool(max_workers: int) -> ProcessPoolExecutor:
+    """The shared section worker pool, (re)created if missing or resized."""
+    global _section_pool, _section_pool_size
+    if _section_pool is None or _section_pool_size != max_workers:
+        if _section_pool is not None:
+            # Running sections of other analyses still finish
+            _section_pool.shutdown(wait=False)
+        _section_pool = ProcessPoolExecutor(max_workers=max_workers, initializer=preload_sections)
+        _section_pool_size = max_workers
+    return _section_pool
+
+
+def replace_broken_section_pool(broken: ProcessPoolExecutor, max_workers: int) -> ProcessPoolExecutor:
+    """
+    A working pool after `broken` raised BrokenProcessPool (a worker died).
+    Only replaces the shared pool if no other run has done so already.
+    """
+    global _section_pool
+    if _section_pool is broken:
+        logger.warning("Section worker pool broken, starting a new one")
+        broken.shutdown(wait=False)
+        _section_pool = None
+    return get_section_pool(max_workers)
+
+
+def shutdown_section_pool() -> None:
+    """Stop the shared worker pool (app shutdown)."""
+    global _section_pool
+    if _section_pool is not None:
+        _section_pool.shutdown(wait=False, cancel_futures=True)
+        _section_pool = None
+
+
+# Collector and its section fingerprints, cached per worker process so
+# sections of the same analysis landing on one worker only unpickle and
+# hash it once. analysis_id -> (collector file signature, collector, fingerprints)
+_worker_analysis: Dict[str, Tuple[Tuple[int, int], object, SectionFingerprints]] = {}
+
+
+def _load_worker_analysis(analysis_id: str) -> Tuple[object, SectionFingerprints]:
+    stat = file_service.get_collector_pickle_path(analysis_id).stat()
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _worker_analysis.get(analysis_id)
+    if cached is None or cached[0] != signature:
+        _worker_analysis.clear()
+        collector = collector_loader_service.load_financial_collector(analysis_id)
+        cached = (signature, collector, SectionFingerprints(analysis_id, collector, _section_dependencies))
+        _worker_analysis[analysis_id] = cached
+    return cached[1], cached[2]
+
+
+def _worker_fingerprint(fingerprints: SectionFingerprints, section_number: int) -> str:
+    """Fingerprint of a section with the source this worker renders it from."""
+    try:
+        load_section_module(section_number)
+    except Exception:
+        pass  # reported when the section is rendered
+    return fingerprints.get(section_number, loaded_section_digest(section_number))
+
+
+def _fingerprint_sections_worker(analysis_id: str, section_numbers: List[int]) -> Dict[int, str]:
+    """
+    Process-pool entry point: fingerprints of an analysis's sections, so the
+    scheduler never loads the collector. Never raises; {} on failure.
+    """
+    try:
+        _, fingerprints = _load_worker_analysis(analysis_id)
+        return {number: _worker_fingerprint(fingerprints, number) for number in section_numbers}
+    except Exception as e:
+        logger.error(f"Could not fingerprint sections of {analysis_id}: {e}", exc_info=True)
+        return {}
+
+
+def _generate_section_worker(analysis_id: str, section_number: int,
+                             section_name: str, section_path: str) -> Dict:
+    """
+    Process-pool entry point: render one section and write its HTML file.
+    Never raises; failures are reported in the returned dict.
+    """
+    started = time.perf_counter()
+    timings: Dict = {}
+    try:
+        collector, fingerprints = _load_worker_analysis(analysis_id)
+        # Taken before rendering, from the source this worker runs
+        fingerprint = _worker_fingerprint(fingerprints, section_number)
+        loaded = time.perf_counter()
+        with chart_sidecars(file_service.get_charts_dir(analysis_id), _chart_url_prefix(analysis_id)):
+            # The worker's collector outlives this section; it gets its own copy
+            html_content = render_section(detached_copy(collector), analysis_id, section_number,
+                                          section_name, timings)
+            write_section_html(section_path, html_content)
+        finished = time.perf_counter()
+        return {"ok": True, "html_path": section_path, "fingerprint": fingerprint,
+                "elapsed": finished - started,
+                "import_seconds": timings.get("import", 0.0),
+                "render_seconds": finished - loaded - timings.get("import", 0.0)}
+    except Exception as e:
+        logger.error(f"Failed to generate section {section_number}: {str(e)}", exc_info=True)
+        return {"ok": False, "error": str(e),
+                "elapsed": time.perf_counter() - started}
+
 
 class SectionRunner:
     """Manages the generation of all analysis sections."""
     
-    def __init__(self, analysis_id: str, db: Session):
+    def __init__(self, analysis_id: str, db: Session, max_workers: Optional[int] = None):
         self.analysis_id = analysis_id
         self.db = db
         self.collector = None
+        self.fingerprints: Optional[SectionFingerprints] = None
+        self.max_workers = settings.SECTION_WORKERS if max_workers is None else max_workers
     
     def initialize(self):
         """Load the financial collector and prepare for section generation."""
+        if self.max_workers > 1:
+            # Pool workers load the collector themselves; only make sure it exists.
+            if not collector_loader_service.get_collector_info(self.analysis_id):
+                raise FileNotFoundError(
+                    f"Financial collector not found for analysis {self.analysis_id}. "
+                    "Data collection (Phase A) must be completed first."
+                )
+            return
         logger.info(f"Loading financial collector for analysis {self.analysis_id}")
         self.collector = collector_loader_service.load_financial_collector(self.analysis_id)
         logger.info("Collector loaded successfully")
     
     def create_section_records(self):
-        """Create section records in the database for tracking."""
+        """
+        Create section records in the database for tracking.
+
+        Records kept from an earlier run are reused, so their fingerprints
+        can be compared and unchanged sections skipped.
+        """
+        existing = {s.section_number for s in self.db.query(Section).filter(
+            Section.analysis_id == self.analysis_id
+        ).all()}
+        created = 0
         for section_meta in SECTIONS_METADATA:
+            if section_meta["number"] in existing:
+                continue
             section = Section(
                 analysis_id=self.analysis_id,
                 section_number=section_meta["number"],
@@ -64,112 +351,171 @@ class SectionRunner:
                 status="pending"
             )
             self.db.add(section)
+            created += 1
         
         self.db.commit()
-        logger.info(f"Created {len(SECTIONS_METADATA)} section records")
-    
-    def generate_section(self, section_number: int) -> bool:
-        """Generate a single section."""
-        section = self.db.query(Section).filter(
+        logger.info(f"Created {created} section records ({len(existing)} kept)")
+
+    def fingerprint(self, section_number: int, module_digest: Optional[str] = None) -> str:
+        """
+        Input fingerprint of a section for the current collector.
+
+        Sections rendered in this process are fingerprinted with the source
+        this process imported. With a process pool the workers fingerprint
+        the sections instead (_fingerprint_sections_worker), and this
+        process never loads the collector.
+        """
+        if self.fingerprints is None:
+            if self.collector is None:
+                self.collector = collector_loader_service.load_financial_collector(self.analysis_id)
+            self.fingerprints = SectionFingerprints(self.analysis_id, self.collector, _section_dependencies)
+        if module_digest is None and self.max_workers <= 1:
+            try:
+                load_section_module(section_number)
+            except Exception:
+                pass  # reported when the section is rendered
+            module_digest = loaded_section_digest(section_number)
+        return self.fingerprints.get(section_number, module_digest)
+
+    def is_current(self, section: Section, fingerprint: Optional[str] = None) -> bool:
+        """
+        Whether a section's stored HTML was generated from the current inputs
+        (`fingerprint`, if already known).
+        """
+        if not section.input_fingerprint or not section.html_path:
+            return False
+        if not Path(section.html_path).exists():
+            return False
+        if fingerprint is None:
+            fingerprint = self.fingerprint(section.section_number)
+        return section.input_fingerprint == fingerprint
+
+    def _mark_unchanged(self, section: Section) -> None:
+        section.status = "complete"
+        section.error_message = None
+        self.db.commit()
+        logger.info(f"Section {section.section_number} unchanged, skipped")
+
+    def _load_sections(self) -> Dict[int, Section]:
+        return {s.section_number: s for s in self.db.query(Section).filter(
+            Section.analysis_id == self.analysis_id
+        ).all()}
+
+    def _skip_unchanged(self, sections: Iterable[Section], fingerprints: Dict[int, str]) -> List[Section]:
+        """Mark the sections whose stored HTML matches `fingerprints` as complete; returns them."""
+        unchanged = [section for section in sections
+                     if section.section_number in fingerprints
+                     and self.is_current(section, fingerprints[section.section_number])]
+        for section in unchanged:
+            self._mark_unchanged(section)
+        return unchanged
+
+    def _get_section(self, section_number: int) -> Optional[Section]:
+        return self.db.query(Section).filter(
             Section.analysis_id == self.analysis_id,
             Section.section_number == section_number
         ).first()
+
+    def _mark_processing(self, section: Section) -> None:
+        section.status = "processing"
+        section.started_at = datetime.utcnow()
+        self.db.commit()
+        logger.info(f"Generating section {section.section_number}: {section.section_name}")
+
+    def _mark_finished(self, section: Section, result: Dict) -> None:
+        section.completed_at = datetime.utcnow()
+        if result.get("ok"):
+            section.status = "complete"
+            section.html_path = result["html_path"]
+            section.input_fingerprint = result.get("fingerprint")
+            section.error_message = None
+        else:
+            section.status = "failed"
+            section.input_fingerprint = None
+            section.error_message = result.get("error")
+        if section.started_at:
+            section.processing_time_seconds = (section.completed_at - section.started_at).total_seconds()
+        self.db.commit()
+        logger.info(f"Section {section.section_number} {section.status} "
+                    f"({result.get('elapsed', 0):.1f}s; import {result.get('import_seconds', 0):.2f}s, "
+                    f"render {result.get('render_seconds', 0):.2f}s)")
+
+    def _section_path(self, section: Section) -> str:
+        return str(file_service.get_section_path(
+            self.analysis_id,
+            section.section_number,
+            section.section_name
+        ))
+
+    def _start_section(self, section: Section) -> str:
+        """Mark a section processing; returns the path to render it to."""
+        self._mark_processing(section)
+        return self._section_path(section)
+    
+    def generate_section(self, section_number: int) -> bool:
+        """Generate a single section in this process."""
+        section = self._get_section(section_number)
         
         if not section:
             logger.error(f"Section {section_number} not found in database")
             return False
-        
+
+        if self.collector is None:
+            self.collector = collector_loader_service.load_financial_collector(self.analysis_id)
+
+        self._mark_processing(section)
+        started = time.perf_counter()
+        timings: Dict = {}
         try:
-            section.status = "processing"
-            section.started_at = datetime.utcnow()
-            self.db.commit()
-            
-            logger.info(f"Generating section {section_number}: {section.section_name}")
-            
-            # Import and call the section generator
-            try:
-                # Get the sections directory
-                sections_dir = Path(__file__).parent / "sections"
-                module_file = sections_dir / f"section_{section_number:02d}.py"
-                
-                logger.info(f"Looking for module at: {module_file}")
-                
-                if not module_file.exists():
-                    raise ModuleNotFoundError(f"Section file not found: {module_file}")
-                
-                # Import using spec
-                import importlib.util
-                spec = importlib.util.spec_from_file_location(
-                    f"section_{section_number:02d}", 
-                    module_file
-                )
-                section_module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(section_module)
-                
-                html_content = section_module.generate(
-                    collector=self.collector,
-                    analysis_id=self.analysis_id
-                )
-            except (ModuleNotFoundError, FileNotFoundError) as e:
-                logger.warning(f"Section {section_number} not implemented yet: {str(e)}")
-                html_content = self._generate_placeholder(section_number, section.section_name)
-            
-            # Save HTML file
-            section_path = file_service.get_section_path(
-                self.analysis_id, 
-                section_number, 
-                section.section_name
-            )
-            
-            with open(section_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
-            
-            # Update section record
-            section.status = "complete"
-            section.completed_at = datetime.utcnow()
-            section.html_path = str(section_path)
-            
-            if section.started_at:
-                processing_time = (section.completed_at - section.started_at).total_seconds()
-                section.processing_time = processing_time
-            
-            self.db.commit()
-            logger.info(f"Section {section_number} completed")
-            return True
-            
+            fingerprint = self.fingerprint(section_number)
+            section_path = self._section_path(section)
+            rendering = time.perf_counter()
+            with chart_sidecars(file_service.get_charts_dir(self.analysis_id),
+                                _chart_url_prefix(self.analysis_id)):
+                html_content = render_section(self.collector, self.analysis_id,
+                                              section_number, section.section_name, timings)
+                write_section_html(section_path, html_content)
+            result = {"ok": True, "html_path": section_path, "fingerprint": fingerprint,
+                      "import_seconds": timings.get("import", 0.0),
+                      "render_seconds": time.perf_counter() - rendering - timings.get("import", 0.0)}
         except Exception as e:
             logger.error(f"Failed to generate section {section_number}: {str(e)}", exc_info=True)
-            section.status = "failed"
-            section.error_message = str(e)
-            section.completed_at = datetime.utcnow()
-            self.db.commit()
-            return False
-    
+            result = {"ok": False, "error": str(e)}
+        result["elapsed"] = time.perf_counter() - started
+
+        self._mark_finished(section, result)
+        return result["ok"]
+
     def _generate_placeholder(self, section_number: int, section_name: str) -> str:
         """Generate placeholder HTML for unimplemented sections."""
-        from .html_utils import generate_section_wrapper
-        
-        content = f"""
-        <div class="placeholder-section">
-            <h2>Section {section_number}: {section_name}</h2>
-            <p class="placeholder-message">This section is not yet implemented.</p>
-            <p>Create the section generator at:</p>
-            <code>backend/app/report_generation/sections/section_{section_number:02d}.py</code>
-        </div>
-        """
-        return generate_section_wrapper(section_number, section_name, content)
+        return _generate_placeholder(section_number, section_name)
     
-    def generate_all_sections(self) -> Dict:
-        """Generate all 20 sections sequentially."""
+    def generate_all_sections(self, cancel: Optional[threading.Event] = None) -> Dict:
+        """
+        Generate all 20 sections sequentially, skipping unchanged ones.
+
+        Stops before the next section once `cancel` is set; the section
+        being rendered at that moment still finishes.
+        """
         results = {
             "total": len(SECTIONS_METADATA),
             "successful": 0,
             "failed": 0,
-            "failures": []
+            "failures": [],
+            "skipped": []
         }
         
         for section_meta in SECTIONS_METADATA:
+            if cancel is not None and cancel.is_set():
+                logger.info(f"Section generation for analysis {self.analysis_id} cancelled")
+                break
             section_number = section_meta["number"]
+            section = self._get_section(section_number)
+            if section and self.is_current(section):
+                self._mark_unchanged(section)
+                results["successful"] += 1
+                results["skipped"].append(section_number)
+                continue
             success = self.generate_section(section_number)
             
             if success:
@@ -180,36 +526,309 @@ class SectionRunner:
         
         return results
 
+    async def _broadcast_section(self, section: Section) -> None:
+        try:
+            await manager.broadcast_section_update(
+                analysis_id=self.analysis_id,
+                section_number=section.section_number,
+                section_name=section.section_name,
+                status=section.status,
+                error_message=section.error_message
+            )
+        except Exception as e:
+            logger.warning(f"Section broadcast failed: {e}")
+
+    def _submit(self, pool: ProcessPoolExecutor, fn, *args) -> Tuple[Future, ProcessPoolExecutor]:
+        """Run fn on the pool, replacing it first if it is already broken; returns (future, pool)."""
+        try:
+            return pool.submit(fn, *args), pool
+        except BrokenProcessPool:
+            pool = replace_broken_section_pool(pool, self.max_workers)
+            return pool.submit(fn, *args), pool
+
+    def _mark_cancelled(self, sections: List[Section]) -> None:
+        for section in sections:
+            section.status = "failed"
+            section.error_message = "Cancelled"
+            section.input_fingerprint = None
+            section.completed_at = datetime.utcnow()
+        self.db.commit()
+
+    async def _stop_sections(self, running: Dict[asyncio.Future, Tuple[int, ProcessPoolExecutor, Future]],
+                             pending: List[int], sections: Dict[int, Section]) -> None:
+        """
+        Wind down a cancelled run: sections still queued on the pool are
+        cancelled, those already rendering (a worker can't be interrupted)
+        are waited for and recorded, and every section that didn't finish
+        is marked failed, so no row stays "processing".
+        """
+        in_flight = {future: number for future, (number, _, work) in running.items() if not work.cancel()}
+        while not all(future.done() for future in in_flight):
+            try:
+                await asyncio.wait(in_flight.keys())
+            except asyncio.CancelledError:
+                pass
+
+        unfinished = [sections[n] for n in pending]
+        unfinished += [sections[number] for future, (number, _, _) in running.items() if future not in in_flight]
+        for future, number in in_flight.items():
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"ok": False, "error": f"Worker failed: {e}"}
+            await run_blocking(self._mark_finished, sections[number], result)
+        await run_blocking(self._mark_cancelled, unfinished)
+        logger.info(f"Section generation for {self.analysis_id} cancelled; "
+                    f"{len(unfinished)} sections not generated")
+
+    async def generate_all_sections_parallel(self, analysis: Analysis) -> Dict:
+        """
+        Generate all sections on a process pool of `max_workers` workers.
+
+        Sections are submitted as soon as their dependencies have finished; each
+        section's DB status, websocket update and the analysis progress are
+        published the moment it completes, so Phase B takes roughly as long as
+        its slowest dependency chain rather than the sum of all sections.
+
+        Database work runs in threads, off the event loop.
+        """
+        results = {
+            "total": len(SECTIONS_METADATA),
+            "successful": 0,
+            "failed": 0,
+            "failures": [],
+            "skipped": []
+        }
+        sections = await run_blocking(self._load_sections)
+        pending = [m["number"] for m in SECTIONS_METADATA if m["number"] in sections]
+        finished: set = set()
+
+        # future -> (section number, pool it was submitted to, pool future)
+        running: Dict[asyncio.Future, Tuple[int, ProcessPoolExecutor, Future]] = {}
+        pool = get_section_pool(self.max_workers)
+
+        # Sections whose inputs are unchanged keep their HTML. A worker
+        # computes the fingerprints, so this process never loads the collector.
+        work, pool = self._submit(pool, _fingerprint_sections_worker, self.analysis_id, pending)
+        try:
+            fingerprints = await asyncio.wrap_future(work)
+        except BrokenProcessPool:
+            fingerprints = {}
+            pool = replace_broken_section_pool(pool, self.max_workers)
+        for section in await run_blocking(self._skip_unchanged, [sections[n] for n in pending], fingerprints):
+            pending.remove(section.section_number)
+            finished.add(section.section_number)
+            await self._broadcast_section(section)
+            results["successful"] += 1
+            results["skipped"].append(section.section_number)
+
+        try:
+            await self._run_sections(analysis, sections, pending, finished, running, pool, results)
+        except asyncio.CancelledError:
+            await self._stop_sections(running, pending, sections)
+            raise
+
+        results["failures"].sort()
+        return results
+
+    async def _run_sections(self, analysis: Analysis, sections: Dict[int, Section], pending: List[int],
+                            finished: set, running: Dict[asyncio.Future, Tuple[int, ProcessPoolExecutor, Future]],
+                            pool: ProcessPoolExecutor, results: Dict) -> None:
+        """Submit and collect the sections of generate_all_sections_parallel."""
+        while pending or running:
+            ready = [n for n in pending
+                     if all(d in finished or d not in sections for d in _section_dependencies(n))]
+            if not ready and not running:
+                # Unsatisfiable dependencies (cycle); run what is left regardless.
+                ready = list(pending)
 
-def run_section_generation(analysis: Analysis, db: Session):
-    """Main entry point for Phase B - called by BackgroundTasks."""
+            for number in ready:
+                section = sections[number]
+                section_path = await run_blocking(self._start_section, section)
+                await self._broadcast_section(section)
+                work, pool = self._submit(pool, _generate_section_worker,
+                                          self.analysis_id, number, section.section_name, section_path)
+                running[asyncio.wrap_future(work)] = (number, pool, work)
+                pending.remove(number)
+
+            done, _ = await asyncio.wait(running.keys(), return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                number, used_pool, _ = running.pop(future)
+                try:
+                    result = future.result()
+                except BrokenProcessPool as e:
+                    # The section (or another on the same pool) killed its worker
+                    result = {"ok": False, "error": f"Worker failed: {e}"}
+                    pool = replace_broken_section_pool(used_pool, self.max_workers)
+                except Exception as e:
+                    result = {"ok": False, "error": f"Worker failed: {e}"}
+
+                section = sections[number]
+                await run_blocking(self._mark_finished, section, result)
+                await self._broadcast_section(section)
+                finished.add(number)
+
+                if result.get("ok"):
+                    results["successful"] += 1
+                else:
+                    results["failed"] += 1
+                    results["failures"].append(number)
+
+                analysis.progress = int(len(finished) * 100 / max(len(sections), 1))
+                await run_blocking(self.db.commit)
+                await manager.broadcast_progress(
+                    analysis_id=self.analysis_id,
+                    progress=analysis.progress,
+                    message=f"Section {number}: {section.status}",
+                    status="generating",
+                    phase="B"
+                )
+
+
+# Chart sidecar files are named after their content (see html_utils)
+_SIDECAR_NAME = re.compile(r"[0-9a-f]{16}\.json")
+# Unreferenced sidecars younger than this may belong to a section that is
+# still being rendered
+SIDECAR_GRACE_SECONDS = 3600
+
+
+def prune_chart_sidecars(analysis_id: str) -> int:
+    """Delete chart sidecars no section page links to any more; returns the count."""
+    charts_dir = file_service.get_charts_dir(analysis_id)
+    if not charts_dir.is_dir():
+        return 0
+
+    referenced = set()
+    for page in file_service.get_sections_dir(analysis_id).glob("*.html"):
+        try:
+            referenced.update(_SIDECAR_NAME.findall(page.read_text(encoding="utf-8", errors="ignore")))
+        except OSError:
+            # Can't tell what the page links to; keep everything
+            return 0
+
+    cutoff = time.time() - SIDECAR_GRACE_SECONDS
+    removed = 0
+    for path in charts_dir.iterdir():
+        match = _SIDECAR_NAME.match(path.name)
+        if not match or match.group(0) in referenced:
+            continue
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except OSError:
+            pass
+    if removed:
+        logger.info(f"Removed {removed} unused chart files for analysis {analysis_id}")
+    return removed
+
+
+def _get_analysis(db: Session, analysis_id: str) -> Optional[Analysis]:
+    return db.query(Analysis).filter(Analysis.analysis_id == analysis_id).first()
+
+
+def _open_session() -> Session:
+    # The entry points below run on an event loop (the API's, with
+    # JOB_WORKER_IN_API) and do every query and commit in a thread. Loaded
+    # objects aren't expired on commit, so reading them back on the loop
+    # doesn't query the database there.
+    return SessionLocal(expire_on_commit=False)
+
+
+async def run_section_generation(analysis_id: str):
+    """Main entry point for Phase B - run by the job worker."""
+    db = _open_session()
     try:
-        analysis.status = "generating"
-        analysis.phase = "B"
-        analysis.progress = 0
-        db.commit()
-        
-        runner = SectionRunner(analysis.analysis_id, db)
-        runner.initialize()
-        runner.create_section_records()
-        
-        logger.info(f"Starting generation of all sections for analysis {analysis.analysis_id}")
-        results = runner.generate_all_sections()
-        
-        if results["failed"] == 0:
-            analysis.status = "complete"
-        else:
-            analysis.status = "partial_complete"
-            analysis.error_log = f"Failed sections: {results['failures']}"
-        
-        analysis.progress = 100
-        db.commit()
-        
-        logger.info(f"Section generation completed: {results}")
-        
-    except Exception as e:
-        logger.error(f"Section generation failed: {str(e)}", exc_info=True)
-        analysis.status = "generation_failed"
-        analysis.error_log = str(e)
-        db.commit()
-        raise
\ No newline at end of file
+        analysis = await run_blocking(_get_analysis, db, analysis_id)
+        if not analysis:
+            logger.error(f"Analysis {analysis_id} not found")
+            return
+
+        try:
+            runner = SectionRunner(analysis_id, db)
+
+            def prepare():
+                analysis.status = "generating"
+                analysis.phase = "B"
+                analysis.progress = 0
+                db.commit()
+                runner.initialize()
+                runner.create_section_records()
+
+            await run_blocking(prepare)
+
+            logger.info(f"Starting generation of all sections for analysis {analysis_id} "
+                        f"({runner.max_workers} workers)")
+            if runner.max_workers > 1:
+                results = await runner.generate_all_sections_parallel(analysis)
+            else:
+                # Cancelling the job stops it between sections; the session
+                # stays open until the thread has returned
+                cancel = threading.Event()
+                results = await run_blocking(runner.generate_all_sections, cancel, cancel=cancel)
+            
+            if results["failed"] == 0:
+                analysis.status = "complete"
+            else:
+                analysis.status = "partial_complete"
+                analysis.error_log = f"Failed sections: {results['failures']}"
+            
+            analysis.progress = 100
+            await run_blocking(db.commit)
+            await manager.broadcast_completion(analysis_id=analysis_id, status=analysis.status)
+            
+            logger.info(f"Section generation completed: {results}")
+            await run_blocking(prune_chart_sidecars, analysis_id)
+            
+        except Exception as e:
+            logger.error(f"Section generation failed: {str(e)}", exc_info=True)
+            await run_blocking(db.rollback)
+            analysis.status = "generation_failed"
+            analysis.error_log = str(e)
+            await run_blocking(db.commit)
+            await manager.broadcast_error(analysis_id=analysis_id, error=str(e))
+            raise
+    finally:
+        await run_blocking(db.close)
+
+
+async def run_section_regeneration(analysis_id: str, section_number: int):
+    """Rebuild a single section in place - run by the job worker."""
+    db = _open_session()
+    try:
+        analysis = await run_blocking(_get_analysis, db, analysis_id)
+        if not analysis:
+            logger.error(f"Analysis {analysis_id} not found")
+            return
+
+        runner = SectionRunner(analysis_id, db, max_workers=1)
+
+        def regenerate() -> bool:
+            runner.initialize()
+            return runner.generate_section(section_number)
+
+        try:
+            ok = await run_blocking(regenerate)
+        except Exception as e:
+            logger.error(f"Regeneration of section {section_number} failed: {str(e)}", exc_info=True)
+            ok = False
+
+        section = await run_blocking(runner._get_section, section_number)
+        if section:
+            await runner._broadcast_section(section)
+
+        def update_status():
+            failed = [s.section_number for s in db.query(Section).filter(
+                Section.analysis_id == analysis_id,
+                Section.status == "failed"
+            ).all()]
+            analysis.status = "partial_complete" if failed else "complete"
+            analysis.error_log = f"Failed sections: {failed}" if failed else None
+            db.commit()
+
+        await run_blocking(update_status)
+        await run_blocking(prune_chart_sidecars, analysis_id)
+        logger.info(f"Section {section_number} regenerated for analysis {analysis_id}: "
+                    f"{'ok' if ok else 'failed'}")
+    finally:
+        await run_blocking(db.close)
@@ -6,6 +6,7 @@ import numpy as np
 from typing import Dict, List, Optional, Any, Tuple
 import json
 
+from backend.app.report_generation.artifacts import ArtifactStore
 from backend.app.report_generation.html_utils import (
     generate_section_wrapper,
     build_stat_grid,
@@ -21,6 +22,9 @@ from backend.app.report_generation.html_utils import (
     format_number
 )
 
+PRODUCES = []
+CONSUMES = ["beta_analysis"]
+
 
 def generate(collector, analysis_id: str) -> str:
     """
@@ -57,6 +61,9 @@ def generate(collector, analysis_id: str) -> str:
     except:
         macro_context = {"status": "unavailable"}
     
+    # Benchmark betas shared with Section 16
+    benchmark_betas = _get_benchmark_betas(ArtifactStore(analysis_id), collector, companies)
+    
     # Analyze all companies once (shared across subsections)
     company_highlights = {}
     for company_name, symbol in companies.items():
@@ -95,7 +102,7 @@ def generate(collector, analysis_id: str) -> str:
     )
     
     section_13_html = _build_section_13_performance_analysis(
-        companies, prices_df, macro_context
+        companies, prices_df, macro_context, benchmark_betas
     )
     
     section_14_html = _build_section_14_visual_analysis(
@@ -525,7 +532,8 @@ def _calculate_composite_scores(company_highlights: Dict[str, Dict]) -> Dict[str
 def _build_section_13_performance_analysis(
     companies: Dict[str, str],
     prices_df: pd.DataFrame,
-    macro_context: Dict
+    macro_context: Dict,
+    benchmark_betas: Optional[Dict[str, float]] = None
 ) -> str:
     """
     Build Section 1.3: Equity Performance Analysis.
@@ -567,7 +575,8 @@ def _build_section_13_performance_analysis(
         # Calculate metrics for each company
         for company_name in companies.keys():
             perf_metrics = _calculate_enhanced_performance_metrics(
-                prices_df, company_name, period_type, macro_context
+                prices_df, company_name, period_type, macro_context,
+                benchmark_beta=(benchmark_betas or {}).get(company_name)
             )
             period_data[company_name] = perf_metrics
         
@@ -720,7 +729,8 @@ def _calculate_enhanced_performance_metrics(
     prices_df: pd.DataFrame, 
     company_name: str, 
     period_type: str, 
-    macro_context: Dict
+    macro_context: Dict,
+    benchmark_beta: Optional[float] = None
 ) -> Dict[str, float]:
     """
     Calculate enhanced performance metrics for different periods.
@@ -730,6 +740,7 @@ def _calculate_enhanced_performance_metrics(
         company_name: Company to analyze
         period_type: Type of period ("ytd", "trailing_12m", "trailing_3y", "full_history")
         macro_context: Macro environment context
+        benchmark_beta: Beta vs the S&P 500 from Section 16, if available
     
     Returns:
         Dictionary with performance metrics
@@ -804,10 +815,11 @@ def _calculate_enhanced_performance_metrics(
     else:
         sharpe_ratio = 0
     
-    # Beta calculation (simplified - using market proxy)
-    # In real implementation, would use actual benchmark returns
-    # For now, assume beta of 1.0 with some noise based on volatility
-    if volatility > 30:
+    # Beta: measured vs the S&P 500 (Section 16) when available,
+    # otherwise approximated from volatility
+    if benchmark_beta is not None and np.isfinite(benchmark_beta):
+        beta = float(benchmark_beta)
+    elif volatility > 30:
         beta = 1.2  # High vol stocks tend to have higher beta
     elif volatility > 20:
         beta = 1.0
@@ -1828,6 +1840,35 @@ def _generate_strategic_insights(
 # SHARED HELPER FUNCTIONS
 # =============================================================================
 
+def _get_benchmark_betas(artifacts: ArtifactStore, collector, companies: Dict[str, str]) -> Dict[str, float]:
+    """
+    Current beta vs the S&P 500 per company, from Section 16's beta analysis.
+
+    Loaded from the artifact store when Section 16 has already run, otherwise
+    computed with Section 16's own routine and stored for it to reuse.
+    """
+    def compute():
+        from backend.app.report_generation.sections.section_16 import (
+            _calculate_enhanced_beta_metrics,
+            _simulate_benchmark_data
+        )
+        daily_prices = collector.get_prices_daily()
+        sp500_daily = daily_prices[daily_prices["symbol"] == "^GSPC"].copy()
+        if sp500_daily.empty:
+            sp500_daily = _simulate_benchmark_data(daily_prices)
+        return _calculate_enhanced_beta_metrics(daily_prices, sp500_daily, companies)
+
+    try:
+        beta_analysis = artifacts.get_or_compute("beta_analysis", compute)
+    except Exception:
+        return {}
+
+    return {
+        company_name: analysis.get('current_beta')
+        for company_name, analysis in (beta_analysis or {}).items()
+    }
+
+
 def _analyze_macro_environment(econ_df: pd.DataFrame) -> Dict[str, Any]:
     """Analyze macro environment for context"""
     if econ_df.empty:
@@ -1,15 +1,15 @@
 """Section 9: Data-Driven Signal Discovery & Macro-Financial Analysis
-Complete integrated version with all subsections and data caching fix
+Complete integrated version with all subsections sharing models via the artifact store
 """
 
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Any, Tuple
-from scipy import stats
 import statsmodels.api as sm
-from statsmodels.stats.outliers_influence import variance_inflation_factor
 import json
 
+from backend.app.report_generation.artifacts import ArtifactStore
+from backend.app.report_generation.regression import correlate, univariate_ols, variance_inflation_factors
 from backend.app.report_generation.html_utils import (
     generate_section_wrapper,
     build_stat_grid,
@@ -28,86 +28,61 @@ from backend.app.report_generation.html_utils import (
 
 
 # =============================================================================
-# MODULE-LEVEL DATA CACHE FOR SHARING BETWEEN SUBSECTIONS
+# SHARED RESULTS (artifact store, reused across subsections and re-runs)
 # =============================================================================
 
-_section_9_cache = {
-    'correlation_analysis': None,
-    'univariate_models': None,
-    'multifactor_models': None,
-    'model_diagnostics': None,
-    'cache_key': None
-}
-
-
-def _get_cache_key(df: pd.DataFrame, economic_df: pd.DataFrame, companies: Dict[str, str]) -> str:
-    """Generate a unique cache key for this analysis run"""
-    return f"{len(df)}_{len(economic_df)}_{len(companies)}_{hash(tuple(companies.keys()))}"
-
-
-def _get_or_generate_correlation_analysis(df: pd.DataFrame, economic_df: pd.DataFrame, 
-                                          companies: Dict[str, str]) -> Dict:
-    """Get cached correlation analysis or generate if needed"""
-    cache_key = _get_cache_key(df, economic_df, companies)
-    
-    if _section_9_cache['cache_key'] != cache_key or _section_9_cache['correlation_analysis'] is None:
-        print("Section 9: Generating correlation analysis...")
-        _section_9_cache['correlation_analysis'] = _analyze_comprehensive_correlations(df, economic_df, companies)
-        _section_9_cache['cache_key'] = cache_key
-    else:
-        print("Section 9: Using cached correlation analysis")
-    
-    return _section_9_cache['correlation_analysis']
-
-
-def _get_or_generate_univariate_models(df: pd.DataFrame, economic_df: pd.DataFrame, 
-                                       companies: Dict[str, str]) -> Dict:
-    """Get cached univariate models or generate if needed"""
-    cache_key = _get_cache_key(df, economic_df, companies)
-    
-    if _section_9_cache['cache_key'] != cache_key or _section_9_cache['univariate_models'] is None:
-        print("Section 9: Generating univariate models...")
-        correlation_analysis = _get_or_generate_correlation_analysis(df, economic_df, companies)
-        _section_9_cache['univariate_models'] = _generate_univariate_models(df, economic_df, companies, correlation_analysis)
-        _section_9_cache['cache_key'] = cache_key
-    else:
-        print("Section 9: Using cached univariate models")
-    
-    return _section_9_cache['univariate_models']
-
-
-def _get_or_generate_multifactor_models(df: pd.DataFrame, economic_df: pd.DataFrame, 
-                                        companies: Dict[str, str]) -> Dict:
-    """Get cached multifactor models or generate if needed"""
-    cache_key = _get_cache_key(df, economic_df, companies)
-    
-    if _section_9_cache['cache_key'] != cache_key or _section_9_cache['multifactor_models'] is None:
-        print("Section 9: Generating multifactor models...")
-        correlation_analysis = _get_or_generate_correlation_analysis(df, economic_df, companies)
-        univariate_models = _get_or_generate_univariate_models(df, economic_df, companies)
-        _section_9_cache['multifactor_models'] = _generate_multifactor_models(df, economic_df, companies, 
-                                                                              correlation_analysis, univariate_models)
-        _section_9_cache['cache_key'] = cache_key
-    else:
-        print("Section 9: Using cached multifactor models")
-    
-    return _section_9_cache['multifactor_models']
-
-
-def _get_or_generate_model_diagnostics(df: pd.DataFrame, economic_df: pd.DataFrame, 
-                                       companies: Dict[str, str]) -> Dict:
-    """Get cached model diagnostics or generate if needed"""
-    cache_key = _get_cache_key(df, economic_df, companies)
-    
-    if _section_9_cache['cache_key'] != cache_key or _section_9_cache['model_diagnostics'] is None:
-        print("Section 9: Generating model diagnostics...")
-        univariate_models = _get_or_generate_univariate_models(df, economic_df, companies)
-        _section_9_cache['model_diagnostics'] = _generate_model_diagnostics(univariate_models)
-        _section_9_cache['cache_key'] = cache_key
-    else:
-        print("Section 9: Using cached model diagnostics")
-    
-    return _section_9_cache['model_diagnostics']
+PRODUCES = [
+    "s9_correlation_analysis",
+    "s9_univariate_models",
+    "s9_multifactor_models",
+    "s9_model_diagnostics",
+]
+CONSUMES = []
+
+
+def _get_or_generate_correlation_analysis(artifacts: ArtifactStore, df: pd.DataFrame,
+                                          economic_df: pd.DataFrame, companies: Dict[str, str]) -> Dict:
+    """Get stored correlation analysis or generate if needed"""
+    return artifacts.get_or_compute(
+        "s9_correlation_analysis",
+        lambda: _analyze_comprehensive_correlations(df, economic_df, companies)
+    )
+
+
+def _get_or_generate_univariate_models(artifacts: ArtifactStore, df: pd.DataFrame,
+                                       economic_df: pd.DataFrame, companies: Dict[str, str]) -> Dict:
+    """Get stored univariate models or generate if needed"""
+    return artifacts.get_or_compute(
+        "s9_univariate_models",
+        lambda: _generate_univariate_models(
+            df, economic_df, companies,
+            _get_or_generate_correlation_analysis(artifacts, df, economic_df, companies)
+        )
+    )
+
+
+def _get_or_generate_multifactor_models(artifacts: ArtifactStore, df: pd.DataFrame,
+                                        economic_df: pd.DataFrame, companies: Dict[str, str]) -> Dict:
+    """Get stored multifactor models or generate if needed"""
+    return artifacts.get_or_compute(
+        "s9_multifactor_models",
+        lambda: _generate_multifactor_models(
+            df, economic_df, companies,
+            _get_or_generate_correlation_analysis(artifacts, df, economic_df, companies),
+            _get_or_generate_univariate_models(artifacts, df, economic_df, companies)
+        )
+    )
+
+
+def _get_or_generate_model_diagnostics(artifacts: ArtifactStore, df: pd.DataFrame,
+                                       economic_df: pd.DataFrame, companies: Dict[str, str]) -> Dict:
+    """Get stored model diagnostics or generate if needed"""
+    return artifacts.get_or_compute(
+        "s9_model_diagnostics",
+        lambda: _generate_model_diagnostics(
+            _get_or_generate_univariate_models(artifacts, df, economic_df, companies)
+        )
+    )
 
 
 # =============================================================================
@@ -131,16 +106,17 @@ def generate(collector, analysis_id: str) -> str:
         companies = collector.companies
         df = collector.get_all_financial_data()
         economic_df = collector.get_economic()
+        artifacts = ArtifactStore(analysis_id)
         
-        # Build all subsections (data will be cached and reused)
-        section_9a1_html = _build_section_9a1_comprehensive_correlation(df, economic_df, companies)
+        # Build all subsections (models are computed once and shared via the artifact store)
+        section_9a1_html = _build_section_9a1_comprehensive_correlation(df, economic_df, companies, artifacts)
         section_9a2_html = _build_section_9a2_extended_correlation(df, economic_df, companies)
-        section_9b1_html = _build_section_9b1_univariate_regression(df, economic_df, companies)
-        section_9b2_html = _build_section_9b2_model_diagnostics(df, economic_df, companies)
-        section_9c1_html = _build_section_9c1_multifactor_models(df, economic_df, companies)
-        section_9c2_html = _build_section_9c2_model_comparison(df, economic_df, companies)
-        section_9d_html = _build_section_9d_visualizations(df, economic_df, companies)
-        section_9e_html = _build_section_9e_strategic_insights(df, economic_df, companies)
+        section_9b1_html = _build_section_9b1_univariate_regression(df, economic_df, companies, artifacts)
+        section_9b2_html = _build_section_9b2_model_diagnostics(df, economic_df, companies, artifacts)
+        section_9c1_html = _build_section_9c1_multifactor_models(df, economic_df, companies, artifacts)
+        section_9c2_html = _build_section_9c2_model_comparison(df, economic_df, companies, artifacts)
+        section_9d_html = _build_section_9d_visualizations(df, economic_df, companies, artifacts)
+        section_9e_html = _build_section_9e_strategic_insights(df, economic_df, companies, artifacts)
         
         # Combine all subsections
         content = f"""
@@ -179,14 +155,14 @@ def generate(collector, analysis_id: str) -> str:
 # =============================================================================
 
 def _build_section_9a1_comprehensive_correlation(df: pd.DataFrame, economic_df: pd.DataFrame, 
-                                                 companies: Dict[str, str]) -> str:
+                                                 companies: Dict[str, str], artifacts: ArtifactStore) -> str:
     """Build subsection 9A.1: Comprehensive Correlation Analysis"""
     
     if economic_df.empty or df.empty:
         return build_info_box("<p>Insufficient data for correlation analysis.</p>", "warning", "Data Unavailable")
     
     # Use cached data
-    correlation_analysis = _get_or_generate_correlation_analysis(df, economic_df, companies)
+    correlation_analysis = _get_or_generate_correlation_analysis(artifacts, df, economic_df, companies)
     
     if not correlation_analysis:
         return build_info_box("<p>No significant correlations found.</p>", "warning", "Analysis Results")
@@ -427,13 +403,13 @@ def _build_section_9a2_extended_correlation(df: pd.DataFrame, economic_df: pd.Da
 # =============================================================================
 
 def _build_section_9b1_univariate_regression(df: pd.DataFrame, economic_df: pd.DataFrame, 
-                                            companies: Dict[str, str]) -> str:
+                                            companies: Dict[str, str], artifacts: ArtifactStore) -> str:
     """Build subsection 9B.1: Univariate OLS Regression Analysis"""
     
     if economic_df.empty or df.empty:
         return ""
     
-    univariate_models = _get_or_generate_univariate_models(df, economic_df, companies)
+    univariate_models = _get_or_generate_univariate_models(artifacts, df, economic_df, companies)
     
     if not univariate_models:
         return build_info_box("<p>Insufficient data for univariate regression analysis.</p>", "warning", "Analysis Results")
@@ -572,13 +548,13 @@ def _build_section_9b1_univariate_regression(df: pd.DataFrame, economic_df: pd.D
 # =============================================================================
 
 def _build_section_9b2_model_diagnostics(df: pd.DataFrame, economic_df: pd.DataFrame, 
-                                        companies: Dict[str, str]) -> str:
+                                        companies: Dict[str, str], artifacts: ArtifactStore) -> str:
     """Build subsection 9B.2: Statistical Model Diagnostics & Validation"""
     
     if economic_df.empty or df.empty:
         return ""
     
-    model_diagnostics = _get_or_generate_model_diagnostics(df, economic_df, companies)
+    model_diagnostics = _get_or_generate_model_diagnostics(artifacts, df, economic_df, companies)
     
     if not model_diagnostics:
         return build_info_box("<p>Model diagnostics unavailable.</p>", "warning", "Diagnostics Status")
@@ -692,14 +668,14 @@ def _build_section_9b2_model_diagnostics(df: pd.DataFrame, economic_df: pd.DataF
 # =============================================================================
 
 def _build_section_9c1_multifactor_models(df: pd.DataFrame, economic_df: pd.DataFrame, 
-                                         companies: Dict[str, str]) -> str:
+                                         companies: Dict[str, str], artifacts: ArtifactStore) -> str:
     """Build subsection 9C.1: Multifactor OLS Regression Models"""
     
     if economic_df.empty or df.empty:
         return ""
     
-    univariate_models = _get_or_generate_univariate_models(df, economic_df, companies)
-    multifactor_models = _get_or_generate_multifactor_models(df, economic_df, companies)
+    univariate_models = _get_or_generate_univariate_models(artifacts, df, economic_df, companies)
+    multifactor_models = _get_or_generate_multifactor_models(artifacts, df, economic_df, companies)
     
     if not multifactor_models:
         return build_info_box("<p>Insufficient data for multifactor regression analysis.</p>", 
@@ -838,14 +814,14 @@ def _build_section_9c1_multifactor_models(df: pd.DataFrame, economic_df: pd.Data
 # =============================================================================
 
 def _build_section_9c2_model_comparison(df: pd.DataFrame, economic_df: pd.DataFrame, 
-                                       companies: Dict[str, str]) -> str:
+                                       companies: Dict[str, str], artifacts: ArtifactStore) -> str:
     """Build subsection 9C.2: Model Performance Comparison & Selection Framework"""
     
     if economic_df.empty or df.empty:
         return ""
     
-    univariate_models = _get_or_generate_univariate_models(df, economic_df, companies)
-    multifactor_models = _get_or_generate_multifactor_models(df, economic_df, companies)
+    univariate_models = _get_or_generate_univariate_models(artifacts, df, economic_df, companies)
+    multifactor_models = _get_or_generate_multifactor_models(artifacts, df, economic_df, companies)
     
     if not univariate_models and not multifactor_models:
         return ""
@@ -970,7 +946,7 @@ INSTRUCTIONS:
 from typing import Dict, Optional
 
 
-def _build_section_9d_visualizations(df, economic_df, companies):
+def _build_section_9d_visualizations(df, economic_df, companies, artifacts):
     """
     Build subsection 9D: Signal Discovery Visualization Analysis
     Complete with all 25 standalone Plotly charts
@@ -981,10 +957,10 @@ def _build_section_9d_visualizations(df, economic_df, companies):
                             "warning", "Analysis Results")
     
     # Get all cached data (reuses existing cache)
-    correlation_analysis = _get_or_generate_correlation_analysis(df, economic_df, companies)
-    univariate_models = _get_or_generate_univariate_models(df, economic_df, companies)
-    multifactor_models = _get_or_generate_multifactor_models(df, economic_df, companies)
-    model_diagnostics = _get_or_generate_model_diagnostics(df, economic_df, companies)
+    correlation_analysis = _get_or_generate_correlation_analysis(artifacts, df, economic_df, companies)
+    univariate_models = _get_or_generate_univariate_models(artifacts, df, economic_df, companies)
+    multifactor_models = _get_or_generate_multifactor_models(artifacts, df, economic_df, companies)
+    model_diagnostics = _get_or_generate_model_diagnostics(artifacts, df, economic_df, companies)
     
     # Get extended correlation data for chart 23
     extended_correlation = _analyze_extended_correlations(df, economic_df, companies)
@@ -1322,16 +1298,16 @@ def _build_section_9d_visualizations(df, economic_df, companies):
 # =============================================================================
 
 def _build_section_9e_strategic_insights(df: pd.DataFrame, economic_df: pd.DataFrame, 
-                                        companies: Dict[str, str]) -> str:
+                                        companies: Dict[str, str], artifacts: ArtifactStore) -> str:
     """Build subsection 9E: Economic Interpretation & Strategic Signal Framework"""
     
     if economic_df.empty or df.empty:
         return ""
     
-    correlation_analysis = _get_or_generate_correlation_analysis(df, economic_df, companies)
-    univariate_models = _get_or_generate_univariate_models(df, economic_df, companies)
-    multifactor_models = _get_or_generate_multifactor_models(df, economic_df, companies)
-    model_diagnostics = _get_or_generate_model_diagnostics(df, economic_df, companies)
+    correlation_analysis = _get_or_generate_correlation_analysis(artifacts, df, economic_df, companies)
+    univariate_models = _get_or_generate_univariate_models(artifacts, df, economic_df, companies)
+    multifactor_models = _get_or_generate_multifactor_models(artifacts, df, economic_df, companies)
+    model_diagnostics = _get_or_generate_model_diagnostics(artifacts, df, economic_df, companies)
     
     if not correlation_analysis:
         return build_info_box("<p>Insufficient data for strategic insights analysis.</p>", 
@@ -1400,82 +1376,63 @@ def _analyze_comprehensive_correlations(df: pd.DataFrame, economic_df: pd.DataFr
         if len(merged_data) < 3:
             continue
         
-        correlations = {}
+        indicators = [col for col in econ_numeric.columns if col in merged_data.columns]
+        revenue_growth = pd.to_numeric(merged_data['revenue_growth'], errors='coerce').dropna()
+        macro_values = merged_data[indicators]
         
-        for macro_indicator in econ_numeric.columns:
-            if macro_indicator not in merged_data.columns or 'revenue_growth' not in merged_data.columns:
-                continue
-            
-            # Get base data
-            revenue_growth = merged_data['revenue_growth'].dropna()
-            macro_values = merged_data[macro_indicator].dropna()
+        if not indicators or revenue_growth.empty:
+            continue
+        
+        # Indicators need 3 contemporaneous observations before lags are tested
+        common_counts = macro_values.reindex(revenue_growth.index).notna().sum().to_numpy()
+        
+        # Test multiple lags (0, 1, 2 years) for all indicators at once,
+        # keeping the strongest correlation (by absolute value) per indicator
+        best_corr = np.full(len(indicators), np.nan)
+        best_p_value = np.ones(len(indicators))
+        best_n = np.zeros(len(indicators), dtype=int)
+        best_lag = np.zeros(len(indicators), dtype=int)
+        
+        for lag in [0, 1, 2]:
+            # For lag > 0: Revenue Growth(t) correlates with Macro(t-lag)
+            # Shift macro indicators forward by 'lag' periods (so they align with future revenue)
+            macro_lagged = macro_values.copy()
+            macro_lagged.index = macro_lagged.index + lag
+            macro_lagged = macro_lagged.reindex(revenue_growth.index)
             
-            # Find common indices
-            common_index = revenue_growth.index.intersection(macro_values.index)
+            corr, p_value, n_obs = correlate(revenue_growth.to_numpy(dtype=float), macro_lagged.to_numpy(dtype=float))
             
-            if len(common_index) < 3:
-                continue
-            
-            # Test multiple lags (0, 1, 2 years)
-            best_corr = None
-            best_lag = 0
-            best_p_value = 1.0
-            best_n = 0
+            better = ~np.isnan(corr) & (np.isnan(best_corr) | (np.abs(corr) > np.abs(best_corr)))
+            best_corr = np.where(better, corr, best_corr)
+            best_p_value = np.where(better, p_value, best_p_value)
+            best_n = np.where(better, n_obs, best_n)
+            best_lag = np.where(better, lag, best_lag)
+        
+        correlations = {}
+        
+        for k in np.flatnonzero((common_counts >= 3) & ~np.isnan(best_corr)):
+            macro_indicator = indicators[k]
+            lag = int(best_lag[k])
             
-            for lag in [0, 1, 2]:
-                try:
-                    # For lag > 0: Revenue Growth(t) correlates with Macro(t-lag)
-                    # Shift macro indicator forward by 'lag' periods (so it aligns with future revenue)
-                    if lag > 0:
-                        # Create lagged macro: shift index forward
-                        macro_lagged = macro_values.copy()
-                        macro_lagged.index = macro_lagged.index + lag
-                    else:
-                        macro_lagged = macro_values
-                    
-                    # Find common indices after lag adjustment
-                    common_lagged = revenue_growth.index.intersection(macro_lagged.index)
-                    
-                    if len(common_lagged) < 3:
-                        continue
-                    
-                    rev_common = revenue_growth[common_lagged]
-                    macro_common = macro_lagged[common_lagged]
-                    
-                    # Calculate correlation
-                    corr_coef, p_value = stats.pearsonr(rev_common, macro_common)
-                    
-                    # Keep the best correlation (by absolute value)
-                    if best_corr is None or abs(corr_coef) > abs(best_corr):
-                        best_corr = corr_coef
-                        best_lag = lag
-                        best_p_value = p_value
-                        best_n = len(common_lagged)
-                
-                except Exception as e:
-                    continue
+            # Determine significance level
+            if best_p_value[k] < 0.01:
+                significance = "***"
+            elif best_p_value[k] < 0.05:
+                significance = "**"
+            elif best_p_value[k] < 0.10:
+                significance = "*"
+            else:
+                significance = ""
             
-            # Store best correlation found across all lags
-            if best_corr is not None:
-                # Determine significance level
-                if best_p_value < 0.01:
-                    significance = "***"
-                elif best_p_value < 0.05:
-                    significance = "**"
-                elif best_p_value < 0.10:
-                    significance = "*"
-                else:
-                    significance = ""
-                
-                correlations[macro_indicator] = {
-                    'correlation': best_corr,
-                    'p_value': best_p_value,
-                    'n_observations': best_n,
-                    'significance': significance,
-                    'abs_correlation': abs(best_corr),
-                    'best_lag': best_lag,  # NEW: which lag worked best
-                    'lag_description': f"Lag {best_lag}Y" if best_lag > 0 else "Contemporaneous"
-                }
+            correlations[macro_indicator] = {
+                'correlation': best_corr[k],
+                'p_value': best_p_value[k],
+                'n_observations': int(best_n[k]),
+                'significance': significance,
+                'abs_correlation': abs(best_corr[k]),
+                'best_lag': lag,  # NEW: which lag worked best
+                'lag_description': f"Lag {lag}Y" if lag > 0 else "Contemporaneous"
+            }
         
         if correlations:
             # Sort by absolute correlation strength
@@ -1548,37 +1505,26 @@ def _analyze_extended_correlations(df: pd.DataFrame, economic_df: pd.DataFrame,
         
         metric_correlations = {}
         
+        indicators = [col for col in econ_numeric.columns if col in merged_data.columns]
+        macro_matrix = merged_data[indicators].to_numpy(dtype=float)
+        
         for financial_metric in financial_metrics:
-            if financial_metric not in merged_data.columns:
+            if financial_metric not in merged_data.columns or not indicators:
                 continue
             
-            correlations = {}
+            # Correlations and p-values against all macro indicators at once
+            financial_values = pd.to_numeric(merged_data[financial_metric], errors='coerce')
+            corr, p_value, _ = correlate(financial_values.to_numpy(dtype=float), macro_matrix)
             
-            for macro_indicator in econ_numeric.columns:
-                if macro_indicator in merged_data.columns:
-                    # Calculate correlation
-                    financial_values = merged_data[financial_metric].dropna()
-                    macro_values = merged_data[macro_indicator].dropna()
-                    
-                    # Find common indices
-                    common_index = financial_values.index.intersection(macro_values.index)
-                    
-                    if len(common_index) >= 3:
-                        fin_common = financial_values[common_index]
-                        macro_common = macro_values[common_index]
-                        
-                        try:
-                            # Calculate correlation and p-value
-                            corr_coef, p_value = stats.pearsonr(fin_common, macro_common)
-                            
-                            if not np.isnan(corr_coef):
-                                correlations[macro_indicator] = {
-                                    'correlation': corr_coef,
-                                    'p_value': p_value,
-                                    'abs_correlation': abs(corr_coef)
-                                }
-                        except:
-                            continue
+            correlations = {
+                macro_indicator: {
+                    'correlation': corr[k],
+                    'p_value': p_value[k],
+                    'abs_correlation': abs(corr[k])
+                }
+                for k, macro_indicator in enumerate(indicators)
+                if not np.isnan(corr[k])
+            }
             
             if correlations:
                 # Find strongest correlation for this metric
@@ -1630,54 +1576,61 @@ def _generate_univariate_models(df: pd.DataFrame, economic_df: pd.DataFrame,
         # Get top 5 strongest correlations
         top_correlations = dict(list(correlation_analysis[company_name]['all_correlations'].items())[:5])
         
+        candidates = [
+            indicator for indicator, corr_stats in top_correlations.items()
+            if indicator in merged_data.columns and abs(corr_stats['correlation']) >= 0.3
+        ]
+        
+        if not candidates:
+            continue
+        
+        # Closed-form fits for all candidates at once
+        y = pd.to_numeric(merged_data['revenue_growth'], errors='coerce')
+        fits = univariate_ols(y.to_numpy(dtype=float), merged_data[candidates].to_numpy(dtype=float), min_obs=4)
+        
         company_models = {}
         
-        for indicator, corr_stats in top_correlations.items():
-            if indicator not in merged_data.columns or abs(corr_stats['correlation']) < 0.3:
+        for k, indicator in enumerate(candidates):
+            if np.isnan(fits['slope'][k]):
                 continue
             
-            y = merged_data['revenue_growth'].dropna()
-            x = merged_data[indicator].dropna()
+            common_index = y.dropna().index.intersection(merged_data[indicator].dropna().index)
             
-            common_index = y.index.intersection(x.index)
-            
-            if len(common_index) >= 4:
-                y_reg = y[common_index]
-                x_reg = x[common_index]
-                
-                X_reg = sm.add_constant(x_reg)
-                
-                try:
-                    model = sm.OLS(y_reg, X_reg).fit()
-                    
-                    company_models[indicator] = {
-                        'slope': model.params.iloc[1] if len(model.params) > 1 else 0,
-                        'intercept': model.params.iloc[0],
-                        'slope_tstat': model.tvalues.iloc[1] if len(model.tvalues) > 1 else 0,
-                        'slope_pvalue': model.pvalues.iloc[1] if len(model.pvalues) > 1 else 1,
-                        'r_squared': model.rsquared,
-                        'adj_r_squared': model.rsquared_adj,
-                        'f_statistic': model.fvalue,
-                        'f_pvalue': model.f_pvalue,
-                        'aic': model.aic,
-                        'bic': model.bic,
-                        'n_observations': len(common_index),
-                        'residual_std_error': np.sqrt(model.mse_resid),
-                        'model_object': model,
-                        'x_data': x_reg,
-                        'y_data': y_reg
-                    }
-                except Exception as e:
-                    continue
+            company_models[indicator] = {
+                'slope': fits['slope'][k],
+                'intercept': fits['intercept'][k],
+                'slope_tstat': fits['slope_tstat'][k],
+                'slope_pvalue': fits['slope_pvalue'][k],
+                'r_squared': fits['r_squared'][k],
+                'adj_r_squared': fits['adj_r_squared'][k],
+                'f_statistic': fits['f_statistic'][k],
+                'f_pvalue': fits['f_pvalue'][k],
+                'aic': fits['aic'][k],
+                'bic': fits['bic'][k],
+                'n_observations': int(fits['n_observations'][k]),
+                'residual_std_error': fits['residual_std_error'][k],
+                'x_data': merged_data.loc[common_index, indicator],
+                'y_data': y[common_index]
+            }
         
         if company_models:
             ranked_models = dict(sorted(company_models.items(), 
                                       key=lambda x: x[1]['adj_r_squared'], 
                                       reverse=True))
             
+            # Only the best model gets a full statsmodels fit (its residuals
+            # feed the diagnostics in 9B.2)
+            best_indicator, best_stats = next(iter(ranked_models.items()))
+            try:
+                best_stats['model_object'] = sm.OLS(
+                    best_stats['y_data'], sm.add_constant(best_stats['x_data'])
+                ).fit()
+            except Exception:
+                pass
+            
             univariate_models[company_name] = {
                 'models': ranked_models,
-                'best_model': list(ranked_models.items())[0] if ranked_models else None,
+                'best_model': (best_indicator, best_stats),
                 'model_count': len(ranked_models)
             }
     
@@ -1854,11 +1807,8 @@ def _fit_multifactor_model(merged_data: pd.DataFrame, predictors: List[str],
         X_reg = x_data.loc[common_index]
         
         # Check multicollinearity
-        correlation_matrix = X_reg.corr()
-        max_corr = 0
-        for i in range(len(correlation_matrix)):
-            for j in range(i+1, len(correlation_matrix)):
-                max_corr = max(max_corr, abs(correlation_matrix.iloc[i, j]))
+        correlation_matrix = np.abs(X_reg.corr().to_numpy())
+        max_corr = np.nanmax(np.triu(correlation_matrix, k=1)) if len(predictors) > 1 else 0
         
         if max_corr > 0.8:
             return None
@@ -1868,12 +1818,8 @@ def _fit_multifactor_model(merged_data: pd.DataFrame, predictors: List[str],
         model = sm.OLS(y_reg, X_reg_const).fit()
         
         # Calculate VIFs
-        vifs = []
-        for i in range(1, X_reg_const.shape[1]):
-            vif = variance_inflation_factor(X_reg_const.values, i)
-            vifs.append(vif)
-        
-        max_vif = max(vifs) if vifs else 0
+        vifs = variance_inflation_factors(X_reg.to_numpy())
+        max_vif = float(np.max(vifs)) if len(vifs) else 0
         
         # Extract coefficients
         coefficients = {}
@@ -5,9 +5,10 @@ Phase 1: Scaffolding + Section 15A (Liquidity & Float Analysis)
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Tuple, Optional
+from typing import Dict, List, Any, Optional
 import logging
 
+from backend.app.report_generation.artifacts import ArtifactStore
 from backend.app.report_generation.html_utils import (
     generate_section_wrapper,
     build_stat_card,
@@ -20,9 +21,13 @@ from backend.app.report_generation.html_utils import (
     format_percentage,
     format_number
 )
+from backend.app.report_generation.indicators import get_indicators, indicators_by_symbol
 
 logger = logging.getLogger(__name__)
 
+PRODUCES = []
+CONSUMES = ["technical_indicators"]
+
 
 """
 REPLACE THE MAIN generate() FUNCTION WITH THIS
@@ -62,6 +67,9 @@ def generate(collector, analysis_id: str) -> str:
             analyst_estimates = pd.DataFrame()
             analyst_targets = pd.DataFrame()
         
+        # Indicators for all tickers, shared with Sections 16 and 17
+        indicators = indicators_by_symbol(get_indicators(ArtifactStore(analysis_id), prices_df))
+        
         # Generate ALL analyses (all phases)
         
         liquidity_analysis = _generate_liquidity_analysis(df, prices_df, institutional_df, profiles_df, companies)
@@ -70,10 +78,10 @@ def generate(collector, analysis_id: str) -> str:
         float_analysis = _analyze_float_dynamics(df, prices_df, institutional_df, profiles_df, companies)
         
         
-        technical_analysis = _generate_technical_analysis(prices_df, companies, df)
+        technical_analysis = _generate_technical_analysis(prices_df, companies, df, indicators)
         
         
-        volatility_analysis = _analyze_volatility_patterns(prices_df, companies, technical_analysis)
+        volatility_analysis = _analyze_volatility_patterns(prices_df, companies, technical_analysis, indicators)
         
         
         price_discovery_analysis = _analyze_price_discovery(prices_df, analyst_targets, profiles_df, companies)
@@ -838,7 +846,7 @@ Replace the stub functions and add these new functions to section_15.py.
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, List
 import logging
 
 logger = logging.getLogger(__name__)
@@ -936,8 +944,8 @@ def _build_volatility_analysis_section(volatility_analysis: Dict, companies: Dic
 # =============================================================================
 
 def _generate_technical_analysis(prices_df: pd.DataFrame, companies: Dict[str, str], 
-                                df: pd.DataFrame) -> Dict[str, Dict]:
-    """Generate comprehensive technical analysis suite"""
+                                df: pd.DataFrame, indicators: Dict[str, pd.DataFrame]) -> Dict[str, Dict]:
+    """Generate comprehensive technical analysis suite from the shared indicator frame"""
     
     first_company = list(companies.keys())[0]
     matches = prices_df[prices_df['Company'] == first_company]
@@ -950,68 +958,38 @@ def _generate_technical_analysis(prices_df: pd.DataFrame, companies: Dict[str, s
     
     for company_name, ticker in companies.items():
         try:
-            # Get company prices
-            if not prices_df.empty:
-                price_matches = prices_df[prices_df['Company'] == company_name]
-                company_prices = price_matches.copy()
-            else:
-                continue
+            company_prices = indicators.get(ticker)
             
-            if len(company_prices) < 50:  # Minimum data for technical analysis
+            if company_prices is None or len(company_prices) < 50:  # Minimum data for technical analysis
                 continue
             
-            company_prices = company_prices.sort_values('date').reset_index(drop=True)
-            
-            # Basic price metrics
-            close_prices = company_prices['close']
-            high_prices = company_prices['high'] if 'high' in company_prices.columns else close_prices
-            low_prices = company_prices['low'] if 'low' in company_prices.columns else close_prices
-            volume = company_prices['volume'] if 'volume' in company_prices.columns else pd.Series([1000000] * len(close_prices))
-            
-            # Momentum indicators
-            # RSI (14-day)
-            rsi = _calculate_rsi(close_prices, 14)
-            current_rsi = rsi.iloc[-1]
-            
-            # MACD
-            macd_line, macd_signal, macd_histogram = _calculate_macd(close_prices)
-            current_macd = macd_line.iloc[-1] if not macd_line.empty else 0
-            current_macd_signal = macd_signal.iloc[-1] if not macd_signal.empty else 0
+            latest = company_prices.iloc[-1]
+            current_price = latest['close']
             
-            # Moving averages
-            sma_20 = close_prices.rolling(window=20).mean()
-            sma_50 = close_prices.rolling(window=50).mean()
+            # Momentum indicators: RSI (14-day) and MACD
+            current_rsi = latest['rsi_14']
+            current_macd = latest['macd']
+            current_macd_signal = latest['macd_signal']
             
             # Price relative to moving averages
-            current_price = close_prices.iloc[-1]
-            price_vs_sma20 = _safe_divide(current_price - sma_20.iloc[-1], sma_20.iloc[-1]) * 100 if not sma_20.empty else 0
-            price_vs_sma50 = _safe_divide(current_price - sma_50.iloc[-1], sma_50.iloc[-1]) * 100 if not sma_50.empty else 0
-            
-            # Volatility indicators
-            # Bollinger Bands
-            bb_middle = sma_20
-            bb_std = close_prices.rolling(window=20).std()
-            bb_upper = bb_middle + (bb_std * 2)
-            bb_lower = bb_middle - (bb_std * 2)
-            bb_position = _safe_divide(current_price - bb_lower.iloc[-1], bb_upper.iloc[-1] - bb_lower.iloc[-1]) if not bb_upper.empty else 0.5
-            
-            # Average True Range (ATR)
-            atr = _calculate_atr(high_prices, low_prices, close_prices, 14)
-            current_atr = atr.iloc[-1] if not atr.empty else 0
+            price_vs_sma20 = _safe_divide(current_price - latest['sma_20'], latest['sma_20']) * 100
+            price_vs_sma50 = _safe_divide(current_price - latest['sma_50'], latest['sma_50']) * 100
+            
+            # Volatility indicators: Bollinger Bands and Average True Range
+            bb_position = _safe_divide(current_price - latest['bb_lower'], latest['bb_upper'] - latest['bb_lower'])
+            current_atr = latest['atr_14'] if pd.notna(latest['atr_14']) else 0
             atr_percentage = _safe_divide(current_atr, current_price) * 100 if current_price > 0 else 0
             
             # Volume indicators
-            volume_sma = volume.rolling(window=20).mean()
-            current_volume_ratio = _safe_divide(volume.iloc[-1], volume_sma.iloc[-1]) if not volume_sma.empty and volume_sma.iloc[-1] > 0 else 1
+            current_volume_ratio = _safe_divide(latest['volume'], latest['volume_sma_20'], default=1) if latest['volume_sma_20'] > 0 else 1
             
             # Trend strength
-            adx = _calculate_adx(high_prices, low_prices, close_prices, 14)
-            current_adx = adx.iloc[-1] if not adx.empty else 25
+            current_adx = latest['adx_14'] if pd.notna(latest['adx_14']) else 25
             
             # Support and resistance levels
             recent_data = company_prices.tail(60)  # Last 3 months
-            support_level = recent_data['low'].min() if 'low' in recent_data.columns else recent_data['close'].min()
-            resistance_level = recent_data['high'].max() if 'high' in recent_data.columns else recent_data['close'].max()
+            support_level = recent_data['low'].min()
+            resistance_level = recent_data['high'].max()
             
             # Technical signals
             momentum_signal = _classify_momentum_signal(current_rsi, current_macd, current_macd_signal)
@@ -1054,65 +1032,6 @@ def _generate_technical_analysis(prices_df: pd.DataFrame, companies: Dict[str, s
     return technical_analysis
 
 
-# Technical indicator calculation helpers
-def _calculate_rsi(prices: pd.Series, period: int = 14) -> pd.Series:
-    """Calculate RSI indicator"""
-    delta = prices.diff()
-    gains = delta.where(delta > 0, 0)
-    losses = -delta.where(delta < 0, 0)
-    
-    avg_gains = gains.rolling(window=period).mean()
-    avg_losses = losses.rolling(window=period).mean()
-    
-    rs = avg_gains / avg_losses
-    rsi = 100 - (100 / (1 + rs))
-    
-    return rsi
-
-
-def _calculate_macd(prices: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) -> Tuple[pd.Series, pd.Series, pd.Series]:
-    """Calculate MACD indicator"""
-    ema_fast = prices.ewm(span=fast).mean()
-    ema_slow = prices.ewm(span=slow).mean()
-    
-    macd_line = ema_fast - ema_slow
-    macd_signal = macd_line.ewm(span=signal).mean()
-    macd_histogram = macd_line - macd_signal
-    
-    return macd_line, macd_signal, macd_histogram
-
-
-def _calculate_atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
-    """Calculate Average True Range"""
-    tr1 = high - low
-    tr2 = abs(high - close.shift())
-    tr3 = abs(low - close.shift())
-    
-    true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    atr = true_range.rolling(window=period).mean()
-    
-    return atr
-
-
-def _calculate_adx(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
-    """Calculate Average Directional Index"""
-    tr = _calculate_atr(high, low, close, period)
-    
-    dm_plus = high.diff()
-    dm_minus = low.diff() * -1
-    
-    dm_plus = dm_plus.where((dm_plus > dm_minus) & (dm_plus > 0), 0)
-    dm_minus = dm_minus.where((dm_minus > dm_plus) & (dm_minus > 0), 0)
-    
-    di_plus = (dm_plus.rolling(window=period).mean() / tr) * 100
-    di_minus = (dm_minus.rolling(window=period).mean() / tr) * 100
-    
-    dx = abs(di_plus - di_minus) / (di_plus + di_minus) * 100
-    adx = dx.rolling(window=period).mean()
-    
-    return adx.fillna(25)
-
-
 # Signal classification helpers
 def _classify_momentum_signal(rsi: float, macd: float, macd_signal: float) -> str:
     """Classify momentum signal"""
@@ -1404,7 +1323,7 @@ def _create_technical_charts(technical_analysis: Dict) -> List[str]:
 # =============================================================================
 
 def _analyze_volatility_patterns(prices_df: pd.DataFrame, companies: Dict[str, str], 
-                                technical_analysis: Dict) -> Dict[str, Dict]:
+                                technical_analysis: Dict, indicators: Dict[str, pd.DataFrame]) -> Dict[str, Dict]:
     """Analyze volatility patterns and clustering"""
     
     if prices_df.empty:
@@ -1414,17 +1333,11 @@ def _analyze_volatility_patterns(prices_df: pd.DataFrame, companies: Dict[str, s
     
     for company_name, ticker in companies.items():
         try:
-            # Get company prices
-            if not prices_df.empty:
-                price_matches = prices_df[prices_df['Company'] == company_name]
-                company_prices = price_matches.copy()
-            else:
-                continue
+            company_prices = indicators.get(ticker)
             
-            if len(company_prices) < 100:  # Need sufficient data
+            if company_prices is None or len(company_prices) < 100:  # Need sufficient data
                 continue
             
-            company_prices = company_prices.sort_values('date').reset_index(drop=True)
             close_prices = company_prices['close']
             
             # Calculate returns
@@ -1435,8 +1348,8 @@ def _analyze_volatility_patterns(prices_df: pd.DataFrame, companies: Dict[str, s
             annualized_vol = daily_vol * np.sqrt(252) * 100
             
             # Rolling volatility analysis
-            vol_20d = returns.rolling(window=20).std() * np.sqrt(252) * 100
-            vol_60d = returns.rolling(window=60).std() * np.sqrt(252) * 100
+            vol_20d = company_prices['volatility_20'].dropna()
+            vol_60d = company_prices['volatility_60'].dropna()
             
             current_vol_20d = vol_20d.iloc[-1] if not vol_20d.empty else annualized_vol
             current_vol_60d = vol_60d.iloc[-1] if not vol_60d.empty else annualized_vol
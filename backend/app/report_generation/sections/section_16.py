@@ -6,6 +6,9 @@ import numpy as np
 from typing import Dict, List, Optional, Any, Tuple
 from scipy import stats
 
+from backend.app.report_generation.artifacts import ArtifactStore
+from backend.app.report_generation.benchmark import BETA_WINDOWS, build_return_panel, relative_metrics
+from backend.app.report_generation.indicators import compute_indicators, get_indicators, indicators_by_symbol
 from backend.app.report_generation.html_utils import (
     generate_section_wrapper,
     build_stat_card,
@@ -22,6 +25,9 @@ from backend.app.report_generation.html_utils import (
     build_colored_cell
 )
 
+PRODUCES = ["beta_analysis"]
+CONSUMES = ["technical_indicators"]
+
 
 def generate(collector, analysis_id: str) -> str:
     """
@@ -51,37 +57,44 @@ def generate(collector, analysis_id: str) -> str:
             sp500_daily = _simulate_benchmark_data(daily_prices)
             sp500_monthly = _simulate_benchmark_data(monthly_prices)
         
+        # Benchmark-relative return statistics for all companies at once,
+        # shared by the subsections below
+        relative = relative_metrics(*build_return_panel(daily_prices, sp500_daily, companies))
+        
+        # Beta metrics are shared by 16A and 16E-16H (and Section 1)
+        artifacts = ArtifactStore(analysis_id)
+        
         # Build all subsections
         section_16a_html = _build_section_16a_beta_analysis(
-            daily_prices, sp500_daily, companies
+            daily_prices, sp500_daily, companies, artifacts, relative
         )
         
         section_16b_html = _build_section_16b_performance_analysis(
-            daily_prices, monthly_prices, sp500_daily, sp500_monthly, companies
+            daily_prices, monthly_prices, sp500_daily, sp500_monthly, companies, relative
         )
         
         section_16c_html = _build_section_16c_regime_analysis(
-            daily_prices, sp500_daily, companies
+            daily_prices, sp500_daily, companies, relative
         )
         
         section_16d_html = _build_section_16d_technical_analysis(
-            daily_prices, sp500_daily, companies
+            daily_prices, sp500_daily, companies, artifacts
         )
         
         section_16e_html = _build_section_16e_risk_management(
-            daily_prices, sp500_daily, companies
+            daily_prices, sp500_daily, companies, artifacts, relative
         )
         
         section_16f_html = _build_section_16f_portfolio_insights(
-            daily_prices, sp500_daily, companies
+            daily_prices, sp500_daily, companies, artifacts, relative
         )
         
         section_16g_html = _build_section_16g_dashboard(
-            daily_prices, sp500_daily, companies
+            daily_prices, sp500_daily, companies, artifacts, relative
         )
         
         section_16h_html = _build_section_16h_strategic_framework(
-            daily_prices, sp500_daily, companies
+            daily_prices, sp500_daily, companies, artifacts, relative
         )
         
         # Combine all subsections
@@ -120,12 +133,24 @@ def generate(collector, analysis_id: str) -> str:
 # SECTION 16A: BETA AND CORRELATION ANALYSIS
 # =============================================================================
 
+def _get_beta_analysis(artifacts: ArtifactStore, daily_prices: pd.DataFrame,
+                       sp500_daily: pd.DataFrame, companies: Dict[str, str],
+                       relative: Optional[Dict[str, Dict]] = None) -> Dict[str, Dict]:
+    """Beta metrics from the artifact store, computed on first use"""
+    return artifacts.get_or_compute(
+        "beta_analysis",
+        lambda: _calculate_enhanced_beta_metrics(daily_prices, sp500_daily, companies, relative)
+    )
+
+
 def _build_section_16a_beta_analysis(daily_prices: pd.DataFrame, sp500_daily: pd.DataFrame,
-                                     companies: Dict[str, str]) -> str:
+                                     companies: Dict[str, str],
+                                     artifacts: ArtifactStore,
+                                     relative: Dict[str, Dict]) -> str:
     """Build Section 16A: Enhanced Beta and Correlation Analysis"""
     
     # Calculate beta metrics
-    beta_analysis = _calculate_enhanced_beta_metrics(daily_prices, sp500_daily, companies)
+    beta_analysis = _get_beta_analysis(artifacts, daily_prices, sp500_daily, companies, relative)
     
     if not beta_analysis:
         return build_info_box("<p>Insufficient data for beta analysis.</p>", "warning", "16A. Beta Analysis")
@@ -205,58 +230,35 @@ def _build_section_16a_beta_analysis(daily_prices: pd.DataFrame, sp500_daily: pd
 
 
 def _calculate_enhanced_beta_metrics(daily_prices: pd.DataFrame, sp500_daily: pd.DataFrame,
-                                     companies: Dict[str, str]) -> Dict[str, Dict]:
+                                     companies: Dict[str, str],
+                                     relative: Optional[Dict[str, Dict]] = None) -> Dict[str, Dict]:
     """Calculate comprehensive beta metrics across multiple timeframes"""
     
-    beta_analysis = {}
+    if relative is None:
+        relative = relative_metrics(*build_return_panel(daily_prices, sp500_daily, companies))
     
-    # Calculate S&P 500 returns
-    sp500_returns = sp500_daily.set_index('date')['close'].pct_change().dropna()
+    beta_analysis = {}
     
-    for company_name, ticker in companies.items():
-        company_prices = daily_prices[daily_prices['Symbol'] == ticker].copy()
+    for company_name in companies:
+        metrics = relative.get(company_name)
         
-        if len(company_prices) < 60:
+        # Need 60 aligned company/market observations
+        if metrics is None or metrics['observations'] < 60:
             continue
         
-        company_returns = company_prices.set_index('date')['close'].pct_change().dropna()
-        
-        # Align returns
-        aligned_data = pd.DataFrame({
-            'company': company_returns,
-            'market': sp500_returns
-        }).dropna()
-        
-        if len(aligned_data) < 60:
-            continue
-        
-        # Calculate betas for different periods
-        betas = {}
-        
-        for window, label in [(60, '60-day'), (120, '120-day'), (252, '252-day')]:
-            if len(aligned_data) >= window:
-                rolling_cov = aligned_data['company'].rolling(window).cov(aligned_data['market'])
-                rolling_var = aligned_data['market'].rolling(window).var()
-                rolling_beta = rolling_cov / rolling_var
-                
-                betas[label] = {
-                    'current': rolling_beta.iloc[-1] if not rolling_beta.empty else 1.0,
-                    'mean': rolling_beta.mean(),
-                    'std': rolling_beta.std(),
-                    'min': rolling_beta.min(),
-                    'max': rolling_beta.max()
-                }
+        # Rolling betas for different periods
+        betas = {
+            f'{window}-day': metrics['rolling'][window]['beta']
+            for window in BETA_WINDOWS if window in metrics['rolling']
+        }
         
-        # Calculate correlation metrics
-        correlation_60d = aligned_data.tail(60)['company'].corr(aligned_data.tail(60)['market']) if len(aligned_data) >= 60 else 0
-        correlation_full = aligned_data['company'].corr(aligned_data['market'])
+        # Correlation metrics
+        correlation_60d = metrics['rolling'][60]['correlation']
+        correlation_full = metrics['correlation_full']
         
         # Up/down market betas
-        up_market = aligned_data[aligned_data['market'] > 0]
-        down_market = aligned_data[aligned_data['market'] < 0]
-        
-        up_beta = _calculate_simple_beta(up_market) if len(up_market) > 20 else 1.0
-        down_beta = _calculate_simple_beta(down_market) if len(down_market) > 20 else 1.0
+        up_beta = metrics['up_beta']
+        down_beta = metrics['down_beta']
         
         # Beta stability metrics (raw, not scored)
         if '252-day' in betas:
@@ -285,19 +287,6 @@ def _calculate_enhanced_beta_metrics(daily_prices: pd.DataFrame, sp500_daily: pd
     return beta_analysis
 
 
-def _calculate_simple_beta(aligned_data: pd.DataFrame) -> float:
-    """Calculate simple beta from aligned returns data"""
-    if aligned_data.empty or len(aligned_data) < 2:
-        return 1.0
-    
-    try:
-        cov = aligned_data['company'].cov(aligned_data['market'])
-        var = aligned_data['market'].var()
-        return cov / var if var > 0 else 1.0
-    except:
-        return 1.0
-
-
 def _create_beta_dataframe(beta_analysis: Dict) -> pd.DataFrame:
     """Create DataFrame for beta table"""
     
@@ -518,12 +507,13 @@ def _generate_beta_insights(beta_analysis: Dict, avg_beta: float, avg_correlatio
 
 def _build_section_16b_performance_analysis(daily_prices: pd.DataFrame, monthly_prices: pd.DataFrame,
                                            sp500_daily: pd.DataFrame, sp500_monthly: pd.DataFrame,
-                                           companies: Dict[str, str]) -> str:
+                                           companies: Dict[str, str],
+                                           relative: Dict[str, Dict]) -> str:
     """Build Section 16B: Relative Performance Intelligence"""
     
     # Calculate performance metrics
     performance_analysis = _calculate_performance_metrics(
-        daily_prices, monthly_prices, sp500_daily, sp500_monthly, companies
+        daily_prices, monthly_prices, sp500_daily, sp500_monthly, companies, relative
     )
     
     if not performance_analysis:
@@ -611,7 +601,7 @@ def _build_section_16b_performance_analysis(daily_prices: pd.DataFrame, monthly_
 
 def _calculate_performance_metrics(daily_prices: pd.DataFrame, monthly_prices: pd.DataFrame,
                                    sp500_daily: pd.DataFrame, sp500_monthly: pd.DataFrame,
-                                   companies: Dict[str, str]) -> Dict[str, Dict]:
+                                   companies: Dict[str, str], relative: Dict[str, Dict]) -> Dict[str, Dict]:
     """Calculate relative performance metrics vs S&P 500"""
     
     performance_analysis = {}
@@ -631,7 +621,6 @@ def _calculate_performance_metrics(daily_prices: pd.DataFrame, monthly_prices: p
             continue
         
         # Calculate returns
-        company_returns_daily = company_daily.set_index('date')['close'].pct_change().dropna()
         company_returns_monthly = company_monthly.set_index('date')['close'].pct_change().dropna()
         
         # Annual return
@@ -641,13 +630,10 @@ def _calculate_performance_metrics(daily_prices: pd.DataFrame, monthly_prices: p
         alpha = company_annual_return - sp500_annual_return
         
         # Tracking error
-        aligned_returns = pd.DataFrame({
-            'company': company_returns_daily,
-            'market': sp500_returns_daily
-        }).dropna()
+        metrics = relative.get(company_name)
         
-        if not aligned_returns.empty:
-            tracking_error = (aligned_returns['company'] - aligned_returns['market']).std() * np.sqrt(252)
+        if metrics is not None and metrics['observations'] > 0:
+            tracking_error = metrics['tracking_error']
             information_ratio = alpha / tracking_error if tracking_error > 0 else 0
         else:
             tracking_error = 0
@@ -963,11 +949,12 @@ Replace the stubbed functions in section_16.py with these implementations
 # =============================================================================
 
 def _build_section_16c_regime_analysis(daily_prices: pd.DataFrame, sp500_daily: pd.DataFrame,
-                                      companies: Dict[str, str]) -> str:
+                                      companies: Dict[str, str],
+                                      relative: Dict[str, Dict]) -> str:
     """Build Section 16C: Market Regime Analysis"""
     
     # Calculate regime metrics
-    regime_analysis = _calculate_regime_metrics(daily_prices, sp500_daily, companies)
+    regime_analysis = _calculate_regime_metrics(sp500_daily, companies, relative)
     
     if not regime_analysis:
         return build_info_box("<p>Insufficient data for regime analysis.</p>", "warning", "16C. Regime Analysis")
@@ -1055,8 +1042,8 @@ def _build_section_16c_regime_analysis(daily_prices: pd.DataFrame, sp500_daily:
     return html
 
 
-def _calculate_regime_metrics(daily_prices: pd.DataFrame, sp500_daily: pd.DataFrame,
-                              companies: Dict[str, str]) -> Dict[str, Dict]:
+def _calculate_regime_metrics(sp500_daily: pd.DataFrame, companies: Dict[str, str],
+                              relative: Dict[str, Dict]) -> Dict[str, Dict]:
     """Calculate performance across market regimes"""
     
     regime_analysis = {}
@@ -1072,26 +1059,18 @@ def _calculate_regime_metrics(daily_prices: pd.DataFrame, sp500_daily: pd.DataFr
     sp500_sma_50 = sp500_daily.set_index('date')['close'].rolling(50).mean()
     sp500_close = sp500_daily.set_index('date')['close']
     
-    # Create regime labels
-    regimes = pd.Series(index=sp500_returns.index, dtype=str)
-    
-    for date in sp500_returns.index:
-        if date in rolling_vol.index and date in sp500_sma_50.index:
-            vol = rolling_vol.loc[date]
-            price = sp500_close.loc[date] if date in sp500_close.index else np.nan
-            sma_50 = sp500_sma_50.loc[date]
-            
-            if pd.notna(vol) and pd.notna(price) and pd.notna(sma_50):
-                if vol < vol_median:
-                    if price > sma_50:
-                        regimes.loc[date] = 'Low Vol Bull'
-                    else:
-                        regimes.loc[date] = 'Low Vol Bear'
-                else:
-                    if price > sma_50:
-                        regimes.loc[date] = 'High Vol Bull'
-                    else:
-                        regimes.loc[date] = 'High Vol Bear'
+    # Create regime labels (NaN until volatility and the 50-day SMA are defined)
+    price = sp500_close.reindex(sp500_returns.index)
+    sma_50 = sp500_sma_50.reindex(sp500_returns.index)
+    bull = price > sma_50
+    labels = np.where(
+        rolling_vol < vol_median,
+        np.where(bull, 'Low Vol Bull', 'Low Vol Bear'),
+        np.where(bull, 'High Vol Bull', 'High Vol Bear')
+    )
+    regimes = pd.Series(labels, index=sp500_returns.index).where(
+        rolling_vol.notna() & price.notna() & sma_50.notna()
+    )
     
     # Calculate S&P 500 regime performance for reference
     sp500_regime_perf = {}
@@ -1101,13 +1080,13 @@ def _calculate_regime_metrics(daily_prices: pd.DataFrame, sp500_daily: pd.DataFr
             sp500_regime_perf[regime] = regime_returns.mean() * 252
     
     # Analyze company performance in each regime
-    for company_name, ticker in companies.items():
-        company_prices = daily_prices[daily_prices['Symbol'] == ticker].copy()
+    for company_name in companies:
+        metrics = relative.get(company_name)
         
-        if len(company_prices) < 60:
+        if metrics is None or len(metrics['returns']) < 59:  # 60 prices
             continue
         
-        company_returns = company_prices.set_index('date')['close'].pct_change().dropna()
+        company_returns = metrics['returns']
         
         # Align with regimes
         aligned_data = pd.DataFrame({
@@ -1140,20 +1119,8 @@ def _calculate_regime_metrics(daily_prices: pd.DataFrame, sp500_daily: pd.DataFr
         stress_returns = company_returns[stress_periods[company_returns.index]].dropna()
         normal_returns = company_returns[~stress_periods[company_returns.index]].dropna()
         
-        # Calculate up/down market betas for downside capture
-        sp500_aligned = pd.DataFrame({
-            'company': company_returns,
-            'market': sp500_returns
-        }).dropna()
-        
-        up_market = sp500_aligned[sp500_aligned['market'] > 0]
-        down_market = sp500_aligned[sp500_aligned['market'] < 0]
-        
-        up_beta = _calculate_simple_beta(up_market) if len(up_market) > 20 else 1.0
-        down_beta = _calculate_simple_beta(down_market) if len(down_market) > 20 else 1.0
-        
-        # Defensive metrics (raw, not scored)
-        downside_capture_ratio = down_beta / up_beta if up_beta != 0 else 1.0
+        # Defensive metrics (raw, not scored): down-market beta / up-market beta
+        downside_capture_ratio = metrics['downside_capture_ratio']
         
         # Bear market alpha
         bear_regimes = ['Low Vol Bear', 'High Vol Bear']
@@ -1498,11 +1465,12 @@ def _generate_regime_insights(regime_analysis: Dict, avg_downside_capture: float
 # =============================================================================
 
 def _build_section_16d_technical_analysis(daily_prices: pd.DataFrame, sp500_daily: pd.DataFrame,
-                                         companies: Dict[str, str]) -> str:
+                                         companies: Dict[str, str], artifacts: ArtifactStore) -> str:
     """Build Section 16D: Enhanced Technical Analysis"""
     
-    # Calculate technical metrics
-    technical_analysis = _calculate_technical_metrics(daily_prices, sp500_daily, companies)
+    # Calculate technical metrics from the indicators shared with Sections 15 and 17
+    indicators = indicators_by_symbol(get_indicators(artifacts, daily_prices))
+    technical_analysis = _calculate_technical_metrics(sp500_daily, companies, indicators)
     
     if not technical_analysis:
         return build_info_box("<p>Insufficient data for technical analysis.</p>", "warning", "16D. Technical Analysis")
@@ -1595,36 +1563,41 @@ def _build_section_16d_technical_analysis(daily_prices: pd.DataFrame, sp500_dail
     return html
 
 
-def _calculate_technical_metrics(daily_prices: pd.DataFrame, sp500_daily: pd.DataFrame,
-                                 companies: Dict[str, str]) -> Dict[str, Dict]:
+def _calculate_technical_metrics(sp500_daily: pd.DataFrame, companies: Dict[str, str],
+                                 indicators: Dict[str, pd.DataFrame]) -> Dict[str, Dict]:
     """Calculate technical indicators relative to S&P 500"""
     
     technical_analysis = {}
     
-    # Calculate S&P 500 technicals
-    sp500_rsi = _calculate_rsi(sp500_daily['close'].values)
+    # Calculate S&P 500 technicals (simulated benchmarks aren't in the shared frame)
+    sp500_indicators = indicators.get("^GSPC")
+    if sp500_indicators is None:
+        sp500_indicators = compute_indicators(sp500_daily.assign(Symbol="^GSPC"))
+    sp500_rsi = _latest_rsi(sp500_indicators)
     sp500_momentum_20d = (sp500_daily['close'].iloc[-1] / sp500_daily['close'].iloc[-20] - 1) if len(sp500_daily) > 20 else 0
     
     for company_name, ticker in companies.items():
-        company_prices = daily_prices[daily_prices['Symbol'] == ticker].copy()
+        company_prices = indicators.get(ticker)
         
-        if len(company_prices) < 60:
+        if company_prices is None or len(company_prices) < 60:
             continue
         
+        latest = company_prices.iloc[-1]
+        
         # Calculate technical indicators
-        company_rsi = _calculate_rsi(company_prices['close'].values)
+        company_rsi = _latest_rsi(company_prices)
         company_momentum_20d = (company_prices['close'].iloc[-1] / company_prices['close'].iloc[-20] - 1) if len(company_prices) > 20 else 0
         
         # Relative metrics
         relative_rsi = company_rsi - sp500_rsi
         relative_momentum = company_momentum_20d - sp500_momentum_20d
         
-        # Moving averages
-        sma_20 = company_prices['close'].rolling(20).mean().iloc[-1] if len(company_prices) >= 20 else company_prices['close'].mean()
-        sma_50 = company_prices['close'].rolling(50).mean().iloc[-1] if len(company_prices) >= 50 else company_prices['close'].mean()
-        sma_200 = company_prices['close'].rolling(200).mean().iloc[-1] if len(company_prices) >= 200 else company_prices['close'].mean()
+        # Moving averages (full-history mean until the window fills)
+        sma_20 = latest['sma_20'] if pd.notna(latest['sma_20']) else company_prices['close'].mean()
+        sma_50 = latest['sma_50'] if pd.notna(latest['sma_50']) else company_prices['close'].mean()
+        sma_200 = latest['sma_200'] if pd.notna(latest['sma_200']) else company_prices['close'].mean()
         
-        current_price = company_prices['close'].iloc[-1]
+        current_price = latest['close']
         
         # Trend analysis
         price_vs_sma20 = (current_price / sma_20 - 1) * 100
@@ -1641,8 +1614,8 @@ def _calculate_technical_metrics(daily_prices: pd.DataFrame, sp500_daily: pd.Dat
         trend_strength = 'Strong' if trend_alignment >= 4 else 'Moderate' if trend_alignment >= 2 else 'Weak'
         
         # Volume analysis
-        if 'volume' in company_prices.columns:
-            avg_volume = company_prices['volume'].rolling(20).mean().iloc[-1]
+        if pd.notna(latest['volume_sma_20']):
+            avg_volume = latest['volume_sma_20']
             recent_volume = company_prices['volume'].iloc[-5:].mean()
             volume_surge = (recent_volume / avg_volume - 1) if avg_volume > 0 else 0
         else:
@@ -1729,24 +1702,17 @@ def _calculate_technical_metrics(daily_prices: pd.DataFrame, sp500_daily: pd.Dat
     return technical_analysis
 
 
-def _calculate_rsi(prices: np.ndarray, period: int = 14) -> float:
-    """Calculate RSI indicator"""
-    if len(prices) < period + 1:
+def _latest_rsi(symbol_indicators: pd.DataFrame, period: int = 14) -> float:
+    """Latest 14-day RSI from a symbol's indicator rows"""
+    if len(symbol_indicators) < period + 1:
         return 50.0
     
-    deltas = np.diff(prices)
-    gains = np.where(deltas > 0, deltas, 0)
-    losses = np.where(deltas < 0, -deltas, 0)
+    rsi = symbol_indicators['rsi_14'].iloc[-1]
     
-    avg_gain = np.mean(gains[-period:])
-    avg_loss = np.mean(losses[-period:])
-    
-    if avg_loss == 0:
+    # No losses in the window
+    if pd.isna(rsi):
         return 100.0
     
-    rs = avg_gain / avg_loss
-    rsi = 100 - (100 / (1 + rs))
-    
     return rsi
 
 
@@ -2084,17 +2050,19 @@ Replace the stubbed functions in section_16.py with these implementations
 # =============================================================================
 
 def _build_section_16e_risk_management(daily_prices: pd.DataFrame, sp500_daily: pd.DataFrame,
-                                      companies: Dict[str, str]) -> str:
+                                      companies: Dict[str, str],
+                                       artifacts: ArtifactStore,
+                                       relative: Dict[str, Dict]) -> str:
     """Build Section 16E: Improved Risk Management"""
     
     # Need beta analysis for risk decomposition
-    beta_analysis = _calculate_enhanced_beta_metrics(daily_prices, sp500_daily, companies)
+    beta_analysis = _get_beta_analysis(artifacts, daily_prices, sp500_daily, companies, relative)
     
     if not beta_analysis:
         return build_info_box("<p>Insufficient data for risk analysis.</p>", "warning", "16E. Risk Management")
     
     # Calculate risk metrics
-    risk_analysis = _calculate_risk_metrics(daily_prices, sp500_daily, companies, beta_analysis)
+    risk_analysis = _calculate_risk_metrics(sp500_daily, companies, beta_analysis, relative)
     
     if not risk_analysis:
         return build_info_box("<p>Insufficient data for risk analysis.</p>", "warning", "16E. Risk Management")
@@ -2190,8 +2158,8 @@ def _build_section_16e_risk_management(daily_prices: pd.DataFrame, sp500_daily:
     return html
 
 
-def _calculate_risk_metrics(daily_prices: pd.DataFrame, sp500_daily: pd.DataFrame,
-                            companies: Dict[str, str], beta_analysis: Dict) -> Dict[str, Dict]:
+def _calculate_risk_metrics(sp500_daily: pd.DataFrame, companies: Dict[str, str],
+                            beta_analysis: Dict, relative: Dict[str, Dict]) -> Dict[str, Dict]:
     """Calculate systematic vs idiosyncratic risk components"""
     
     risk_analysis = {}
@@ -2201,16 +2169,16 @@ def _calculate_risk_metrics(daily_prices: pd.DataFrame, sp500_daily: pd.DataFram
     market_variance = sp500_returns.var()
     market_volatility = sp500_returns.std() * np.sqrt(252)
     
-    for company_name, ticker in companies.items():
+    for company_name in companies:
         if company_name not in beta_analysis:
             continue
         
-        company_prices = daily_prices[daily_prices['Symbol'] == ticker].copy()
+        metrics = relative.get(company_name)
         
-        if len(company_prices) < 60:
+        if metrics is None or len(metrics['returns']) < 59:  # 60 prices
             continue
         
-        company_returns = company_prices.set_index('date')['close'].pct_change().dropna()
+        company_returns = metrics['returns']
         
         # Get beta
         beta = beta_analysis[company_name]['current_beta']
@@ -2235,20 +2203,11 @@ def _calculate_risk_metrics(daily_prices: pd.DataFrame, sp500_daily: pd.DataFram
         downside_returns = company_returns[company_returns < 0]
         downside_deviation = downside_returns.std() * np.sqrt(252) if len(downside_returns) > 0 else 0
         
-        # Maximum drawdown
-        cumulative_returns = (1 + company_returns).cumprod()
-        running_max = cumulative_returns.expanding().max()
-        drawdown = (cumulative_returns - running_max) / running_max
-        max_drawdown = drawdown.min()
-        
-        # Recovery analysis
+        # Maximum drawdown and recovery (within 1% of the prior peak)
+        max_drawdown = metrics['max_drawdown']
         recovery_days = None
-        if max_drawdown < 0:
-            drawdown_start = drawdown.idxmin()
-            recovery_mask = (drawdown.index > drawdown_start) & (drawdown > -0.01)
-            if recovery_mask.any():
-                recovery_date = drawdown[recovery_mask].index[0]
-                recovery_days = (recovery_date - drawdown_start).days
+        if metrics['recovery_date'] is not None:
+            recovery_days = (metrics['recovery_date'] - metrics['drawdown_start']).days
         
         # Risk-adjusted returns
         mean_return = company_returns.mean() * 252
@@ -2677,14 +2636,16 @@ def _generate_risk_insights(risk_analysis: Dict, avg_systematic_pct: float,
 # =============================================================================
 
 def _build_section_16f_portfolio_insights(daily_prices: pd.DataFrame, sp500_daily: pd.DataFrame,
-                                         companies: Dict[str, str]) -> str:
+                                         companies: Dict[str, str],
+                                          artifacts: ArtifactStore,
+                                          relative: Dict[str, Dict]) -> str:
     """Build Section 16F: Portfolio Construction Insights"""
     
     # Gather all required analyses
-    beta_analysis = _calculate_enhanced_beta_metrics(daily_prices, sp500_daily, companies)
-    risk_analysis = _calculate_risk_metrics(daily_prices, sp500_daily, companies, beta_analysis) if beta_analysis else {}
+    beta_analysis = _get_beta_analysis(artifacts, daily_prices, sp500_daily, companies, relative)
+    risk_analysis = _calculate_risk_metrics(sp500_daily, companies, beta_analysis, relative) if beta_analysis else {}
     performance_analysis = _calculate_performance_metrics(
-        daily_prices, daily_prices, sp500_daily, sp500_daily, companies
+        daily_prices, daily_prices, sp500_daily, sp500_daily, companies, relative
     )
     
     if not beta_analysis or not risk_analysis or not performance_analysis:
@@ -3169,11 +3130,13 @@ Replace the stubbed functions in section_16.py with these implementations
 # =============================================================================
 
 def _build_section_16g_dashboard(daily_prices: pd.DataFrame, sp500_daily: pd.DataFrame,
-                                companies: Dict[str, str]) -> str:
+                                companies: Dict[str, str],
+                                 artifacts: ArtifactStore,
+                                 relative: Dict[str, Dict]) -> str:
     """Build Section 16G: Comprehensive Multi-Dimensional Dashboard"""
     
     # Gather all analyses
-    beta_analysis = _calculate_enhanced_beta_metrics(daily_prices, sp500_daily, companies)
+    beta_analysis = _get_beta_analysis(artifacts, daily_prices, sp500_daily, companies, relative)
     
     if not beta_analysis:
         return build_info_box("<p>Insufficient data for dashboard.</p>", "warning", "16G. Dashboard")
@@ -3182,9 +3145,9 @@ def _build_section_16g_dashboard(daily_prices: pd.DataFrame, sp500_daily: pd.Dat
     sp500_monthly = sp500_daily
     
     performance_analysis = _calculate_performance_metrics(
-        daily_prices, monthly_prices, sp500_daily, sp500_monthly, companies
+        daily_prices, monthly_prices, sp500_daily, sp500_monthly, companies, relative
     )
-    risk_analysis = _calculate_risk_metrics(daily_prices, sp500_daily, companies, beta_analysis)
+    risk_analysis = _calculate_risk_metrics(sp500_daily, companies, beta_analysis, relative)
     
     html = """
     <div class="subsection-container">
@@ -3742,11 +3705,13 @@ def _create_portfolio_summary_dataframe(beta_analysis: Dict, performance_analysi
 # =============================================================================
 
 def _build_section_16h_strategic_framework(daily_prices: pd.DataFrame, sp500_daily: pd.DataFrame,
-                                          companies: Dict[str, str]) -> str:
+                                          companies: Dict[str, str],
+                                           artifacts: ArtifactStore,
+                                           relative: Dict[str, Dict]) -> str:
     """Build Section 16H: Strategic Benchmark Intelligence Framework (New Format)"""
     
     # Gather all analyses
-    beta_analysis = _calculate_enhanced_beta_metrics(daily_prices, sp500_daily, companies)
+    beta_analysis = _get_beta_analysis(artifacts, daily_prices, sp500_daily, companies, relative)
     
     if not beta_analysis:
         return build_info_box("<p>Insufficient data for strategic framework.</p>", "warning", "16H. Strategic Framework")
@@ -3755,10 +3720,10 @@ def _build_section_16h_strategic_framework(daily_prices: pd.DataFrame, sp500_dai
     sp500_monthly = sp500_daily
     
     performance_analysis = _calculate_performance_metrics(
-        daily_prices, monthly_prices, sp500_daily, sp500_monthly, companies
+        daily_prices, monthly_prices, sp500_daily, sp500_monthly, companies, relative
     )
-    risk_analysis = _calculate_risk_metrics(daily_prices, sp500_daily, companies, beta_analysis)
-    regime_analysis = _calculate_regime_metrics(daily_prices, sp500_daily, companies)
+    risk_analysis = _calculate_risk_metrics(sp500_daily, companies, beta_analysis, relative)
+    regime_analysis = _calculate_regime_metrics(sp500_daily, companies, relative)
     portfolio_insights = _calculate_portfolio_insights(
         beta_analysis, performance_analysis, risk_analysis, companies
     )
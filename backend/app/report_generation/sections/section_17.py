@@ -8,6 +8,7 @@ from scipy import stats
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+from backend.app.report_generation.artifacts import ArtifactStore
 from backend.app.report_generation.html_utils import (
     generate_section_wrapper,
     build_stat_card,
@@ -23,6 +24,10 @@ from backend.app.report_generation.html_utils import (
     build_summary_card,
     build_comparison_bars
 )
+from backend.app.report_generation.indicators import get_indicators, indicators_by_symbol
+
+PRODUCES = []
+CONSUMES = ["technical_indicators"]
 
 
 def generate(collector, analysis_id: str) -> str:
@@ -57,9 +62,12 @@ def generate(collector, analysis_id: str) -> str:
     except:
         df_insider = pd.DataFrame()
     
+    # Indicators for all tickers, shared with Sections 15 and 16
+    indicators = indicators_by_symbol(get_indicators(ArtifactStore(analysis_id), df_prices))
+    
     # Perform analysis for 17A.1
     price_fundamental_signals = _analyze_price_fundamental_relationships(
-        df_prices, df_financial, companies
+        indicators, df_financial, companies
     )
     
     momentum_analysis  = _analyze_momentum_fundamental_correlation(df_prices, df_financial, companies, price_fundamental_signals)
@@ -805,30 +813,24 @@ def _create_chart_17a1_significance_scatter(signals: Dict) -> str:
 # =============================================================================
 
 def _analyze_price_fundamental_relationships(
-    df_prices: pd.DataFrame, 
+    indicators: Dict[str, pd.DataFrame], 
     df_financial: pd.DataFrame,
     companies: Dict[str, str]
 ) -> Dict[str, Dict]:
     """Analyze how technical price indicators predict fundamental changes"""
     
-    if df_prices.empty or df_financial.empty:
+    if not indicators or df_financial.empty:
         return {}
     
     price_fundamental_signals = {}
     
     for company_name, ticker in companies.items():
         try:
-            # Get company price data
-            company_prices = df_prices[df_prices['symbol'] == ticker].copy()
-            if company_prices.empty:
+            # Get company prices with technical indicators
+            company_prices = indicators.get(ticker)
+            if company_prices is None or company_prices.empty:
                 continue
             
-            company_prices['date'] = pd.to_datetime(company_prices['date'])
-            company_prices = company_prices.sort_values('date')
-            
-            # Calculate technical indicators
-            company_prices = _calculate_technical_indicators(company_prices)
-            
             # Get company financial data
             company_financials = df_financial[df_financial['Company'] == company_name].copy()
             if company_financials.empty:
@@ -854,44 +856,6 @@ def _analyze_price_fundamental_relationships(
     return price_fundamental_signals
 
 
-def _calculate_technical_indicators(df: pd.DataFrame) -> pd.DataFrame:
-    """Calculate technical indicators for price data"""
-    
-    df = df.copy()
-    
-    # Moving averages
-    df['SMA_20'] = df['close'].rolling(window=20).mean()
-    df['SMA_50'] = df['close'].rolling(window=50).mean()
-    df['SMA_200'] = df['close'].rolling(window=200).mean()
-    
-    # Momentum indicators
-    df['ROC_20'] = ((df['close'] - df['close'].shift(20)) / df['close'].shift(20)) * 100
-    df['ROC_60'] = ((df['close'] - df['close'].shift(60)) / df['close'].shift(60)) * 100
-    
-    # RSI
-    delta = df['close'].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-    rs = gain / loss
-    df['RSI'] = 100 - (100 / (1 + rs))
-    
-    # MACD
-    ema_12 = df['close'].ewm(span=12, adjust=False).mean()
-    ema_26 = df['close'].ewm(span=26, adjust=False).mean()
-    df['MACD'] = ema_12 - ema_26
-    df['MACD_signal'] = df['MACD'].ewm(span=9, adjust=False).mean()
-    
-    # Volatility
-    df['volatility_20'] = df['close'].pct_change().rolling(window=20).std() * np.sqrt(252) * 100
-    
-    # Volume indicators
-    if 'volume' in df.columns:
-        df['volume_SMA_20'] = df['volume'].rolling(window=20).mean()
-        df['volume_ratio'] = df['volume'] / df['volume_SMA_20']
-    
-    return df
-
-
 def _compute_price_fundamental_correlations_annual(
     price_df: pd.DataFrame, 
     financial_df: pd.DataFrame
@@ -906,10 +870,10 @@ def _compute_price_fundamental_correlations_annual(
         # Aggregate price metrics by year (using year-end values and averages)
         annual_price = price_df.groupby('year').agg({
             'close': 'last',
-            'ROC_20': 'mean',
-            'ROC_60': 'mean',
-            'RSI': 'mean',
-            'MACD': 'mean',
+            'roc_20': 'mean',
+            'roc_60': 'mean',
+            'rsi_14': 'mean',
+            'macd': 'mean',
             'volatility_20': 'mean',
             'volume_ratio': 'mean'
         }).reset_index()
@@ -932,7 +896,7 @@ def _compute_price_fundamental_correlations_annual(
         merged['roe_change'] = merged['returnOnEquity'].diff()
         
         # Shift technical indicators to test predictive power (lag by 1 year)
-        for col in ['ROC_20', 'ROC_60', 'RSI', 'MACD', 'volatility_20', 'annual_return']:
+        for col in ['roc_20', 'roc_60', 'rsi_14', 'macd', 'volatility_20', 'annual_return']:
             if col in merged.columns:
                 merged[f'{col}_lag1'] = merged[col].shift(1)
         
@@ -940,9 +904,9 @@ def _compute_price_fundamental_correlations_annual(
         correlations = {}
         
         # Price momentum predicting revenue growth
-        valid_data = merged[['ROC_60_lag1', 'revenue_growth_yoy']].dropna()
+        valid_data = merged[['roc_60_lag1', 'revenue_growth_yoy']].dropna()
         if len(valid_data) >= 3:
-            corr, pval = stats.pearsonr(valid_data['ROC_60_lag1'], valid_data['revenue_growth_yoy'])
+            corr, pval = stats.pearsonr(valid_data['roc_60_lag1'], valid_data['revenue_growth_yoy'])
             correlations['momentum_revenue'] = {
                 'correlation': corr,
                 'p_value': pval,
@@ -951,9 +915,9 @@ def _compute_price_fundamental_correlations_annual(
             }
         
         # RSI predicting margin changes
-        valid_data = merged[['RSI_lag1', 'margin_change']].dropna()
+        valid_data = merged[['rsi_14_lag1', 'margin_change']].dropna()
         if len(valid_data) >= 3:
-            corr, pval = stats.pearsonr(valid_data['RSI_lag1'], valid_data['margin_change'])
+            corr, pval = stats.pearsonr(valid_data['rsi_14_lag1'], valid_data['margin_change'])
             correlations['rsi_margins'] = {
                 'correlation': corr,
                 'p_value': pval,
@@ -3,27 +3,39 @@
 from datetime import datetime
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterator
 from backend.app.report_generation.html_utils import (
-    generate_section_wrapper,
+    stream_section_wrapper,
     build_data_table,
     build_info_box,
     build_section_divider
 )
 
 
-def generate(collector, analysis_id: str) -> str:
+def generate(collector, analysis_id: str) -> Iterator[str]:
     """
     Generate Section 19: Comprehensive Appendix
     
+    The appendix is the largest section (every macro series, the full
+    metrics catalog and glossary), so it is streamed: each appendix is
+    built and handed to the writer before the next one starts.
+    
     Args:
         collector: Loaded FinancialDataCollection object
         analysis_id: The analysis ID
     
     Returns:
-        Complete HTML string
+        Iterator of HTML chunks forming the complete page
     """
     
+    return stream_section_wrapper(
+        19, "Appendix: Reference Materials & Documentation", _iter_appendix_content(collector)
+    )
+
+
+def _iter_appendix_content(collector) -> Iterator[str]:
+    """Yield the section body one appendix at a time"""
+    
     # Extract data
     companies = collector.companies
     df = collector.get_all_financial_data()
@@ -34,17 +46,7 @@ def generate(collector, analysis_id: str) -> str:
     except:
         profiles_df = pd.DataFrame()
     
-    # Build all appendix subsections
-    appendix_a_html = _build_appendix_a_macro_indicators(economic_df)
-    appendix_b_html = _build_appendix_b_metrics_catalog(df)
-    appendix_c_html = _build_appendix_c_methodology(collector, companies)
-    appendix_d_html = _build_appendix_d_glossary()
-    appendix_e_html = _build_appendix_e_data_quality(df, economic_df, companies, collector)
-    appendix_f_html = _build_appendix_f_company_profiles(profiles_df, companies)
-    appendix_g_html = _build_appendix_g_references()
-    
-    # Combine all subsections
-    content = f"""
+    yield f"""
     <div class="section-content-wrapper">
         <div style="text-align: center; margin-bottom: 40px;">
             <p style="font-size: 1.1rem; color: var(--text-secondary); line-height: 1.8;">
@@ -53,30 +55,27 @@ def generate(collector, analysis_id: str) -> str:
                 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')} • Source: FMP API & FRED Data
             </p>
         </div>
-        
-        {appendix_a_html}
-        {build_section_divider()}
-        
-        {appendix_b_html}
-        {build_section_divider()}
-        
-        {appendix_c_html}
-        {build_section_divider()}
-        
-        {appendix_d_html}
-        {build_section_divider()}
-        
-        {appendix_e_html}
-        {build_section_divider()}
-        
-        {appendix_f_html}
-        {build_section_divider()}
-        
-        {appendix_g_html}
+        """
+    
+    # Build each appendix subsection only when the previous one has been written
+    appendices = [
+        lambda: _build_appendix_a_macro_indicators(economic_df),
+        lambda: _build_appendix_b_metrics_catalog(df),
+        lambda: _build_appendix_c_methodology(collector, companies),
+        lambda: _build_appendix_d_glossary(),
+        lambda: _build_appendix_e_data_quality(df, economic_df, companies, collector),
+        lambda: _build_appendix_f_company_profiles(profiles_df, companies),
+        lambda: _build_appendix_g_references(),
+    ]
+    divider = build_section_divider()
+    for idx, build_appendix in enumerate(appendices):
+        if idx:
+            yield divider
+        yield build_appendix()
+    
+    yield """
     </div>
     """
-    
-    return generate_section_wrapper(19, "Appendix: Reference Materials & Documentation", content)
 
 
 # =============================================================================
@@ -0,0 +1,23 @@
+"""Background job schemas for API responses"""
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+
+class JobResponse(BaseModel):
+    """Schema for job status response"""
+    job_id: str
+    job_type: str
+    resource_id: Optional[str]
+    lane: str
+    status: str
+    attempts: int
+    max_attempts: int
+    cancel_requested: bool
+    error: Optional[str]
+    created_at: datetime
+    run_after: Optional[datetime]
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
+    
+    class Config:
+        from_attributes = True
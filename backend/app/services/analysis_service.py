@@ -6,6 +6,7 @@ import shutil
 import asyncio
 from pathlib import Path
 from .file_service import file_service
+from .collector_loader_service import collector_loader_service
 
 from ..models.analysis import Analysis
 from ..models.user import User
@@ -108,6 +109,7 @@ async def delete_sections_and_files(db: Session, analysis_id: str) -> tuple[int,
     ).delete()
     print("Debug")
     # Delete all files
+    collector_loader_service.invalidate_financial_collector(analysis_id)
     analysis_dir = file_service.get_analysis_dir(analysis_id)
     files_deleted = False
     
@@ -140,6 +142,43 @@ async def delete_sections_only(db: Session, analysis_id: str) -> tuple[int, int]
     
     return sections_deleted, html_files_deleted
 
+def mark_sections_pending(db: Session, analysis_id: str) -> int:
+    """
+    Queue all sections for regeneration, keeping their HTML and input
+    fingerprints so the next run skips the ones whose inputs are unchanged
+    Returns: number of sections kept
+    """
+    return db.query(Section).filter(
+        Section.analysis_id == analysis_id
+    ).update(
+        {Section.status: "pending", Section.error_message: None, Section.started_at: None},
+        synchronize_session=False
+    )
+
+async def delete_collected_files(analysis_id: str) -> bool:
+    """
+    Delete collected data and derived artifacts (Excel, pickle, artifacts)
+    but keep the generated sections directory
+    Returns: files_deleted_bool
+    """
+    collector_loader_service.invalidate_financial_collector(analysis_id)
+    analysis_dir = file_service.get_analysis_dir(analysis_id)
+    sections_dir = file_service.get_sections_dir(analysis_id)
+    if not analysis_dir.exists():
+        return False
+    
+    def remove_collected():
+        for child in analysis_dir.iterdir():
+            if child == sections_dir:
+                continue
+            if child.is_dir():
+                shutil.rmtree(child)
+            else:
+                child.unlink()
+    
+    await asyncio.to_thread(remove_collected)
+    return True
+
 def reset_analysis_state(analysis: Analysis, status: str, phase: Optional[str] = None, progress: int = 0) -> None:
     """Reset analysis state fields"""
     analysis.status = status
@@ -1,12 +1,144 @@
+import copy
 import pickle
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
+import pandas as pd
 from .file_service import FileService
+from ..core.frames import private_copy
+from ..config import settings
 from ..data_collection.financial_collector import FinancialDataCollection
 from ..data_collection.dataset_collector import DatasetCollection
 
 file_service = FileService()
 
+
+def _estimate_bytes(obj: Any, fallback: int) -> int:
+    """
+    Rough in-memory footprint of a collector: the deep size of every
+    DataFrame it holds directly or in dict attributes (prices, statements,
+    raw_tables, ...), which dominate its memory use.
+    """
+    total = 0
+    for value in vars(obj).values():
+        frames = value.values() if isinstance(value, dict) else (value,)
+        for frame in frames:
+            if isinstance(frame, pd.DataFrame):
+                total += int(frame.memory_usage(index=True, deep=True).sum())
+    return max(total, fallback)
+
+
+def _detach(value: Any) -> Any:
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return private_copy(value)
+    if isinstance(value, dict):
+        return {k: _detach(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_detach(v) for v in value]
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+
+def detached_copy(collector: Any) -> Any:
+    """
+    Copy of a collector that can be modified without affecting the original:
+    its dicts, lists and sets are copied, and its DataFrames and Series
+    via core.frames.private_copy.
+    """
+    clone = copy.copy(collector)
+    clone.__dict__.update({name: _detach(value) for name, value in vars(collector).items()})
+    return clone
+
+
+class CollectorCache:
+    """
+    Bounded, memory-aware LRU cache of unpickled collectors.
+
+    Entries are keyed by (kind, id) and remember the pickle's mtime and size;
+    a lookup whose file has changed on disk is treated as a miss. The total
+    estimated size of cached collectors is kept under `max_bytes` by evicting
+    least recently used entries. The cache keeps its own copy of a collector
+    and hands out detached copies (see detached_copy), so a caller modifying
+    the collector it got never affects the others.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _signature(path: Path) -> Tuple[int, int]:
+        stat_info = path.stat()
+        return stat_info.st_mtime_ns, stat_info.st_size
+
+    def get(self, key: Tuple[str, str], path: Path) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry["signature"] == self._signature(path):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                collector = entry["collector"]
+            else:
+                if entry is not None:
+                    self._drop(key)
+                self.misses += 1
+                return None
+        return detached_copy(collector)
+
+    def put(self, key: Tuple[str, str], path: Path, collector: Any) -> None:
+        if self.max_bytes <= 0:
+            return
+        signature = self._signature(path)
+        nbytes = _estimate_bytes(collector, fallback=signature[1])
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = {"collector": detached_copy(collector), "signature": signature, "bytes": nbytes}
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes and self._entries:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate(self, key: Tuple[str, str]) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _drop(self, key: Tuple[str, str]) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry["bytes"]
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+collector_cache = CollectorCache(max_bytes=settings.COLLECTOR_CACHE_MAX_BYTES)
+
+
 class CollectorLoaderService:
     """Service for loading and managing pickled FinancialDataCollection objects."""
     
@@ -33,6 +165,10 @@ class CollectorLoaderService:
                 "Data collection (Phase A) must be completed first."
             )
         
+        cached = collector_cache.get(("financial", analysis_id), collector_path)
+        if cached is not None:
+            return cached
+        
         try:
             with open(collector_path, 'rb') as f:
                 collector = pickle.load(f)
@@ -44,6 +180,7 @@ class CollectorLoaderService:
                     f"Got {type(collector)} instead."
                 )
             
+            collector_cache.put(("financial", analysis_id), collector_path, collector)
             return collector
             
         except pickle.UnpicklingError as e:
@@ -68,6 +205,7 @@ class CollectorLoaderService:
             Path to the saved pickle file
         """
         collector_path = file_service.get_collector_pickle_path(analysis_id)
+        collector_cache.invalidate(("financial", analysis_id))
         
         try:
             with open(collector_path, 'wb') as f:
@@ -92,6 +230,7 @@ class CollectorLoaderService:
             True if deleted, False if file didn't exist
         """
         collector_path = file_service.get_collector_pickle_path(analysis_id)
+        collector_cache.invalidate(("financial", analysis_id))
         
         if collector_path.exists():
             collector_path.unlink()
@@ -136,6 +275,10 @@ class CollectorLoaderService:
                 "Data collection (Phase A) must be completed first."
             )
         
+        cached = collector_cache.get(("dataset", dataset_id), collector_path)
+        if cached is not None:
+            return cached
+        
         try:
             with open(collector_path, 'rb') as f:
                 collector = pickle.load(f)
@@ -147,6 +290,7 @@ class CollectorLoaderService:
                     f"Got {type(collector)} instead."
                 )
             
+            collector_cache.put(("dataset", dataset_id), collector_path, collector)
             return collector
             
         except pickle.UnpicklingError as e:
@@ -162,6 +306,7 @@ class CollectorLoaderService:
     ) -> Path:
 
         collector_path = file_service.get_dataset_collector_pickle_path(dataset_id)
+        collector_cache.invalidate(("dataset", dataset_id))
         
         try:
             with open(collector_path, 'wb') as f:
@@ -178,6 +323,7 @@ class CollectorLoaderService:
     def delete_dataset_collector(analysis_id: str) -> bool:
 
         collector_path = file_service.get_dataset_collector_pickle_path(analysis_id)
+        collector_cache.invalidate(("dataset", analysis_id))
         
         if collector_path.exists():
             collector_path.unlink()
@@ -200,6 +346,25 @@ class CollectorLoaderService:
             "modified_at": stat_info.st_mtime
         }
 
+    
+    # --------------------------------------------------------------------------
+    # in-process collector cache
+    # --------------------------------------------------------------------------
+    @staticmethod
+    def invalidate_financial_collector(analysis_id: str) -> None:
+        """Drop a cached FinancialDataCollection (e.g. after a reset)."""
+        collector_cache.invalidate(("financial", analysis_id))
+    
+    @staticmethod
+    def invalidate_dataset_collector(dataset_id: str) -> None:
+        """Drop a cached DatasetCollection (e.g. after a reset)."""
+        collector_cache.invalidate(("dataset", dataset_id))
+    
+    @staticmethod
+    def get_cache_stats() -> dict:
+        """Hit/miss counters and memory use of the collector cache."""
+        return collector_cache.stats()
+
 
 # Create a singleton instance
 collector_loader_service = CollectorLoaderService()
\ No newline at end of file
@@ -14,7 +14,9 @@ from ..config import settings
 from ..data_collection.fred_collector import FREDCollector  
 from ..data_collection.financial_collector import FinancialDataCollection 
 from ..data_collection.dataset_collector import DatasetCollection
+from ..data_collection.local_source import LocalDataSource
 from .collector_loader_service import collector_loader_service
+from .dataset_store_service import dataset_store_service
 from ..core.websocket_manager import manager
 from ..database import SessionLocal
 
@@ -22,6 +24,12 @@ class DataCollectionService:
     def __init__(self):
         self.fmp_api_key = settings.FMP_API_KEY
         self.fred_api_key = settings.FRED_API_KEY
+
+    def _local_source(self):
+        """DATA-database backend for Phase A, or None to collect from FMP only."""
+        if settings.COLLECTION_SOURCE != "auto":
+            return None
+        return LocalDataSource.create(grace_hours=settings.COLLECTION_DB_GRACE_HOURS)
     
     async def collect_data_for_analysis(self, analysis_id: str) -> None:
         """Run Phase A data collection for an analysis"""
@@ -54,7 +62,10 @@ class DataCollectionService:
                     export_dir=file_service.get_analysis_dir(analysis.analysis_id),
                     econ_dir = file_service.get_shared_economic_indicators_path(),
                     websocket_manager=manager,
-                    analysis_id=analysis.analysis_id
+                    analysis_id=analysis.analysis_id,
+                    max_concurrency=settings.FMP_MAX_CONCURRENCY,
+                    rate_limit_per_minute=settings.FMP_RATE_LIMIT_PER_MINUTE,
+                    local_source=self._local_source(),
                 )
                 await financial_collector.get_all_financial_data_async(force_collect=True)
                 await financial_collector.export_excel()
@@ -124,7 +135,8 @@ class DataCollectionService:
                     companies=companies_dict,
                     years=dataset.years_back,
                     export_dir=file_service.get_dataset_directory(dataset_id),
-                    econ_dir = file_service.get_shared_economic_indicators_path()
+                    econ_dir = file_service.get_shared_economic_indicators_path(),
+                    local_source=self._local_source(),
                 )
                 dataset_collector.get_all_financial_data(force_collect=True)
                 dataset_collector.export_excel()
@@ -137,6 +149,12 @@ class DataCollectionService:
                 collector=dataset_collector,
                 dataset_id=dataset_id
                 )
+
+                # Columnar per-table store read by the data endpoints
+                try:
+                    dataset_store_service.save_dataset_store(dataset_collector, dataset_id)
+                except Exception as e:
+                    print(f"⚠️ Dataset store not written, endpoints will read the pickle: {e}")
                 
                 # Update analysis status
                 dataset.status = "ready"
@@ -0,0 +1,333 @@
+"""
+Columnar on-disk store for DatasetCollection tables.
+
+Each collected dataset is persisted next to its pickle as a directory of
+per-table Parquet files plus a small manifest:
+
+    data/datasets/<dataset_id>/store/
+        manifest.json
+        financial.parquet
+        is.parquet
+        ...
+
+The data endpoints read only the table they serve, only the requested
+columns, and push Symbol/Year/date filters down to the Parquet reader, so
+a request costs roughly the size of the slice it returns. Datasets without
+a (current) store fall back to unpickling the collector.
+"""
+
+import json
+import logging
+import os
+import shutil
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .file_service import file_service
+from .collector_loader_service import collector_loader_service
+from ..data_collection.dataset_collector import DatasetCollection
+
+logger = logging.getLogger(__name__)
+
+STORE_VERSION = 1
+ROW_GROUP_SIZE = 50_000
+
+# table name -> DatasetCollection getter
+STORE_TABLES: Dict[str, str] = {
+    "financial": "get_all_financial_data",
+    "is": "get_income_statements",
+    "bs": "get_balance_sheets",
+    "cf": "get_cash_flows",
+    "ratios": "get_ratios",
+    "metrics": "get_key_metrics",
+    "ev": "get_enterprise_values",
+    "daily": "get_prices_daily",
+    "monthly": "get_prices_monthly",
+    "sp500d": "get_sp500_daily",
+    "sp500m": "get_sp500_monthly",
+    "institutional": "get_institutional_ownership",
+    "insider": "get_insider_trading_latest",
+    "insiderstats": "get_insider_statistics",
+    "profiles": "get_profiles",
+    "employees": "get_employee_history",
+    "analyst": "get_analyst_estimates_only",
+    "targets": "get_price_targets",
+    "coverage": "get_analyst_coverage_summary",
+    "economic": "get_economic",
+}
+
+# Filters are (column, op, value) with op in ==, !=, <, <=, >, >=, in
+Filter = Tuple[str, str, Any]
+
+
+def _tmp_path(path: Path) -> Path:
+    """A temp file next to `path` private to this writer."""
+    return path.with_name(f"{path.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp")
+
+
+def _to_arrow(df: pd.DataFrame) -> pa.Table:
+    """
+    Convert a DataFrame to Arrow, stringifying object columns whose values
+    have mixed Python types (e.g. FMP fields that are sometimes a number
+    and sometimes a string), which Arrow cannot infer a single type for.
+    """
+    df = df.reset_index(drop=True)
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        df = df.copy()
+        for col in df.columns:
+            if df[col].dtype != object:
+                continue
+            try:
+                pa.array(df[col], from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                df[col] = df[col].map(lambda v: v if v is None or (isinstance(v, float) and pd.isna(v)) else str(v))
+        # Column labels must be strings in Parquet
+        df.columns = [str(c) for c in df.columns]
+        return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def _coerce_filter_value(arrow_type: pa.DataType, value: Any) -> Any:
+    """Cast a filter value so it compares against the stored column type."""
+    if isinstance(value, (list, tuple, set)):
+        return [_coerce_filter_value(arrow_type, v) for v in value]
+    if pa.types.is_timestamp(arrow_type):
+        ts = pd.Timestamp(value)
+        if arrow_type.tz is not None and ts.tzinfo is None:
+            ts = ts.tz_localize(arrow_type.tz)
+        return ts
+    if pa.types.is_date(arrow_type):
+        return pd.Timestamp(value).date()
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return str(value)
+    if pa.types.is_integer(arrow_type):
+        return int(value)
+    if pa.types.is_floating(arrow_type):
+        return float(value)
+    return value
+
+
+class DatasetStoreService:
+    """Service for writing and reading the per-table Parquet store of a dataset."""
+
+    @staticmethod
+    def resolve_table(data_source: str) -> str:
+        """
+        Map a data_source name (including the aliases accepted by the query
+        endpoints) to a store table name.
+
+        Raises:
+            ValueError: If the data source is unknown
+        """
+        aliases = {
+            "prices daily": "daily", "daily prices": "daily",
+            "prices monthly": "monthly", "monthly prices": "monthly",
+            "s&p 500 daily": "sp500d", "sp 500 daily": "sp500d",
+            "s&p 500 monthly": "sp500m", "sp 500 monthly": "sp500m",
+            "insider trading": "insider",
+            "insider statistics": "insiderstats",
+            "economic indicators": "economic",
+        }
+        table = aliases.get(data_source, data_source)
+        if table not in STORE_TABLES:
+            raise ValueError(f"Invalid data_source: {data_source}")
+        return table
+
+    @staticmethod
+    def _manifest_path(dataset_id: str) -> Path:
+        return file_service.get_dataset_store_dir(dataset_id) / "manifest.json"
+
+    @staticmethod
+    def load_manifest(dataset_id: str) -> Optional[dict]:
+        """
+        Return the store manifest, or None if there is no usable store.
+
+        A store is ignored when it was written by another store version or
+        when the collector pickle has been rewritten since it was built.
+        """
+        manifest_path = DatasetStoreService._manifest_path(dataset_id)
+        if not manifest_path.exists():
+            return None
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unreadable dataset store manifest for {dataset_id}: {e}")
+            return None
+
+        if manifest.get("version") != STORE_VERSION:
+            return None
+
+        pickle_path = file_service.get_dataset_collector_pickle_path(dataset_id)
+        if pickle_path.exists() and pickle_path.stat().st_mtime > manifest.get("source_mtime", 0) + 1:
+            return None
+        return manifest
+
+    @staticmethod
+    def table_columns(dataset_id: str, table: str) -> Optional[List[str]]:
+        """Column names of a stored table, read from the manifest."""
+        manifest = DatasetStoreService.load_manifest(dataset_id)
+        if not manifest or table not in manifest.get("tables", {}):
+            return None
+        return list(manifest["tables"][table]["columns"])
+
+    @staticmethod
+    def save_dataset_store(collector: DatasetCollection, dataset_id: str) -> Path:
+        """
+        Write every table of a collector to the columnar store.
+
+        Tables are written to temporary files and swapped in, and the
+        manifest is written last, so readers never see a partial store.
+
+        Args:
+            collector: The collected DatasetCollection
+            dataset_id: The unique identifier for the dataset
+
+        Returns:
+            Path to the store directory
+        """
+        store_dir = file_service.get_dataset_store_dir(dataset_id)
+        store_dir.mkdir(parents=True, exist_ok=True)
+
+        tables: Dict[str, dict] = {}
+        for table, getter in STORE_TABLES.items():
+            try:
+                df = getattr(collector, getter)()
+            except Exception as e:
+                logger.warning(f"Dataset store: skipping table '{table}' for {dataset_id}: {e}")
+                continue
+            if not isinstance(df, pd.DataFrame):
+                continue
+
+            arrow_table = _to_arrow(df)
+            path = store_dir / f"{table}.parquet"
+            tmp_path = _tmp_path(path)
+            try:
+                pq.write_table(arrow_table, tmp_path, row_group_size=ROW_GROUP_SIZE, compression="zstd")
+                os.replace(tmp_path, path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+
+            tables[table] = {
+                "file": path.name,
+                "rows": arrow_table.num_rows,
+                "columns": arrow_table.schema.names,
+                "types": {f.name: str(f.type) for f in arrow_table.schema},
+            }
+
+        pickle_path = file_service.get_dataset_collector_pickle_path(dataset_id)
+        manifest = {
+            "version": STORE_VERSION,
+            "dataset_id": dataset_id,
+            "created_at": datetime.utcnow().isoformat(),
+            "source_mtime": pickle_path.stat().st_mtime if pickle_path.exists() else 0,
+            "tables": tables,
+        }
+        manifest_path = DatasetStoreService._manifest_path(dataset_id)
+        tmp_manifest = _tmp_path(manifest_path)
+        try:
+            with open(tmp_manifest, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(tmp_manifest, manifest_path)
+        finally:
+            tmp_manifest.unlink(missing_ok=True)
+
+        return store_dir
+
+    @staticmethod
+    def delete_dataset_store(dataset_id: str) -> bool:
+        """
+        Delete the columnar store of a dataset.
+
+        Returns:
+            True if deleted, False if there was no store
+        """
+        store_dir = file_service.get_dataset_store_dir(dataset_id)
+        if store_dir.exists():
+            shutil.rmtree(store_dir, ignore_errors=True)
+            return True
+        return False
+
+    @staticmethod
+    def read_table(
+        dataset_id: str,
+        table: str,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[List[Filter]] = None,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Read one table from the store with column projection and predicate
+        pushdown.
+
+        Columns and filters that the table doesn't have are ignored, matching
+        how the endpoints treat them on DataFrames.
+
+        Returns:
+            The (filtered) DataFrame, or None if the table isn't in the store
+        """
+        manifest = DatasetStoreService.load_manifest(dataset_id)
+        if not manifest or table not in manifest.get("tables", {}):
+            return None
+
+        path = file_service.get_dataset_store_dir(dataset_id) / manifest["tables"][table]["file"]
+        if not path.exists():
+            return None
+
+        try:
+            schema = pq.read_schema(path)
+            names = set(schema.names)
+
+            read_columns = None
+            if columns:
+                read_columns = list(dict.fromkeys(c for c in columns if c in names))
+
+            arrow_filters = []
+            for col, op, value in filters or []:
+                if col not in names or value is None:
+                    continue
+                if isinstance(value, (str, list, tuple, set)) and len(value) == 0:
+                    continue
+                arrow_filters.append((col, op, _coerce_filter_value(schema.field(col).type, value)))
+
+            arrow_table = pq.read_table(
+                path,
+                columns=read_columns,
+                filters=arrow_filters or None,
+                use_threads=True,
+            )
+            return arrow_table.to_pandas()
+        except Exception as e:
+            logger.warning(f"Dataset store read failed for {dataset_id}/{table}, falling back to pickle: {e}")
+            return None
+
+    @staticmethod
+    def load_table(
+        dataset_id: str,
+        table: str,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[List[Filter]] = None,
+    ) -> pd.DataFrame:
+        """
+        Load a table, preferring the columnar store and falling back to the
+        pickled collector for datasets collected before the store existed.
+
+        The fallback path returns the full table; callers keep applying
+        their own DataFrame filters, which are no-ops on pre-filtered data.
+        """
+        df = DatasetStoreService.read_table(dataset_id, table, columns=columns, filters=filters)
+        if df is not None:
+            return df
+
+        collector = collector_loader_service.load_dataset_collector(dataset_id)
+        return getattr(collector, STORE_TABLES[table])()
+
+
+# Create a singleton instance
+dataset_store_service = DatasetStoreService()
@@ -48,6 +48,14 @@ class FileService:
         """Get path to the pickled FinancialDataCollection object."""
         return self.get_analysis_dir(analysis_id) / "financial_collector.pkl"
 
+    def get_artifacts_dir(self, analysis_id: str) -> Path:
+        """Get directory of the shared report artifacts for an analysis."""
+        return self.get_analysis_dir(analysis_id) / "artifacts"
+
+    def get_charts_dir(self, analysis_id: str) -> Path:
+        """Get directory of the lazily loaded chart data files for an analysis."""
+        return self.get_sections_dir(analysis_id) / "charts"
+
     def collector_pickle_exists(self, analysis_id: str) -> bool:
         """Check if collector pickle file exists."""
         return self.get_collector_pickle_path(analysis_id).exists()
@@ -84,6 +92,10 @@ class FileService:
         """Get path to the pickled FinancialDataCollection object."""
         return self.get_dataset_directory(dataset_id) / "dataset_collector.pkl"
     
+    def get_dataset_store_dir(self, dataset_id: str) -> Path:
+        """Get directory of the per-table Parquet store for a dataset."""
+        return self.get_dataset_directory(dataset_id) / "store"
+    
     def dataset_collector_pickle_exists(self, dataset_id: str) -> bool:
         """Check if dataset collector pickle file exists."""
         return self.get_dataset_collector_pickle_path(dataset_id).exists()
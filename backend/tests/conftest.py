@@ -0,0 +1,146 @@
+"""Test setup: project root on sys.path, placeholder settings for config.py and an in-memory Redis."""
+import fnmatch
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+for name, value in {
+    "DATABASE_URL": "sqlite://",
+    "SECRET_KEY": "test",
+    "DOCS_PASSWORD": "test",
+    "GOOGLE_CLIENT_ID": "test",
+    "GOOGLE_CLIENT_SECRET": "test",
+    "GOOGLE_REDIRECT_URI": "http://localhost/callback",
+    "RESEND_API_KEY": "test",
+}.items():
+    os.environ.setdefault(name, value)
+
+
+class FakeRedis:
+    """In-memory stand-in for the parts of redis.Redis the cache layer uses."""
+
+    def __init__(self):
+        self.store = {}
+        self.published = []
+        self.scan_counts = []
+
+    @staticmethod
+    def _key(key):
+        return key.encode() if isinstance(key, str) else key
+
+    def ping(self):
+        return True
+
+    def get(self, key):
+        return self.store.get(self._key(key))
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and self._key(key) in self.store:
+            return None
+        self.store[self._key(key)] = value if isinstance(value, bytes) else str(value).encode()
+        return True
+
+    def mget(self, keys):
+        return [self.get(key) for key in keys]
+
+    def unlink(self, *keys):
+        return sum(self.store.pop(self._key(key), None) is not None for key in keys)
+
+    delete = unlink
+
+    def scan_iter(self, match="*", count=None):
+        self.scan_counts.append(count)
+        for key in list(self.store):
+            if fnmatch.fnmatchcase(key.decode(), match):
+                yield key
+
+    def publish(self, channel, message):
+        self.published.append((channel, message))
+        return 1
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, *args, **kwargs):
+        self.commands.append(("set", args, kwargs))
+
+    def execute(self):
+        results = [getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+        self.commands = []
+        return results
+
+
+class FakeAsyncRedis:
+    """redis.asyncio counterpart of FakeRedis, sharing its data."""
+
+    def __init__(self, redis):
+        self.redis = redis
+
+    async def ping(self):
+        return True
+
+    async def get(self, key):
+        return self.redis.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        return self.redis.set(key, value, ex=ex, nx=nx)
+
+    async def mget(self, keys):
+        return self.redis.mget(keys)
+
+    async def unlink(self, *keys):
+        return self.redis.unlink(*keys)
+
+    async def publish(self, channel, message):
+        return self.redis.publish(channel, message)
+
+    async def scan_iter(self, match="*", count=None):
+        for key in self.redis.scan_iter(match=match, count=count):
+            yield key
+
+    def pipeline(self, transaction=True):
+        return FakeAsyncPipeline(self.redis)
+
+
+class FakeAsyncPipeline(FakePipeline):
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self):
+        return FakePipeline.execute(self)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Point the cache clients at an in-memory Redis and start with an empty L1."""
+    from backend.app.core.cache import client
+    from backend.app.core.cache.local import local_cache
+
+    redis = FakeRedis()
+    monkeypatch.setattr(client.settings, "CACHE_ENABLED", True)
+    monkeypatch.setattr(client, "_connection_failed", False)
+    monkeypatch.setattr(client, "_redis_client", redis)
+    monkeypatch.setattr(client, "_async_redis_client", FakeAsyncRedis(redis))
+    local_cache.clear()
+    yield redis
+    local_cache.clear()
@@ -0,0 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from backend.app.report_generation import artifacts
+from backend.app.report_generation.artifacts import ArtifactStore
+
+
+def test_concurrent_puts_of_a_shared_artifact(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifacts.file_service, "get_artifacts_dir", lambda analysis_id: tmp_path)
+    monkeypatch.setattr(artifacts.file_service, "get_collector_pickle_path",
+                        lambda analysis_id: tmp_path / "collector.pkl")
+    frame = pd.DataFrame({"Symbol": ["AAPL"] * 5000, "RSI": range(5000)})
+
+    def put(_):
+        ArtifactStore("a1").put("technical_indicators", frame)
+
+    with ThreadPoolExecutor(3) as pool:
+        list(pool.map(put, range(12)))
+
+    assert not list(tmp_path.glob("*.tmp"))
+    pd.testing.assert_frame_equal(ArtifactStore("a1").get("technical_indicators"), frame)
+
+
+def test_every_writer_gets_its_own_temp_file(tmp_path):
+    path = tmp_path / "technical_indicators.parquet"
+    assert artifacts._tmp_path(path) != artifacts._tmp_path(path)
+
+
+def test_artifacts_are_stale_once_their_producer_changes(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifacts.file_service, "get_artifacts_dir", lambda analysis_id: tmp_path)
+    monkeypatch.setattr(artifacts.file_service, "get_collector_pickle_path",
+                        lambda analysis_id: tmp_path / "collector.pkl")
+    digest = {"value": "v1"}
+    monkeypatch.setattr(artifacts, "producer_digest", lambda key: digest["value"])
+
+    ArtifactStore("a1").put("beta_analysis", {"AAPL": 1.1})
+    assert ArtifactStore("a1").get("beta_analysis") == {"AAPL": 1.1}
+
+    digest["value"] = "v2"
+    assert ArtifactStore("a1").get("beta_analysis") is None
+
+
+def test_producer_digest_follows_the_computing_module():
+    from backend.app.report_generation.fingerprint import REPORT_DIR, file_digest
+
+    assert artifacts.producer_digest("beta_analysis") == file_digest(REPORT_DIR / "sections" / "section_16.py")
+    assert artifacts.producer_digest("technical_indicators") == file_digest(REPORT_DIR / "indicators.py")
@@ -0,0 +1,27 @@
+import asyncio
+
+import httpx
+
+from backend.app.data_collection import async_http
+
+
+def test_no_backoff_after_the_last_attempt(monkeypatch):
+    sleeps = []
+
+    async def sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(async_http.asyncio, "sleep", sleep)
+
+    async def main():
+        async with async_http.AsyncHTTPEngine(retries=3, backoff=0.5) as engine:
+            await engine._client.aclose()
+            engine._client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(503)))
+            result = await engine.get_json("https://example.com/api")
+        return result, engine
+
+    result, engine = asyncio.run(main())
+    assert result is None
+    assert engine.requests_made == 3
+    assert engine.requests_failed == 1
+    assert sleeps == [0.5, 1.0]
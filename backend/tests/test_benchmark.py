@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+
+from backend.app.report_generation.benchmark import build_return_panel, relative_metrics
+
+
+def _prices(dates, returns, symbol=None):
+    frame = pd.DataFrame({"date": dates, "close": 100.0 * np.cumprod(1.0 + returns)})
+    if symbol is not None:
+        frame["Symbol"] = symbol
+    return frame
+
+
+def _panel():
+    rng = np.random.default_rng(7)
+    dates = pd.bdate_range("2022-01-03", periods=420)
+    market_returns = rng.normal(0.0004, 0.01, len(dates))
+
+    def company(beta, vol):
+        return beta * market_returns + rng.normal(0.0, vol, len(dates))
+
+    # The benchmark misses a few days the companies trade on
+    benchmark = _prices(dates, market_returns).drop(index=[50, 51, 300]).reset_index(drop=True)
+
+    full = _prices(dates, company(1.2, 0.008), "FULL")
+    # Trades on its own, sparser calendar with gaps
+    gaps = _prices(dates, company(0.8, 0.012), "GAPS")
+    gaps = gaps.drop(index=list(range(100, 130)) + list(range(200, 420, 7))).reset_index(drop=True)
+    # Listed late: more than 60 but fewer than 120 observations
+    late = _prices(dates[-100:], company(1.5, 0.01)[-100:], "LATE")
+    # Fewer observations than the shortest lookback
+    short = _prices(dates[-40:], company(1.0, 0.01)[-40:], "SHORT")
+
+    daily = pd.concat([full, gaps, late, short], ignore_index=True)
+    companies = {"Full": "FULL", "Gaps": "GAPS", "Late": "LATE", "Short": "SHORT"}
+    return build_return_panel(daily, benchmark, companies)
+
+
+def _aligned(returns, market, name):
+    return pd.DataFrame({"company": returns[name], "market": market}).dropna()
+
+
+def test_rolling_beta_and_correlation_match_pandas():
+    returns, market = _panel()
+    metrics = relative_metrics(returns, market)
+
+    for name in ["Full", "Gaps", "Late", "Short"]:
+        aligned = _aligned(returns, market, name)
+        assert metrics[name]["observations"] == len(aligned)
+
+        for window in (60, 120, 252):
+            if len(aligned) < window:
+                assert window not in metrics[name]["rolling"]
+                continue
+
+            rolling = aligned["company"].rolling(window)
+            beta = rolling.cov(aligned["market"]) / aligned["market"].rolling(window).var()
+            corr = rolling.corr(aligned["market"])
+            result = metrics[name]["rolling"][window]
+
+            assert np.isclose(result["beta"]["current"], beta.iloc[-1])
+            assert np.isclose(result["beta"]["mean"], beta.mean())
+            assert np.isclose(result["beta"]["std"], beta.std())
+            assert np.isclose(result["beta"]["min"], beta.min())
+            assert np.isclose(result["beta"]["max"], beta.max())
+            assert np.isclose(result["correlation"], corr.iloc[-1])
+
+    assert set(metrics["Late"]["rolling"]) == {60}
+    assert metrics["Short"]["rolling"] == {}
+
+
+def test_full_sample_and_regime_statistics_match_pandas():
+    returns, market = _panel()
+    metrics = relative_metrics(returns, market)
+
+    for name in ["Full", "Gaps", "Late"]:
+        aligned = _aligned(returns, market, name)
+        up = aligned[aligned["market"] > 0]
+        down = aligned[aligned["market"] < 0]
+        result = metrics[name]
+
+        assert np.isclose(result["correlation_full"], aligned["company"].corr(aligned["market"]))
+        assert np.isclose(result["up_beta"], up["company"].cov(up["market"]) / up["market"].var())
+        assert np.isclose(result["down_beta"], down["company"].cov(down["market"]) / down["market"].var())
+        assert np.isclose(
+            result["tracking_error"],
+            (aligned["company"] - aligned["market"]).std() * np.sqrt(252),
+        )
+
+    # Too few up/down days for a regime beta
+    assert metrics["Short"]["up_beta"] == 1.0
+    assert metrics["Short"]["down_beta"] == 1.0
+
+
+def test_drawdown_follows_each_companys_own_returns():
+    returns, market = _panel()
+    metrics = relative_metrics(returns, market)
+
+    for name in ["Full", "Gaps", "Short"]:
+        own = returns[name].dropna()
+        wealth = (1 + own).cumprod()
+        drawdown = (wealth - wealth.cummax()) / wealth.cummax()
+
+        assert np.isclose(metrics[name]["max_drawdown"], drawdown.min())
+        assert metrics[name]["drawdown_start"] == drawdown.idxmin()
+        recovered = drawdown[drawdown.index > drawdown.idxmin()]
+        recovered = recovered[recovered > -0.01]
+        expected = recovered.index[0] if len(recovered) else None
+        assert metrics[name]["recovery_date"] == expected
+
+
+def test_windows_longer_than_the_history_are_skipped():
+    returns, market = _panel()
+    metrics = relative_metrics(returns.iloc[-50:], market, windows=(20, 60))
+
+    assert set(metrics["Full"]["rolling"]) == {20}
+    assert relative_metrics(pd.DataFrame(), market) == {}
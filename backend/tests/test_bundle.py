@@ -0,0 +1,19 @@
+from backend.app.report_generation import bundle
+
+
+def test_publish_keeps_earlier_versions_and_adopts_legacy_ones(tmp_path, monkeypatch):
+    bundle_dir, legacy_dir = tmp_path / "bundle", tmp_path / "legacy"
+    legacy_dir.mkdir()
+    (legacy_dir / "report.0123456789ab.css").write_text("old")
+    monkeypatch.setattr(bundle, "BUNDLE_DIR", bundle_dir)
+    monkeypatch.setattr(bundle, "LEGACY_BUNDLE_DIR", legacy_dir)
+    bundle.report_bundle.cache_clear()
+    try:
+        urls = bundle.publish_report_bundle()
+    finally:
+        bundle.report_bundle.cache_clear()
+
+    names = sorted(p.name for p in bundle_dir.iterdir())
+    assert "report.0123456789ab.css" in names
+    assert all(url.rsplit("/", 1)[1] in names for url in urls.values())
+    assert not [name for name in names if name.endswith(".tmp")]
@@ -0,0 +1,101 @@
+import asyncio
+
+from backend.app.core.cache import client
+from backend.app.core.cache.local import invalidation_channel, local_cache
+
+PREFIX = client.settings.CACHE_PREFIX
+AUTH_KEYS = [f"{PREFIX}:auth:user:{i}" for i in range(3)]
+
+
+def _fill(fake_redis, n=1200):
+    for i in range(n):
+        client.cache_set_sync(f"{PREFIX}:bls:series:{i}", {"i": i}, ttl=60)
+    client.cache_set_sync(f"{PREFIX}:fred:series:1", {"i": 1}, ttl=60)
+    for key in AUTH_KEYS:
+        client.cache_set_sync(key, {"user": key}, ttl=60)
+
+
+def _keys(fake_redis):
+    return {key.decode() for key in fake_redis.store}
+
+
+def test_delete_pattern_sync_keeps_the_excluded_prefix(fake_redis):
+    _fill(fake_redis)
+
+    deleted = client.delete_pattern_sync(f"{PREFIX}:*", exclude_prefix=f"{PREFIX}:auth:")
+
+    assert deleted == 1201
+    assert _keys(fake_redis) == set(AUTH_KEYS)
+    assert set(fake_redis.scan_counts) == {client.SCAN_BATCH_SIZE}
+    assert (invalidation_channel(), f"{PREFIX}:*") in fake_redis.published
+
+
+def test_delete_pattern_sync_only_touches_the_source(fake_redis):
+    _fill(fake_redis, n=10)
+
+    assert client.delete_pattern_sync(f"{PREFIX}:bls:*", exclude_prefix=f"{PREFIX}:auth:") == 10
+    assert _keys(fake_redis) == {f"{PREFIX}:fred:series:1"} | set(AUTH_KEYS)
+
+
+def test_async_delete_pattern_keeps_the_excluded_prefix(fake_redis):
+    _fill(fake_redis)
+
+    deleted = asyncio.run(client.cache_delete_pattern(f"{PREFIX}:*", exclude_prefix=f"{PREFIX}:auth:"))
+
+    assert deleted == 1201
+    assert _keys(fake_redis) == set(AUTH_KEYS)
+    assert (invalidation_channel(), f"{PREFIX}:*") in fake_redis.published
+
+
+def test_pipelined_mset_and_mget_round_trip(fake_redis):
+    items = {f"{PREFIX}:oe:{i}": {"rank": i, "rows": list(range(i))} for i in range(5)}
+
+    async def main():
+        assert await client.cache_mset(items, ttl=60)
+        return await client.cache_mget(list(items) + [f"{PREFIX}:oe:missing"])
+
+    values = asyncio.run(main())
+
+    assert values == list(items.values()) + [None]
+    assert client.cache_mget_sync(list(items)) == list(items.values())
+    assert client.cache_mget_sync([]) == []
+
+
+def test_mget_skips_values_that_fail_to_decode(fake_redis):
+    client.cache_set_sync(f"{PREFIX}:a", {"ok": True}, ttl=60)
+    fake_redis.store[f"{PREFIX}:b".encode()] = b"\x01not json"
+
+    assert client.cache_mget_sync([f"{PREFIX}:a", f"{PREFIX}:b"]) == [{"ok": True}, None]
+
+
+def test_async_get_and_set_read_legacy_values(fake_redis):
+    fake_redis.store[f"{PREFIX}:legacy".encode()] = b'{"v": 1}'
+
+    async def main():
+        assert await client.cache_set(f"{PREFIX}:new", {"v": 2}, ttl=60)
+        return await client.cache_get(f"{PREFIX}:legacy"), await client.cache_get(f"{PREFIX}:new")
+
+    assert asyncio.run(main()) == ({"v": 1}, {"v": 2})
+
+
+def test_cache_delete_drops_the_local_copy_and_broadcasts(fake_redis):
+    key = f"{PREFIX}:portal:bls"
+    client.cache_set_sync(key, {"v": 1}, ttl=60, local_ttl=30)
+    assert local_cache.get(key) == {"v": 1}
+
+    assert asyncio.run(client.cache_delete(key))
+
+    assert local_cache.get(key) is None
+    assert client.cache_get_sync(key) is None
+    assert (invalidation_channel(), key) in fake_redis.published
+
+
+def test_everything_is_a_miss_without_redis(monkeypatch):
+    monkeypatch.setattr(client.settings, "CACHE_ENABLED", False)
+
+    assert client.cache_get_sync("k") is None
+    assert not client.cache_set_sync("k", 1, ttl=60)
+    assert client.cache_mget_sync(["a", "b"]) == [None, None]
+    assert client.delete_pattern_sync("*") == 0
+    assert asyncio.run(client.cache_mget(["a"])) == [None]
+    assert asyncio.run(client.cache_delete_pattern("*")) == 0
@@ -0,0 +1,92 @@
+import json
+
+import numpy as np
+import pytest
+from pydantic import BaseModel
+
+from backend.app.core.cache import serialization
+from backend.app.core.cache.serialization import (
+    CODEC_JSON, CODEC_MSGPACK, CODEC_ORJSON, ZSTD_FLAG, decode, encode,
+)
+
+VALUE = {
+    "series_id": "CUUR0000SA0",
+    "data": [{"year": 2024, "period": "M01", "value": 309.685, "footnotes": None}],
+    "latest": True,
+    "nested": {"labels": ["a", "b"], "count": 2},
+}
+
+
+class Point(BaseModel):
+    date: str
+    value: float
+
+
+@pytest.mark.parametrize("serializer, codec", [
+    ("orjson", CODEC_ORJSON),
+    ("msgpack", CODEC_MSGPACK),
+    ("json", CODEC_JSON),
+])
+def test_round_trip_per_codec(monkeypatch, serializer, codec):
+    monkeypatch.setattr(serialization.settings, "CACHE_SERIALIZER", serializer)
+    monkeypatch.setattr(serialization.settings, "CACHE_COMPRESSION_MIN_BYTES", 0)
+
+    data, compressed = encode(VALUE)
+
+    assert data[0] == codec
+    assert not compressed
+    assert decode(data) == VALUE
+
+
+@pytest.mark.parametrize("serializer", ["orjson", "msgpack", "json"])
+def test_large_values_are_zstd_compressed(monkeypatch, serializer):
+    monkeypatch.setattr(serialization.settings, "CACHE_SERIALIZER", serializer)
+    monkeypatch.setattr(serialization.settings, "CACHE_COMPRESSION_MIN_BYTES", 1024)
+    value = {"data": [dict(VALUE["data"][0], month=i) for i in range(500)]}
+
+    data, compressed = encode(value)
+
+    assert compressed
+    assert data[0] & ZSTD_FLAG
+    assert len(data) < len(json.dumps(value))
+    assert decode(data) == value
+    # Below the threshold the same codec stores it as is
+    small, small_compressed = encode(VALUE)
+    assert not small_compressed and small[0] == data[0] & ~ZSTD_FLAG
+
+
+def test_legacy_json_values_are_still_readable():
+    # What the v1 cache stored: json.dumps text, read back as bytes or str
+    legacy = json.dumps(VALUE, default=str)
+    assert decode(legacy.encode()) == VALUE
+    assert decode(legacy) == VALUE
+    assert decode(json.dumps([1, 2, 3]).encode()) == [1, 2, 3]
+    assert decode(b'"text"') == "text"
+    assert decode(None) is None
+
+
+@pytest.mark.parametrize("serializer", ["orjson", "msgpack", "json"])
+def test_pydantic_models_are_stored_as_dicts(monkeypatch, serializer):
+    monkeypatch.setattr(serialization.settings, "CACHE_SERIALIZER", serializer)
+    value = {"points": [Point(date="2024-01-01", value=1.5)]}
+
+    assert decode(encode(Point(date="2024-01-01", value=1.5))[0]) == {"date": "2024-01-01", "value": 1.5}
+    assert decode(encode(value)[0]) == {"points": [{"date": "2024-01-01", "value": 1.5}]}
+
+
+def test_orjson_handles_numpy_values(monkeypatch):
+    monkeypatch.setattr(serialization.settings, "CACHE_SERIALIZER", "orjson")
+    data, _ = encode({"values": np.array([1.5, 2.5]), "count": np.int64(2)})
+    assert decode(data) == {"values": [1.5, 2.5], "count": 2}
+
+
+def test_missing_libraries_fall_back_to_the_stdlib_codec(monkeypatch):
+    monkeypatch.setattr(serialization.settings, "CACHE_SERIALIZER", "msgpack")
+    monkeypatch.setattr(serialization, "msgpack", None)
+    assert encode(VALUE)[0][0] == CODEC_ORJSON
+
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert encode(VALUE)[0][0] == CODEC_JSON
+
+    monkeypatch.setattr(serialization.settings, "CACHE_SERIALIZER", "pickle")
+    assert encode(VALUE)[0][0] == CODEC_JSON
@@ -0,0 +1,104 @@
+from fastapi.testclient import TestClient
+
+from backend.app import main
+from backend.app.core.cache import warmup
+
+PREFIX = main.settings.CACHE_PREFIX
+SECRET = "webhook-secret"
+
+
+class Session:
+    def close(self):
+        pass
+
+
+class Endpoint:
+    def __init__(self, namespace, calls, fail=False):
+        self.namespace = namespace
+        self.calls = calls
+        self.fail = fail
+
+    def warm(self, db, **params):
+        if self.fail:
+            raise RuntimeError("DATA database unavailable")
+        self.calls.append((self.namespace, params))
+
+
+def _client(fake_redis, monkeypatch, failing=()):
+    calls = []
+    monkeypatch.setattr(main.settings, "CACHE_WEBHOOK_SECRET", SECRET)
+    monkeypatch.setattr(warmup, "DataSessionLocal", Session)
+    monkeypatch.setattr(warmup, "get_cached_endpoint",
+                        lambda namespace: Endpoint(namespace, calls, fail=namespace in failing))
+    for key in (f"{PREFIX}:bls:cu:overview:1", f"{PREFIX}:fred:claims:overview:1", f"{PREFIX}:auth:user:1"):
+        fake_redis.set(key, b'{"v": 1}')
+    return TestClient(main.app), calls
+
+
+def _status(client):
+    response = client.get("/cache/warmup", auth=(main.DOCS_USERNAME, main.DOCS_PASSWORD))
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_webhook_warms_only_the_requested_source(fake_redis, monkeypatch):
+    client, calls = _client(fake_redis, monkeypatch)
+
+    response = client.delete("/cache/webhook", params={"source": "bls", "x_webhook_key": SECRET})
+
+    assert response.status_code == 200
+    assert response.json() == {"deleted": 1, "source": "bls", "warming": ["bls"]}
+    assert {key.decode() for key in fake_redis.store} >= {
+        f"{PREFIX}:fred:claims:overview:1", f"{PREFIX}:auth:user:1",
+    }
+    # The background task ran after the response
+    bls_targets = [(ns, params) for ns, param_sets in warmup.WARMUP_TARGETS["bls"] for params in param_sets]
+    assert sorted(calls, key=repr) == sorted(bls_targets, key=repr)
+
+    status = _status(client)
+    assert status["fred"] is None and status["treasury"] is None
+    assert status["bls"]["state"] == "completed"
+    assert status["bls"]["targets"] == len(bls_targets)
+    assert status["bls"]["warmed"] == len(bls_targets)
+    assert status["bls"]["coverage"] == 1.0
+    assert status["bls"]["errors"] == []
+
+
+def test_warmup_status_reports_failures(fake_redis, monkeypatch):
+    client, calls = _client(fake_redis, monkeypatch, failing={"fred:fedfunds:series"})
+
+    client.delete("/cache/webhook", params={"source": "fred", "x_webhook_key": SECRET})
+
+    status = _status(client)["fred"]
+    assert status["failed"] == 2
+    assert status["warmed"] == status["targets"] - 2
+    assert all(error.startswith("fred:fedfunds:series") for error in status["errors"])
+    assert all(ns.startswith("fred:") for ns, _ in calls)
+
+
+def test_webhook_without_warming_or_for_unknown_sources(fake_redis, monkeypatch):
+    client, calls = _client(fake_redis, monkeypatch)
+
+    no_warm = client.delete("/cache/webhook", params={"source": "bls", "x_webhook_key": SECRET, "warm": False})
+    unknown = client.delete("/cache/webhook", params={"source": "bea", "x_webhook_key": SECRET})
+
+    assert no_warm.json()["warming"] == []
+    assert unknown.json()["warming"] == []
+    assert calls == []
+    assert all(value is None for value in _status(client).values())
+
+
+def test_webhook_rejects_a_wrong_key(fake_redis, monkeypatch):
+    client, calls = _client(fake_redis, monkeypatch)
+
+    response = client.delete("/cache/webhook", params={"source": "bls", "x_webhook_key": "wrong"})
+
+    assert response.status_code == 401
+    assert len(fake_redis.store) == 3
+    assert calls == []
+
+
+def test_warmup_sources():
+    assert warmup.warmup_sources() == list(warmup.WARMUP_TARGETS)
+    assert warmup.warmup_sources("treasury") == ["treasury"]
+    assert warmup.warmup_sources("bea") == []
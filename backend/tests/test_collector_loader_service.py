@@ -0,0 +1,35 @@
+import pandas as pd
+
+from backend.app.services.collector_loader_service import CollectorCache
+
+
+class Collector:
+    def __init__(self):
+        self.companies = {"Apple": "AAPL"}
+        self.prices = pd.DataFrame({"close": [1.0, 2.0]})
+        self.raw_tables = {"profile": pd.DataFrame({"symbol": ["AAPL"]})}
+
+
+def test_callers_modifying_a_cached_collector_dont_affect_others(tmp_path):
+    path = tmp_path / "collector.pkl"
+    path.write_bytes(b"x")
+    cache = CollectorCache(max_bytes=10**9)
+    loaded = Collector()
+    cache.put(("financial", "a1"), path, loaded)
+
+    # The caller that loaded it, and one served from the cache
+    first = cache.get(("financial", "a1"), path)
+    for collector in (loaded, first):
+        collector.companies["Microsoft"] = "MSFT"
+        collector.prices["sma"] = collector.prices["close"].rolling(2).mean()
+        collector.prices.loc[0, "close"] = -1.0
+        collector.raw_tables["profile"].loc[0, "symbol"] = "XXX"
+        collector.raw_tables["extra"] = pd.DataFrame()
+
+    second = cache.get(("financial", "a1"), path)
+    assert second.companies == {"Apple": "AAPL"}
+    assert list(second.prices.columns) == ["close"]
+    assert second.prices["close"].tolist() == [1.0, 2.0]
+    assert second.raw_tables["profile"]["symbol"].tolist() == ["AAPL"]
+    assert set(second.raw_tables) == {"profile"}
+    assert isinstance(second, Collector)
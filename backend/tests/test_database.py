@@ -0,0 +1,37 @@
+import asyncio
+import threading
+import time
+
+import httpx
+from fastapi import Depends, FastAPI
+
+from backend.app import database
+
+
+def test_data_db_requests_wait_for_a_slot_off_the_threadpool(monkeypatch):
+    monkeypatch.setattr(database.settings, "DATA_DB_POOL_SIZE", 2)
+    monkeypatch.setattr(database.settings, "DATA_DB_MAX_OVERFLOW", 0)
+    monkeypatch.setattr(database, "_data_db_limiter", None)
+
+    app = FastAPI()
+    lock = threading.Lock()
+    running = {"now": 0, "max": 0}
+
+    @app.get("/data")
+    def data(_slot: None = Depends(database.data_db_slot)):
+        with lock:
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+        time.sleep(0.05)
+        with lock:
+            running["now"] -= 1
+        return {}
+
+    async def main():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = await asyncio.gather(*(client.get("/data") for _ in range(6)))
+        assert all(r.status_code == 200 for r in responses)
+
+    asyncio.run(main())
+    assert running["max"] == 2
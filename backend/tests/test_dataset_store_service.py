@@ -0,0 +1,125 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from backend.app.services import dataset_store_service as store_module
+from backend.app.services.dataset_store_service import _to_arrow, dataset_store_service
+
+
+class Collector:
+    """The DatasetCollection getters the store reads; the rest are skipped."""
+
+    def __init__(self):
+        symbols = ["AAPL", "MSFT", "GOOG", "AMZN"]
+        self.financial = pd.DataFrame({
+            "Company": [f"{s} Inc" for s in symbols for _ in range(3)],
+            "Symbol": [s for s in symbols for _ in range(3)],
+            "Year": [2021, 2022, 2023] * len(symbols),
+            "revenue": np.arange(12, dtype=float) * 1e9,
+            "netIncome": np.arange(12, dtype=float) * 1e8,
+        })
+        dates = pd.date_range("2024-01-01", periods=10, freq="B")
+        self.daily = pd.DataFrame({
+            "Symbol": np.repeat(symbols, len(dates)),
+            "date": np.tile(dates, len(symbols)),
+            "close": np.arange(40, dtype=float),
+        })
+
+    def get_all_financial_data(self):
+        return self.financial
+
+    def get_prices_daily(self):
+        return self.daily
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(store_module.file_service, "data_dir", tmp_path)
+    collector = Collector()
+    pickle_path = store_module.file_service.get_dataset_collector_pickle_path("d1")
+    pickle_path.parent.mkdir(parents=True)
+    pickle_path.write_bytes(b"x")
+    monkeypatch.setattr(store_module.collector_loader_service, "load_dataset_collector",
+                        lambda dataset_id: collector)
+    dataset_store_service.save_dataset_store(collector, "d1")
+    return collector
+
+
+def test_projection_and_in_filters_match_the_pickle_path(store):
+    companies, years = ["MSFT", "AMZN"], [2022, 2023]
+    columns = ["Company", "Symbol", "Year", "revenue"]
+
+    df = dataset_store_service.load_table(
+        "d1", "financial", columns=columns,
+        filters=[("Symbol", "in", companies), ("Year", "in", years)],
+    )
+
+    old = store.financial
+    old = old[old["Symbol"].isin(companies) & old["Year"].isin(years)][columns]
+    pd.testing.assert_frame_equal(df, old.reset_index(drop=True), check_dtype=False)
+
+
+def test_date_range_filters_are_pushed_down(store):
+    df = dataset_store_service.load_table(
+        "d1", "daily",
+        filters=[("Symbol", "==", "GOOG"), ("date", ">=", "2024-01-08"), ("date", "<=", "2024-01-10")],
+    )
+    assert df["Symbol"].unique().tolist() == ["GOOG"]
+    assert df["date"].dt.strftime("%Y-%m-%d").tolist() == ["2024-01-08", "2024-01-09", "2024-01-10"]
+
+
+def test_unknown_columns_and_empty_filters_are_ignored(store):
+    df = dataset_store_service.load_table(
+        "d1", "financial", columns=["Symbol", "missing"],
+        filters=[("missing", "==", 1), ("Symbol", "in", []), ("Year", "in", None)],
+    )
+    assert df.columns.tolist() == ["Symbol"]
+    assert len(df) == len(store.financial)
+
+
+def test_mixed_type_object_columns_are_stringified():
+    df = pd.DataFrame({
+        "Symbol": ["AAPL", "MSFT", "GOOG"],
+        "mixed": [1.5, "n/a", None],
+        "numbers": [1, 2, 3],
+    })
+    table = _to_arrow(df)
+
+    mixed_type = table.schema.field("mixed").type
+    assert pa.types.is_string(mixed_type) or pa.types.is_large_string(mixed_type)
+    assert table.column("mixed").to_pylist() == ["1.5", "n/a", None]
+    assert table.column("numbers").to_pylist() == [1, 2, 3]
+
+
+def test_a_newer_pickle_invalidates_the_store(store):
+    assert dataset_store_service.load_manifest("d1") is not None
+
+    pickle_path = store_module.file_service.get_dataset_collector_pickle_path("d1")
+    later = time.time() + 60
+    os.utime(pickle_path, (later, later))
+
+    assert dataset_store_service.load_manifest("d1") is None
+    assert dataset_store_service.read_table("d1", "financial") is None
+
+
+def test_load_table_falls_back_to_the_pickle_without_a_store(store):
+    dataset_store_service.delete_dataset_store("d1")
+
+    df = dataset_store_service.load_table("d1", "financial", columns=["Symbol"],
+                                          filters=[("Symbol", "in", ["AAPL"])])
+    # The fallback returns the whole table for the endpoint to filter
+    pd.testing.assert_frame_equal(df, store.financial)
+
+
+def test_concurrent_writers_leave_a_readable_store(store):
+    with ThreadPoolExecutor(3) as pool:
+        list(pool.map(lambda _: dataset_store_service.save_dataset_store(store, "d1"), range(6)))
+
+    store_dir = store_module.file_service.get_dataset_store_dir("d1")
+    assert not list(store_dir.glob("*.tmp"))
+    assert len(dataset_store_service.load_table("d1", "financial")) == len(store.financial)
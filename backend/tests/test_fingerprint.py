@@ -0,0 +1,23 @@
+from backend.app.report_generation import fingerprint
+from backend.app.report_generation.fingerprint import SectionFingerprints
+
+
+class _Collector:
+    companies = {"Apple": "AAPL"}
+    years = 5
+    raw_tables = {}
+
+
+def test_fingerprint_follows_the_imported_section_source():
+    fps = SectionFingerprints("a1", _Collector(), lambda n: [])
+    on_disk = fps.get(19)
+    assert fps.get(19, fingerprint.file_digest(fingerprint.SECTIONS_DIR / "section_19.py")) == on_disk
+    # A worker still running an older source of the section
+    assert fps.get(19, "0" * 64) != on_disk
+    assert fps.get(19) == on_disk
+
+
+def test_public_url_change_invalidates_sections(monkeypatch):
+    before = fingerprint.code_version(19)
+    monkeypatch.setattr(fingerprint.settings, "API_PUBLIC_URL", "https://api.example.com")
+    assert fingerprint.code_version(19) != before
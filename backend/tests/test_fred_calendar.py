@@ -0,0 +1,80 @@
+import asyncio
+from datetime import date, timedelta
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.app import database
+from backend.app.api.research import fred_calendar
+from backend.app.core.deps import get_current_user
+from backend.app.data_models import FredRelease, FredReleaseDate
+
+
+def test_async_database_url_uses_asyncpg_for_postgres_only():
+    url = database.get_async_database_url("postgresql://user:secret@db:5432/data")
+    assert url == "postgresql+asyncpg://user:secret@db:5432/data"
+    assert database.get_async_database_url("postgresql+psycopg2://u:p@db/data").startswith("postgresql+asyncpg://")
+    assert database.get_async_database_url("sqlite:///data.db") is None
+
+
+def test_get_async_data_db_requires_a_postgres_data_database(monkeypatch):
+    monkeypatch.setattr(database, "AsyncDataSessionLocal", None)
+
+    async def main():
+        with pytest.raises(RuntimeError):
+            await database.get_async_data_db().__anext__()
+
+    asyncio.run(main())
+
+
+def test_fred_calendar_runs_on_an_async_session(tmp_path, monkeypatch):
+    pytest.importorskip("aiosqlite")
+    today = date.today()
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'data.db'}")
+    monkeypatch.setattr(database, "AsyncDataSessionLocal",
+                        async_sessionmaker(engine, autoflush=False, expire_on_commit=False))
+
+    app = FastAPI()
+    app.include_router(fred_calendar.router)
+    app.dependency_overrides[get_current_user] = lambda: None
+
+    async def main():
+        async with engine.begin() as conn:
+            await conn.run_sync(lambda sync_conn: database.DataBase.metadata.create_all(
+                sync_conn, tables=[FredRelease.__table__, FredReleaseDate.__table__]))
+
+        async with database.AsyncDataSessionLocal() as db:
+            db.add_all([
+                FredRelease(release_id=10, name="Consumer Price Index", series_count=3),
+                FredRelease(release_id=50, name="Employment Situation", series_count=None),
+                FredReleaseDate(release_id=10, release_date=today - timedelta(days=30)),
+                FredReleaseDate(release_id=10, release_date=today + timedelta(days=2)),
+                FredReleaseDate(release_id=50, release_date=today + timedelta(days=3)),
+            ])
+            await db.commit()
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            stats = (await client.get("/api/research/fred-calendar/stats")).json()
+            upcoming = (await client.get("/api/research/fred-calendar/upcoming", params={"days": 7})).json()
+            dates = (await client.get("/api/research/fred-calendar/release/10/dates")).json()
+            missing = await client.get("/api/research/fred-calendar/release/99/dates")
+        await engine.dispose()
+        return stats, upcoming, dates, missing
+
+    stats, upcoming, dates, missing = asyncio.run(main())
+
+    assert stats == {
+        "total_dates": 3,
+        "future_dates": 2,
+        "historical_dates": 1,
+        "total_releases": 2,
+        "earliest_date": (today - timedelta(days=30)).isoformat(),
+        "latest_date": (today + timedelta(days=3)).isoformat(),
+    }
+    assert [(r["release_id"], r["series_count"]) for r in upcoming["releases"]] == [(10, 3), (50, 0)]
+    assert dates["past_dates"] == [(today - timedelta(days=30)).isoformat()]
+    assert dates["future_dates"] == [(today + timedelta(days=2)).isoformat()]
+    assert missing.status_code == 404
@@ -0,0 +1,156 @@
+import json
+import random
+import time
+import zlib
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+from backend.app.data_collection.fred_collector import FREDCollector
+
+# FRED series with different start dates and frequencies
+FRED_SERIES = {
+    "GDPC1": pd.date_range("2000-01-01", "2005-10-01", freq="QS"),
+    "UNRATE": pd.date_range("2001-06-01", "2005-12-01", freq="MS"),
+    "MORTGAGE30US": pd.date_range("2002-03-07", "2005-12-29", freq="W-THU"),
+    "VIXCLS": pd.bdate_range("2003-01-02", "2005-12-30"),
+    "SP500": pd.bdate_range("2004-06-01", "2005-12-30"),
+    "GS10": pd.date_range("2000-01-01", "2005-12-01", freq="MS"),
+    "T10Y2Y": pd.bdate_range("2005-01-03", "2005-12-30"),
+}
+INDICATORS = {
+    "Real_GDP": "GDPC1",
+    "Unemployment_Rate": "UNRATE",
+    "Mortgage_Rate_30Y": "MORTGAGE30US",
+    "VIX_Index": "VIXCLS",
+    "S&P_500_Index": "SP500",
+    "Treasury_10Y": "GS10",
+    "Yield_Curve_10Y_2Y": "T10Y2Y",
+}
+TREASURY_DATES = pd.bdate_range("2002-01-02", "2005-12-30")
+GSPC_DATES = pd.bdate_range("2003-01-02", "2005-12-30")
+
+
+def _values(key, n):
+    rng = np.random.default_rng(zlib.crc32(key.encode()))
+    return np.round(rng.normal(5.0, 1.0, n), 4)
+
+
+class Response:
+    def __init__(self, status_code=200, text="", payload=None):
+        self.status_code = status_code
+        self.text = text
+        self._payload = payload
+
+    def json(self):
+        return json.loads(json.dumps(self._payload))
+
+
+class StubSession:
+    """Answers FRED CSV and FMP JSON requests, completing in random order."""
+
+    def __init__(self):
+        self.headers = {}
+        self.requests = []
+
+    def mount(self, prefix, adapter):
+        pass
+
+    def get(self, url, params=None, timeout=None):
+        self.requests.append(url)
+        time.sleep(random.uniform(0, 0.01))
+        if "fredgraph.csv" in url:
+            series_id = parse_qs(urlparse(url).query)["id"][0]
+            dates = FRED_SERIES.get(series_id)
+            if dates is None:
+                return Response(404)
+            values = [str(v) for v in _values(series_id, len(dates))]
+            values[3] = "."  # FRED's missing-value marker
+            rows = [f"{d:%Y-%m-%d},{v}" for d, v in zip(dates, values)]
+            return Response(text="observation_date," + series_id + "\n" + "\n".join(rows))
+        if url.endswith("/economic-indicators"):
+            if params["name"] != "retailSales":
+                return Response(payload=[])
+            dates = pd.date_range("1999-01-01", "2005-12-01", freq="MS")
+            return Response(payload=[
+                {"date": f"{d:%Y-%m-%d}", "value": float(v)} for d, v in zip(dates, _values("retail", len(dates)))
+            ])
+        if url.endswith("/treasury-rates"):
+            return Response(payload=[
+                {"date": f"{d:%Y-%m-%d}", "month3": float(a), "year2": float(b), "year5": float(c), "year10": float(e)}
+                for d, a, b, c, e in zip(
+                    TREASURY_DATES, *(_values(t, len(TREASURY_DATES)) for t in ("m3", "y2", "y5", "y10"))
+                )
+            ])
+        if url.endswith("/historical-price-eod/full"):
+            return Response(payload=[
+                {"date": f"{d:%Y-%m-%d}", "adjClose": float(v)}
+                for d, v in zip(GSPC_DATES, _values("gspc", len(GSPC_DATES)))
+            ])
+        return Response(404)
+
+
+def _collect(max_workers):
+    collector = FREDCollector(
+        indicators=INDICATORS, fmp_api_key="key", max_workers=max_workers,
+        fred_min_interval=0.0, fmp_rate_per_minute=600_000, use_response_cache=False,
+    )
+    collector.session = StubSession()
+    collector.fetch_all()
+    return collector
+
+
+def _sequential_panel(raw_frames, rule, how):
+    """The per-series resample + outer-merge chain the panels used to be built with."""
+    panel = None
+    for name, df in raw_frames.items():
+        if df is None or df.empty:
+            frame = pd.DataFrame(columns=["Date", name])
+        else:
+            ts = df.set_index("Date")[name]
+            frame = getattr(ts.resample(rule), how)().to_frame().reset_index()
+            frame.columns = ["Date", name]
+        panel = frame if panel is None else panel.merge(frame, on="Date", how="outer")
+    return panel.sort_values("Date").reset_index(drop=True)
+
+
+def test_parallel_fetch_matches_a_sequential_fetch():
+    parallel = _collect(max_workers=8)
+    sequential = _collect(max_workers=1)
+
+    assert list(parallel.raw_frames) == list(sequential.raw_frames)
+    for name, frame in parallel.raw_frames.items():
+        pd.testing.assert_frame_equal(frame, sequential.raw_frames[name], obj=name)
+
+    # FRED series, FMP-only indicators, Treasury tenors and spreads
+    assert len(parallel.session.requests) == len(INDICATORS) + len(FREDCollector.FMP_ECON_SERIES) + 2
+    assert {"Retail_Sales", "Treasury_3M", "Treasury_2Y", "Spread_10Y_3M", "Spread_5Y_3M"} <= set(parallel.raw_frames)
+    assert "Initial_Jobless_Claims" not in parallel.raw_frames
+    # FRED stays primary; FMP extends the history
+    assert parallel.raw_frames["S&P_500_Index"]["Date"].min() == GSPC_DATES[0]
+    assert parallel.raw_frames["Treasury_10Y"]["Date"].min() == pd.Timestamp("2000-01-01")
+
+
+def test_single_pass_panels_match_the_sequential_construction():
+    collector = _collect(max_workers=8)
+
+    for build, rule, how in (
+        (collector.build_monthly_panel, "ME", "last"),
+        (collector.build_quarterly_panel, "QE-DEC", "last"),
+    ):
+        expected = _sequential_panel(collector.raw_frames, rule, how)
+        panel = build()
+        assert list(panel.columns) == ["Date"] + list(collector.raw_frames)
+        pd.testing.assert_frame_equal(panel, expected, check_dtype=False, check_freq=False)
+
+
+def test_other_aggregations_and_empty_series():
+    collector = _collect(max_workers=4)
+    collector.raw_frames["Empty"] = pd.DataFrame(columns=["Date", "Empty"])
+
+    for how in ("mean", "max", "min"):
+        expected = _sequential_panel(collector.raw_frames, "ME", how)
+        panel = collector._build_panel("ME", how)
+        pd.testing.assert_frame_equal(panel, expected, check_dtype=False, check_freq=False)
+        assert panel["Empty"].isna().all()
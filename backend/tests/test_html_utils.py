@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.app.report_generation import html_utils
+
+
+def _baseline_table(df):
+    """build_data_table before tables were streamed (row by row via iterrows)"""
+    html = '<table id="t" class="data-table"><thead><tr>'
+    html += "".join(f"<th>{col}</th>" for col in df.columns) + "</tr></thead><tbody>"
+    for _, row in df.iterrows():
+        html += "<tr>"
+        for val in row:
+            if pd.isna(val):
+                display_val = "—"
+            elif isinstance(val, (int, float)):
+                if isinstance(val, float):
+                    display_val = f"{val:.2f}" if abs(val) < 1000 else f"{val:,.2f}"
+                else:
+                    display_val = f"{val:,}"
+            else:
+                display_val = str(val)
+            html += f"<td>{display_val}</td>"
+        html += "</tr>"
+    return html + "</tbody></table>"
+
+
+FRAMES = {
+    "ints": pd.DataFrame({"year": [2020, 2021], "n": [5, 12000]}),
+    "ints_and_floats": pd.DataFrame({"year": [2020, 2021], "pe": [12.345, np.nan]}),
+    "bools": pd.DataFrame({"flag": [True, False], "other": [False, True]}),
+    "bools_and_ints": pd.DataFrame({"flag": [True, False], "n": [1, 2000]}),
+    "mixed": pd.DataFrame({
+        "ticker": ["AAPL", None],
+        "flag": [True, False],
+        "n": pd.array([1, None], dtype="Int64"),
+        "year": [2020, 2021],
+        "pe": [1234.5, -0.004],
+        "np_int": pd.Series([np.int64(7), "x"], dtype=object),
+    }),
+    "nullable_ints": pd.DataFrame({"n": pd.array([1, None, 3000], dtype="Int64")}),
+    "dates": pd.DataFrame({"date": pd.to_datetime(["2024-01-02", None])}),
+    "dates_and_values": pd.DataFrame({"date": pd.to_datetime(["2024-01-02", "2024-01-03"]),
+                                      "close": [1.5, 2500.0]}),
+    "floats": pd.DataFrame({"a": [0.1, 1e6, np.inf, -np.inf, np.nan], "b": [1, 2, 3, 4, 5.5]}),
+}
+
+
+@pytest.mark.parametrize("name", sorted(FRAMES))
+def test_tables_render_as_before(name):
+    df = FRAMES[name]
+    html = html_utils.build_data_table(df, table_id="t", sortable=False)
+    assert html == _baseline_table(df)
+
+
+def test_chunked_tables_match_a_single_chunk():
+    df = FRAMES["mixed"]
+    chunked = "".join(html_utils.iter_data_table(df, table_id="t", sortable=False, chunk_rows=1))
+    assert chunked == _baseline_table(df)
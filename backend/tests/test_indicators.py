@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+
+from backend.app.report_generation.indicators import compute_indicators
+
+
+def _prices(symbol, dates, start):
+    close = start + np.arange(len(dates), dtype=float) * 0.1
+    return pd.DataFrame({
+        "date": dates,
+        "Symbol": symbol,
+        "close": close,
+        "high": close + 1,
+        "low": close - 1,
+        "volume": 1_000.0,
+    })
+
+
+def test_indicators_use_each_symbols_own_calendar():
+    dates = pd.bdate_range("2023-01-02", periods=260)
+    a = _prices("A", dates, 50.0)
+    # B trades on every date but one, e.g. a local holiday
+    b = _prices("B", dates.delete(240), 100.0)
+
+    frame = compute_indicators(pd.concat([a, b], ignore_index=True))
+    b_rows = frame[frame["Symbol"] == "B"].reset_index(drop=True)
+    last = b_rows.iloc[-1]
+
+    assert np.isclose(last["sma_200"], b["close"].iloc[-200:].mean())
+    assert np.isclose(last["sma_20"], b["close"].iloc[-20:].mean())
+    assert b_rows[["sma_200", "rsi_14", "atr_14", "adx_14", "volatility_20"]].iloc[-1].notna().all()
+    assert b_rows["volatility_60"].iloc[200:].notna().all()
+
+
+def test_indicators_match_single_symbol_computation():
+    dates = pd.bdate_range("2023-01-02", periods=120)
+    a = _prices("A", dates, 50.0)
+    b = _prices("B", dates[::2], 100.0)
+
+    combined = compute_indicators(pd.concat([a, b], ignore_index=True))
+    alone = compute_indicators(b)
+
+    pd.testing.assert_frame_equal(
+        combined[combined["Symbol"] == "B"].reset_index(drop=True),
+        alone.reset_index(drop=True),
+    )
@@ -0,0 +1,92 @@
+import asyncio
+import threading
+import time
+
+from backend.app.jobs.tasks import run_blocking
+
+
+def test_cancelled_blocking_work_is_waited_for():
+    steps = []
+
+    def work(cancel):
+        for step in range(50):
+            if cancel.is_set():
+                break
+            time.sleep(0.02)
+            steps.append(step)
+        return "done"
+
+    async def scenario():
+        cancel = threading.Event()
+        task = asyncio.create_task(run_blocking(work, cancel, cancel=cancel))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        # The thread has returned by the time the task is done
+        finished = len(steps)
+        await asyncio.sleep(0.1)
+        return task, cancel, finished
+
+    task, cancel, finished = asyncio.run(scenario())
+    assert task.cancelled()
+    assert cancel.is_set()
+    assert 0 < finished < 50
+    assert len(steps) == finished
+
+
+def test_claims_respect_the_per_user_limit(tmp_path, monkeypatch):
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from backend.app.jobs import service
+    from backend.app.models import Job, User
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    User.__table__.create(engine)
+    Job.__table__.create(engine)
+    Session = sessionmaker(bind=engine)
+    monkeypatch.setattr(service, "SessionLocal", Session)
+    monkeypatch.setattr(service.settings, "JOB_MAX_RUNNING_PER_USER", 1)
+
+    db = Session()
+    db.add(User(user_id="u1", email="u1@example.com"))
+    db.add_all([Job(job_id=f"j{i}", user_id="u1", job_type="dataset.collect", status="queued")
+                for i in range(2)])
+    db.commit()
+    db.close()
+
+    assert service.claim_job("j0", "w1")[0] == "claimed"
+    assert service.claim_job("j1", "w2")[0] == "busy"
+    assert service.claim_job("j0", "w2")[0] == "skip"
+
+
+def test_recovery_pushes_only_jobs_missing_from_the_queue(tmp_path, monkeypatch):
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from backend.app.jobs import service, worker
+    from backend.app.jobs.queue import MemoryQueue
+    from backend.app.models import Job, User
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+    User.__table__.create(engine)
+    Job.__table__.create(engine)
+    Session = sessionmaker(bind=engine)
+    monkeypatch.setattr(service, "SessionLocal", Session)
+
+    db = Session()
+    db.add(User(user_id="u1", email="u1@example.com"))
+    db.add_all([Job(job_id=f"j{i}", user_id="u1", job_type="dataset.collect", lane="batch", status="queued")
+                for i in range(2)])
+    db.commit()
+    db.close()
+
+    async def scenario():
+        queue = MemoryQueue()
+        await queue.push("j0", "batch")
+        await worker.JobWorker(concurrency=1)._recover(queue)
+        return await queue.sizes(), await queue.queued_ids()
+
+    sizes, queued = asyncio.run(scenario())
+    assert queued == {"j0", "j1"}
+    assert sizes["batch"] == 2
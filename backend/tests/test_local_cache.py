@@ -0,0 +1,136 @@
+from backend.app.core.cache import local
+from backend.app.core.cache.local import LocalCache
+
+PREFIX = local.settings.CACHE_PREFIX
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_their_ttl(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(local.time, "monotonic", clock)
+    cache = LocalCache(max_bytes=1000, default_ttl=30)
+
+    cache.put("short", 1, nbytes=10, ttl=5)
+    cache.put("default", 2, nbytes=10)
+    # Never kept longer than the L1 default, whatever the caller asks for
+    cache.put("long", 3, nbytes=10, ttl=3600)
+
+    clock.now += 6
+    assert cache.get("short") is None
+    assert cache.get("default") == 2
+    clock.now += 25
+    assert cache.get("default") is None
+    assert cache.get("long") is None
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["bytes"] == 0
+
+
+def test_least_recently_used_entries_are_evicted_by_size():
+    cache = LocalCache(max_bytes=100, default_ttl=30)
+    cache.put("a", "a", nbytes=40)
+    cache.put("b", "b", nbytes=40)
+    assert cache.get("a") == "a"  # b is now the least recently used
+
+    cache.put("c", "c", nbytes=40)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "a"
+    assert cache.get("c") == "c"
+    assert cache.stats() == {"entries": 2, "bytes": 80, "max_bytes": 100, "evictions": 1}
+
+
+def test_oversized_values_and_a_disabled_cache_store_nothing():
+    cache = LocalCache(max_bytes=100, default_ttl=30)
+    cache.put("big", "x", nbytes=101)
+    assert cache.get("big") is None
+
+    disabled = LocalCache(max_bytes=0, default_ttl=30)
+    disabled.put("k", "v", nbytes=1)
+    assert disabled.get("k") is None
+
+
+def test_replacing_a_key_keeps_the_byte_count():
+    cache = LocalCache(max_bytes=100, default_ttl=30)
+    cache.put("k", 1, nbytes=60)
+    cache.put("k", 2, nbytes=30)
+    assert cache.get("k") == 2
+    assert cache.stats()["bytes"] == 30
+
+
+def _filled():
+    cache = LocalCache(max_bytes=10_000, default_ttl=30)
+    for key in (f"{PREFIX}:bls:cu:1", f"{PREFIX}:bls:ln:2", f"{PREFIX}:fred:gdp", f"{PREFIX}:auth:user:1"):
+        cache.put(key, key, nbytes=10)
+    return cache
+
+
+def test_pattern_invalidation_drops_only_matching_entries():
+    cache = _filled()
+
+    assert cache.invalidate(f"{PREFIX}:bls:*") == 2
+
+    assert cache.get(f"{PREFIX}:bls:cu:1") is None
+    assert cache.get(f"{PREFIX}:bls:ln:2") is None
+    assert cache.get(f"{PREFIX}:fred:gdp") == f"{PREFIX}:fred:gdp"
+    assert cache.stats()["bytes"] == 20
+    assert cache.invalidate(f"{PREFIX}:fred:gdp") == 1
+    assert cache.invalidate(f"{PREFIX}:treasury:*") == 0
+
+
+def test_full_patterns_clear_everything():
+    for pattern in ("*", f"{PREFIX}:*"):
+        cache = _filled()
+        assert cache.invalidate(pattern) == 4
+        assert cache.stats()["entries"] == 0
+        assert cache.stats()["bytes"] == 0
+
+
+class FakePubSub:
+    def __init__(self, messages):
+        self.messages = list(messages)
+        self.channels = []
+
+    def subscribe(self, channel):
+        self.channels.append(channel)
+
+    def get_message(self, timeout=None):
+        if not self.messages:
+            local._listener_stop.set()
+            return None
+        return self.messages.pop(0)
+
+    def close(self):
+        pass
+
+
+def test_listener_applies_invalidations_from_other_workers(fake_redis, monkeypatch):
+    pubsub = FakePubSub([
+        {"type": "subscribe", "data": 1},
+        {"type": "message", "data": f"{PREFIX}:bls:*".encode()},
+    ])
+    monkeypatch.setattr(fake_redis, "pubsub", lambda ignore_subscribe_messages=True: pubsub, raising=False)
+    for key in (f"{PREFIX}:bls:cu:1", f"{PREFIX}:fred:gdp"):
+        local.local_cache.put(key, key, nbytes=10)
+
+    local._listener_stop.clear()
+    local._listen()
+
+    assert pubsub.channels == [local.invalidation_channel()]
+    assert local.local_cache.get(f"{PREFIX}:bls:cu:1") is None
+    assert local.local_cache.get(f"{PREFIX}:fred:gdp") == f"{PREFIX}:fred:gdp"
+
+
+def test_publish_invalidation_clears_here_and_broadcasts(fake_redis):
+    local.local_cache.put(f"{PREFIX}:bls:cu:1", 1, nbytes=10)
+
+    local.publish_invalidation(f"{PREFIX}:*")
+
+    assert local.local_cache.stats()["entries"] == 0
+    assert fake_redis.published == [(local.invalidation_channel(), f"{PREFIX}:*")]
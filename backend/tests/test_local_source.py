@@ -0,0 +1,59 @@
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.data_collection.local_source import LocalDataSource
+from backend.app.data_models.models import IncomeStatement, TableUpdateTracking
+
+
+def test_only_current_pairs_with_rows_are_served(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'data.db'}")
+    TableUpdateTracking.__table__.create(engine)
+    IncomeStatement.__table__.create(engine)
+    Session = sessionmaker(bind=engine)
+
+    now = datetime.now()
+    tracking = {
+        "AAPL": (now + timedelta(days=1), None),
+        "MSFT": (now + timedelta(days=1), None),      # no rows
+        "GOOG": (None, None),                          # never scheduled
+        "NVDA": (now + timedelta(days=1), "HTTP 429"),  # last update failed
+    }
+    db = Session()
+    for symbol, (next_due, error) in tracking.items():
+        db.add(TableUpdateTracking(table_name="income_statements", symbol=symbol,
+                                   last_update_timestamp=now, next_update_due=next_due,
+                                   last_error=error))
+        if symbol != "MSFT":
+            db.add(IncomeStatement(symbol=symbol, date=date(2024, 12, 31), period="FY",
+                                   revenue=1.0, created_at=now, updated_at=now))
+    db.commit()
+    db.close()
+
+    served = LocalDataSource(Session).fetch(["income_statement"], list(tracking), years=5)
+    assert list(served["income_statement"]) == ["AAPL"]
+    assert served["income_statement"]["AAPL"][0]["date"] == "2024-12-31"
+
+
+def test_prices_are_only_served_for_the_whole_panel(tmp_path):
+    from backend.app.data_models.models import PriceDaily
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'data.db'}")
+    TableUpdateTracking.__table__.create(engine)
+    PriceDaily.__table__.create(engine)
+    Session = sessionmaker(bind=engine)
+
+    now = datetime.now()
+    db = Session()
+    for symbol in ("AAPL", "^GSPC"):
+        db.add(TableUpdateTracking(table_name="prices_daily", symbol=symbol, last_update_timestamp=now,
+                                   next_update_due=now + timedelta(days=1)))
+        db.add(PriceDaily(symbol=symbol, date=date.today(), adj_close=100.0, created_at=now))
+    db.commit()
+    db.close()
+
+    source = LocalDataSource(Session)
+    assert "prices_full" not in source.fetch(["prices_full"], ["AAPL", "MSFT", "^GSPC"], years=1)
+    served = source.fetch(["prices_full"], ["AAPL", "^GSPC"], years=1)
+    assert served["prices_full"]["AAPL"][0]["close"] == 100.0
@@ -0,0 +1,100 @@
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from backend.app.data_collection import macro_store
+
+
+def _monthly(n):
+    return pd.DataFrame({"Date": pd.date_range("2000-01-31", periods=n, freq="ME"), "X": range(n)})
+
+
+def test_publishes_in_the_same_second_get_distinct_snapshots(tmp_path):
+    raw_long = pd.DataFrame({"Date": [], "Series": [], "Value": []})
+    generated_at = datetime(2025, 1, 1, 9, 30)
+
+    first = macro_store.publish_macro_store(tmp_path, raw_long, _monthly(114), _monthly(38), generated_at=generated_at)
+    assert len(macro_store.load_macro_panel(tmp_path, "monthly")) == 114
+
+    second = macro_store.publish_macro_store(tmp_path, raw_long, _monthly(117), _monthly(39), generated_at=generated_at)
+    assert second != first
+    assert first.exists()
+    assert len(macro_store.load_macro_panel(tmp_path, "monthly")) == 117
+
+
+def test_build_waits_for_the_store_another_process_is_building(tmp_path, monkeypatch):
+    from backend.app.data_collection import fred_collector
+
+    def _refresh(self, *args, **kwargs):
+        raise AssertionError("FRED fetched while another process holds the refresh lock")
+
+    monkeypatch.setattr(fred_collector.FREDCollector, "run_refresh", _refresh)
+    raw_long = pd.DataFrame({"Date": [], "Series": [], "Value": []})
+    with macro_store.refresh_lock(tmp_path) as acquired:
+        assert acquired
+        macro_store.publish_macro_store(tmp_path, raw_long, _monthly(24), _monthly(8))
+        panel = fred_collector.build_macro_store(tmp_path, panel="monthly", wait_seconds=0)
+    assert len(panel) == 24
+
+
+def test_panels_are_read_once_and_callers_get_private_copies(tmp_path, monkeypatch):
+    raw_long = pd.DataFrame({"Date": [], "Series": [], "Value": []})
+    macro_store.publish_macro_store(tmp_path, raw_long, _monthly(12), _monthly(4))
+
+    conversions = []
+    read_table = macro_store.feather.read_table
+
+    def counting_read_table(*args, **kwargs):
+        table = read_table(*args, **kwargs)
+        conversions.append(table.num_rows)
+        return table
+
+    monkeypatch.setattr(macro_store.feather, "read_table", counting_read_table)
+    macro_store._loaded.clear()
+
+    first = macro_store.load_macro_panel(tmp_path, "monthly")
+    first["X"] = -1
+    first["extra"] = 1.0
+    (converted,) = [frame for _, frame in macro_store._loaded.values()]
+    second = macro_store.load_macro_panel(tmp_path, "monthly")
+    assert all(frame is converted for _, frame in macro_store._loaded.values())
+    assert second["X"].tolist() == list(range(12))
+    assert "extra" not in second.columns
+    assert len(conversions) == 1
+
+    only_x = macro_store.load_macro_panel(tmp_path, "monthly", columns=["X", "missing"])
+    assert list(only_x.columns) == ["X"]
+    assert len(conversions) == 1
+
+
+def test_waiting_for_another_builder_is_bounded(tmp_path, monkeypatch):
+    from backend.app.data_collection import fred_collector
+
+    from backend.app.config import settings
+
+    assert macro_store.BUILD_WAIT_SECONDS < settings.JOB_STALE_SECONDS
+    with macro_store.refresh_lock(tmp_path) as acquired:
+        assert acquired
+        started = time.monotonic()
+        panel = fred_collector.build_macro_store(tmp_path, panel="monthly", wait_seconds=0.3, poll_seconds=0.1)
+    assert panel is None
+    assert time.monotonic() - started < 2
+
+
+def test_concurrent_loads_of_a_new_snapshot(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    raw_long = pd.DataFrame({"Date": [], "Series": [], "Value": []})
+    macro_store.publish_macro_store(tmp_path, raw_long, _monthly(24), _monthly(8))
+    macro_store.load_macro_panel(tmp_path, "monthly")
+    macro_store.load_macro_panel(tmp_path, "quarterly")
+    macro_store.publish_macro_store(tmp_path, raw_long, _monthly(30), _monthly(10))
+
+    panels = ["monthly", "quarterly"] * 16
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        frames = list(pool.map(lambda panel: macro_store.load_macro_panel(tmp_path, panel), panels))
+
+    assert [len(frame) for frame in frames] == [30, 10] * 16
+    assert len(macro_store._loaded) == 2
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,24 @@
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from backend.app.api.research import portal_api
+
+
+def test_queries_share_a_bounded_set_of_sessions(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'data.db'}")
+    sessions = set()
+
+    def query(n):
+        def run(session):
+            sessions.add(id(session))
+            if n == 3:
+                raise ValueError("bad query")
+            return session.execute(text("SELECT :n"), {"n": n}).scalar()
+        return run
+
+    with Session(bind=engine) as db:
+        results = portal_api.run_queries_concurrently(db, {f"q{n}": query(n) for n in range(10)})
+
+    assert results == {f"q{n}": (None if n == 3 else n) for n in range(10)}
+    assert list(results) == [f"q{n}" for n in range(10)]
+    assert len(sessions) <= portal_api.PORTAL_SESSIONS_PER_REQUEST
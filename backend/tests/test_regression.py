@@ -0,0 +1,99 @@
+import warnings
+
+import numpy as np
+import pytest
+import statsmodels.api as sm
+from scipy import stats
+from statsmodels.stats.stattools import durbin_watson
+
+from backend.app.report_generation.regression import correlate, univariate_ols, variance_inflation_factors
+
+
+def _data():
+    rng = np.random.default_rng(3)
+    x = rng.normal(size=(40, 3))
+    y = 0.5 + 2.0 * x[:, 0] - 0.3 * x[:, 1] + rng.normal(scale=0.8, size=40)
+    # Each column has its own missing rows; y has some too
+    x[[1, 5, 9], 0] = np.nan
+    x[20:26, 1] = np.nan
+    y[[3, 30]] = np.nan
+    return y, x
+
+
+def test_correlate_matches_scipy():
+    y, x = _data()
+    r, p, n = correlate(y, x)
+    rs, ps, _ = correlate(y, x, method="spearman")
+
+    for k in range(x.shape[1]):
+        keep = ~np.isnan(y) & ~np.isnan(x[:, k])
+        expected = stats.pearsonr(y[keep], x[keep, k])
+        spearman = stats.spearmanr(y[keep], x[keep, k])
+        assert n[k] == keep.sum()
+        assert np.isclose(r[k], expected.statistic)
+        assert np.isclose(p[k], expected.pvalue)
+        assert np.isclose(rs[k], spearman.statistic)
+        assert np.isclose(ps[k], spearman.pvalue)
+
+
+def test_univariate_ols_matches_statsmodels():
+    y, x = _data()
+    fits = univariate_ols(y, x)
+
+    for k in range(x.shape[1]):
+        keep = ~np.isnan(y) & ~np.isnan(x[:, k])
+        model = sm.OLS(y[keep], sm.add_constant(x[keep, k])).fit()
+
+        assert fits["n_observations"][k] == keep.sum()
+        assert np.isclose(fits["intercept"][k], model.params[0])
+        assert np.isclose(fits["slope"][k], model.params[1])
+        assert np.isclose(fits["slope_tstat"][k], model.tvalues[1])
+        assert np.isclose(fits["slope_pvalue"][k], model.pvalues[1])
+        assert np.isclose(fits["r_squared"][k], model.rsquared)
+        assert np.isclose(fits["adj_r_squared"][k], model.rsquared_adj)
+        assert np.isclose(fits["f_statistic"][k], model.fvalue)
+        assert np.isclose(fits["f_pvalue"][k], model.f_pvalue)
+        assert np.isclose(fits["aic"][k], model.aic)
+        assert np.isclose(fits["bic"][k], model.bic)
+        assert np.isclose(fits["residual_std_error"][k], np.sqrt(model.mse_resid))
+        assert np.isclose(fits["durbin_watson"][k], durbin_watson(model.resid))
+
+
+@pytest.mark.parametrize("fn", [correlate, univariate_ols])
+def test_degenerate_columns_are_nan(fn):
+    y = np.array([1.0, 2.0, 4.0, 3.0, 5.0, np.nan])
+    x = np.column_stack([
+        np.full(6, 7.0),                                 # constant regressor
+        [1.0, 2.0, np.nan, np.nan, np.nan, np.nan],      # n = 2
+        np.full(6, np.nan),                              # all NaN
+        [2.0, 1.0, 3.0, 5.0, 4.0, 0.0],                  # usable
+    ])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        result = fn(y, x)
+
+    values = result[0] if fn is correlate else result["slope"]
+    n = result[2] if fn is correlate else result["n_observations"]
+    assert np.isnan(values[:3]).all()
+    assert np.isfinite(values[3])
+    assert n.tolist() == [5, 2, 0, 5]
+    if fn is univariate_ols:
+        for key in ("slope_tstat", "slope_pvalue", "r_squared", "durbin_watson"):
+            assert np.isnan(result[key][:3]).all()
+
+
+def test_unknown_correlation_method():
+    with pytest.raises(ValueError):
+        correlate(np.arange(5.0), np.arange(5.0), method="kendall")
+
+
+def test_variance_inflation_factors_match_auxiliary_regressions():
+    _, x = _data()
+    x = x[~np.isnan(x).any(axis=1)]
+    vif = variance_inflation_factors(x)
+
+    for k in range(x.shape[1]):
+        others = sm.add_constant(np.delete(x, k, axis=1))
+        r_squared = sm.OLS(x[:, k], others).fit().rsquared
+        assert np.isclose(vif[k], 1.0 / (1.0 - r_squared))
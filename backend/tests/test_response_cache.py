@@ -0,0 +1,51 @@
+from backend.app.data_collection.response_cache import ResponseCache
+
+URL = "https://financialmodelingprep.com/stable/income-statement"
+
+
+class _DownRedis:
+    def mget(self, keys):
+        raise ConnectionError("redis down")
+
+    def pipeline(self, transaction=True):
+        raise ConnectionError("redis down")
+
+
+def test_failing_redis_falls_back_to_disk(tmp_path, monkeypatch):
+    cache = ResponseCache(backend="redis", root=tmp_path)
+    monkeypatch.setattr(cache, "_redis", lambda: _DownRedis())
+
+    cache.set(URL, {"symbol": "AAPL", "apikey": "secret"}, [{"revenue": 1}])
+    assert cache.get(URL, {"symbol": "AAPL", "apikey": "other"}) == [{"revenue": 1}]
+    assert cache.get(URL, {"symbol": "MSFT"}) is None
+    assert cache.stats()["hits"] == 1
+
+
+def test_empty_results_are_not_cached(tmp_path):
+    cache = ResponseCache(backend="disk", root=tmp_path)
+    cache.set(URL, {"symbol": "NEWCO"}, [])
+    cache.set(URL, {"symbol": "OTHER"}, {})
+    assert cache.get(URL, {"symbol": "NEWCO"}) is None
+    assert cache.get(URL, {"symbol": "OTHER"}) is None
+    assert not list(tmp_path.rglob("*.bin"))
+
+
+def test_redis_keys_are_outside_the_api_cache_namespace():
+    from fnmatch import fnmatch
+
+    from backend.app.config import settings
+
+    key = ResponseCache(backend="redis")._redis_key("ab" * 32)
+    assert not fnmatch(key, f"{settings.CACHE_PREFIX}:*")
+
+
+def test_threads_writing_the_same_response_do_not_clash(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = ResponseCache(backend="disk", root=tmp_path)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: cache.set(URL, {"symbol": "AAPL"}, [{"revenue": i}]), range(32)))
+
+    assert cache.get(URL, {"symbol": "AAPL"}) in [[{"revenue": i}] for i in range(32)]
+    assert len(list(tmp_path.rglob("*.bin"))) == 1
+    assert not list(tmp_path.rglob("*.tmp"))
@@ -0,0 +1,132 @@
+import gzip
+import os
+from datetime import datetime, timedelta
+from email.utils import formatdate
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.app.api import analyses
+from backend.app.core.deps import get_current_user
+from backend.app.database import Base, get_db
+from backend.app.models.analysis import Analysis
+from backend.app.models.section import Section
+from backend.app.models.user import User
+from backend.app.report_generation.compression import precompress, select_variant, variant_path
+
+# The precompressed pages include a brotli variant
+pytest.importorskip("brotli")
+
+PAGE = b"<html><body>" + b"<p>Section 9</p>" * 500 + b"</body></html>"
+URL = "/api/analyses/a1/sections/9"
+
+
+@pytest.fixture
+def client(tmp_path):
+    html_path = tmp_path / "section_09.html"
+    html_path.write_bytes(PAGE)
+    precompress(str(html_path))
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine, tables=[User.__table__, Analysis.__table__, Section.__table__])
+    SessionLocal = sessionmaker(bind=engine)
+    with SessionLocal() as db:
+        db.add_all([
+            User(user_id="u1", email="u1@example.com"),
+            Analysis(analysis_id="a1", user_id="u1", companies=["AAPL"]),
+            Section(section_id="s9", analysis_id="a1", section_number=9, section_name="Signal Discovery",
+                    status="complete", html_path=str(html_path), completed_at=datetime(2026, 1, 5, 12, 0, 0)),
+        ])
+        db.commit()
+
+    def db_session():
+        with SessionLocal() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(analyses.router)
+    app.dependency_overrides[get_db] = db_session
+    app.dependency_overrides[get_current_user] = lambda: User(user_id="u1", email="u1@example.com")
+    return TestClient(app)
+
+
+def _get(client, **headers):
+    return client.get(URL, headers=headers)
+
+
+def test_if_none_match_returns_304_with_the_same_validators(client):
+    first = _get(client, **{"Accept-Encoding": "gzip"})
+    assert first.status_code == 200
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.content == PAGE
+
+    second = _get(client, **{"Accept-Encoding": "gzip", "If-None-Match": first.headers["etag"]})
+    assert second.status_code == 304
+    assert second.content == b""
+    for header in ("etag", "last-modified", "cache-control", "vary"):
+        assert second.headers[header] == first.headers[header]
+    assert second.headers["vary"] == "Accept-Encoding"
+
+
+def test_weak_and_listed_etags_match(client):
+    etag = _get(client, **{"Accept-Encoding": "gzip"}).headers["etag"]
+
+    weak = _get(client, **{"Accept-Encoding": "gzip", "If-None-Match": f'"other", W/{etag}'})
+    assert weak.status_code == 304
+
+
+def test_etags_differ_per_encoding(client):
+    etag = _get(client, **{"Accept-Encoding": "gzip"}).headers["etag"]
+
+    identity = _get(client, **{"Accept-Encoding": "identity", "If-None-Match": etag})
+    assert identity.status_code == 200
+    assert identity.headers["etag"] != etag
+
+
+def test_if_modified_since(client):
+    last_modified = _get(client).headers["last-modified"]
+    assert _get(client, **{"If-Modified-Since": last_modified}).status_code == 304
+
+    earlier = formatdate((datetime(2026, 1, 5, 12, 0, 0) - timedelta(hours=1)).timestamp(), usegmt=True)
+    assert _get(client, **{"If-Modified-Since": earlier}).status_code == 200
+    assert _get(client, **{"If-Modified-Since": "not a date"}).status_code == 200
+
+
+def test_a_stale_etag_wins_over_if_modified_since(client):
+    last_modified = _get(client).headers["last-modified"]
+    response = _get(client, **{"If-None-Match": '"stale"', "If-Modified-Since": last_modified})
+    assert response.status_code == 200
+
+
+def test_accept_encoding_negotiation(tmp_path):
+    path = tmp_path / "page.html"
+    path.write_bytes(PAGE)
+    precompress(str(path))
+    page = str(path)
+    br = variant_path(page, "br")
+    gz = variant_path(page, "gzip")
+
+    assert select_variant(page, "br;q=0, gzip") == (gz, "gzip")
+    assert select_variant(page, "gzip, deflate, br") == (br, "br")
+    assert select_variant(page, "*") == (br, "br")
+    assert select_variant(page, "br;q=0, *") == (gz, "gzip")
+    assert select_variant(page, "*;q=0") == (page, None)
+    assert select_variant(page, "identity") == (page, None)
+    assert select_variant(page, None) == (page, None)
+    assert gzip.decompress(open(gz, "rb").read()) == PAGE
+
+
+def test_a_missing_variant_falls_back_to_the_plain_page(client, tmp_path):
+    page = str(tmp_path / "section_09.html")
+    for encoding in ("br", "gzip"):
+        os.remove(variant_path(page, encoding))
+
+    response = _get(client, **{"Accept-Encoding": "br, gzip"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.content == PAGE
+    assert response.headers["vary"] == "Accept-Encoding"
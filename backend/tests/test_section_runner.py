@@ -0,0 +1,197 @@
+from backend.app.report_generation import section_runner
+
+
+def test_a_broken_pool_is_replaced_once():
+    broken = section_runner.get_section_pool(1)
+    try:
+        replacement = section_runner.replace_broken_section_pool(broken, 1)
+        assert replacement is not broken
+        # A second run seeing the same broken pool keeps the replacement
+        assert section_runner.replace_broken_section_pool(broken, 1) is replacement
+        assert section_runner.get_section_pool(1) is replacement
+    finally:
+        section_runner.shutdown_section_pool()
+
+
+def test_entry_points_query_off_the_event_loop(monkeypatch):
+    import asyncio
+    import threading
+
+    threads = []
+
+    def get_analysis(db, analysis_id):
+        threads.append(threading.current_thread())
+        return None
+
+    monkeypatch.setattr(section_runner, "_get_analysis", get_analysis)
+    asyncio.run(section_runner.run_section_generation("missing"))
+    asyncio.run(section_runner.run_section_regeneration("missing", 3))
+    assert len(threads) == 2
+    assert threading.main_thread() not in threads
+
+
+def test_workers_fingerprint_from_a_cached_collector(tmp_path, monkeypatch):
+    class Collector:
+        companies = {"Apple": "AAPL"}
+        years = 5
+        raw_tables = {}
+
+    pickle_path = tmp_path / "collector.pkl"
+    pickle_path.write_bytes(b"v1")
+    loads = []
+    monkeypatch.setattr(section_runner.file_service, "get_collector_pickle_path", lambda analysis_id: pickle_path)
+    monkeypatch.setattr(section_runner.collector_loader_service, "load_financial_collector",
+                        lambda analysis_id: loads.append(analysis_id) or Collector())
+    monkeypatch.setattr(section_runner, "_worker_analysis", {})
+
+    first = section_runner._fingerprint_sections_worker("a1", [0, 19])
+    assert sorted(first) == [0, 19]
+    assert section_runner._fingerprint_sections_worker("a1", [19]) == {19: first[19]}
+    assert loads == ["a1"]
+
+    # A new collector file is loaded again
+    pickle_path.write_bytes(b"version 2")
+    section_runner._fingerprint_sections_worker("a1", [19])
+    assert loads == ["a1", "a1"]
+
+
+def test_unreferenced_chart_sidecars_are_pruned_after_the_grace_period(tmp_path, monkeypatch):
+    import os
+    import time
+
+    sections_dir = tmp_path / "sections"
+    charts_dir = sections_dir / "charts"
+    charts_dir.mkdir(parents=True)
+    monkeypatch.setattr(section_runner.file_service, "get_sections_dir", lambda analysis_id: sections_dir)
+    monkeypatch.setattr(section_runner.file_service, "get_charts_dir", lambda analysis_id: charts_dir)
+
+    used, stale, fresh = "0123456789abcdef.json", "fedcba9876543210.json", "00000000000000aa.json"
+    (sections_dir / "section_01_overview.html").write_text(f'<div data-src="/charts/{used}"></div>')
+    old = time.time() - section_runner.SIDECAR_GRACE_SECONDS - 60
+    for name in (used, stale, stale + ".br", fresh):
+        (charts_dir / name).write_text("{}")
+    for name in (used, stale, stale + ".br"):
+        os.utime(charts_dir / name, (old, old))
+
+    assert section_runner.prune_chart_sidecars("a1") == 2
+    assert sorted(p.name for p in charts_dir.iterdir()) == sorted([used, fresh])
+
+
+def test_section_pages_never_keep_stale_compressed_variants(tmp_path, monkeypatch):
+    page = tmp_path / "section_01_overview.html"
+    page.write_text("old")
+    (tmp_path / "section_01_overview.html.gz").write_bytes(b"old")
+    published = []
+
+    def precompress(path):
+        # The page is in place and its old variants are gone
+        published.append((open(path).read(), sorted(p.name for p in tmp_path.iterdir())))
+
+    monkeypatch.setattr(section_runner, "precompress", precompress)
+    section_runner.write_section_html(str(page), iter(["<p>", "new", "</p>"]))
+    assert published == [("<p>new</p>", ["section_01_overview.html"])]
+
+
+def test_a_failed_render_keeps_the_previous_page(tmp_path):
+    page = tmp_path / "section_01_overview.html"
+    page.write_text("old")
+
+    def render():
+        yield "<p>"
+        raise RuntimeError("boom")
+
+    try:
+        section_runner.write_section_html(str(page), render())
+    except RuntimeError:
+        pass
+    assert [p.name for p in tmp_path.iterdir()] == ["section_01_overview.html"]
+    assert page.read_text() == "old"
+
+
+def test_cancelling_a_parallel_run_leaves_no_section_processing(monkeypatch):
+    import asyncio
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from types import SimpleNamespace
+
+    pool = ThreadPoolExecutor(1)
+    started, release = threading.Event(), threading.Event()
+
+    def generate(analysis_id, number, name, path):
+        started.set()
+        release.wait(5)
+        return {"ok": True, "html_path": path, "fingerprint": "f"}
+
+    sections = {n: SimpleNamespace(section_number=n, section_name=f"s{n}", status="pending")
+                for n in (1, 2, 3, 4)}
+    finished = {}
+
+    class Runner(section_runner.SectionRunner):
+        def _load_sections(self):
+            return sections
+
+        def _skip_unchanged(self, pending, fingerprints):
+            return []
+
+        def _start_section(self, section):
+            section.status = "processing"
+            return f"/tmp/{section.section_name}.html"
+
+        def _mark_finished(self, section, result):
+            section.status = "complete" if result.get("ok") else "failed"
+            finished[section.section_number] = section.status
+
+        def _mark_cancelled(self, unfinished):
+            for section in unfinished:
+                section.status = "failed"
+
+        async def _broadcast_section(self, section):
+            pass
+
+    monkeypatch.setattr(section_runner, "get_section_pool", lambda workers: pool)
+    monkeypatch.setattr(section_runner, "_fingerprint_sections_worker", lambda analysis_id, numbers: {})
+    monkeypatch.setattr(section_runner, "_generate_section_worker", generate)
+    monkeypatch.setattr(section_runner, "_section_dependencies", lambda number: [])
+
+    async def main():
+        runner = Runner("a1", SimpleNamespace(commit=lambda: None), max_workers=2)
+        task = asyncio.create_task(runner.generate_all_sections_parallel(SimpleNamespace(progress=0)))
+        await asyncio.to_thread(started.wait, 5)
+        task.cancel()
+        await asyncio.sleep(0.05)
+        # The section already rendering is waited for, not abandoned
+        assert not task.done()
+        release.set()
+        try:
+            await task
+        except asyncio.CancelledError:
+            return True
+        return False
+
+    try:
+        assert asyncio.run(main())
+    finally:
+        pool.shutdown(wait=True)
+    assert finished == {1: "complete"}
+    assert {n: s.status for n, s in sections.items()} == {1: "complete", 2: "failed", 3: "failed", 4: "failed"}
+
+
+def test_edited_sections_are_reloaded_only_in_debug(tmp_path, monkeypatch):
+    from types import ModuleType
+
+    module_file = tmp_path / "section_99.py"
+    module_file.write_text("X = 1\n")
+    module = ModuleType("section_99")
+    reloaded = []
+    monkeypatch.setattr(section_runner, "SECTIONS_DIR", tmp_path)
+    monkeypatch.setattr(section_runner.importlib, "reload", lambda m: reloaded.append(m) or m)
+    monkeypatch.setitem(section_runner._section_modules, 99, (module, module_file.stat().st_mtime_ns - 1, "old"))
+    monkeypatch.setattr(section_runner.settings, "SECTION_RELOAD_MODULES", True)
+
+    monkeypatch.setattr(section_runner.settings, "DEBUG", False)
+    assert section_runner.load_section_module(99) == (module, 0.0)
+    assert reloaded == []
+
+    monkeypatch.setattr(section_runner.settings, "DEBUG", True)
+    assert section_runner.load_section_module(99)[0] is module
+    assert reloaded == [module]
@@ -0,0 +1,22 @@
+import time
+
+from backend.app.core.cache import singleflight
+
+
+def test_waiting_for_another_worker_is_bounded_and_backs_off(monkeypatch):
+    polls = []
+    monkeypatch.setattr(singleflight, "cache_get_sync", lambda key, track=True: polls.append(key))
+
+    started = time.monotonic()
+    assert singleflight.wait_for_value_sync("k", 0.6) is None
+    elapsed = time.monotonic() - started
+
+    assert 0.6 <= elapsed < 0.9
+    # 0.05, 0.1, 0.2, then capped waits instead of a poll every 50ms
+    assert len(polls) <= 5
+
+
+def test_waiting_returns_the_value_once_stored(monkeypatch):
+    values = iter([None, None, {"v": 1}])
+    monkeypatch.setattr(singleflight, "cache_get_sync", lambda key, track=True: next(values))
+    assert singleflight.wait_for_value_sync("k", 5) == {"v": 1}
@@ -0,0 +1,42 @@
+# scripts/build_dataset_stores.py
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.app.services.file_service import file_service
+from backend.app.services.collector_loader_service import collector_loader_service
+from backend.app.services.dataset_store_service import dataset_store_service
+
+
+def build_dataset_stores(force: bool = False):
+    """Write the Parquet store for datasets collected before it existed"""
+    datasets_dir = file_service.data_dir / "datasets"
+    if not datasets_dir.exists():
+        print("No datasets directory, nothing to do")
+        return
+
+    built, skipped, failed = 0, 0, 0
+    for dataset_dir in sorted(p for p in datasets_dir.iterdir() if p.is_dir()):
+        dataset_id = dataset_dir.name
+        if not file_service.dataset_collector_pickle_exists(dataset_id):
+            continue
+        if not force and dataset_store_service.load_manifest(dataset_id):
+            skipped += 1
+            continue
+
+        try:
+            collector = collector_loader_service.load_dataset_collector(dataset_id)
+            dataset_store_service.save_dataset_store(collector, dataset_id)
+            built += 1
+            print(f"  ✓ {dataset_id}")
+        except Exception as e:
+            failed += 1
+            print(f"  ✗ {dataset_id}: {e}")
+
+    print(f"✅ Done: {built} built, {skipped} already current, {failed} failed")
+
+
+if __name__ == "__main__":
+    build_dataset_stores(force="--force" in sys.argv)
@@ -0,0 +1,27 @@
+"""
+File: scripts/migrate_add_jobs_table.py
+
+Creates the jobs table used by the background job queue (backend/app/jobs).
+Safe to run more than once.
+
+Usage: python scripts/migrate_add_jobs_table.py
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+from backend.app.database import engine, Base
+from backend.app.models.job import Job
+
+
+def create_jobs_table():
+    """Create the jobs table"""
+    print("Creating jobs table...")
+    Base.metadata.create_all(bind=engine, tables=[Job.__table__])
+    print("✓ Jobs table created successfully!")
+
+
+if __name__ == "__main__":
+    create_jobs_table()
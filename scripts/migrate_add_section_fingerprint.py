@@ -0,0 +1,33 @@
+"""
+File: scripts/migrate_add_section_fingerprint.py
+
+Adds sections.input_fingerprint, used to skip regenerating sections whose
+inputs haven't changed. Safe to run more than once.
+
+Usage: python scripts/migrate_add_section_fingerprint.py
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+from sqlalchemy import inspect, text
+from backend.app.database import engine
+
+
+def add_section_fingerprint():
+    """Add the input_fingerprint column to the sections table"""
+    columns = [c["name"] for c in inspect(engine).get_columns("sections")]
+    if "input_fingerprint" in columns:
+        print("✓ sections.input_fingerprint already exists. No migration needed.")
+        return
+
+    print("Adding sections.input_fingerprint...")
+    with engine.begin() as conn:
+        conn.execute(text("ALTER TABLE sections ADD COLUMN input_fingerprint VARCHAR(64)"))
+    print("✓ Column added. Existing sections will be regenerated once, then reused while unchanged.")
+
+
+if __name__ == "__main__":
+    add_section_fingerprint()
@@ -0,0 +1,36 @@
+"""
+File: scripts/refresh_macro_store.py
+
+Refreshes the shared macro store (FRED/FMP panels read by the collectors)
+ahead of time, e.g. daily from cron, so collections never wait on FRED.
+Incremental unless --full is given or the last full download is too old.
+
+Usage: python scripts/refresh_macro_store.py [--full] [--excel]
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+from backend.app.config import settings
+from backend.app.data_collection.fred_collector import FREDCollector
+from backend.app.data_collection.macro_store import refresh_lock
+from backend.app.services.file_service import file_service
+
+
+def refresh_macro_store(full: bool = False, export_excel: bool = False):
+    """Run one macro store refresh"""
+    econ_dir = file_service.get_shared_economic_indicators_path()
+    print(f"Refreshing macro store in {econ_dir}...")
+    with refresh_lock(econ_dir) as acquired:
+        if not acquired:
+            print("ℹ️ Another process is refreshing the macro store - skipping")
+            return
+        collector = FREDCollector(fmp_api_key=settings.FMP_API_KEY, export_dir=econ_dir)
+        result = collector.run_refresh(export_excel=export_excel, full=full)
+    print(f"✓ Macro store refreshed: {result}")
+
+
+if __name__ == "__main__":
+    refresh_macro_store(full="--full" in sys.argv, export_excel="--excel" in sys.argv)